@@ -0,0 +1,117 @@
+"""
+Entity construction and validation benchmark.
+
+Compares, for a synthetic transcript of N words:
+
+- construction: one validated ``Entity(...)`` per word against
+  ``Entity.model_construct``, and against unvalidated construction plus one
+  batch check of the columns (the path EntityCreator.create_entities uses)
+- re-validation of a written file: ``WordDatabase.model_validate`` on the
+  loaded JSON against the batch record check used by
+  DatabaseWriter._validate_written_file
+
+Exits with an error if the trusted construction path is not faster than
+validated construction.
+
+Usage:
+    python benchmarks/entity_validation_benchmark.py [--count 1000000]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.shared.entity_validation import (  # noqa: E402
+    check_entity_columns, check_entity_records, construct_entities
+)
+from src.shared.models import Entity, WordDatabase  # noqa: E402
+
+
+SYLLABLES = [["ho", "la"], ["mun", "do"], ["co", "lom", "bia"], ["sol"]]
+
+
+def _columns(count: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    start = np.cumsum(rng.uniform(0.1, 0.6, count))
+    duration = rng.uniform(0.1, 0.9, count)
+    syllable_counts = np.array([len(SYLLABLES[i % len(SYLLABLES)]) for i in range(count)])
+    return {
+        "start_time": start,
+        "end_time": start + duration,
+        "duration": duration,
+        "confidence": rng.uniform(0.3, 1.0, count),
+        "quality_score": rng.uniform(0.3, 1.0, count),
+        "syllable_count": syllable_counts,
+        "speaker_id": rng.integers(0, 3, count),
+    }
+
+
+def _rows(columns: Dict[str, np.ndarray]) -> List[dict]:
+    created_at = datetime.now().isoformat()
+    lists = {name: values.tolist() for name, values in columns.items()}
+    return [
+        dict(entity_id=f"word_{i + 1:03d}", entity_type="word", text="palabra",
+             start_time=lists["start_time"][i], end_time=lists["end_time"][i],
+             duration=lists["duration"][i], confidence=lists["confidence"][i],
+             probability=lists["confidence"][i], syllables=list(SYLLABLES[i % len(SYLLABLES)]),
+             syllable_count=lists["syllable_count"][i], phonetic=None,
+             quality_score=lists["quality_score"][i], speaker_id=lists["speaker_id"][i],
+             recording_id="rec", recording_path="rec.wav", processed=False, clip_path=None,
+             selection_reason=None, created_at=created_at)
+        for i in range(len(columns["start_time"]))
+    ]
+
+
+def _timed(label: str, fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed:>8.2f} s")
+    return elapsed
+
+
+def benchmark(count: int) -> None:
+    columns = _columns(count)
+    rows = _rows(columns)
+    print(f"{count:,} entities\n\nconstruction")
+
+    validated = _timed("Entity(...) per word", lambda: [Entity(**row) for row in rows])
+    _timed("Entity.model_construct per word", lambda: [Entity.model_construct(**row) for row in rows])
+
+    def trusted():
+        report = check_entity_columns({
+            **columns,
+            "probability": columns["confidence"],
+            "syllable_lengths": columns["syllable_count"],
+            "entity_type": ["word"] * count,
+        })
+        assert report.valid
+        return construct_entities(dict(row) for row in rows)
+
+    fast = _timed("construct_entities + batch check", trusted)
+    print(f"  {'speedup':<36} {validated / fast:>8.1f} x\n\nwritten file re-validation")
+    if fast >= validated:
+        raise SystemExit("construct_entities + batch check is not faster than validated construction")
+
+    data = {"metadata": {"version": "1.0", "created_at": datetime.now().isoformat()},
+            "speaker_map": {0: {"name": "Speaker 0"}}, "entities": rows}
+    validated = _timed("WordDatabase.model_validate", lambda: WordDatabase.model_validate(data))
+    fast = _timed("check_entity_records", lambda: check_entity_records(rows))
+    print(f"  {'speedup':<36} {validated / fast:>8.1f} x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="Number of entities")
+    args = parser.parse_args()
+    benchmark(args.count)
+
+
+if __name__ == "__main__":
+    main()
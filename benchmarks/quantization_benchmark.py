@@ -0,0 +1,119 @@
+"""
+Int8 dynamic quantization benchmark for the PyTorch Whisper backend.
+
+Transcribes fixture recordings with each model at fp32 and int8 on CPU and
+reports throughput, word error rate of int8 against fp32, and the drift of
+word start times for words both runs agree on.
+
+Usage:
+    python benchmarks/quantization_benchmark.py [--models small medium] [--threads 8]
+        [audio files...]
+"""
+import argparse
+import re
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.audio_to_json.audio_processor import process_audio  # noqa: E402
+from src.audio_to_json.model_registry import estimate_model_bytes  # noqa: E402
+from src.audio_to_json.transcription import (  # noqa: E402
+    TranscriptionEngine, Word, release_whisper_model
+)
+from src.shared.config import Config  # noqa: E402
+
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+DEFAULT_FILES = [FIXTURES / "spanish_clear_30sec.wav", FIXTURES / "spanish_noisy_30sec.wav"]
+
+
+def _normalise(text: str) -> str:
+    return re.sub(r"[^\w]", "", text.lower())
+
+
+def word_error_rate(reference: List[str], hypothesis: List[str]) -> float:
+    """Levenshtein distance over words divided by the reference length."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, start=1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp_word in enumerate(hypothesis, start=1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + (ref_word != hyp_word))
+        previous = current
+    return previous[-1] / max(len(reference), 1)
+
+
+def timestamp_drift(reference: List[Word], hypothesis: List[Word]) -> np.ndarray:
+    """Start-time differences of words matched between two transcripts."""
+    matcher = SequenceMatcher(a=[_normalise(w.text) for w in reference],
+                              b=[_normalise(w.text) for w in hypothesis], autojunk=False)
+    return np.array([
+        abs(reference[block.a + k].start_time - hypothesis[block.b + k].start_time)
+        for block in matcher.get_matching_blocks() for k in range(block.size)
+    ])
+
+
+def _run(config: Config, audio) -> Tuple[float, float, List[List[Word]], int]:
+    """Load the model, transcribe every file; returns load time, transcribe time, words, size."""
+    engine = TranscriptionEngine(config.whisper)
+    start = time.perf_counter()
+    model = engine.model
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    words = [engine.transcribe_audio(a) for a in audio]
+    transcribe_time = time.perf_counter() - start
+
+    size = estimate_model_bytes(model)
+    release_whisper_model(config.whisper)
+    return load_time, transcribe_time, words, size
+
+
+def benchmark(models: List[str], files: List[Path], threads: int) -> None:
+    import torch
+    if threads:
+        torch.set_num_threads(threads)
+
+    config = Config()
+    config.whisper.device = "cpu"
+    audio = [process_audio(str(f), config) for f in files]
+    audio_seconds = sum(a.duration for a in audio)
+    print(f"{len(files)} file(s), {audio_seconds:.0f}s audio, {torch.get_num_threads()} torch threads\n")
+    print(f"{'model':<8} {'precision':<9} {'size (MB)':>9} {'load (s)':>8} {'x realtime':>10} "
+          f"{'WER vs fp32':>11} {'drift p50 (ms)':>14} {'drift p95 (ms)':>14}")
+
+    for model in models:
+        config.whisper.model = model
+        reference = None
+        for precision in ["fp32", "int8"]:
+            config.whisper.precision = precision
+            load_time, transcribe_time, words, size = _run(config, audio)
+            if reference is None:
+                reference = words
+                wer, p50, p95 = 0.0, 0.0, 0.0
+            else:
+                wer = word_error_rate([_normalise(w.text) for f in reference for w in f],
+                                      [_normalise(w.text) for f in words for w in f])
+                drift = np.concatenate([timestamp_drift(r, h) for r, h in zip(reference, words)])
+                p50, p95 = (np.percentile(drift, [50, 95]) * 1000) if len(drift) else (np.nan, np.nan)
+            print(f"{model:<8} {precision:<9} {size / 1e6:>9.0f} {load_time:>8.1f} "
+                  f"{audio_seconds / transcribe_time:>10.2f} {wer:>11.1%} {p50:>14.0f} {p95:>14.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", type=Path, default=DEFAULT_FILES, help="Audio files")
+    parser.add_argument("--models", nargs="+", default=["small", "medium"], help="Whisper model sizes")
+    parser.add_argument("--threads", type=int, default=0, help="Torch threads (0 = torch default)")
+    args = parser.parse_args()
+    benchmark(args.models, args.files, args.threads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Resampling benchmark for the audio.resampler backends.
+
+Resamples a synthetic stereo recording at typical input rates (44.1 kHz and
+48 kHz) to the pipeline rate and reports speed and quality for each backend.
+The "librosa (stereo)" row reproduces the old behaviour of resampling both
+channels and averaging afterwards.
+
+The test signal is a sum of in-band tones (kept) and tones above the output
+Nyquist frequency (which should be removed). Quality is reported as the SNR
+of the output against the exact in-band tones at the output rate, so
+passband error and aliasing both lower the score.
+
+Usage:
+    python benchmarks/resampling_benchmark.py [--seconds 60] [--repeats 3]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.audio_to_json.audio_processor import resample_audio  # noqa: E402
+
+
+RESAMPLERS = ["librosa", "soxr_hq", "soxr_qq", "scipy_poly"]
+INPUT_RATES = [44100, 48000]
+IN_BAND_HZ = [110.0, 440.0, 1250.0, 3100.0, 5900.0]
+OUT_OF_BAND_HZ = [10500.0, 14000.0, 19000.0]
+EDGE_SECONDS = 0.05
+
+
+def _tones(freqs, sample_rate: int, n_samples: int) -> np.ndarray:
+    t = np.arange(n_samples, dtype=np.float64) / sample_rate
+    return sum(0.1 * np.sin(2 * np.pi * f * t + i) for i, f in enumerate(freqs))
+
+
+def _stereo_signal(sample_rate: int, seconds: float) -> np.ndarray:
+    """(2, samples) float32 with the same in-band content on both channels."""
+    n = int(sample_rate * seconds)
+    in_band = _tones(IN_BAND_HZ, sample_rate, n)
+    left = in_band + _tones(OUT_OF_BAND_HZ, sample_rate, n)
+    right = in_band - _tones(OUT_OF_BAND_HZ[:1], sample_rate, n)
+    return np.stack([left, right]).astype(np.float32)
+
+
+def _snr_db(output: np.ndarray, target_sr: int) -> float:
+    reference = _tones(IN_BAND_HZ, target_sr, len(output))
+    edge = int(EDGE_SECONDS * target_sr)
+    error = output[edge:-edge] - reference[edge:-edge]
+    return 10 * np.log10(np.sum(reference[edge:-edge] ** 2) / max(np.sum(error ** 2), 1e-30))
+
+
+def _run(stereo: np.ndarray, original_sr: int, target_sr: int, resampler: str,
+         downmix_first: bool) -> np.ndarray:
+    if downmix_first:
+        return resample_audio(stereo.mean(axis=0, dtype=np.float32), original_sr, target_sr, resampler)
+    return np.mean(resample_audio(stereo, original_sr, target_sr, resampler), axis=0)
+
+
+def benchmark(seconds: float, repeats: int, target_sr: int) -> None:
+    print(f"{seconds:.0f}s stereo input -> {target_sr} Hz mono, best of {repeats}\n")
+    print(f"{'input':>8}  {'resampler':<18} {'time (ms)':>10} {'x realtime':>11} {'SNR (dB)':>9}")
+
+    for original_sr in INPUT_RATES:
+        stereo = _stereo_signal(original_sr, seconds)
+        cases = [("librosa (stereo)", "librosa", False)] + [(r, r, True) for r in RESAMPLERS]
+        for label, resampler, downmix_first in cases:
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                output = _run(stereo, original_sr, target_sr, resampler, downmix_first)
+                best = min(best, time.perf_counter() - start)
+            print(f"{original_sr:>8}  {label:<18} {best * 1000:>10.1f} "
+                  f"{seconds / best:>11.0f} {_snr_db(output, target_sr):>9.1f}")
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0, help="Length of the test signal")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per case (best is kept)")
+    parser.add_argument("--target-sr", type=int, default=16000, help="Output sample rate")
+    args = parser.parse_args()
+    benchmark(args.seconds, args.repeats, args.target_sr)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,31 @@ Audio processing module for loading, validation, and resampling.
 
 Handles audio file loading with format validation, metadata extraction, and
 automatic resampling to target sample rate for consistent pipeline processing.
+Long WAV/FLAC recordings can be streamed block by block so that only the
+output-rate array is held in memory, and decoded audio can be cached on disk
+as memory-mapped .npy files so re-runs skip decoding entirely. probe_audio
+reads metadata from the container header alone, without decoding samples.
+Multichannel input is downmixed before resampling, and the resampler
+(librosa, soxr HQ/QQ or scipy polyphase) is selected by audio.resampler.
 """
+import json
+import math
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 import librosa
 import soundfile as sf
+import soxr
 import numpy as np
+from scipy.signal import resample_poly
 
 from ..shared.models import AudioMetadata
 from ..shared.config import Config
 from ..shared.exceptions import AudioError
 from ..shared.logging_config import LoggerMixin
+from ..shared.disk_cache import DiskCache
+from ..shared.fingerprint import file_fingerprint, config_fingerprint
 
 
 class AudioProcessor(LoggerMixin):
@@ -24,13 +36,16 @@ class AudioProcessor(LoggerMixin):
     def __init__(self, config: Config):
         super().__init__()
         self.config = config
+        self.cache = DecodedAudioCache.from_config(config)
         
-    def process_audio(self, audio_path: str) -> 'ProcessedAudio':
+    def process_audio(self, audio_path: str, content_hash: Optional[str] = None) -> 'ProcessedAudio':
         """
         Load and process audio file with validation and resampling.
         
         Args:
             audio_path: Path to the audio file
+            content_hash: file_fingerprint of the file, if the caller already
+                computed it (otherwise hashed here when the cache needs it)
             
         Returns:
             ProcessedAudio object with audio data and metadata
@@ -45,6 +60,27 @@ class AudioProcessor(LoggerMixin):
             if not Path(audio_path).exists():
                 raise AudioError(f"Audio file not found: {audio_path}")
             
+            if content_hash is None and self.cache:
+                content_hash = file_fingerprint(audio_path)
+            fingerprint = decoded_audio_fingerprint(content_hash, self.config) if content_hash else None
+            cache_key = fingerprint if self.cache else None
+            if cache_key:
+                cached = self.cache.load(cache_key)
+                if cached is not None:
+                    self.log_stage_complete("audio_processing",
+                                          final_duration=cached.duration,
+                                          final_sr=cached.sample_rate,
+                                          cache="hit")
+                    return cached
+            
+            # Header is read once and reused for streaming and metadata
+            file_info, file_size = _read_header(audio_path)
+            
+            if self.config.audio.streaming:
+                processed = self._process_streaming(audio_path, file_info, file_size)
+                processed.fingerprint = fingerprint
+                return self._store_cached(cache_key, processed)
+            
             # Load audio file
             self.log_progress("Loading audio file", file=audio_path)
             audio_data, original_sr = librosa.load(
@@ -53,83 +89,370 @@ class AudioProcessor(LoggerMixin):
                 mono=True if self.config.audio.channels == 1 else False
             )
             
-            # Get file metadata
-            file_info = sf.info(audio_path)
-            file_size = os.path.getsize(audio_path)
-            
-            # Create metadata
-            metadata = AudioMetadata(
-                path=audio_path,
-                duration=len(audio_data) / original_sr,
-                sample_rate=original_sr,
-                channels=file_info.channels,
-                format=file_info.format.lower(),
-                size_bytes=file_size
-            )
+            # Duration and rate come from the decoded samples, the rest from the header
+            metadata = _header_metadata(audio_path, file_info, file_size,
+                                        duration=len(audio_data) / original_sr,
+                                        sample_rate=original_sr)
             
             self.log_progress("Audio loaded", 
                             duration=metadata.duration,
                             original_sr=original_sr,
                             channels=metadata.channels)
             
+            # Downmix before resampling so only one channel is filtered
+            if self.config.audio.channels == 1 and len(audio_data.shape) > 1:
+                audio_data = np.mean(audio_data, axis=0, dtype=np.float32)
+            
             # Resample if necessary
             target_sr = self.config.audio.sample_rate
             if original_sr != target_sr:
                 self.log_progress("Resampling audio", 
                                 from_sr=original_sr, 
-                                to_sr=target_sr)
-                audio_data = librosa.resample(
-                    audio_data, 
-                    orig_sr=original_sr, 
-                    target_sr=target_sr
-                )
-                
-            # Ensure correct number of channels
-            if self.config.audio.channels == 1 and len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=0)
+                                to_sr=target_sr,
+                                resampler=self.config.audio.resampler)
+                audio_data = resample_audio(audio_data, original_sr, target_sr,
+                                            self.config.audio.resampler)
             
             # Create processed audio object
             processed = ProcessedAudio(
                 data=audio_data,
                 sample_rate=target_sr,
-                duration=len(audio_data) / target_sr,
-                metadata=metadata
+                duration=audio_data.shape[-1] / target_sr,
+                metadata=metadata,
+                fingerprint=fingerprint
             )
             
             self.log_stage_complete("audio_processing",
                                   final_duration=processed.duration,
                                   final_sr=processed.sample_rate)
             
-            return processed
+            return self._store_cached(cache_key, processed)
             
         except Exception as e:
             self.log_stage_error("audio_processing", e, file=audio_path)
             if isinstance(e, AudioError):
                 raise
             raise AudioError(f"Failed to process audio file: {e}", {"file": audio_path})
+    
+    def stream_audio(self, audio_path: str) -> Iterator[np.ndarray]:
+        """
+        Decode, downmix and resample a file in bounded-size blocks.
+        
+        With a soxr resampler the blocks are fed through one soxr stream. With
+        the other resamplers each block is read with enough neighbouring
+        context for a polyphase filter. Either way the concatenated blocks
+        equal a whole-file resample with the same filter. librosa cannot
+        resample block by block, so the "librosa" resampler streams with
+        scipy polyphase instead (a warning is logged); its output differs
+        slightly from the non-streaming path.
+        
+        Args:
+            audio_path: Path to a soundfile-readable audio file (WAV, FLAC, OGG)
+            
+        Yields:
+            float32 blocks at the target sample rate, 1-D for mono output
+            (including single-channel files) or (channels, samples) when
+            channels are preserved
+        """
+        target_sr = self.config.audio.sample_rate
+        
+        with sf.SoundFile(audio_path) as f:
+            original_sr = f.samplerate
+            frames = f.frames
+            mono = self._mono_output(f.channels)
+            if self.config.audio.resampler in _SOXR_QUALITY and original_sr != target_sr:
+                yield from self._stream_soxr(f)
+                return
+            if self.config.audio.resampler == "librosa" and original_sr != target_sr:
+                self.logger.warning("Streaming resamples with scipy polyphase instead of librosa",
+                                    file=audio_path, original_sr=original_sr, target_sr=target_sr)
+            
+            up, down = _resample_ratio(original_sr, target_sr)
+            block = down * max(1, round(self.config.audio.block_seconds * original_sr / down))
+            context = down * math.ceil(_RESAMPLE_CONTEXT_SAMPLES / down) if up != down else 0
+            
+            for start in range(0, frames, block):
+                stop = min(start + block, frames)
+                read_start = max(0, start - context)
+                read_stop = min(frames, stop + context)
+                f.seek(read_start)
+                data = f.read(read_stop - read_start, dtype='float32', always_2d=True).T
+                
+                # Downmix before resampling so only one channel is filtered
+                if mono:
+                    data = data.mean(axis=0, dtype=np.float32)
+                
+                if up == down:
+                    yield np.ascontiguousarray(data)
+                    continue
+                
+                resampled = resample_poly(data, up, down, axis=-1).astype(np.float32, copy=False)
+                lead = (start - read_start) * up // down
+                length = math.ceil((stop - start) * up / down)
+                yield np.ascontiguousarray(resampled[..., lead:lead + length])
+    
+    def _stream_soxr(self, f: sf.SoundFile) -> Iterator[np.ndarray]:
+        """Resample an open file block by block through a single soxr stream."""
+        mono = self._mono_output(f.channels)
+        block = max(1, round(self.config.audio.block_seconds * f.samplerate))
+        stream = soxr.ResampleStream(f.samplerate, self.config.audio.sample_rate,
+                                     1 if mono else f.channels, dtype='float32',
+                                     quality=_SOXR_QUALITY[self.config.audio.resampler])
+        
+        for start in range(0, f.frames, block):
+            data = f.read(min(block, f.frames - start), dtype='float32', always_2d=True)
+            if mono:
+                data = data.mean(axis=1, dtype=np.float32)
+            resampled = stream.resample_chunk(data, last=start + block >= f.frames)
+            if len(resampled):
+                yield np.ascontiguousarray(resampled.T)
+    
+    def _mono_output(self, file_channels: int) -> bool:
+        """Whether streamed output is 1-D: downmixed, or a single-channel file (as librosa.load returns)."""
+        return self.config.audio.channels == 1 or file_channels == 1
+    
+    def _process_streaming(self, audio_path: str, file_info, file_size: int) -> 'ProcessedAudio':
+        """Stream a file into a preallocated output buffer."""
+        target_sr = self.config.audio.sample_rate
+        metadata = _header_metadata(audio_path, file_info, file_size)
+        
+        self.log_progress("Streaming audio file",
+                        duration=metadata.duration,
+                        original_sr=metadata.sample_rate,
+                        channels=metadata.channels,
+                        block_seconds=self.config.audio.block_seconds)
+        
+        up, down = _resample_ratio(file_info.samplerate, target_sr)
+        total = math.ceil(file_info.frames * up / down)
+        if self._mono_output(file_info.channels):
+            audio_data = np.empty(total, dtype=np.float32)
+        else:
+            audio_data = np.empty((file_info.channels, total), dtype=np.float32)
+        
+        written = 0
+        for block in self.stream_audio(audio_path):
+            length = block.shape[-1]
+            audio_data[..., written:written + length] = block
+            written += length
+        audio_data = audio_data[..., :written]
+        
+        processed = ProcessedAudio(
+            data=audio_data,
+            sample_rate=target_sr,
+            duration=audio_data.shape[-1] / target_sr,
+            metadata=metadata
+        )
+        
+        self.log_stage_complete("audio_processing",
+                              final_duration=processed.duration,
+                              final_sr=processed.sample_rate,
+                              streaming=True)
+        
+        return processed
+    
+    def _store_cached(self, cache_key: Optional[str], processed: 'ProcessedAudio') -> 'ProcessedAudio':
+        """Save decoded audio to the cache (best-effort) and return it unchanged."""
+        if cache_key:
+            try:
+                self.cache.store(cache_key, processed)
+            except Exception as e:
+                self.logger.warning("Failed to cache decoded audio", error=str(e))
+        return processed
+
+
+def _read_header(audio_path: str):
+    """Read the container header (no samples are decoded)."""
+    try:
+        return sf.info(audio_path), os.path.getsize(audio_path)
+    except Exception as e:
+        raise AudioError(f"Cannot read audio header: {e}", {"file": audio_path})
+
+
+def _header_metadata(audio_path: str, file_info, file_size: int,
+                     duration: Optional[float] = None,
+                     sample_rate: Optional[int] = None) -> AudioMetadata:
+    """Build AudioMetadata from a header, optionally overriding decoded values."""
+    return AudioMetadata(
+        path=audio_path,
+        duration=file_info.frames / file_info.samplerate if duration is None else duration,
+        sample_rate=file_info.samplerate if sample_rate is None else sample_rate,
+        channels=file_info.channels,
+        format=file_info.format.lower(),
+        size_bytes=file_size
+    )
+
+
+# Input samples of context read on each side of a block; comfortably wider
+# than the half-length of scipy's default polyphase filter
+_RESAMPLE_CONTEXT_SAMPLES = 2048
+
+
+def _resample_ratio(original_sr: int, target_sr: int) -> Tuple[int, int]:
+    """Reduced up/down factors for polyphase resampling."""
+    g = math.gcd(int(original_sr), int(target_sr))
+    return int(target_sr) // g, int(original_sr) // g
+
+
+# soxr quality recipes for the soxr resamplers
+_SOXR_QUALITY = {"soxr_hq": "HQ", "soxr_qq": "QQ"}
+
+
+def resample_audio(data: np.ndarray, original_sr: int, target_sr: int,
+                   resampler: str = "librosa") -> np.ndarray:
+    """
+    Resample 1-D or (channels, samples) audio along the last axis.
+    
+    Args:
+        data: Audio samples
+        original_sr: Input sample rate
+        target_sr: Output sample rate
+        resampler: "librosa", "soxr_hq", "soxr_qq" or "scipy_poly"
+        
+    Returns:
+        Resampled audio (float32 for the soxr and scipy resamplers)
+        
+    Raises:
+        AudioError: If the resampler is unknown
+    """
+    if resampler == "librosa":
+        return librosa.resample(data, orig_sr=original_sr, target_sr=target_sr)
+    
+    data = np.asarray(data, dtype=np.float32)
+    if resampler in _SOXR_QUALITY:
+        # soxr expects (samples, channels)
+        resampled = soxr.resample(data.T, original_sr, target_sr,
+                                  quality=_SOXR_QUALITY[resampler])
+        return np.ascontiguousarray(resampled.T)
+    if resampler == "scipy_poly":
+        up, down = _resample_ratio(original_sr, target_sr)
+        return resample_poly(data, up, down, axis=-1).astype(np.float32, copy=False)
+    raise AudioError(f"Unknown resampler: {resampler}")
 
 
 class ProcessedAudio:
-    """Container for processed audio data and metadata."""
+    """
+    Container for processed audio data and metadata.
+    
+    ``fingerprint`` identifies the samples without reading them (the source
+    file's content hash combined with the decode settings, see
+    decoded_audio_fingerprint) so caches downstream need not hash them again.
+    It is None when unknown.
+    """
     
-    def __init__(self, data: np.ndarray, sample_rate: int, duration: float, metadata: AudioMetadata):
+    def __init__(self, data: np.ndarray, sample_rate: int, duration: float, metadata: AudioMetadata,
+                 fingerprint: Optional[str] = None):
         self.data = data
         self.sample_rate = sample_rate
         self.duration = duration
         self.metadata = metadata
+        self.fingerprint = fingerprint
         self.channels = 1 if len(data.shape) == 1 else data.shape[0]
         
     def __repr__(self):
         return f"ProcessedAudio(duration={self.duration:.2f}s, sr={self.sample_rate}Hz, channels={self.channels})"
+    
+    @classmethod
+    def from_npy(cls, path, sample_rate: int, metadata: AudioMetadata,
+                 fingerprint: Optional[str] = None) -> 'ProcessedAudio':
+        """
+        Open decoded audio saved with np.save without copying it into memory.
+        
+        Args:
+            path: Path to the .npy file
+            sample_rate: Sample rate of the saved samples
+            metadata: Metadata of the original file
+            fingerprint: Fingerprint of the saved samples, if known
+            
+        Returns:
+            ProcessedAudio whose data is a read-only memory map
+        """
+        data = np.load(path, mmap_mode='r')
+        return cls(data=data, sample_rate=sample_rate,
+                   duration=data.shape[-1] / sample_rate, metadata=metadata,
+                   fingerprint=fingerprint)
+
+
+def decoded_audio_fingerprint(content_hash: str, config: Config) -> str:
+    """
+    Identity of the samples a file decodes to under the given settings.
+    
+    Args:
+        content_hash: file_fingerprint of the source file
+        config: Configuration (the audio decode settings are used)
+        
+    Returns:
+        Hex digest, also used as the decoded-audio cache key
+    """
+    audio = config.audio
+    return config_fingerprint("decoded-audio", content_hash, {
+        "sample_rate": audio.sample_rate,
+        "channels": audio.channels,
+        "streaming": audio.streaming,
+        "resampler": audio.resampler,
+    })
 
 
-def process_audio(audio_path: str, config: Config) -> ProcessedAudio:
+class DecodedAudioCache(LoggerMixin):
+    """
+    Disk cache of decoded, resampled PCM.
+    
+    Entries are keyed by the source file's content hash and the decode
+    settings (target rate, channel layout, decode path), stored as .npy plus
+    a JSON sidecar with the original file's metadata, and opened zero-copy.
+    """
+    
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        super().__init__()
+        self.disk = DiskCache(directory, max_bytes)
+    
+    @classmethod
+    def from_config(cls, config: Config) -> Optional['DecodedAudioCache']:
+        """Cache for the configured directory, or None when caching is disabled."""
+        audio = config.audio
+        if not audio.cache_dir:
+            return None
+        return cls(audio.cache_dir, audio.cache_max_mb * 1024 * 1024)
+    
+    @staticmethod
+    def key_for(audio_path: str, config: Config, content_hash: Optional[str] = None) -> str:
+        """Cache key for a file under the given decode settings."""
+        return decoded_audio_fingerprint(content_hash or file_fingerprint(audio_path), config)
+    
+    def load(self, key: str) -> Optional[ProcessedAudio]:
+        """Open a cached entry, or None on a miss or unreadable entry."""
+        paths = self.disk.lookup(key, [".npy", ".json"])
+        if paths is None:
+            return None
+        try:
+            with open(paths[".json"], 'r', encoding='utf-8') as f:
+                info = json.load(f)
+            return ProcessedAudio.from_npy(paths[".npy"], info["sample_rate"],
+                                           AudioMetadata(**info["metadata"]), fingerprint=key)
+        except Exception as e:
+            self.logger.warning("Unreadable audio cache entry discarded", key=key, error=str(e))
+            self.disk.discard(key)
+            return None
+    
+    def store(self, key: str, audio: ProcessedAudio) -> None:
+        """Write an entry and evict old ones beyond the size cap."""
+        data_tmp = self.disk.temp_path(key, ".npy")
+        info_tmp = self.disk.temp_path(key, ".json")
+        with open(data_tmp, 'wb') as f:
+            np.save(f, np.ascontiguousarray(audio.data, dtype=np.float32))
+        with open(info_tmp, 'w', encoding='utf-8') as f:
+            json.dump({"sample_rate": audio.sample_rate,
+                       "metadata": audio.metadata.model_dump()}, f)
+        self.disk.commit(key, {".npy": data_tmp, ".json": info_tmp})
+
+
+def process_audio(audio_path: str, config: Config, content_hash: Optional[str] = None) -> ProcessedAudio:
     """
     Convenience function for processing audio files.
     
     Args:
         audio_path: Path to the audio file
         config: Configuration object
+        content_hash: Optional precomputed file_fingerprint of the file
         
     Returns:
         ProcessedAudio object
@@ -138,4 +461,41 @@ def process_audio(audio_path: str, config: Config) -> ProcessedAudio:
         AudioError: If audio processing fails
     """
     processor = AudioProcessor(config)
-    return processor.process_audio(audio_path)
\ No newline at end of file
+    return processor.process_audio(audio_path, content_hash)
+
+
+def stream_audio(audio_path: str, config: Config) -> Iterator[np.ndarray]:
+    """
+    Convenience generator yielding resampled audio blocks.
+    
+    Args:
+        audio_path: Path to a soundfile-readable audio file
+        config: Configuration object (audio.sample_rate, channels, block_seconds)
+        
+    Yields:
+        float32 blocks at the target sample rate
+    """
+    processor = AudioProcessor(config)
+    yield from processor.stream_audio(audio_path)
+
+
+def probe_audio(audio_path: str) -> AudioMetadata:
+    """
+    Read audio metadata from the file header without decoding any samples.
+    
+    Duration is derived from the header's frame count, so probing costs a
+    file open and a header read regardless of recording length.
+    
+    Args:
+        audio_path: Path to a soundfile-readable audio file
+        
+    Returns:
+        AudioMetadata with duration, sample rate, channels, format and size
+        
+    Raises:
+        AudioError: If the file is missing or its header cannot be read
+    """
+    if not Path(audio_path).exists():
+        raise AudioError(f"Audio file not found: {audio_path}")
+    file_info, file_size = _read_header(audio_path)
+    return _header_metadata(audio_path, file_info, file_size)
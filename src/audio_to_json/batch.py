@@ -0,0 +1,136 @@
+"""
+Input resolution for multi-file batch processing.
+
+Expands a batch source (directory, glob pattern or manifest file) into an
+ordered list of audio files and derives a non-colliding output path for
+each. Files can be ordered longest-first from their headers so parallel
+workers finish together.
+"""
+import glob
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional
+
+from ..shared.exceptions import PipelineError
+from .audio_processor import probe_audio
+
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".flac", ".ogg"}
+MANIFEST_EXTENSIONS = {".txt", ".json"}
+
+
+def resolve_batch_inputs(source: str, pattern: Optional[str] = None) -> List[Path]:
+    """
+    Expand a batch source into audio file paths.
+
+    Args:
+        source: Directory (searched recursively), glob pattern, or manifest file
+            (.txt with one path per line, or .json list of paths). Relative
+            manifest entries are resolved against the manifest's directory.
+        pattern: Optional glob applied inside a directory source (e.g. "*.wav")
+
+    Returns:
+        Sorted, de-duplicated list of audio file paths
+
+    Raises:
+        PipelineError: If the source cannot be read or matches no files
+    """
+    source_path = Path(source)
+
+    if source_path.is_dir():
+        if pattern:
+            candidates = source_path.rglob(pattern)
+        else:
+            candidates = (p for p in source_path.rglob("*") if p.suffix.lower() in AUDIO_EXTENSIONS)
+        files = [p for p in candidates if p.is_file()]
+    elif source_path.is_file() and source_path.suffix.lower() in MANIFEST_EXTENSIONS:
+        files = _read_manifest(source_path)
+    else:
+        files = [Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file()]
+
+    files = sorted(set(files))
+    if not files:
+        raise PipelineError(f"No audio files found for batch source: {source}")
+
+    return files
+
+
+def _read_manifest(manifest_path: Path) -> List[Path]:
+    """Read file paths from a .txt or .json manifest."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if manifest_path.suffix.lower() == ".json":
+                entries = json.load(f)
+                if not isinstance(entries, list):
+                    raise ValueError("JSON manifest must be a list of paths")
+            else:
+                entries = [line.strip() for line in f
+                           if line.strip() and not line.strip().startswith("#")]
+    except Exception as e:
+        raise PipelineError(f"Failed to read batch manifest: {e}", {"manifest": str(manifest_path)})
+
+    base_dir = manifest_path.parent
+    paths = []
+    for entry in entries:
+        path = Path(str(entry))
+        if not path.is_absolute():
+            path = base_dir / path
+        paths.append(path)
+    return paths
+
+
+def batch_output_paths(audio_files: List[Path], output_dir: Optional[Path]) -> List[Path]:
+    """
+    Derive one JSON output path per input file.
+
+    Without an output directory each database is written next to its audio
+    file. With one, the inputs' directory structure below their common parent
+    is mirrored so files with the same name never collide. Inputs differing
+    only in extension (``a.wav`` and ``a.mp3``) keep it in the output name
+    (``a.wav.json``, ``a.mp3.json``).
+
+    Raises:
+        PipelineError: If two inputs would still share an output path
+    """
+    if output_dir is None:
+        relative = list(audio_files)
+    else:
+        resolved = [p.resolve() for p in audio_files]
+        if len(resolved) == 1:
+            common = resolved[0].parent
+        else:
+            common = Path(os.path.commonpath([str(p.parent) for p in resolved]))
+        relative = [Path(output_dir) / p.relative_to(common) for p in resolved]
+
+    plain = [p.with_suffix('.json') for p in relative]
+    counts = Counter(plain)
+    outputs = [path if counts[path] == 1 else source.with_name(source.name + '.json')
+               for path, source in zip(plain, relative)]
+
+    output_counts = Counter(outputs)
+    duplicates = sorted(str(p) for p, n in output_counts.items() if n > 1)
+    if duplicates:
+        raise PipelineError("Batch inputs map to the same output file", {"outputs": duplicates})
+    return outputs
+
+
+def longest_first(audio_files: List[Path]) -> List[int]:
+    """
+    Order files by decreasing duration, read from headers only.
+
+    Starting the longest recordings first keeps one long file from running
+    alone at the end of a parallel batch. Files whose header cannot be read
+    sort last (they fail quickly); ties keep input order.
+
+    Returns:
+        Indices into ``audio_files`` in scheduling order
+    """
+    durations = []
+    for path in audio_files:
+        try:
+            durations.append(probe_audio(str(path)).duration)
+        except Exception:
+            durations.append(-1.0)
+    return sorted(range(len(audio_files)), key=lambda i: -durations[i])
@@ -0,0 +1,126 @@
+"""
+Span planning and word splicing for confidence-driven model cascades.
+
+After a fast model has transcribed the whole recording, words whose
+confidence falls below a threshold mark the regions worth a second opinion.
+Each weak word is widened by some context, nearby regions are merged, and
+every region is cut at the pauses around its outermost words so a larger
+model can re-transcribe just that audio. The larger model's words then
+replace the fast model's words inside each region.
+"""
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from .transcription import Word
+
+
+@dataclass
+class RefinementSpan:
+    """A region of audio to re-transcribe and the words it replaces."""
+    first_word: int  # Index of the first replaced word
+    last_word: int   # Index of the last replaced word (inclusive)
+    start: float     # Audio cut start (seconds)
+    end: float       # Audio cut end (seconds)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def _cut_before(words: List[Word], index: int) -> float:
+    """Cut point in the pause before a word (start of audio for the first word)."""
+    if index == 0:
+        return 0.0
+    return (words[index - 1].end_time + words[index].start_time) / 2
+
+
+def _cut_after(words: List[Word], index: int, duration: float) -> float:
+    """Cut point in the pause after a word (end of audio for the last word)."""
+    if index == len(words) - 1:
+        return max(duration, words[index].end_time)
+    return (words[index].end_time + words[index + 1].start_time) / 2
+
+
+def plan_refinement_spans(words: List[Word], threshold: float, context_s: float,
+                          merge_gap_s: float, duration: float) -> List[RefinementSpan]:
+    """
+    Find the regions around low-confidence words.
+
+    Args:
+        words: Time-ordered words from the fast model
+        threshold: Words with confidence below this are re-transcribed
+        context_s: Audio on each side of a weak word re-transcribed with it
+        merge_gap_s: Regions separated by less than this are merged
+        duration: Length of the audio in seconds
+
+    Returns:
+        Ordered, non-overlapping RefinementSpan list (empty if every word is confident)
+    """
+    ranges: List[List[int]] = []
+    for index, word in enumerate(words):
+        if word.confidence >= threshold:
+            continue
+
+        # Every word overlapping the weak word's context window is replaced
+        window_start = word.start_time - context_s
+        window_end = word.end_time + context_s
+        first = index
+        while first > 0 and words[first - 1].end_time > window_start:
+            first -= 1
+        last = index
+        while last < len(words) - 1 and words[last + 1].start_time < window_end:
+            last += 1
+
+        if ranges and first <= ranges[-1][1] + 1:
+            ranges[-1][1] = max(ranges[-1][1], last)
+        else:
+            ranges.append([first, last])
+
+    spans: List[RefinementSpan] = []
+    for first, last in ranges:
+        start = _cut_before(words, first)
+        end = _cut_after(words, last, duration)
+        if spans and start - spans[-1].end < merge_gap_s:
+            spans[-1].last_word = last
+            spans[-1].end = end
+        else:
+            spans.append(RefinementSpan(first, last, start, end))
+    return spans
+
+
+def splice_refined_words(words: List[Word],
+                         refinements: Sequence[Tuple[RefinementSpan, List[Word]]]) -> List[Word]:
+    """
+    Replace the words inside each span with the larger model's words.
+
+    Refined timestamps are relative to the span start; they are shifted onto
+    the original timeline and words whose centre falls outside the span are
+    dropped. A span whose re-transcription produced no words keeps the fast
+    model's words.
+
+    Args:
+        words: Time-ordered words from the fast model
+        refinements: (span, span-relative words) pairs in span order
+
+    Returns:
+        Time-ordered list of Word objects
+    """
+    spliced: List[Word] = []
+    position = 0
+
+    for span, refined in refinements:
+        spliced.extend(words[position:span.first_word])
+        position = span.last_word + 1
+
+        shifted = []
+        for word in refined:
+            start = span.start + word.start_time
+            end = min(span.start + word.end_time, span.end)
+            if span.start <= (start + end) / 2 < span.end:
+                shifted.append(Word(text=word.text, start_time=start, end_time=end,
+                                    confidence=word.confidence))
+
+        spliced.extend(shifted if shifted else words[span.first_word:position])
+
+    spliced.extend(words[position:])
+    return spliced
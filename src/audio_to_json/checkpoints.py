@@ -0,0 +1,187 @@
+"""
+Stage checkpoints for resumable pipeline runs.
+
+Persists each stage's output (decoded audio, transcribed words, diarization
+result and raw entities) under the checkpoint directory. Each checkpoint is
+keyed by a hash of the input file's content and the configuration sections
+that stage depends on, chained through upstream stage keys, so a checkpoint
+is only reused when everything that produced it is unchanged. The directory
+is a DiskCache, so it is capped in size and the least recently used
+checkpoints are evicted first.
+"""
+import json
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from ..shared.config import Config
+from ..shared.models import AudioMetadata, DiarizationResult, Entity
+from ..shared.disk_cache import DiskCache
+from ..shared.fingerprint import file_fingerprint, config_fingerprint
+from ..shared.logging_config import LoggerMixin
+from .audio_processor import ProcessedAudio
+from .transcription import Word
+from .word_table import WordTable
+
+
+@dataclass
+class StageKeys:
+    """Checkpoint keys for every stage of one pipeline run."""
+    audio: str
+    words: str
+    diarization: str
+    entities: str
+
+
+class CheckpointStore(LoggerMixin):
+    """Reads and writes stage checkpoints in a size-capped directory."""
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        super().__init__()
+        self.directory = Path(directory)
+        self.disk = DiskCache(directory, max_bytes)
+
+    def stage_keys(self, audio_path: str, config: Config,
+                   speaker_mapping: Optional[Any] = None,
+                   content_hash: Optional[str] = None) -> StageKeys:
+        """
+        Compute checkpoint keys for a run.
+
+        Args:
+            audio_path: Input audio file (hashed by content)
+            config: Pipeline configuration
+            speaker_mapping: Optional legacy speaker mapping (affects entities)
+            content_hash: file_fingerprint of the input, if already computed
+
+        Returns:
+            StageKeys for audio, words, diarization and entities
+        """
+        content_hash = content_hash or file_fingerprint(audio_path)
+        audio_key = config_fingerprint("audio", content_hash, config.audio)
+        words_key = config_fingerprint("words", audio_key, config.whisper, config.vad)
+        diarization_key = config_fingerprint("diarization", audio_key, config.speakers, config.vad)
+        entities_key = config_fingerprint("entities", words_key, diarization_key, speaker_mapping)
+        return StageKeys(audio_key, words_key, diarization_key, entities_key)
+
+    # Decoded audio
+
+    def save_audio(self, key: str, audio: ProcessedAudio) -> None:
+        """Save decoded audio as .npy plus metadata JSON."""
+        entry = self._entry(key, "audio")
+        data_tmp = self.disk.temp_path(entry, ".npy")
+        with open(data_tmp, 'wb') as f:
+            np.save(f, np.ascontiguousarray(audio.data))
+        self._write_json(key, "audio", {
+            "sample_rate": audio.sample_rate,
+            "duration": audio.duration,
+            "metadata": audio.metadata.model_dump(),
+            "fingerprint": audio.fingerprint
+        }, extra={".npy": data_tmp})
+
+    def load_audio(self, key: str) -> Optional[ProcessedAudio]:
+        """Load decoded audio (memory-mapped), or None if absent/invalid."""
+        info = self._read_json(key, "audio", extra=[".npy"])
+        if info is None:
+            return None
+        try:
+            return ProcessedAudio.from_npy(self.disk.path(self._entry(key, "audio"), ".npy"),
+                                           info["sample_rate"], AudioMetadata(**info["metadata"]),
+                                           fingerprint=info.get("fingerprint"))
+        except Exception as e:
+            self.logger.warning("Invalid audio checkpoint ignored", key=key, error=str(e))
+            return None
+
+    # Transcribed words
+
+    def save_words(self, key: str, words: Union[List[Word], WordTable]) -> None:
+        """Save transcribed words (a WordTable is written in the same format)."""
+        if isinstance(words, WordTable):
+            rows = zip(words.texts(), words.start.tolist(), words.end.tolist(), words.confidence.tolist())
+            data = [{"text": text, "start_time": start, "end_time": end, "confidence": confidence}
+                    for text, start, end, confidence in rows]
+        else:
+            data = [asdict(w) for w in words]
+        self._write_json(key, "words", data)
+
+    def load_words(self, key: str) -> Optional[List[Word]]:
+        """Load transcribed words, or None if absent/invalid."""
+        data = self._read_json(key, "words")
+        if data is None:
+            return None
+        try:
+            return [Word(**item) for item in data]
+        except Exception as e:
+            self.logger.warning("Invalid words checkpoint ignored", key=key, error=str(e))
+            return None
+
+    # Diarization
+
+    def save_diarization(self, key: str, result: DiarizationResult) -> None:
+        """Save a diarization result."""
+        self._write_json(key, "diarization", result.model_dump())
+
+    def load_diarization(self, key: str) -> Optional[DiarizationResult]:
+        """Load a diarization result, or None if absent/invalid."""
+        data = self._read_json(key, "diarization")
+        if data is None:
+            return None
+        try:
+            return DiarizationResult.model_validate(data)
+        except Exception as e:
+            self.logger.warning("Invalid diarization checkpoint ignored", key=key, error=str(e))
+            return None
+
+    # Raw (unfiltered) entities
+
+    def save_entities(self, key: str, entities: List[Entity]) -> None:
+        """Save raw entities before quality filtering."""
+        self._write_json(key, "entities", [e.model_dump() for e in entities])
+
+    def load_entities(self, key: str) -> Optional[List[Entity]]:
+        """Load raw entities, or None if absent/invalid."""
+        data = self._read_json(key, "entities")
+        if data is None:
+            return None
+        try:
+            return [Entity.model_validate(item) for item in data]
+        except Exception as e:
+            self.logger.warning("Invalid entities checkpoint ignored", key=key, error=str(e))
+            return None
+
+    # Helpers
+
+    @staticmethod
+    def _entry(key: str, stage: str) -> str:
+        """DiskCache entry name of one stage checkpoint."""
+        return f"{stage}_{key[:32]}"
+
+    def _write_json(self, key: str, stage: str, payload: Any,
+                    extra: Optional[Dict[str, Path]] = None) -> None:
+        """
+        Write JSON (and any staged ``extra`` files) as one cache entry.
+
+        Files are staged and renamed into place so a crash never leaves a
+        half-written checkpoint; older checkpoints are evicted beyond the cap.
+        """
+        entry = self._entry(key, stage)
+        tmp_path = self.disk.temp_path(entry, ".json")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "stage": stage, "data": payload}, f, ensure_ascii=False)
+        self.disk.commit(entry, {**(extra or {}), ".json": tmp_path})
+
+    def _read_json(self, key: str, stage: str, extra: Optional[List[str]] = None) -> Optional[Any]:
+        paths = self.disk.lookup(self._entry(key, stage), [".json"] + (extra or []))
+        if paths is None:
+            return None
+        path = paths[".json"]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                envelope: Dict[str, Any] = json.load(f)
+            if envelope.get("key") != key or envelope.get("stage") != stage:
+                return None
+            return envelope["data"]
+        except Exception as e:
+            self.logger.warning("Unreadable checkpoint ignored", path=str(path), error=str(e))
+            return None
@@ -0,0 +1,221 @@
+"""
+Chunk planning and word stitching for long-form transcription.
+
+Splits long audio into overlapping windows whose boundaries fall on low-energy
+points (pauses between words), and merges per-window transcriptions back into a
+single word list on the original timeline. Each window "owns" the span between
+its cut points; words are kept by the window that owns their centre and
+near-duplicates transcribed on both sides of a cut are dropped. Stitching
+also works incrementally (WordStitcher) for streaming transcription.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .transcription import Word
+
+
+# Analysis frame used when searching for quiet cut points
+ENERGY_FRAME_SECONDS = 0.02
+
+
+@dataclass
+class AudioChunk:
+    """A window of audio to transcribe independently."""
+    start_sample: int
+    end_sample: int
+    own_start: float  # Start of the span this chunk is authoritative for (seconds)
+    own_end: float    # End of the span this chunk is authoritative for (seconds)
+
+    def offset_seconds(self, sample_rate: int) -> float:
+        """Start of the chunk on the original timeline."""
+        return self.start_sample / sample_rate
+
+
+def find_quiet_point(data: np.ndarray, sample_rate: int, target_sample: int, search_samples: int) -> int:
+    """
+    Find the lowest-energy frame centre within ``search_samples`` of a target.
+
+    Args:
+        data: Mono audio samples
+        sample_rate: Sample rate in Hz
+        target_sample: Nominal cut position
+        search_samples: Half-width of the search window
+
+    Returns:
+        Sample index of the quietest point (the target if the window is too short)
+    """
+    frame = max(1, int(ENERGY_FRAME_SECONDS * sample_rate))
+    lo = max(0, target_sample - search_samples)
+    hi = min(len(data), target_sample + search_samples)
+    n_frames = (hi - lo) // frame
+    if n_frames < 2:
+        return target_sample
+
+    window = np.asarray(data[lo:lo + n_frames * frame], dtype=np.float32).reshape(n_frames, frame)
+    energy = np.einsum("ij,ij->i", window, window)
+    # Prefer the frame closest to the target when several are equally quiet
+    distance = np.abs(np.arange(n_frames) * frame + frame // 2 + lo - target_sample)
+    best = np.lexsort((distance, energy))[0]
+    return int(lo + best * frame + frame // 2)
+
+
+def plan_chunks(data: np.ndarray, sample_rate: int,
+                chunk_length_s: float, overlap_s: float) -> List[AudioChunk]:
+    """
+    Split audio into overlapping chunks cut at low-energy points.
+
+    Args:
+        data: Mono audio samples
+        sample_rate: Sample rate in Hz
+        chunk_length_s: Nominal chunk length in seconds
+        overlap_s: Audio shared between neighbouring chunks in seconds
+
+    Returns:
+        Ordered list of AudioChunk objects covering the whole signal
+    """
+    total = len(data)
+    chunk_samples = int(chunk_length_s * sample_rate)
+    if chunk_samples <= 0 or total <= chunk_samples:
+        return [AudioChunk(0, total, 0.0, total / sample_rate)]
+
+    half_overlap = int(overlap_s * sample_rate / 2)
+    search = min(half_overlap, chunk_samples // 4) or chunk_samples // 4
+
+    # Cut points partition the timeline; chunks extend half the overlap past them
+    cuts = [0]
+    nominal = chunk_samples
+    while nominal < total - chunk_samples // 4:
+        cut = find_quiet_point(data, sample_rate, nominal, search)
+        cuts.append(cut)
+        nominal = cut + chunk_samples
+    cuts.append(total)
+
+    chunks = []
+    for i in range(len(cuts) - 1):
+        start = max(0, cuts[i] - half_overlap)
+        end = min(total, cuts[i + 1] + half_overlap)
+        chunks.append(AudioChunk(
+            start_sample=start,
+            end_sample=end,
+            own_start=cuts[i] / sample_rate,
+            own_end=cuts[i + 1] / sample_rate
+        ))
+    return chunks
+
+
+def _normalise(text: str) -> str:
+    return text.strip().lower().strip(".,;:!?¿¡\"'")
+
+
+def _is_duplicate(previous: Word, current: Word, min_overlap: float = 0.5) -> bool:
+    """Two words are duplicates if they match in text and mostly overlap in time."""
+    if _normalise(previous.text) != _normalise(current.text):
+        return False
+    overlap = min(previous.end_time, current.end_time) - max(previous.start_time, current.start_time)
+    shorter = min(previous.end_time - previous.start_time, current.end_time - current.start_time)
+    if shorter <= 0:
+        return overlap >= 0
+    return overlap / shorter >= min_overlap
+
+
+class WordStitcher:
+    """
+    Incremental form of stitch_chunk_words for chunks arriving in order.
+
+    Each chunk's words are shifted, trimmed to the chunk's owned span and
+    de-duplicated against the previous chunk. A chunk's last word is held
+    back only if it reaches into the next chunk's audio, where it may turn
+    out to be a boundary duplicate of a more confident transcription.
+    """
+
+    def __init__(self, chunks: Sequence[AudioChunk], sample_rate: int):
+        self.chunks = list(chunks)
+        self.sample_rate = sample_rate
+        self._position = 0
+        self._pending: Optional[Word] = None
+
+    def add(self, chunk: AudioChunk, words: List[Word]) -> List[Word]:
+        """
+        Stitch the next chunk's words.
+
+        Args:
+            chunk: The chunk the words were transcribed from
+            words: Chunk-relative words
+
+        Returns:
+            Words on the original timeline that are now final
+        """
+        is_last = self._position == len(self.chunks) - 1
+        self._position += 1
+        offset = chunk.offset_seconds(self.sample_rate)
+
+        shifted = []
+        for word in words:
+            start = word.start_time + offset
+            end = word.end_time + offset
+            centre = (start + end) / 2
+
+            in_span = chunk.own_start <= centre < chunk.own_end
+            if is_last:
+                in_span = chunk.own_start <= centre
+            if not in_span:
+                continue
+
+            shifted.append(Word(
+                text=word.text,
+                start_time=start,
+                end_time=end,
+                confidence=word.confidence
+            ))
+        shifted.sort(key=lambda w: (w.start_time, w.end_time))
+
+        final: List[Word] = []
+        for word in shifted:
+            if self._pending is not None and _is_duplicate(self._pending, word):
+                # Keep the more confident transcription of the boundary word
+                if word.confidence > self._pending.confidence:
+                    self._pending = word
+                continue
+            if self._pending is not None:
+                final.append(self._pending)
+            self._pending = word
+
+        # Words ending before the next chunk's audio cannot have a duplicate there
+        if self._pending is not None and not is_last:
+            next_start = self.chunks[self._position].offset_seconds(self.sample_rate)
+            if self._pending.end_time < next_start:
+                final.append(self._pending)
+                self._pending = None
+        return final
+
+    def finish(self) -> List[Word]:
+        """Release the held-back word once no more chunks will arrive."""
+        final = [self._pending] if self._pending is not None else []
+        self._pending = None
+        return final
+
+
+def stitch_chunk_words(chunk_results: Sequence[Tuple[AudioChunk, List[Word]]],
+                       sample_rate: int) -> List[Word]:
+    """
+    Merge per-chunk word lists onto the original timeline.
+
+    Word times are shifted by each chunk's offset, words whose centre falls
+    outside the chunk's owned span are discarded, and duplicates straddling
+    a cut are removed.
+
+    Args:
+        chunk_results: (chunk, words) pairs with chunk-relative timestamps, in order
+        sample_rate: Sample rate used to plan the chunks
+
+    Returns:
+        Time-ordered list of Word objects
+    """
+    stitcher = WordStitcher([chunk for chunk, _ in chunk_results], sample_rate)
+    merged: List[Word] = []
+    for chunk, words in chunk_results:
+        merged.extend(stitcher.add(chunk, words))
+    merged.extend(stitcher.finish())
+    return merged
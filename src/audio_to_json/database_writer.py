@@ -3,17 +3,21 @@ Database writing module for atomic JSON operations.
 
 Handles writing WordDatabase objects to JSON files with atomic operations,
 backup creation, and validation. Ensures data integrity and provides
-rollback capabilities for safe database updates.
+rollback capabilities for safe database updates. Databases can also be
+streamed to disk batch by batch (DatabaseWriter.open_stream) so entities
+never have to be held in memory all at once.
 """
 import json
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from ..shared.models import WordDatabase, SpeakerInfo
+from ..shared.models import WordDatabase, SpeakerInfo, Entity
 from ..shared.config import Config
 from ..shared.exceptions import DatabaseError
+from ..shared.entity_validation import check_entity_records
+from ..shared.text_index import TextIndex, text_index_path, update_text_index
 from ..shared.logging_config import LoggerMixin
 
 
@@ -70,6 +74,9 @@ class DatabaseWriter(LoggerMixin):
                 # Atomic move to final location
                 shutil.move(str(temp_path), str(output_path))
                 
+                if self.config.output.text_index:
+                    self._save_text_index(output_path, entities=database.entities)
+                
                 self.log_stage_complete("database_writing",
                                       output_path=str(output_path),
                                       file_size=output_path.stat().st_size,
@@ -95,6 +102,53 @@ class DatabaseWriter(LoggerMixin):
                 raise
             raise DatabaseError(f"Failed to write database: {e}", {"output_path": str(output_path)})
     
+    def open_stream(self, output_path: Optional[Path] = None) -> 'DatabaseStream':
+        """
+        Start writing a database whose entities arrive in batches.
+        
+        Entities are written to a temporary file as they arrive; metadata and
+        speaker map follow when the stream is closed, and only then does the
+        file replace ``output_path``. Use as a context manager so a failure
+        discards the partial file and restores any backup.
+        
+        Args:
+            output_path: Optional custom output path
+            
+        Returns:
+            DatabaseStream accepting entity batches
+        """
+        output_path = Path(output_path) if output_path is not None else Path(self.config.output.database_path)
+        self.log_stage_start("database_writing", output_path=str(output_path), streaming=True)
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        backup_path = None
+        if output_path.exists() and self.config.output.backup_on_update:
+            backup_path = self._create_backup(output_path)
+            self.log_progress("Backup created", backup_path=str(backup_path))
+        
+        return DatabaseStream(self, output_path, backup_path)
+    
+    def _save_text_index(self, output_path: Path, entities: Optional[List[Entity]] = None,
+                         index: Optional[TextIndex] = None) -> None:
+        """
+        Write the text index next to a database: ``index`` as is, or the
+        saved index updated for ``entities``.
+        
+        The index is derived data: if it cannot be written, the stale file is
+        removed (readers rebuild the index from the entities) and the
+        database write still succeeds.
+        """
+        index_path = text_index_path(output_path)
+        try:
+            if index is None:
+                index = update_text_index(output_path, entities)
+            else:
+                index.save(index_path)
+            self.log_progress("Text index saved", index_path=str(index_path), indexed_words=len(index))
+        except Exception as e:
+            self.logger.warning("Failed to save text index", index_path=str(index_path), error=str(e))
+            index_path.unlink(missing_ok=True)
+    
     def _create_backup(self, file_path: Path) -> Path:
         """Create timestamped backup of existing file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -138,13 +192,127 @@ class DatabaseWriter(LoggerMixin):
                 if key not in data:
                     raise ValueError(f"Missing required key: {key}")
             
-            # Try to parse back to WordDatabase
-            WordDatabase.model_validate(data)
+            if not isinstance(data['entities'], list):
+                raise ValueError("entities is not a list")
+            
+            # Entities are checked as one batch and reported per rule; the
+            # rest of the database goes through WordDatabase as before
+            report = check_entity_records(data['entities'])
+            if not report.valid:
+                raise DatabaseError(f"Written file validation failed: {report.summary()}",
+                                    {"violations": report.violations,
+                                     "examples": report.examples})
+            WordDatabase.model_validate({**data, 'entities': []})
             
+        except DatabaseError:
+            raise
         except Exception as e:
             raise DatabaseError(f"Written file validation failed: {e}")
 
 
+class DatabaseStream:
+    """
+    A database file being written entity batch by entity batch.
+    
+    The file has the same keys as write_database output, with ``entities``
+    first so they can be written before the metadata (which records the
+    final entity count) is known.
+    """
+    
+    def __init__(self, writer: DatabaseWriter, output_path: Path, backup_path: Optional[Path]):
+        self.writer = writer
+        self.output_path = output_path
+        self.backup_path = backup_path
+        self.temp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+        self.entity_count = 0
+        
+        output = writer.config.output
+        # Built batch by batch alongside the file, saved next to it on close
+        self._text_index = TextIndex() if output.text_index else None
+        self._pretty = output.pretty_print
+        self._file = open(self.temp_path, 'w', encoding=output.encoding)
+        self._file.write('{\n  "entities": [' if self._pretty else '{"entities":[')
+    
+    def __enter__(self) -> 'DatabaseStream':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+    
+    def _dumps(self, value: Any, level: int) -> str:
+        """JSON for a value nested ``level`` levels deep, matching write_database formatting."""
+        if self._pretty:
+            text = json.dumps(value, indent=2, ensure_ascii=False, separators=(',', ': '))
+            return text.replace("\n", "\n" + "  " * level)
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    
+    def write_entities(self, entities: List[Entity]) -> None:
+        """Append a batch of entities to the file."""
+        for entity in entities:
+            separator = "," if self.entity_count else ""
+            if self._pretty:
+                separator += "\n    "
+            self._file.write(separator + self._dumps(entity.model_dump(), 2))
+            self.entity_count += 1
+        self._file.flush()
+        if self._text_index is not None:
+            self._text_index.add_entities(entities)
+    
+    def close(self, metadata: Dict[str, Any], speaker_map: Dict[int, SpeakerInfo]) -> Path:
+        """
+        Write metadata and speaker map and move the file into place.
+        
+        Metadata and speaker map are validated as a WordDatabase header before
+        writing; entities were validated as Entity objects when created, so
+        the file is not re-read (which would load every entity at once).
+        
+        Args:
+            metadata: Database metadata
+            speaker_map: Speaker ID to info mapping
+            
+        Returns:
+            Path to the written database file
+            
+        Raises:
+            DatabaseError: If the header is invalid or writing fails
+        """
+        try:
+            header = WordDatabase(metadata=metadata, speaker_map=speaker_map, entities=[]).model_dump()
+            if self._pretty:
+                self._file.write(("\n  ]" if self.entity_count else "]") +
+                                 ',\n  "metadata": ' + self._dumps(header["metadata"], 1) +
+                                 ',\n  "speaker_map": ' + self._dumps(header["speaker_map"], 1) + "\n}")
+            else:
+                self._file.write('],"metadata":' + self._dumps(header["metadata"], 0) +
+                                 ',"speaker_map":' + self._dumps(header["speaker_map"], 0) + "}")
+            self._file.close()
+            shutil.move(str(self.temp_path), str(self.output_path))
+        except Exception as e:
+            self.abort()
+            self.writer.log_stage_error("database_writing", e, output_path=str(self.output_path))
+            raise DatabaseError(f"Failed to write database: {e}", {"output_path": str(self.output_path)})
+        
+        if self._text_index is not None:
+            self.writer._save_text_index(self.output_path, index=self._text_index)
+        
+        self.writer.log_stage_complete("database_writing",
+                                     output_path=str(self.output_path),
+                                     file_size=self.output_path.stat().st_size,
+                                     entities_written=self.entity_count)
+        return self.output_path
+    
+    def abort(self) -> None:
+        """Discard the partial file and restore the backup, if any."""
+        if not self._file.closed:
+            self._file.close()
+        if self.temp_path.exists():
+            self.temp_path.unlink()
+        if self.backup_path and self.backup_path.exists():
+            shutil.move(str(self.backup_path), str(self.output_path))
+            self.writer.log_progress("Backup restored due to write failure")
+
+
 def write_database(database: WordDatabase, output_path: Path, config: Config) -> Path:
     """
     Convenience function for writing database.
@@ -6,13 +6,20 @@ interfaces established in the shared models and configuration system.
 """
 import os
 import time
-from typing import List, Optional, Tuple, Any
+import warnings
+from typing import List, Optional, Tuple, Any, Hashable, TYPE_CHECKING
 from pathlib import Path
 
+import numpy as np
+
 from ..shared.models import DiarizationResult, SpeakerSegment
 from ..shared.config import DiarizationConfig
 from ..shared.exceptions import PipelineError
 from ..shared.logging_config import LoggerMixin
+from .model_registry import get_model_registry
+
+if TYPE_CHECKING:
+    from .audio_processor import ProcessedAudio
 
 # Optional ML dependencies with graceful fallback
 try:
@@ -39,14 +46,23 @@ class DiarizationProcessor(LoggerMixin):
                         min_speakers=config.min_speakers,
                         max_speakers=config.max_speakers,
                         pyannote_available=PYANNOTE_AVAILABLE)
+    
+    @property
+    def model_key(self) -> Hashable:
+        """Registry key for the configured PyAnnote pipeline."""
+        return ("pyannote", self.config.model,
+                self.config.segmentation_threshold, self.config.clustering_threshold)
         
-    def process_audio(self, audio_path: str, audio_duration: float) -> DiarizationResult:
+    def process_audio(self, audio_path: str, audio_duration: float,
+                      audio: Optional["ProcessedAudio"] = None) -> DiarizationResult:
         """
         Process audio file for speaker diarization.
         
         Args:
             audio_path: Path to input audio file
             audio_duration: Duration of audio in seconds
+            audio: Already-decoded audio; when given, PyAnnote runs on this
+                buffer instead of decoding the file again
             
         Returns:
             DiarizationResult with speakers and segments
@@ -62,7 +78,7 @@ class DiarizationProcessor(LoggerMixin):
         
         try:
             # Validate inputs
-            if not Path(audio_path).exists():
+            if audio is None and not Path(audio_path).exists():
                 raise PipelineError(f"Audio file not found: {audio_path}")
             
             if audio_duration <= 0:
@@ -78,7 +94,7 @@ class DiarizationProcessor(LoggerMixin):
                 self._load_pipeline()
             
             # Perform diarization
-            diarization_result = self.pipeline(audio_path)
+            diarization_result = self.pipeline(self._pipeline_input(audio_path, audio))
             
             # Convert to our format
             segments = self._extract_segments(diarization_result, audio_duration)
@@ -116,28 +132,32 @@ class DiarizationProcessor(LoggerMixin):
             return self._create_single_speaker_fallback(audio_duration, processing_time)
         
     def _load_pipeline(self) -> None:
-        """Load PyAnnote diarization pipeline."""
+        """Load PyAnnote diarization pipeline (shared through the model registry)."""
         if not PYANNOTE_AVAILABLE:
             raise PipelineError(
                 "PyAnnote not available. Install with: pip install pyannote.audio torch"
             )
         
+        self.pipeline = get_model_registry().get_or_load(self.model_key, self._build_pipeline)
+    
+    def _build_pipeline(self) -> Any:
+        """Load and configure a PyAnnote pipeline from the pretrained model."""
         try:
             self.logger.info("Loading diarization pipeline", model=self.config.model)
             
             # Load the pipeline
             # Get HuggingFace token from environment variable
             hf_token = os.getenv('HF_TOKEN')
-            self.pipeline = Pipeline.from_pretrained(
+            pipeline = Pipeline.from_pretrained(
                 self.config.model,
                 use_auth_token=hf_token
             )
             
             # Configure parameters
-            if hasattr(self.pipeline, 'instantiate'):
+            if hasattr(pipeline, 'instantiate'):
                 try:
                     # Set speaker constraints - try with new API first
-                    self.pipeline.instantiate({
+                    pipeline.instantiate({
                         "clustering": {
                             "threshold": self.config.clustering_threshold
                         },
@@ -151,10 +171,30 @@ class DiarizationProcessor(LoggerMixin):
                     pass
             
             self.logger.info("Diarization pipeline loaded successfully")
+            return pipeline
             
         except Exception as e:
             raise PipelineError(f"Failed to load diarization pipeline: {e}")
+    
+    def _pipeline_input(self, audio_path: str, audio: Optional["ProcessedAudio"]) -> Any:
+        """
+        Build the PyAnnote input for a file.
         
+        Decoded audio is handed over as a {"waveform", "sample_rate"} mapping
+        whose (channel, time) tensor shares memory with the numpy buffer.
+        """
+        if audio is None or torch is None:
+            return audio_path
+        
+        data = np.asarray(audio.data, dtype=np.float32)  # No copy for float32 input
+        if data.ndim == 1:
+            data = data[np.newaxis, :]
+        with warnings.catch_warnings():
+            # Memory-mapped checkpoints are read-only; PyAnnote never writes to its input
+            warnings.filterwarnings("ignore", message=".*not writable.*")
+            waveform = torch.from_numpy(data)
+        return {"waveform": waveform, "sample_rate": audio.sample_rate}
+    
     def _extract_segments(self, diarization_output: Any, audio_duration: float) -> List[SpeakerSegment]:
         """Convert PyAnnote output to SpeakerSegment objects."""
         segments = []
@@ -310,7 +350,8 @@ def check_diarization_dependencies() -> Tuple[bool, Optional[str]]:
 
 def process_diarization(audio_path: str, 
                        audio_duration: float,
-                       config: Optional[DiarizationConfig] = None) -> DiarizationResult:
+                       config: Optional[DiarizationConfig] = None,
+                       audio: Optional["ProcessedAudio"] = None) -> DiarizationResult:
     """
     Convenience function for diarization processing.
     
@@ -318,6 +359,7 @@ def process_diarization(audio_path: str,
         audio_path: Path to audio file
         audio_duration: Audio duration in seconds
         config: Diarization configuration (uses defaults if None)
+        audio: Already-decoded audio to diarize instead of re-reading the file
         
     Returns:
         DiarizationResult object
@@ -326,4 +368,30 @@ def process_diarization(audio_path: str,
         config = DiarizationConfig()
     
     processor = DiarizationProcessor(config)
-    return processor.process_audio(audio_path, audio_duration)
\ No newline at end of file
+    return processor.process_audio(audio_path, audio_duration, audio=audio)
+
+
+def preload_diarization_pipeline(config: Optional[DiarizationConfig] = None) -> None:
+    """
+    Load the configured PyAnnote pipeline into the registry ahead of first use.
+    
+    Args:
+        config: Diarization configuration (uses defaults if None)
+        
+    Raises:
+        PipelineError: If PyAnnote is unavailable or the model cannot be loaded
+    """
+    DiarizationProcessor(config or DiarizationConfig())._load_pipeline()
+
+
+def release_diarization_pipeline(config: Optional[DiarizationConfig] = None) -> bool:
+    """
+    Drop the configured PyAnnote pipeline from the registry.
+    
+    Args:
+        config: Diarization configuration (uses defaults if None)
+        
+    Returns:
+        True if a loaded pipeline was released
+    """
+    return get_model_registry().release(DiarizationProcessor(config or DiarizationConfig()).model_key)
@@ -5,14 +5,21 @@ Converts Whisper transcription output to validated Entity objects with quality f
 based on confidence, duration, and syllable count. Handles speaker assignment and
 generates unique entity IDs for database storage.
 """
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterable, Iterator
 from datetime import datetime
 
+import numpy as np
+
 from ..shared.models import Entity, DiarizationResult, SpeakerSegment
 from ..shared.config import QualityConfig
 from ..shared.exceptions import EntityError
+from ..shared.entity_validation import check_entity_columns, construct_entities
 from ..shared.logging_config import LoggerMixin
 from .transcription import Word
+from .interval_index import IntervalIndex
+from .word_table import WordTable
+from .quality_filter import EntityColumns, evaluate_quality_filters
+from .speaker_identification import CompiledSpeakerMapping
 
 
 class EntityCreator(LoggerMixin):
@@ -21,21 +28,34 @@ class EntityCreator(LoggerMixin):
     def __init__(self, quality_config: QualityConfig):
         super().__init__()
         self.quality_config = quality_config
+        self._indexed_segments: Optional[List[SpeakerSegment]] = None
+        self._segment_index: Optional[IntervalIndex] = None
+        self._compiled_source: Optional[Union[Dict[str, str], List[Dict[str, Any]]]] = None
+        self._compiled_mapping: Optional[CompiledSpeakerMapping] = None
         
-    def create_entities(self, words: List[Word], 
+    def create_entities(self, words: Union[List[Word], WordTable], 
                        recording_id: str, 
                        recording_path: str,
-                       speaker_mapping: Optional[Dict[str, str]] = None,
-                       diarization_result: Optional[DiarizationResult] = None) -> List[Entity]:
+                       speaker_mapping: Optional[Union[Dict[str, str], List[Dict[str, Any]]]] = None,
+                       diarization_result: Optional[DiarizationResult] = None,
+                       start_index: int = 0) -> List[Entity]:
         """
         Create Entity objects from Whisper word transcription data.
         
+        Durations, speaker assignment, syllable counts and quality scores are
+        computed column-wise over a WordTable. The Entity constraints are then
+        checked once for the whole batch (see shared.entity_validation); words
+        violating them are skipped with one aggregate warning, and the rest
+        are built without per-object validation.
+        
         Args:
-            words: List of Word objects from Whisper
+            words: WordTable or list of Word objects from Whisper
             recording_id: Identifier for the source recording
             recording_path: Path to the source audio file
             speaker_mapping: Optional mapping of time ranges to speaker IDs (legacy support)
             diarization_result: Optional DiarizationResult with speaker segments
+            start_index: Number of words already converted for this recording
+                (keeps entity IDs unique when words arrive in batches)
             
         Returns:
             List of Entity objects
@@ -48,57 +68,77 @@ class EntityCreator(LoggerMixin):
                                word_count=len(words),
                                recording_id=recording_id)
             
-            entities = []
+            table, positions = self._as_table(words)
             current_time = datetime.now().isoformat()
             
-            for i, word_data in enumerate(words):
-                try:
-                    # Generate unique entity ID
-                    entity_id = f"word_{i+1:03d}"
-                    
-                    # Calculate duration
-                    start_time = float(word_data.start_time)
-                    end_time = float(word_data.end_time)
-                    duration = end_time - start_time
-                    
-                    # Determine speaker ID (prioritize diarization_result over legacy speaker_mapping)
-                    speaker_id = self._assign_speaker_id(start_time, end_time, diarization_result, speaker_mapping)
-                    
-                    # Basic syllable analysis (simple heuristic)
-                    text = word_data.text.strip()
-                    syllables = self._estimate_syllables(text)
-                    
-                    # Create entity
-                    entity = Entity(
-                        entity_id=entity_id,
-                        entity_type="word",
-                        text=text,
-                        start_time=start_time,
-                        end_time=end_time,
-                        duration=duration,
-                        confidence=float(word_data.confidence),
-                        probability=float(word_data.confidence),  # Use confidence for both
-                        syllables=syllables,
-                        syllable_count=len(syllables),
-                        phonetic=None,  # To be filled by future phonetic analysis
-                        quality_score=self._calculate_quality_score(word_data, duration, syllables),
-                        speaker_id=speaker_id,
-                        recording_id=recording_id,
-                        recording_path=recording_path,
-                        processed=False,
-                        clip_path=None,
-                        selection_reason=None,
-                        created_at=current_time
-                    )
-                    
-                    entities.append(entity)
-                    
-                except Exception as e:
-                    self.logger.warning("Failed to create entity for word", 
-                                      word_index=i, 
-                                      word_text=word_data.text if hasattr(word_data, 'text') else "",
-                                      error=str(e))
-                    continue
+            # Resolve speakers for all words in one indexed lookup
+            segment_speakers = self._assign_speakers_from_segments(table, diarization_result)
+            if segment_speakers is None and speaker_mapping:
+                segment_speakers = self._assign_speakers_from_mapping(table, speaker_mapping)
+            if segment_speakers is None:
+                segment_speakers = np.zeros(len(table), dtype=np.int64)
+            
+            texts = [text.strip() for text in table.texts()]
+            syllables = self._syllables_for(texts)
+            syllable_counts = np.array([len(s) for s in syllables], dtype=np.int64)
+            durations = table.durations
+            quality_scores = self._quality_scores(table.confidence, durations, syllable_counts)
+            
+            confidence = table.confidence
+            
+            # Check every Entity constraint over the whole batch at once, then
+            # build the valid rows without per-object validation
+            report = check_entity_columns({
+                "entity_type": ["word"] * len(table),
+                "start_time": table.start,
+                "end_time": table.end,
+                "duration": durations,
+                "confidence": confidence,
+                "probability": confidence,
+                "quality_score": quality_scores,
+                "syllable_count": syllable_counts,
+                "syllable_lengths": syllable_counts,
+                "speaker_id": segment_speakers,
+            })
+            if not report.valid:
+                self.logger.warning("Skipped words failing entity validation",
+                                  skipped=report.invalid_count,
+                                  violations=report.violations,
+                                  word_indices={rule: positions[rows].tolist()
+                                                for rule, rows in report.examples.items()})
+            
+            keep = ~report.invalid
+            columns = zip(positions[keep].tolist(), [t for t, k in zip(texts, keep) if k],
+                          [s for s, k in zip(syllables, keep) if k],
+                          table.start[keep].tolist(), table.end[keep].tolist(), durations[keep].tolist(),
+                          confidence[keep].tolist(), quality_scores[keep].tolist(),
+                          segment_speakers[keep].tolist())
+            
+            entities = construct_entities(
+                dict(
+                    entity_id=f"word_{start_index+i+1:03d}",
+                    entity_type="word",
+                    text=text,
+                    start_time=start_time,
+                    end_time=end_time,
+                    duration=duration,
+                    confidence=word_confidence,
+                    probability=word_confidence,  # Use confidence for both
+                    syllables=list(word_syllables),
+                    syllable_count=len(word_syllables),
+                    phonetic=None,  # To be filled by future phonetic analysis
+                    quality_score=score,
+                    speaker_id=speaker_id,
+                    recording_id=recording_id,
+                    recording_path=recording_path,
+                    processed=False,
+                    clip_path=None,
+                    selection_reason=None,
+                    created_at=current_time
+                )
+                for i, text, word_syllables, start_time, end_time, duration, word_confidence, score, speaker_id
+                in columns
+            )
                     
             self.log_stage_complete("entity_creation", 
                                   entities_created=len(entities),
@@ -109,11 +149,78 @@ class EntityCreator(LoggerMixin):
         except Exception as e:
             self.log_stage_error("entity_creation", e)
             raise EntityError(f"Failed to create entities: {e}")
+    
+    def _as_table(self, words: Union[List[Word], WordTable]):
+        """
+        Columnar view of the input words.
+        
+        Returns:
+            Tuple of (WordTable, original position of each row); words whose
+            times or confidence cannot be read are logged and left out
+        """
+        if isinstance(words, WordTable):
+            return words, np.arange(len(words))
+        try:
+            return WordTable.from_words(words), np.arange(len(words))
+        except (TypeError, ValueError, AttributeError):
+            pass
+        
+        readable, positions = [], []
+        for i, word in enumerate(words):
+            try:
+                readable.append(Word(text=word.text, start_time=float(word.start_time),
+                                     end_time=float(word.end_time), confidence=float(word.confidence)))
+                positions.append(i)
+            except (TypeError, ValueError, AttributeError) as e:
+                self.logger.warning("Failed to create entity for word", 
+                                  word_index=i, 
+                                  word_text=getattr(word, 'text', ""),
+                                  error=str(e))
+        return WordTable.from_words(readable), np.array(positions, dtype=np.int64)
+    
+    def _syllables_for(self, texts: List[str]) -> List[List[str]]:
+        """Syllables of each text, estimated once per distinct word."""
+        estimates: Dict[str, List[str]] = {}
+        for text in texts:
+            if text not in estimates:
+                estimates[text] = self._estimate_syllables(text)
+        return [estimates[text] for text in texts]
+    
+    def iter_entities(self, word_batches: Iterable[List[Word]],
+                      recording_id: str,
+                      recording_path: str,
+                      speaker_mapping: Optional[Union[Dict[str, str], List[Dict[str, Any]]]] = None,
+                      diarization_result: Optional[DiarizationResult] = None) -> Iterator[List[Entity]]:
+        """
+        Create entities batch by batch as transcribed words arrive.
+        
+        Entity IDs continue across batches, so the concatenated output matches
+        create_entities on the full word list.
+        
+        Args:
+            word_batches: Iterable of Word lists (e.g. TranscriptionEngine.iter_transcription)
+            recording_id: Identifier for the source recording
+            recording_path: Path to the source audio file
+            speaker_mapping: Optional mapping of time ranges to speaker IDs (legacy support)
+            diarization_result: Optional DiarizationResult with speaker segments
             
+        Yields:
+            List of Entity objects per word batch
+        """
+        word_count = 0
+        for words in word_batches:
+            yield self.create_entities(words, recording_id, recording_path,
+                                       speaker_mapping, diarization_result,
+                                       start_index=word_count)
+            word_count += len(words)
+    
     def apply_quality_filters(self, entities: List[Entity]) -> List[Entity]:
         """
         Apply quality filtering based on configuration.
         
+        Rules are evaluated as masks over entity columns (see quality_filter);
+        the number of entities each rule rejected is logged.
+        
         Args:
             entities: List of Entity objects to filter
             
@@ -125,39 +232,17 @@ class EntityCreator(LoggerMixin):
                                total_entities=len(entities))
             
             original_count = len(entities)
-            filtered_entities = []
+            result = evaluate_quality_filters(EntityColumns.from_entities(entities), self.quality_config)
+            filtered_entities = result.select(entities)
             
-            for entity in entities:
-                # Confidence filter
-                if entity.confidence < self.quality_config.min_confidence:
-                    continue
-                    
-                # Duration filters
-                if entity.duration < self.quality_config.min_word_duration:
-                    continue
-                if entity.duration > self.quality_config.max_word_duration:
-                    continue
-                    
-                # Syllable count filter (allow common short words like "tal")
-                min_syl, max_syl = self.quality_config.syllable_range
-                if not (min_syl <= entity.syllable_count <= max_syl):
-                    # Special exception for common Spanish words that are useful even if short
-                    if entity.text.lower() not in ["tal", "que", "con", "por", "sin", "son"]:
-                        continue
-                    
-                # Text validation
-                if not entity.text or len(entity.text.strip()) == 0:
-                    continue
-                    
-                filtered_entities.append(entity)
-                
             filtered_count = len(filtered_entities)
             pass_rate = (filtered_count / original_count * 100) if original_count > 0 else 0
             
             self.log_stage_complete("quality_filtering",
                                   original_count=original_count,
                                   filtered_count=filtered_count,
-                                  pass_rate=f"{pass_rate:.1f}%")
+                                  pass_rate=f"{pass_rate:.1f}%",
+                                  rejections=result.rejections)
             
             return filtered_entities
             
@@ -171,6 +256,8 @@ class EntityCreator(LoggerMixin):
         """
         Assign speaker ID based on temporal overlap with diarization segments.
         
+        Single-word form of the column-wise assignment in create_entities.
+        
         Args:
             start_time: Word start time in seconds
             end_time: Word end time in seconds  
@@ -180,75 +267,56 @@ class EntityCreator(LoggerMixin):
         Returns:
             Speaker ID (integer, starting from 0)
         """
-        # Prioritize diarization_result if available
-        if diarization_result and diarization_result.segments:
-            return self._assign_speaker_from_segments(start_time, end_time, diarization_result.segments)
+        word = WordTable.from_columns([""], [start_time], [end_time], [0.0])
+        speaker_ids = self._assign_speakers_from_segments(word, diarization_result)
+        if speaker_ids is None and speaker_mapping:
+            speaker_ids = self._assign_speakers_from_mapping(word, speaker_mapping)
+        return int(speaker_ids[0]) if speaker_ids is not None else 0
+    
+    def _assign_speakers_from_segments(self, words: WordTable,
+                                       diarization_result: Optional[DiarizationResult]) -> Optional[np.ndarray]:
+        """
+        Vectorized speaker assignment for all word centres.
         
-        # Fallback to legacy speaker_mapping for backward compatibility
-        if speaker_mapping:
-            return self._assign_speaker_from_mapping(start_time, end_time, speaker_mapping)
+        Each word goes to the segment containing its centre, or the closest
+        segment if none does (the algorithm from HANDOFF-2). Lookups go
+        through an IntervalIndex built once per segment list.
         
-        # Default fallback
-        return 0
+        Returns:
+            Array of speaker IDs aligned with words, or None when there are no
+            diarization segments
+        """
+        if not diarization_result or not diarization_result.segments:
+            return None
+        segments = diarization_result.segments
+        speaker_ids = np.array([seg.speaker_id for seg in segments], dtype=np.int64)
+        return speaker_ids[self._index_for(segments).lookup(words.centres)]
     
-    def _assign_speaker_from_segments(self, start_time: float, end_time: float, 
-                                     segments: List[SpeakerSegment]) -> int:
+    def _index_for(self, segments: List[SpeakerSegment]) -> IntervalIndex:
+        """Interval index for a segment list, built once and reused."""
+        if self._indexed_segments is not segments or self._segment_index is None:
+            self._segment_index = IntervalIndex.from_segments(segments)
+            self._indexed_segments = segments
+        return self._segment_index
+    
+    def _assign_speakers_from_mapping(self, words: WordTable,
+                                      speaker_mapping: Union[Dict[str, str], List[Dict[str, Any]]]) -> np.ndarray:
         """
-        Assign speaker ID using temporal overlap with diarization segments.
+        Vectorized legacy speaker assignment using a time range mapping.
         
-        Implements the algorithm from HANDOFF-2:
-        1. Calculate word center time: (start_time + end_time) / 2
-        2. Find segment that contains the word center
-        3. If no segment contains center, use closest segment
-        4. If no segments exist, return 0
+        Returns:
+            Array of speaker IDs aligned with words (0 outside every range)
         """
-        if not segments:
-            return 0
-        
-        word_center = (start_time + end_time) / 2
-        
-        # First pass: find segment that contains the word center
-        for segment in segments:
-            if segment.start_time <= word_center <= segment.end_time:
-                return segment.speaker_id
-        
-        # Second pass: if no containing segment, find closest segment
-        closest_segment = None
-        min_distance = float('inf')
-        
-        for segment in segments:
-            # Calculate distance from word center to segment
-            if word_center < segment.start_time:
-                distance = segment.start_time - word_center
-            elif word_center > segment.end_time:
-                distance = word_center - segment.end_time
-            else:
-                # This should not happen (covered in first pass), but handle it
-                return segment.speaker_id
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_segment = segment
-        
-        return closest_segment.speaker_id if closest_segment else 0
+        compiled = self._mapping_for(speaker_mapping)
+        speaker_ids = np.array(compiled.speaker_ids + [0], dtype=np.int64)  # -1 selects the default
+        return speaker_ids[compiled.lookup(words.centres)]
     
-    def _assign_speaker_from_mapping(self, start_time: float, end_time: float,
-                                   speaker_mapping: Dict[str, str]) -> int:
-        """Legacy speaker assignment using time range mapping."""
-        word_center = (start_time + end_time) / 2
-        for time_range, speaker_id in speaker_mapping.items():
-            # Parse time range format "start-end"
-            try:
-                range_start, range_end = map(float, time_range.split("-"))
-                if range_start <= word_center <= range_end:
-                    # Convert speaker_id to integer (handle both "speaker_0" and "0" formats)
-                    if isinstance(speaker_id, str) and speaker_id.startswith("speaker_"):
-                        return int(speaker_id.replace("speaker_", ""))
-                    return int(speaker_id)
-            except (ValueError, AttributeError):
-                continue
-                
-        return 0  # Default fallback
+    def _mapping_for(self, speaker_mapping: Union[Dict[str, str], List[Dict[str, Any]]]) -> CompiledSpeakerMapping:
+        """Compiled form of a speaker mapping, built once and reused."""
+        if self._compiled_source is not speaker_mapping or self._compiled_mapping is None:
+            self._compiled_mapping = CompiledSpeakerMapping.from_mapping(speaker_mapping, integer_ids=True)
+            self._compiled_source = speaker_mapping
+        return self._compiled_mapping
         
     def _estimate_syllables(self, text: str) -> List[str]:
         """
@@ -310,30 +378,26 @@ class EntityCreator(LoggerMixin):
                                 duration: float, 
                                 syllables: List[str]) -> float:
         """Calculate overall quality score for a word."""
-        confidence = float(word_data.confidence)
-        
+        return float(self._quality_scores(np.array([float(word_data.confidence)]),
+                                          np.array([duration]),
+                                          np.array([len(syllables)]))[0])
+    
+    def _quality_scores(self, confidence: np.ndarray, durations: np.ndarray,
+                        syllable_counts: np.ndarray) -> np.ndarray:
+        """Quality scores for whole columns of words."""
         # Duration score (prefer medium durations)
-        duration_score = 1.0
-        if duration < 0.2:
-            duration_score = 0.5
-        elif duration > 2.0:
-            duration_score = 0.7
-            
+        duration_score = np.where(durations < 0.2, 0.5, np.where(durations > 2.0, 0.7, 1.0))
+        
         # Syllable score (prefer 2-4 syllables)
-        syllable_score = 1.0
-        syllable_count = len(syllables)
-        if syllable_count == 1:
-            syllable_score = 0.6
-        elif syllable_count > 5:
-            syllable_score = 0.8
-            
+        syllable_score = np.where(syllable_counts == 1, 0.6, np.where(syllable_counts > 5, 0.8, 1.0))
+        
         # Weighted average
-        quality_score = (confidence * 0.6 + duration_score * 0.2 + syllable_score * 0.2)
+        quality_score = confidence * 0.6 + duration_score * 0.2 + syllable_score * 0.2
         
-        return min(1.0, max(0.0, quality_score))
+        return np.clip(quality_score, 0.0, 1.0)
 
 
-def create_entities(words: Union[List[Word], List[Dict[str, Any]]], 
+def create_entities(words: Union[List[Word], List[Dict[str, Any]], WordTable], 
                    speaker_mapping: Optional[Dict[str, str]], 
                    recording_id: str,
                    recording_path: str = "unknown.wav",
@@ -343,7 +407,7 @@ def create_entities(words: Union[List[Word], List[Dict[str, Any]]],
     Convenience function for creating entities.
     
     Args:
-        words: Whisper transcription Word objects or dictionaries
+        words: Whisper transcription Word objects, dictionaries or a WordTable
         speaker_mapping: Optional speaker mapping (legacy support)
         recording_id: Recording identifier
         recording_path: Path to audio file
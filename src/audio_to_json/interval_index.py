@@ -0,0 +1,167 @@
+"""
+Sorted, array-backed index over closed time intervals.
+
+Answers "which interval contains t" and "which interval is nearest to t" with
+np.searchsorted instead of scanning every interval, for one point or a whole
+array of points at once. Results match a linear scan over the intervals in
+their original order: among several containing intervals the earliest listed
+wins, and ties in distance go to the earliest listed interval.
+"""
+import heapq
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from ..shared.models import SpeakerSegment
+
+
+class IntervalIndex:
+    """Immutable index over closed intervals [start, end]."""
+
+    def __init__(self, starts: Sequence[float], ends: Sequence[float]):
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        if self.starts.shape != self.ends.shape or self.starts.ndim != 1:
+            raise ValueError("starts and ends must be 1-D arrays of equal length")
+
+        order = np.arange(len(self.starts))
+
+        # Containment: split the timeline at every boundary into alternating
+        # point slots (2k) and open-gap slots (2k+1), then assign each slot
+        # the earliest listed interval covering it
+        self._points = np.unique(np.concatenate([self.starts, self.ends]))
+        self._slots = np.full(max(2 * len(self._points) - 1, 0), -1, dtype=np.int64)
+        first_slot = 2 * np.searchsorted(self._points, self.starts)
+        last_slot = 2 * np.searchsorted(self._points, self.ends)
+        self._fill_slots(first_slot, last_slot)
+
+        # Nearest: intervals by start (ties: earliest listed first) and by end
+        # (ties: earliest listed last, so "last end < t" picks it)
+        self._by_start = np.lexsort((order, self.starts))
+        self._sorted_starts = self.starts[self._by_start]
+        self._by_end = np.lexsort((-order, self.ends))
+        self._sorted_ends = self.ends[self._by_end]
+
+    def _fill_slots(self, first_slot: np.ndarray, last_slot: np.ndarray) -> None:
+        """
+        Sweep the slots left to right with a heap of the open intervals.
+
+        The winner only changes where an interval opens or closes, so each
+        run between two such boundaries is filled with one slice; long or
+        nested intervals cost O(log n) each rather than their slot count.
+        """
+        valid = np.flatnonzero(last_slot >= first_slot)
+        opening = valid[np.lexsort((valid, first_slot[valid]))].tolist()
+        first, last = first_slot.tolist(), last_slot.tolist()
+        boundaries = np.unique(np.concatenate([first_slot[valid], last_slot[valid] + 1])).tolist()
+
+        open_intervals: List[int] = []
+        next_opening = 0
+        for k, slot in enumerate(boundaries):
+            while next_opening < len(opening) and first[opening[next_opening]] == slot:
+                heapq.heappush(open_intervals, opening[next_opening])
+                next_opening += 1
+            while open_intervals and last[open_intervals[0]] < slot:
+                heapq.heappop(open_intervals)
+            if open_intervals and k + 1 < len(boundaries):
+                self._slots[slot:boundaries[k + 1]] = open_intervals[0]
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[SpeakerSegment]) -> "IntervalIndex":
+        """Build an index over diarization segments (positions follow list order)."""
+        segments = list(segments)
+        return cls([s.start_time for s in segments], [s.end_time for s in segments])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def containing(self, points) -> np.ndarray:
+        """
+        Find the earliest listed interval containing each point.
+
+        Args:
+            points: Scalar or array of times
+
+        Returns:
+            Array of interval positions, -1 where no interval contains the point
+        """
+        points = np.atleast_1d(np.asarray(points, dtype=np.float64))
+        result = np.full(points.shape, -1, dtype=np.int64)
+        if len(self._points) == 0:
+            return result
+
+        k = np.searchsorted(self._points, points, side='left')
+        in_range = k < len(self._points)
+        on_point = in_range & (self._points[np.minimum(k, len(self._points) - 1)] == points)
+        in_gap = in_range & ~on_point & (k > 0)
+
+        result[on_point] = self._slots[2 * k[on_point]]
+        result[in_gap] = self._slots[2 * k[in_gap] - 1]
+        return result
+
+    def nearest(self, points) -> np.ndarray:
+        """
+        Find the closest interval to each point not contained in any interval.
+
+        Distance is measured to the nearer edge; ties go to the earliest listed
+        interval.
+
+        Args:
+            points: Scalar or array of times
+
+        Returns:
+            Array of interval positions, -1 if the index is empty
+        """
+        points = np.atleast_1d(np.asarray(points, dtype=np.float64))
+        n = len(self.starts)
+        if n == 0:
+            return np.full(points.shape, -1, dtype=np.int64)
+
+        # First interval starting after the point
+        after_pos = np.searchsorted(self._sorted_starts, points, side='right')
+        has_after = after_pos < n
+        after = self._by_start[np.minimum(after_pos, n - 1)]
+        after_dist = np.where(has_after, self.starts[after] - points, np.inf)
+
+        # Last interval ending before the point
+        before_pos = np.searchsorted(self._sorted_ends, points, side='left') - 1
+        has_before = before_pos >= 0
+        before = self._by_end[np.maximum(before_pos, 0)]
+        before_dist = np.where(has_before, points - self.ends[before], np.inf)
+
+        pick_after = (after_dist < before_dist) | ((after_dist == before_dist) & (after < before))
+        return np.where(pick_after, after, before).astype(np.int64)
+
+    def lookup(self, points) -> np.ndarray:
+        """
+        Containing interval for each point, falling back to the nearest one.
+
+        Args:
+            points: Scalar or array of times
+
+        Returns:
+            Array of interval positions, -1 only if the index is empty
+        """
+        result = self.containing(points)
+        missing = result < 0
+        if missing.any() and len(self):
+            result[missing] = self.nearest(np.atleast_1d(np.asarray(points, dtype=np.float64))[missing])
+        return result
+
+
+def assign_speakers(segments: List[SpeakerSegment], centres) -> np.ndarray:
+    """
+    Vectorized speaker lookup for many time points.
+
+    Args:
+        segments: Diarization segments
+        centres: Array of word centre times
+
+    Returns:
+        Array of speaker IDs (0 when there are no segments)
+    """
+    centres = np.atleast_1d(np.asarray(centres, dtype=np.float64))
+    if not segments:
+        return np.zeros(centres.shape, dtype=np.int64)
+    speaker_ids = np.array([s.speaker_id for s in segments], dtype=np.int64)
+    return speaker_ids[IntervalIndex.from_segments(segments).lookup(centres)]
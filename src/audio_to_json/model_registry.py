@@ -0,0 +1,257 @@
+"""
+Process-wide registry for loaded ML models.
+
+Keeps expensive models (Whisper, PyAnnote) resident between pipeline runs so a
+batch of files pays the load cost once. Models are keyed by a hashable tuple
+(e.g. model name, device and precision), loaded lazily through a caller-supplied
+loader, and released on an LRU basis when the model count or memory budget is
+exceeded. Counts are capped per model family (the first element of a tuple
+key, e.g. "whisper" or "pyannote"), so loading a diarization pipeline never
+evicts a Whisper model. Safe to use from multiple threads.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
+
+from ..shared.logging_config import LoggerMixin
+
+
+# Attribute levels searched for torch modules inside non-module models
+# (e.g. a PyAnnote pipeline holding segmentation and embedding models)
+_MODULE_SEARCH_DEPTH = 3
+
+
+def _find_modules(obj: Any, depth: int, seen: Set[int]) -> List[Any]:
+    """Torch modules reachable from ``obj`` through instance attributes."""
+    if id(obj) in seen:
+        return []
+    seen.add(id(obj))
+    if callable(getattr(obj, "parameters", None)):
+        return [obj]
+    if depth == 0:
+        return []
+    try:
+        attributes = vars(obj)
+    except TypeError:
+        return []
+    modules = []
+    for value in list(attributes.values()):
+        modules.extend(_find_modules(value, depth - 1, seen))
+    return modules
+
+
+def _module_bytes(module: Any, seen: Set[int]) -> int:
+    """Bytes of a module's parameters and buffers not already counted in ``seen``."""
+    total = 0
+    tensors = list(module.parameters())
+    if hasattr(module, "buffers"):
+        tensors.extend(module.buffers())
+    if hasattr(module, "modules"):
+        # Dynamically quantized layers keep int8 weights in packed params
+        tensors.extend(child.weight() for child in module.modules()
+                       if hasattr(child, "_packed_params") and callable(getattr(child, "weight", None)))
+    for tensor in tensors:
+        if id(tensor) not in seen:
+            seen.add(id(tensor))
+            total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """
+    Estimate the resident size of a model from its parameters and buffers.
+
+    Works for torch modules (including dynamically quantized ones) and for
+    objects holding torch modules in their attributes, such as Whisper
+    wrappers or PyAnnote pipelines.
+    Returns 0 when the size cannot be determined.
+    """
+    try:
+        seen: Set[int] = set()
+        return int(sum(_module_bytes(module, seen)
+                       for module in _find_modules(model, _MODULE_SEARCH_DEPTH, set())))
+    except Exception:
+        return 0
+
+
+def model_family(key: Hashable) -> Optional[Hashable]:
+    """Family a registry key belongs to: the first element of a tuple key."""
+    return key[0] if isinstance(key, tuple) and key else None
+
+
+class _Unset:
+    """Marker for configure() arguments that were not passed."""
+
+
+_UNSET = _Unset()
+
+
+class _RegistryEntry:
+    """A loaded model and its estimated memory footprint."""
+
+    def __init__(self, model: Any, size_bytes: int):
+        self.model = model
+        self.size_bytes = size_bytes
+
+
+class ModelRegistry(LoggerMixin):
+    """
+    Thread-safe LRU cache of loaded models.
+
+    Args:
+        max_models: Models kept per family unless ``family_limits`` says otherwise
+        memory_budget_bytes: Optional limit on the estimated size of all models
+        family_limits: Family -> models kept for that family
+    """
+
+    def __init__(self, max_models: int = 2, memory_budget_bytes: Optional[int] = None,
+                 family_limits: Optional[Dict[Hashable, int]] = None):
+        super().__init__()
+        self.max_models = max_models
+        self.memory_budget_bytes = memory_budget_bytes
+        self.family_limits: Dict[Hashable, int] = dict(family_limits or {})
+        self._entries: "OrderedDict[Hashable, _RegistryEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_models: Optional[int] = None,
+                  memory_budget_bytes: Any = _UNSET,
+                  family_limits: Optional[Dict[Hashable, int]] = None) -> None:
+        """
+        Update capacity limits and evict anything that no longer fits.
+
+        Arguments left out keep their current value; ``memory_budget_bytes=None``
+        removes the memory budget. ``family_limits`` entries are merged into
+        the existing ones.
+        """
+        with self._lock:
+            if max_models is not None:
+                self.max_models = max_models
+            if memory_budget_bytes is not _UNSET:
+                self.memory_budget_bytes = memory_budget_bytes
+            if family_limits:
+                self.family_limits.update(family_limits)
+            self._evict()
+
+    def family_limit(self, family: Optional[Hashable]) -> int:
+        """Models kept for a family."""
+        return self.family_limits.get(family, self.max_models)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the model for ``key``, loading it with ``loader`` on a miss.
+
+        Concurrent requests for the same key share a single load; loads for
+        different keys proceed in parallel.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.model
+                self.misses += 1
+
+            self.log_progress("Loading model into registry", key=str(key))
+            try:
+                model = loader()
+                size_bytes = estimate_model_bytes(model)
+
+                with self._lock:
+                    self._entries[key] = _RegistryEntry(model, size_bytes)
+                    self._entries.move_to_end(key)
+                    self._evict(keep=key)
+            finally:
+                # Dropped on failure too, so a failed load does not leave a lock behind
+                with self._lock:
+                    self._load_locks.pop(key, None)
+
+            self.log_progress("Model registered", key=str(key), size_mb=round(size_bytes / 1e6, 1))
+            return model
+
+    def preload(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Load a model ahead of time (e.g. at process startup)."""
+        return self.get_or_load(key, loader)
+
+    def release(self, key: Hashable) -> bool:
+        """Drop a model from the registry. Returns True if it was loaded."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all models and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def keys(self) -> List[Hashable]:
+        """Keys of loaded models, least recently used first."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated memory held by all loaded models."""
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self, keep: Optional[Hashable] = None) -> None:
+        """Evict least recently used models until limits are respected."""
+        families: Dict[Optional[Hashable], List[Hashable]] = {}
+        for key in self._entries:
+            families.setdefault(model_family(key), []).append(key)
+        for family, keys in families.items():
+            excess = len(keys) - self.family_limit(family)
+            for victim in [k for k in keys if k != keep][:max(excess, 0)]:
+                self._evict_key(victim)
+
+        while self.memory_budget_bytes is not None and self._entries:
+            if sum(e.size_bytes for e in self._entries.values()) <= self.memory_budget_bytes:
+                break
+            victim = next((k for k in self._entries if k != keep), None)
+            if victim is None:
+                # Only the model just loaded remains; keep it even if over budget
+                break
+            self._evict_key(victim)
+
+    def _evict_key(self, key: Hashable) -> None:
+        self._entries.pop(key)
+        self.evictions += 1
+        self.log_progress("Model evicted from registry", key=str(key))
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
@@ -5,21 +5,44 @@ Coordinates all stages of the pipeline from audio file to complete JSON database
 Provides resumability, error handling, and smart buffering for Colombian Spanish.
 Implements the core workflow: Audio → Transcription → Entities → Database.
 """
+import multiprocessing
+import os
 import time
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 
-from ..shared.config import Config
-from ..shared.models import WordDatabase, SpeakerInfo, DiarizationResult, Entity
+import numpy as np
+
+from ..shared.config import Config, DiarizationConfig
+from ..shared.models import (
+    WordDatabase, SpeakerInfo, DiarizationResult, Entity, BatchFileResult, BatchSummary
+)
 from ..shared.exceptions import PipelineError
 from ..shared.logging_config import LoggerMixin
+from ..shared.fingerprint import file_fingerprint
+
+from .audio_processor import ProcessedAudio, process_audio
+from .transcription import (
+    transcribe_audio, transcribe_table, transcribe_stream, preload_whisper_model, release_whisper_model,
+    whisper_model_keys, shutdown_chunk_pools
+)
+from .entity_creation import EntityCreator, create_entities, apply_quality_filters
+from .database_writer import DatabaseWriter, write_database
+from .diarization import (
+    process_diarization, check_diarization_dependencies,
+    preload_diarization_pipeline, release_diarization_pipeline
+)
+from .model_registry import get_model_registry, model_family
+from .batch import resolve_batch_inputs, batch_output_paths, longest_first
+from .checkpoints import CheckpointStore, StageKeys
+from .vad import SpeechRegionMap, detect_speech
+
 
-from .audio_processor import process_audio
-from .transcription import transcribe_audio
-from .entity_creation import create_entities, apply_quality_filters
-from .database_writer import write_database
-from .diarization import process_diarization, check_diarization_dependencies
+# Pipeline stages in execution order; resuming from a stage reuses checkpoints of earlier ones
+STAGE_ORDER = ["audio", "transcription", "entities", "database"]
 
 
 class AudioToJsonPipeline(LoggerMixin):
@@ -28,6 +51,48 @@ class AudioToJsonPipeline(LoggerMixin):
     def __init__(self, config: Config):
         super().__init__()
         self.config = config
+        self._configure_model_registry()
+    
+    def _configure_model_registry(self) -> None:
+        """
+        Apply model cache limits from configuration to the shared registry.
+        
+        ``max_loaded_models`` caps the Whisper family only, raised if needed
+        so the model and cascade model both stay resident; diarization and
+        VAD models are capped separately under their own families.
+        """
+        whisper_config = self.config.whisper
+        budget_mb = whisper_config.model_memory_budget_mb
+        whisper_keys = whisper_model_keys(whisper_config)
+        get_model_registry().configure(
+            memory_budget_bytes=budget_mb * 1024 * 1024 if budget_mb else None,
+            family_limits={model_family(whisper_keys[0]):
+                           max(whisper_config.max_loaded_models, len(whisper_keys))}
+        )
+    
+    def preload_models(self) -> None:
+        """
+        Load the models this pipeline needs before the first file is processed.
+        
+        Models are held in the process-wide registry, so every pipeline run in
+        this process reuses them instead of reloading from disk.
+        """
+        self.log_progress("Preloading models", whisper_model=self.config.whisper.model)
+        preload_whisper_model(self.config.whisper)
+        
+        if self._diarization_enabled():
+            available, error = check_diarization_dependencies()
+            if available:
+                preload_diarization_pipeline(self._diarization_config())
+            else:
+                self.logger.warning("Diarization dependencies not available, skipping preload",
+                                  reason=error)
+    
+    def release_models(self) -> None:
+        """Drop this pipeline's models from the process-wide registry and chunk workers."""
+        release_whisper_model(self.config.whisper)
+        shutdown_chunk_pools()
+        release_diarization_pipeline(self._diarization_config())
         
     def process_audio_to_json(self, 
                              audio_path: str, 
@@ -41,7 +106,11 @@ class AudioToJsonPipeline(LoggerMixin):
             audio_path: Path to input audio file
             output_path: Optional output path for JSON file
             speaker_mapping: Optional speaker time mapping
-            resume_from_stage: Optional stage to resume from
+            resume_from_stage: Optional stage to resume from ("transcription",
+                "entities" or "database"). Earlier stages are restored from
+                checkpoints in ``processing.checkpoint_dir`` and recomputed if no
+                valid checkpoint exists. With ``processing.checkpoints`` enabled
+                and no resume stage, all valid checkpoints are reused.
             
         Returns:
             WordDatabase object with all processed entities
@@ -58,34 +127,47 @@ class AudioToJsonPipeline(LoggerMixin):
                                output_path=output_path,
                                resume_from=resume_from_stage)
             
+            if resume_from_stage is not None and resume_from_stage not in STAGE_ORDER[1:]:
+                raise PipelineError(f"Unknown resume stage: {resume_from_stage}",
+                                    {"valid_stages": STAGE_ORDER[1:]})
+            
+            # An explicit resume stage forces that stage and later ones to re-run;
+            # otherwise every valid checkpoint is reused
+            store = self._checkpoint_store(resume_from_stage)
+            if resume_from_stage:
+                resume_index = STAGE_ORDER.index(resume_from_stage)
+            else:
+                resume_index = len(STAGE_ORDER) - 1 if store else 0
+            # The file is hashed at most once per run, for checkpoints and caches alike
+            content_hash = self._content_hash(audio_path, store)
+            keys = store.stage_keys(audio_path, self.config, speaker_mapping, content_hash) if store else None
+            
+            def reuse(stage: str) -> bool:
+                return store is not None and resume_index > STAGE_ORDER.index(stage)
+            
             # Stage 1: Audio Processing
-            if resume_from_stage not in ["transcription", "entities", "database"]:
+            processed_audio = store.load_audio(keys.audio) if reuse("audio") else None
+            if processed_audio is not None:
+                self.log_progress("Stage 1 restored from checkpoint", duration=processed_audio.duration)
+            else:
                 self.log_progress("Starting Stage 1: Audio Processing")
-                processed_audio = process_audio(audio_path, self.config)
+                processed_audio = process_audio(audio_path, self.config, content_hash)
+                self._save_checkpoint(store, "audio", keys, processed_audio)
                 self.log_progress("Stage 1 complete", 
                                 duration=processed_audio.duration,
                                 sample_rate=processed_audio.sample_rate)
-            else:
-                # For resume functionality (future implementation)
-                raise NotImplementedError("Resume functionality not yet implemented")
-            
-            # Stage 2: Transcription
-            if resume_from_stage not in ["entities", "database"]:
-                self.log_progress("Starting Stage 2: Transcription")
-                words = transcribe_audio(processed_audio, self.config.whisper)
-                self.log_progress("Stage 2 complete", 
-                                word_count=len(words),
-                                avg_confidence=sum(w.confidence for w in words) / len(words) if words else 0.0)
-            else:
-                raise NotImplementedError("Resume functionality not yet implemented")
             
-            # Stage 2.5: Speaker Diarization (conditional)
-            diarization_result = None
-            if resume_from_stage not in ["entities", "database"]:
-                diarization_result = self._process_diarization(audio_path, processed_audio.duration)
-            
-            # Stage 3: Entity Creation
-            if resume_from_stage not in ["database"]:
+            # Raw entities make stages 2-3 unnecessary when resuming at the database stage
+            entities = store.load_entities(keys.entities) if reuse("entities") else None
+            if entities is not None:
+                self.log_progress("Stage 3 restored from checkpoint", original_entities=len(entities))
+            else:
+                # Stage 2 / 2.5: Transcription and Speaker Diarization
+                words, diarization_result = self._transcribe_and_diarize(
+                    audio_path, processed_audio, store, keys, reuse("transcription")
+                )
+                
+                # Stage 3: Entity Creation
                 self.log_progress("Starting Stage 3: Entity Creation")
                 recording_id = self._generate_recording_id(audio_file)
                 entities = create_entities(
@@ -96,14 +178,13 @@ class AudioToJsonPipeline(LoggerMixin):
                     self.config.quality,
                     diarization_result
                 )
-                
-                # Apply quality filtering
-                filtered_entities = apply_quality_filters(entities, self.config.quality)
-                self.log_progress("Stage 3 complete",
-                                original_entities=len(entities), 
-                                filtered_entities=len(filtered_entities))
-            else:
-                raise NotImplementedError("Resume functionality not yet implemented")
+                self._save_checkpoint(store, "entities", keys, entities)
+            
+            # Apply quality filtering
+            filtered_entities = apply_quality_filters(entities, self.config.quality)
+            self.log_progress("Stage 3 complete",
+                            original_entities=len(entities), 
+                            filtered_entities=len(filtered_entities))
             
             # Stage 4: Database Creation
             self.log_progress("Starting Stage 4: Database Creation")
@@ -129,10 +210,325 @@ class AudioToJsonPipeline(LoggerMixin):
             
         except Exception as e:
             self.log_stage_error("full_pipeline", e, audio_file=audio_path)
-            if isinstance(e, (PipelineError, NotImplementedError)):
+            if isinstance(e, PipelineError):
                 raise
             raise PipelineError(f"Pipeline failed: {e}", {"audio_file": audio_path})
     
+    def stream_audio_to_json(self,
+                             audio_path: str,
+                             output_path: str,
+                             speaker_mapping: Optional[Dict[str, str]] = None) -> Path:
+        """
+        Process an audio file to a JSON database, writing entities as they are transcribed.
+        
+        Words arrive window by window from the transcription engine; each batch
+        is turned into entities, quality-filtered and appended to the output
+        file, so entities reach disk while later windows are still decoding
+        and are never all held in memory. Diarization (if enabled) runs first
+        because speaker assignment needs it. Checkpoints and the smart
+        buffering report are not used on this path.
+        
+        Args:
+            audio_path: Path to input audio file
+            output_path: Output path for the JSON file
+            speaker_mapping: Optional speaker time mapping
+            
+        Returns:
+            Path to the written database file
+            
+        Raises:
+            PipelineError: If pipeline processing fails
+        """
+        try:
+            start_time = time.time()
+            audio_file = Path(audio_path)
+            self.log_stage_start("full_pipeline", audio_file=str(audio_file),
+                               output_path=output_path, streaming=True)
+            
+            processed_audio = process_audio(audio_path, self.config, self._content_hash(audio_path))
+            speech = self._speech_regions(processed_audio)
+            transcribed_audio = speech.compact(processed_audio) if speech is not None else processed_audio
+            diarization_result = self._diarization_stage(audio_path, transcribed_audio, None, None, speech)
+            
+            word_batches = transcribe_stream(transcribed_audio, self.config.whisper)
+            if speech is not None:
+                word_batches = (speech.map_words(words) for words in word_batches)
+            
+            creator = EntityCreator(self.config.quality)
+            entity_batches = creator.iter_entities(word_batches,
+                                                   self._generate_recording_id(audio_file),
+                                                   str(audio_file),
+                                                   speaker_mapping,
+                                                   diarization_result)
+            
+            speaker_ids = set()
+            with DatabaseWriter(self.config).open_stream(Path(output_path)) as stream:
+                for entities in entity_batches:
+                    filtered = creator.apply_quality_filters(entities)
+                    stream.write_entities(filtered)
+                    speaker_ids.update(entity.speaker_id for entity in filtered)
+                    self.log_progress("Entities streamed",
+                                    batch_entities=len(filtered),
+                                    entities_written=stream.entity_count,
+                                    elapsed=f"{time.time() - start_time:.2f}s")
+                output_file = stream.close(
+                    self._database_metadata(stream.entity_count, processed_audio),
+                    self._speaker_map(speaker_ids)
+                )
+            
+            total_time = time.time() - start_time
+            self.log_stage_complete("full_pipeline",
+                                  total_time=f"{total_time:.2f}s",
+                                  entities_processed=stream.entity_count,
+                                  audio_duration=processed_audio.duration,
+                                  processing_rate=f"{processed_audio.duration/total_time:.1f}x realtime")
+            return output_file
+            
+        except Exception as e:
+            self.log_stage_error("full_pipeline", e, audio_file=audio_path)
+            if isinstance(e, PipelineError):
+                raise
+            raise PipelineError(f"Pipeline failed: {e}", {"audio_file": audio_path})
+    
+    def _transcribe_and_diarize(self, audio_path: str, processed_audio,
+                                store: Optional[CheckpointStore], keys: Optional[StageKeys],
+                                reuse: bool):
+        """
+        Run Stage 2 (transcription) and Stage 2.5 (diarization).
+        
+        Neither stage needs the other's output, so with
+        processing.concurrent_diarization enabled they run in parallel threads
+        and are joined here before entity creation. Torch's intra-op thread
+        count is process-wide, so if processing.concurrent_threads is set it
+        is applied once, before both stages start, and restored when both
+        finish. Unset, the stages share the process's current budget (in a
+        batch worker, the per-worker cap set by _init_batch_worker). With
+        vad.enabled, both stages run on the voiced regions only and their
+        timestamps are mapped back to the original timeline.
+        
+        Returns:
+            Tuple of (words, diarization result or None)
+        """
+        words = store.load_words(keys.words) if reuse else None
+        if words is not None:
+            self.log_progress("Stage 2 restored from checkpoint", word_count=len(words))
+        
+        diarization_result = store.load_diarization(keys.diarization) if reuse else None
+        if diarization_result is not None:
+            self.log_progress("Stage 2.5 restored from checkpoint",
+                            speakers_detected=len(diarization_result.speakers))
+        
+        run_transcription = words is None
+        run_diarization = diarization_result is None and self._diarization_enabled()
+        processing = self.config.processing
+        
+        # Both stages see only the voiced regions; results are mapped back afterwards
+        speech = self._speech_regions(processed_audio) if run_transcription or run_diarization else None
+        if speech is not None:
+            processed_audio = speech.compact(processed_audio)
+        
+        if run_transcription and run_diarization and processing.concurrent_diarization:
+            self.log_progress("Running transcription and diarization concurrently",
+                            torch_threads=processing.concurrent_threads)
+            with _torch_threads(processing.concurrent_threads), \
+                    ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline-stage") as executor:
+                transcription_future = executor.submit(
+                    self._transcription_stage, processed_audio, store, keys, speech
+                )
+                diarization_future = executor.submit(
+                    self._diarization_stage, audio_path, processed_audio, store, keys, speech
+                )
+                words = transcription_future.result()
+                diarization_result = diarization_future.result()
+            return words, diarization_result
+        
+        if run_transcription:
+            words = self._transcription_stage(processed_audio, store, keys, speech)
+        if diarization_result is None:
+            diarization_result = self._diarization_stage(audio_path, processed_audio, store, keys, speech)
+        return words, diarization_result
+    
+    def _speech_regions(self, processed_audio: ProcessedAudio) -> Optional[SpeechRegionMap]:
+        """Voiced regions to process, or None if VAD is disabled or keeps everything."""
+        if not self.config.vad.enabled:
+            return None
+        self.log_progress("Starting Stage 1.5: Voice Activity Detection")
+        speech = detect_speech(processed_audio, self.config.vad)
+        return None if speech.covers_everything else speech
+    
+    def _transcription_stage(self, processed_audio, store: Optional[CheckpointStore],
+                             keys: Optional[StageKeys],
+                             speech: Optional[SpeechRegionMap] = None):
+        """
+        Transcribe audio and checkpoint the words (on the original timeline).
+        
+        With processing.columnar_words the words stay in a WordTable through
+        entity creation instead of one Word object per word.
+        """
+        self.log_progress("Starting Stage 2: Transcription")
+        if self.config.processing.columnar_words:
+            words = transcribe_table(processed_audio, self.config.whisper)
+            confidences = words.confidence
+        else:
+            words = transcribe_audio(processed_audio, self.config.whisper)
+            confidences = [w.confidence for w in words]
+        if speech is not None:
+            words = speech.map_words(words)
+        self._save_checkpoint(store, "words", keys, words)
+        self.log_progress("Stage 2 complete", 
+                        word_count=len(words),
+                        avg_confidence=float(np.mean(confidences)) if len(words) else 0.0)
+        return words
+    
+    def _diarization_stage(self, audio_path: str, processed_audio,
+                           store: Optional[CheckpointStore],
+                           keys: Optional[StageKeys],
+                           speech: Optional[SpeechRegionMap] = None) -> Optional[DiarizationResult]:
+        """Run diarization (if enabled) and checkpoint the result (on the original timeline)."""
+        diarization_result = self._process_diarization(audio_path, processed_audio)
+        if diarization_result is not None:
+            if speech is not None:
+                diarization_result = speech.map_diarization(diarization_result)
+            self._save_checkpoint(store, "diarization", keys, diarization_result)
+        return diarization_result
+    
+    def _diarization_config(self) -> Optional[DiarizationConfig]:
+        """Diarization settings from the speakers section, if any."""
+        return getattr(getattr(self.config, 'speakers', None), 'diarization', None)
+    
+    def _diarization_enabled(self) -> bool:
+        """Check whether diarization is enabled in configuration."""
+        return bool(getattr(getattr(self.config, 'speakers', None), 'enable_diarization', False))
+    
+    def _checkpoint_store(self, resume_from_stage: Optional[str]) -> Optional[CheckpointStore]:
+        """Return the checkpoint store if checkpointing is enabled or a resume is requested."""
+        processing = self.config.processing
+        if not processing.checkpoints and resume_from_stage is None:
+            return None
+        return CheckpointStore(processing.checkpoint_dir, processing.checkpoint_max_mb * 1024 * 1024)
+    
+    def _content_hash(self, audio_path: str, store: Optional[CheckpointStore] = None) -> Optional[str]:
+        """Hash of the input file if checkpoints or a cache will use it, else None."""
+        if store is None and not (self.config.audio.cache_dir or self.config.whisper.cache_dir):
+            return None
+        return file_fingerprint(audio_path)
+    
+    def _save_checkpoint(self, store: Optional[CheckpointStore], stage: str,
+                         keys: Optional[StageKeys], payload: Any) -> None:
+        """Save a stage checkpoint; failures are logged and never abort the run."""
+        if store is None:
+            return
+        try:
+            if stage == "audio":
+                store.save_audio(keys.audio, payload)
+            elif stage == "words":
+                store.save_words(keys.words, payload)
+            elif stage == "diarization":
+                store.save_diarization(keys.diarization, payload)
+            elif stage == "entities":
+                store.save_entities(keys.entities, payload)
+        except Exception as e:
+            self.logger.warning("Failed to save checkpoint", stage=stage, error=str(e))
+    
+    def process_batch(self,
+                      source: Union[str, List[str]],
+                      output_dir: Optional[str] = None,
+                      workers: int = 1,
+                      speaker_mapping: Optional[Dict[str, str]] = None,
+                      pattern: Optional[str] = None) -> BatchSummary:
+        """
+        Process many audio files, isolating failures per file.
+        
+        Files are fanned out over ``workers`` processes, longest recordings
+        first (durations come from file headers). Each worker builds its
+        own pipeline once and preloads models, so models stay warm for every
+        file it handles. A failing file is recorded in the summary and does not
+        stop the batch.
+        
+        Args:
+            source: Directory, glob pattern, manifest file, or explicit list of paths
+            output_dir: Optional directory for JSON outputs (default: next to each audio file)
+            workers: Number of worker processes (1 = process in this process)
+            speaker_mapping: Optional speaker time mapping applied to every file
+            pattern: Optional glob filter when ``source`` is a directory
+            
+        Returns:
+            BatchSummary with per-file results in input order
+            
+        Raises:
+            PipelineError: If the batch source cannot be resolved or two
+                inputs map to the same output file
+        """
+        start_time = time.time()
+        
+        if isinstance(source, (list, tuple)):
+            audio_files = [Path(p) for p in source]
+        else:
+            audio_files = resolve_batch_inputs(source, pattern)
+        output_paths = batch_output_paths(audio_files, Path(output_dir) if output_dir else None)
+        workers = max(1, min(workers, len(audio_files)))
+        
+        self.log_stage_start("batch_processing", files=len(audio_files), workers=workers)
+        
+        results: List[Optional[BatchFileResult]] = [None] * len(audio_files)
+        jobs = [(str(a), str(o), speaker_mapping) for a, o in zip(audio_files, output_paths)]
+        
+        if workers == 1:
+            try:
+                self.preload_models()
+            except Exception as e:
+                # Surface the load failure per file rather than aborting the batch
+                self.logger.warning("Model preload failed", error=str(e))
+            for index, job in enumerate(jobs):
+                results[index] = _process_batch_file(self, *job)
+                self._log_batch_progress(results[index], index + 1, len(jobs))
+        else:
+            context = multiprocessing.get_context("spawn")
+            threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=context,
+                                     initializer=_init_batch_worker,
+                                     initargs=(self.config.model_dump(), threads_per_worker)) as executor:
+                futures = {executor.submit(_run_batch_job, *jobs[index]): index
+                           for index in longest_first(audio_files)}
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        # Worker crashed (e.g. out of memory) - record and carry on
+                        results[index] = BatchFileResult(
+                            audio_path=jobs[index][0],
+                            success=False,
+                            error=str(e),
+                            error_type=type(e).__name__
+                        )
+                    self._log_batch_progress(results[index], completed, len(jobs))
+        
+        summary = BatchSummary(results=results, workers=workers, total_time=time.time() - start_time)
+        
+        self.log_stage_complete("batch_processing",
+                              files=len(summary.results),
+                              succeeded=summary.succeeded,
+                              failed=summary.failed,
+                              total_time=f"{summary.total_time:.2f}s",
+                              audio_duration=summary.total_audio_duration)
+        
+        return summary
+    
+    def _log_batch_progress(self, result: BatchFileResult, completed: int, total: int) -> None:
+        """Log the outcome of one batch file."""
+        if result.success:
+            self.log_progress("Batch file complete",
+                            file=result.audio_path,
+                            progress=f"{completed}/{total}",
+                            processing_time=f"{result.processing_time:.2f}s")
+        else:
+            self.logger.warning("Batch file failed",
+                              file=result.audio_path,
+                              progress=f"{completed}/{total}",
+                              error=result.error)
+    
     def process_diarization(self, audio_path: str) -> DiarizationResult:
         """
         Process audio file for speaker diarization only.
@@ -155,11 +551,12 @@ class AudioToJsonPipeline(LoggerMixin):
             
             self.log_stage_start("diarization_only", audio_file=str(audio_file))
             
-            # Process audio to get duration
+            # Decode once; diarization runs on this buffer and its duration
             processed_audio = process_audio(audio_path, self.config)
+            audio_duration = processed_audio.duration
             
             # Process diarization
-            diarization_result = self._process_diarization(audio_path, processed_audio.duration)
+            diarization_result = self._process_diarization(audio_path, processed_audio)
             
             if diarization_result is None:
                 # Create single-speaker fallback result
@@ -167,13 +564,13 @@ class AudioToJsonPipeline(LoggerMixin):
                 single_segment = SpeakerSegment(
                     speaker_id=0,
                     start_time=0.0,
-                    end_time=processed_audio.duration,
+                    end_time=audio_duration,
                     confidence=1.0
                 )
                 diarization_result = DiarizationResult(
                     speakers=[0],
                     segments=[single_segment],
-                    audio_duration=processed_audio.duration,
+                    audio_duration=audio_duration,
                     processing_time=0.0
                 )
             
@@ -209,19 +606,20 @@ class AudioToJsonPipeline(LoggerMixin):
         database = self.process_audio_to_json(audio_path)
         return database.entities
     
-    def _process_diarization(self, audio_path: str, audio_duration: float) -> Optional[DiarizationResult]:
+    def _process_diarization(self, audio_path: str,
+                             processed_audio: ProcessedAudio) -> Optional[DiarizationResult]:
         """
         Process diarization if enabled in configuration.
         
         Args:
             audio_path: Path to audio file
-            audio_duration: Duration of audio in seconds
+            processed_audio: Decoded audio from Stage 1, reused so the file is not decoded again
             
         Returns:
             DiarizationResult if successful, None if disabled/failed
         """
         # Check if diarization is enabled
-        if not hasattr(self.config, 'speakers') or not getattr(self.config.speakers, 'enable_diarization', False):
+        if not self._diarization_enabled():
             self.log_progress("Diarization disabled by configuration")
             return None
         
@@ -235,14 +633,12 @@ class AudioToJsonPipeline(LoggerMixin):
         try:
             self.log_progress("Starting Stage 2.5: Speaker Diarization")
             
-            # Get diarization config
-            diarization_config = getattr(self.config.speakers, 'diarization', None)
-            
-            # Process diarization
+            # Process diarization (the PyAnnote pipeline is cached in the model registry)
             diarization_result = process_diarization(
                 audio_path=audio_path,
-                audio_duration=audio_duration,
-                config=diarization_config
+                audio_duration=processed_audio.duration,
+                config=self._diarization_config(),
+                audio=processed_audio
             )
             
             self.log_progress("Stage 2.5 complete",
@@ -266,15 +662,21 @@ class AudioToJsonPipeline(LoggerMixin):
     
     def _create_database(self, entities, processed_audio) -> WordDatabase:
         """Create WordDatabase with entities and metadata."""
-        
-        # Create metadata
-        metadata = {
+        return WordDatabase(
+            metadata=self._database_metadata(len(entities), processed_audio),
+            speaker_map=self._speaker_map(set(entity.speaker_id for entity in entities)),
+            entities=entities
+        )
+    
+    def _database_metadata(self, entity_count: int, processed_audio) -> Dict[str, Any]:
+        """Database metadata for a run."""
+        return {
             "version": "1.0",
             "created_at": datetime.now().isoformat(),
             "whisper_model": self.config.whisper.model,
             "audio_duration": processed_audio.duration,
             "audio_sample_rate": processed_audio.sample_rate,
-            "entity_count": len(entities),
+            "entity_count": entity_count,
             "config_snapshot": {
                 "min_confidence": self.config.quality.min_confidence,
                 "min_word_duration": self.config.quality.min_word_duration,
@@ -282,10 +684,10 @@ class AudioToJsonPipeline(LoggerMixin):
                 "syllable_range": self.config.quality.syllable_range
             }
         }
-        
-        # Create speaker map
+    
+    def _speaker_map(self, speaker_ids) -> Dict[int, SpeakerInfo]:
+        """Speaker map for the speakers that own entities (default speaker if none)."""
         speaker_map = {}
-        speaker_ids = set(entity.speaker_id for entity in entities)
         for speaker_id in speaker_ids:
             speaker_map[speaker_id] = SpeakerInfo(
                 name=f"Speaker {speaker_id}",
@@ -300,12 +702,7 @@ class AudioToJsonPipeline(LoggerMixin):
                 gender="Unknown", 
                 region="Unknown"
             )
-        
-        return WordDatabase(
-            metadata=metadata,
-            speaker_map=speaker_map,
-            entities=entities
-        )
+        return speaker_map
     
     def _apply_smart_buffering(self, database: WordDatabase) -> WordDatabase:
         """
@@ -316,42 +713,120 @@ class AudioToJsonPipeline(LoggerMixin):
         """
         self.log_progress("Applying smart buffering for Colombian Spanish")
         
-        # Sort entities by start time
-        sorted_entities = sorted(database.entities, key=lambda e: e.start_time)
+        entities = database.entities
+        starts = np.fromiter((e.start_time for e in entities), dtype=np.float64, count=len(entities))
+        ends = np.fromiter((e.end_time for e in entities), dtype=np.float64, count=len(entities))
         
-        overlap_count = 0
-        zero_gap_count = 0
+        # Sort entities by start time and compare each word with the next
+        order = np.argsort(starts, kind='stable')
+        current_ends = ends[order][:-1]
+        next_starts = starts[order][1:]
+        gaps = next_starts - current_ends
         
-        for i in range(len(sorted_entities) - 1):
-            current = sorted_entities[i]
-            next_entity = sorted_entities[i + 1]
-            
-            # Check for zero gap (Colombian Spanish characteristic)
-            gap = next_entity.start_time - current.end_time
-            
-            if abs(gap) < 0.001:  # Essentially zero gap
-                zero_gap_count += 1
-                # Do NOT add buffer - would cause overlap
-                continue
-            
-            # Check for existing overlap
-            if current.end_time > next_entity.start_time:
-                overlap_count += 1
-                self.logger.warning("Word overlap detected",
-                                  current_word=current.text,
-                                  next_word=next_entity.text,
-                                  current_end=current.end_time,
-                                  next_start=next_entity.start_time)
+        # Zero gap (Colombian Spanish characteristic): do NOT add buffer - would cause overlap
+        zero_gaps = np.abs(gaps) < 0.001
         
+        # Existing overlaps
+        overlaps = ~zero_gaps & (current_ends > next_starts)
+        for i in np.flatnonzero(overlaps).tolist():
+            current = entities[order[i]]
+            next_entity = entities[order[i + 1]]
+            self.logger.warning("Word overlap detected",
+                              current_word=current.text,
+                              next_word=next_entity.text,
+                              current_end=current.end_time,
+                              next_start=next_entity.start_time)
+        
+        pairs = len(gaps)
+        zero_gap_count = int(zero_gaps.sum())
         self.log_progress("Smart buffering analysis complete",
-                        total_word_pairs=len(sorted_entities) - 1,
+                        total_word_pairs=pairs,
                         zero_gaps=zero_gap_count,
-                        overlaps=overlap_count,
-                        zero_gap_percentage=f"{zero_gap_count/(len(sorted_entities)-1)*100:.1f}%" if len(sorted_entities) > 1 else "0%")
+                        overlaps=int(overlaps.sum()),
+                        zero_gap_percentage=f"{zero_gap_count/pairs*100:.1f}%" if pairs > 0 else "0%")
         
         return database
 
 
+# Pipeline owned by each batch worker process, built once by _init_batch_worker
+_worker_pipeline: Optional[AudioToJsonPipeline] = None
+
+
+def _set_torch_threads(num_threads: int) -> None:
+    """Limit torch intra-op threads for the whole process."""
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+
+@contextmanager
+def _torch_threads(num_threads: Optional[int]):
+    """Set torch's process-wide intra-op thread count, restoring it on exit (None leaves it alone)."""
+    if num_threads is None:
+        yield
+        return
+    try:
+        import torch
+    except ImportError:
+        yield
+        return
+    previous = torch.get_num_threads()
+    torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+
+def _init_batch_worker(config_data: Dict[str, Any], num_threads: int) -> None:
+    """Build this worker's pipeline and warm its models."""
+    global _worker_pipeline
+    _set_torch_threads(num_threads)
+    _worker_pipeline = AudioToJsonPipeline(Config(**config_data))
+    try:
+        _worker_pipeline.preload_models()
+    except Exception as e:
+        # Surface the load failure per file rather than killing the pool
+        _worker_pipeline.logger.warning("Model preload failed in batch worker", error=str(e))
+
+
+def _run_batch_job(audio_path: str, output_path: str,
+                   speaker_mapping: Optional[Dict[str, str]]) -> BatchFileResult:
+    """Process one batch file with this worker's pipeline."""
+    return _process_batch_file(_worker_pipeline, audio_path, output_path, speaker_mapping)
+
+
+def _process_batch_file(pipeline: AudioToJsonPipeline,
+                        audio_path: str,
+                        output_path: str,
+                        speaker_mapping: Optional[Dict[str, str]]) -> BatchFileResult:
+    """Process one file, converting any failure into a failed result."""
+    start_time = time.time()
+    try:
+        database = pipeline.process_audio_to_json(audio_path, output_path, speaker_mapping)
+        return BatchFileResult(
+            audio_path=audio_path,
+            output_path=output_path,
+            success=True,
+            entity_count=len(database.entities),
+            audio_duration=database.metadata.get("audio_duration", 0.0),
+            processing_time=time.time() - start_time,
+            worker_pid=os.getpid()
+        )
+    except Exception as e:
+        return BatchFileResult(
+            audio_path=audio_path,
+            output_path=output_path,
+            success=False,
+            error=str(e),
+            error_type=type(e).__name__,
+            processing_time=time.time() - start_time,
+            worker_pid=os.getpid()
+        )
+
+
 def process_audio_to_json(audio_path: str, 
                          config: Config,
                          output_path: Optional[str] = None,
@@ -379,4 +854,31 @@ def process_audio_to_json(audio_path: str,
         output_path, 
         speaker_mapping, 
         resume_from_stage
-    )
\ No newline at end of file
+    )
+
+
+def process_batch(source: Union[str, List[str]],
+                  config: Config,
+                  output_dir: Optional[str] = None,
+                  workers: int = 1,
+                  speaker_mapping: Optional[Dict[str, str]] = None,
+                  pattern: Optional[str] = None) -> BatchSummary:
+    """
+    Convenience function for batch processing.
+    
+    Args:
+        source: Directory, glob pattern, manifest file, or list of paths
+        config: Configuration object
+        output_dir: Optional output directory for JSON files
+        workers: Number of worker processes
+        speaker_mapping: Optional speaker mapping applied to every file
+        pattern: Optional glob filter for directory sources
+        
+    Returns:
+        BatchSummary object
+        
+    Raises:
+        PipelineError: If the batch source cannot be resolved
+    """
+    pipeline = AudioToJsonPipeline(config)
+    return pipeline.process_batch(source, output_dir, workers, speaker_mapping, pattern)
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Vectorized quality filtering of word entities.
+
+Entity fields used by the quality rules are gathered once into columns
+(EntityColumns). Each rule in QualityConfig then becomes one boolean mask
+over those columns. The masks are combined to give the surviving entity
+indices and a count of how many entities each rule rejected. Columns can be
+kept and re-filtered under different thresholds, so a sweep over
+QualityConfig values does not rebuild or re-validate any Entity objects.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from ..shared.config import QualityConfig
+from ..shared.models import Entity
+
+
+# Common Spanish words kept even when their syllable count is out of range
+SHORT_WORD_WHITELIST = ("tal", "que", "con", "por", "sin", "son")
+
+# Rule names in the order they are reported
+QUALITY_RULES = ("confidence", "min_duration", "max_duration", "syllable_range", "empty_text")
+
+
+@dataclass
+class EntityColumns:
+    """Entity fields used by the quality rules, one array per field."""
+    confidence: np.ndarray
+    duration: np.ndarray
+    syllable_count: np.ndarray
+    whitelisted: np.ndarray  # Text is in SHORT_WORD_WHITELIST
+    empty_text: np.ndarray   # Text is empty or whitespace
+
+    @classmethod
+    def from_entities(cls, entities: Sequence[Entity]) -> "EntityColumns":
+        """Gather the columns from Entity objects."""
+        count = len(entities)
+        texts = [entity.text for entity in entities]
+        whitelist = set(SHORT_WORD_WHITELIST)
+        return cls(
+            confidence=np.fromiter((e.confidence for e in entities), dtype=np.float64, count=count),
+            duration=np.fromiter((e.duration for e in entities), dtype=np.float64, count=count),
+            syllable_count=np.fromiter((e.syllable_count for e in entities), dtype=np.int64, count=count),
+            whitelisted=np.fromiter((t.lower() in whitelist for t in texts), dtype=bool, count=count),
+            empty_text=np.fromiter((not t.strip() for t in texts), dtype=bool, count=count),
+        )
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+
+@dataclass
+class QualityFilterResult:
+    """Outcome of filtering: surviving indices and per-rule rejection counts."""
+    indices: np.ndarray         # Positions of entities passing every rule
+    rejections: Dict[str, int]  # Rule name -> entities failing that rule
+    total: int
+
+    @property
+    def passed(self) -> int:
+        return len(self.indices)
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.total if self.total else 0.0
+
+    def select(self, entities: Sequence[Entity]) -> List[Entity]:
+        """The surviving entities, in their original order."""
+        return [entities[i] for i in self.indices.tolist()]
+
+
+def rule_masks(columns: EntityColumns, config: QualityConfig) -> Dict[str, np.ndarray]:
+    """
+    Rejection mask of each quality rule.
+
+    Args:
+        columns: Entity columns
+        config: Quality thresholds
+
+    Returns:
+        Dictionary of rule name -> boolean array, True where the rule rejects
+    """
+    min_syllables, max_syllables = config.syllable_range
+    syllables_out_of_range = ((columns.syllable_count < min_syllables) |
+                              (columns.syllable_count > max_syllables))
+    return {
+        "confidence": columns.confidence < config.min_confidence,
+        "min_duration": columns.duration < config.min_word_duration,
+        "max_duration": columns.duration > config.max_word_duration,
+        "syllable_range": syllables_out_of_range & ~columns.whitelisted,
+        "empty_text": columns.empty_text,
+    }
+
+
+def evaluate_quality_filters(columns: EntityColumns, config: QualityConfig) -> QualityFilterResult:
+    """
+    Apply every quality rule to the columns at once.
+
+    An entity failing several rules is counted under each of them, so the
+    rejection counts show how restrictive each threshold is on its own.
+
+    Args:
+        columns: Entity columns
+        config: Quality thresholds
+
+    Returns:
+        QualityFilterResult with surviving indices and rejection counts
+    """
+    masks = rule_masks(columns, config)
+    rejected = np.zeros(len(columns), dtype=bool)
+    for mask in masks.values():
+        rejected |= mask
+    return QualityFilterResult(
+        indices=np.flatnonzero(~rejected),
+        rejections={rule: int(masks[rule].sum()) for rule in QUALITY_RULES},
+        total=len(columns),
+    )
+
+
+def sweep_quality_filters(entities: Sequence[Entity],
+                          configs: Sequence[QualityConfig]) -> List[QualityFilterResult]:
+    """
+    Convenience function for comparing several quality configurations.
+
+    The entity columns are gathered once and re-filtered under each config.
+
+    Args:
+        entities: Entities to filter
+        configs: Quality configurations to evaluate
+
+    Returns:
+        One QualityFilterResult per config, in the same order
+    """
+    columns = EntityColumns.from_entities(entities)
+    return [evaluate_quality_filters(columns, config) for config in configs]
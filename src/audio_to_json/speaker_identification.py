@@ -6,11 +6,123 @@ Supports multi-speaker scenarios and default speaker assignment.
 Integrates speaker information into entity metadata for pronunciation analysis.
 """
 from typing import List, Dict, Any, Optional, Tuple, Union
-from copy import deepcopy
+
+import numpy as np
 
 from ..shared.models import Entity, SpeakerInfo
 from ..shared.exceptions import SpeakerError
 from ..shared.logging_config import LoggerMixin
+from .interval_index import IntervalIndex
+
+
+def parse_time_range(time_range: str) -> Tuple[float, float]:
+    """
+    Parse a legacy "start-end" time range key.
+    
+    Raises:
+        ValueError: If the key is not two numbers separated by "-"
+        AttributeError: If the key is not a string
+    """
+    start_str, end_str = time_range.split("-")
+    return float(start_str), float(end_str)
+
+
+def speaker_id_to_int(speaker_id: Any) -> int:
+    """Convert "speaker_N" or "N" style speaker IDs to an integer."""
+    if isinstance(speaker_id, str) and speaker_id.startswith("speaker_"):
+        return int(speaker_id.replace("speaker_", ""))
+    return int(speaker_id)
+
+
+class CompiledSpeakerMapping:
+    """
+    Speaker mapping parsed once into a sorted interval index.
+    
+    Ranges keep their original priority: where ranges overlap or touch, the
+    earliest listed one wins, exactly as a first-match scan would.
+    """
+    
+    def __init__(self, starts: List[float], ends: List[float],
+                 speaker_ids: List[Any], details: List[Dict[str, Any]],
+                 invalid_ranges: Optional[List[Any]] = None):
+        self.index = IntervalIndex(starts, ends)
+        self.speaker_ids = speaker_ids
+        self.details = details
+        self.invalid_ranges = invalid_ranges or []
+    
+    @classmethod
+    def from_mapping(cls, speaker_mapping: Union[List[Dict[str, Any]], Dict[str, Any]],
+                     integer_ids: bool = False) -> "CompiledSpeakerMapping":
+        """
+        Compile a list or dict speaker mapping.
+        
+        Args:
+            speaker_mapping: List of {start, end, speaker, speaker_id, ...} dicts,
+                or dict of "start-end" keys to speaker IDs
+            integer_ids: Convert speaker IDs to int, skipping ranges whose ID
+                cannot be converted (legacy EntityCreator behaviour)
+            
+        Returns:
+            CompiledSpeakerMapping
+            
+        Raises:
+            SpeakerError: If a list entry has non-numeric bounds
+        """
+        starts, ends, speaker_ids, details, invalid = [], [], [], [], []
+        
+        if isinstance(speaker_mapping, list):
+            for position, mapping in enumerate(speaker_mapping):
+                try:
+                    start_time = float(mapping.get("start", 0.0))
+                    end_time = float(mapping.get("end", float('inf')))
+                except (TypeError, ValueError) as e:
+                    raise SpeakerError(f"Invalid speaker mapping entry {position}: {e}")
+                speaker_id = mapping.get("speaker_id", 0)
+                if integer_ids:
+                    try:
+                        speaker_id = speaker_id_to_int(speaker_id)
+                    except (ValueError, TypeError):
+                        invalid.append(position)
+                        continue
+                starts.append(start_time)
+                ends.append(end_time)
+                speaker_ids.append(speaker_id)
+                details.append(mapping)
+        else:
+            for time_range, speaker_id in speaker_mapping.items():
+                try:
+                    start_time, end_time = parse_time_range(time_range)
+                    if integer_ids:
+                        speaker_id = speaker_id_to_int(speaker_id)
+                except (ValueError, AttributeError, TypeError):
+                    invalid.append(time_range)
+                    continue
+                starts.append(start_time)
+                ends.append(end_time)
+                speaker_ids.append(speaker_id)
+                details.append({})
+        
+        return cls(starts, ends, speaker_ids, details, invalid)
+    
+    def __len__(self) -> int:
+        return len(self.speaker_ids)
+    
+    def lookup(self, centres) -> np.ndarray:
+        """Position of the matching range for each time, -1 where none matches."""
+        return self.index.containing(centres)
+
+
+def _entity_centres(entities: List[Entity]) -> np.ndarray:
+    starts = np.fromiter((e.start_time for e in entities), dtype=np.float64, count=len(entities))
+    ends = np.fromiter((e.end_time for e in entities), dtype=np.float64, count=len(entities))
+    return (starts + ends) / 2
+
+
+def _with_speaker(entity: Entity, speaker_id: Any) -> Entity:
+    """Copy-on-write: return the entity itself unless its speaker_id changes."""
+    if type(speaker_id) is type(entity.speaker_id) and speaker_id == entity.speaker_id:
+        return entity
+    return entity.model_copy(update={"speaker_id": speaker_id})
 
 
 class SpeakerMapper(LoggerMixin):
@@ -25,6 +137,10 @@ class SpeakerMapper(LoggerMixin):
         """
         Apply speaker mapping to entities based on timestamp ranges.
         
+        The input entities are never modified: entities whose speaker changes
+        are replaced by copies with the new speaker_id, the rest are shared
+        with the input list.
+        
         Args:
             entities: List of Entity objects to process
             speaker_mapping: Speaker mapping data (various formats supported)
@@ -43,16 +159,13 @@ class SpeakerMapper(LoggerMixin):
                                entity_count=len(entities),
                                has_speaker_mapping=speaker_mapping is not None)
             
-            # Create deep copy of entities to avoid modifying originals
-            updated_entities = deepcopy(entities)
-            
             # Handle different speaker mapping formats
             if speaker_mapping is None:
-                return self._apply_default_speaker(updated_entities)
+                return self._apply_default_speaker(entities)
             elif isinstance(speaker_mapping, list):
-                return self._apply_list_mapping(updated_entities, speaker_mapping)
+                return self._apply_list_mapping(entities, speaker_mapping)
             elif isinstance(speaker_mapping, dict):
-                return self._apply_dict_mapping(updated_entities, speaker_mapping)
+                return self._apply_dict_mapping(entities, speaker_mapping)
             else:
                 raise SpeakerError(f"Unsupported speaker mapping format: {type(speaker_mapping)}")
                 
@@ -67,9 +180,10 @@ class SpeakerMapper(LoggerMixin):
         self.log_progress("Applying default speaker assignment")
         
         # Ensure all entities have default speaker
-        for entity in entities:
-            if not entity.speaker_id or entity.speaker_id == "":
-                entity.speaker_id = 0
+        updated_entities = [
+            _with_speaker(entity, 0) if not entity.speaker_id or entity.speaker_id == "" else entity
+            for entity in entities
+        ]
         
         # Create default speaker map
         speaker_map = {
@@ -81,10 +195,10 @@ class SpeakerMapper(LoggerMixin):
         }
         
         self.log_stage_complete("speaker_mapping",
-                              entities_updated=len(entities),
+                              entities_updated=len(updated_entities),
                               speakers_assigned=1)
         
-        return entities, speaker_map
+        return updated_entities, speaker_map
     
     def _apply_list_mapping(self, entities: List[Entity], 
                           speaker_mapping: List[Dict[str, Any]]) -> Tuple[List[Entity], Dict[str, Dict[str, Any]]]:
@@ -92,49 +206,17 @@ class SpeakerMapper(LoggerMixin):
         self.log_progress("Applying list-based speaker mapping", 
                         mapping_count=len(speaker_mapping))
         
-        speaker_map = {}
-        speakers_updated = 0
-        
-        for entity in entities:
-            entity_center_time = (entity.start_time + entity.end_time) / 2
-            
-            # Find matching speaker range
-            for mapping in speaker_mapping:
-                start_time = mapping.get("start", 0.0)
-                end_time = mapping.get("end", float('inf'))
-                
-                if start_time <= entity_center_time <= end_time:
-                    speaker_id = mapping.get("speaker_id", 0)
-                    speaker_name = mapping.get("speaker", "Unknown Speaker")
-                    
-                    # Update entity
-                    entity.speaker_id = speaker_id
-                    speakers_updated += 1
-                    
-                    # Add to speaker map
-                    if speaker_id not in speaker_map:
-                        speaker_map[speaker_id] = {
-                            "name": speaker_name,
-                            "gender": mapping.get("gender", "Unknown"),
-                            "region": mapping.get("region", "Unknown")
-                        }
-                    break
-            else:
-                # No matching range found - use default
-                if not entity.speaker_id:
-                    entity.speaker_id = 0
-                    if 0 not in speaker_map:
-                        speaker_map[0] = {
-                            "name": "Default Speaker",
-                            "gender": "Unknown",
-                            "region": "Unknown"
-                        }
+        compiled = CompiledSpeakerMapping.from_mapping(speaker_mapping)
         
-        self.log_stage_complete("speaker_mapping",
-                              entities_updated=speakers_updated,
-                              speakers_assigned=len(speaker_map))
+        def speaker_info(position: int) -> Dict[str, Any]:
+            mapping = compiled.details[position]
+            return {
+                "name": mapping.get("speaker", "Unknown Speaker"),
+                "gender": mapping.get("gender", "Unknown"),
+                "region": mapping.get("region", "Unknown")
+            }
         
-        return entities, speaker_map
+        return self._apply_compiled(entities, compiled, speaker_info)
     
     def _apply_dict_mapping(self, entities: List[Entity], 
                           speaker_mapping: Dict[str, str]) -> Tuple[List[Entity], Dict[str, Dict[str, Any]]]:
@@ -142,53 +224,55 @@ class SpeakerMapper(LoggerMixin):
         self.log_progress("Applying dict-based speaker mapping", 
                         mapping_count=len(speaker_mapping))
         
+        compiled = CompiledSpeakerMapping.from_mapping(speaker_mapping)
+        for time_range in compiled.invalid_ranges:
+            self.logger.warning("Invalid time range format", 
+                              time_range=time_range)
+        
+        def speaker_info(position: int) -> Dict[str, Any]:
+            speaker_id = compiled.speaker_ids[position]
+            return {
+                "name": f"Speaker {str(speaker_id).split('_')[-1]}",
+                "gender": "Unknown",
+                "region": "Unknown"
+            }
+        
+        return self._apply_compiled(entities, compiled, speaker_info)
+    
+    def _apply_compiled(self, entities: List[Entity], compiled: CompiledSpeakerMapping,
+                        speaker_info) -> Tuple[List[Entity], Dict[str, Dict[str, Any]]]:
+        """Assign speakers from a compiled mapping, copying only changed entities."""
+        positions = compiled.lookup(_entity_centres(entities)) if entities else []
+        
         speaker_map = {}
         speakers_updated = 0
+        updated_entities = []
         
-        for entity in entities:
-            entity_center_time = (entity.start_time + entity.end_time) / 2
-            
-            # Find matching time range
-            for time_range, speaker_id in speaker_mapping.items():
-                try:
-                    # Parse time range format "start-end"
-                    start_str, end_str = time_range.split("-")
-                    start_time = float(start_str)
-                    end_time = float(end_str)
-                    
-                    if start_time <= entity_center_time <= end_time:
-                        entity.speaker_id = speaker_id
-                        speakers_updated += 1
-                        
-                        # Add to speaker map if not exists
-                        if speaker_id not in speaker_map:
-                            speaker_map[speaker_id] = {
-                                "name": f"Speaker {speaker_id.split('_')[-1]}",
-                                "gender": "Unknown",
-                                "region": "Unknown"
-                            }
-                        break
-                        
-                except (ValueError, AttributeError):
-                    self.logger.warning("Invalid time range format", 
-                                      time_range=time_range)
-                    continue
-            else:
+        for entity, position in zip(entities, positions):
+            if position >= 0:
+                speaker_id = compiled.speaker_ids[position]
+                speakers_updated += 1
+                if speaker_id not in speaker_map:
+                    speaker_map[speaker_id] = speaker_info(position)
+            elif not entity.speaker_id:
                 # No matching range - use default
-                if not entity.speaker_id:
-                    entity.speaker_id = 0
-                    if 0 not in speaker_map:
-                        speaker_map[0] = {
-                            "name": "Default Speaker",
-                            "gender": "Unknown",
-                            "region": "Unknown"
-                        }
+                speaker_id = 0
+                if 0 not in speaker_map:
+                    speaker_map[0] = {
+                        "name": "Default Speaker",
+                        "gender": "Unknown",
+                        "region": "Unknown"
+                    }
+            else:
+                speaker_id = entity.speaker_id
+            
+            updated_entities.append(_with_speaker(entity, speaker_id))
         
         self.log_stage_complete("speaker_mapping",
                               entities_updated=speakers_updated,
                               speakers_assigned=len(speaker_map))
         
-        return entities, speaker_map
+        return updated_entities, speaker_map
 
 
 def apply_speaker_mapping(entities: List[Entity], 
@@ -3,9 +3,20 @@ Transcription engine using OpenAI Whisper for speech-to-text with word timestamp
 
 Provides Spanish language transcription with word-level timing information
 for precise pronunciation clip extraction. Handles deterministic output
-and confidence scoring for quality filtering.
+and confidence scoring for quality filtering. Inference runs on the backend
+selected by ``whisper.backend`` (see transcription_backends). Results can be
+cached on disk by audio content and configuration (see TranscriptionCache),
+or streamed window by window as they are decoded (iter_transcription).
 """
-from typing import List, Dict, Any
+import asyncio
+import atexit
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Tuple, Iterator, AsyncIterator
 import whisper
 import torch
 import numpy as np
@@ -14,7 +25,16 @@ from dataclasses import dataclass
 from ..shared.config import WhisperConfig
 from ..shared.exceptions import TranscriptionError
 from ..shared.logging_config import LoggerMixin
+from ..shared.disk_cache import DiskCache
+from ..shared.fingerprint import array_fingerprint, config_fingerprint
 from .audio_processor import ProcessedAudio
+from .model_registry import get_model_registry
+from .transcription_backends import create_backend
+
+
+# Window length for streaming transcription when chunk_length_s is unset
+# (Whisper's own 30 s decoding window)
+STREAM_WINDOW_SECONDS = 30.0
 
 
 @dataclass
@@ -32,21 +52,42 @@ class TranscriptionEngine(LoggerMixin):
     def __init__(self, whisper_config: WhisperConfig):
         super().__init__()
         self.config = whisper_config
+        self.backend = create_backend(whisper_config)
+        self.cache = TranscriptionCache.from_config(whisper_config)
         self._model = None
         
+    @property
+    def model_key(self) -> tuple:
+        """Registry key identifying the Whisper model this engine needs."""
+        return self.backend.model_key
+    
     @property
     def model(self):
-        """Lazy-load Whisper model."""
+        """Lazy-load Whisper model from the process-wide model registry."""
         if self._model is None:
-            self.log_progress("Loading Whisper model", model=self.config.model)
-            self._model = whisper.load_model(self.config.model)
-            self.log_progress("Whisper model loaded successfully")
+            registry = get_model_registry()
+            self._model = registry.get_or_load(self.model_key, self._load_model)
         return self._model
     
+    def _load_model(self):
+        """Load the Whisper model from disk (called by the registry on a miss)."""
+        self.log_progress("Loading Whisper model", model=self.config.model,
+                        device=self.config.device, backend=self.backend.name)
+        model = self.backend.load_model()
+        self.log_progress("Whisper model loaded successfully")
+        return model
+    
     def transcribe_audio(self, audio: ProcessedAudio) -> List[Word]:
         """
         Transcribe audio with word-level timestamps.
         
+        Long recordings are split into overlapping chunks when
+        ``chunk_length_s`` is configured (see ``_transcribe_chunked``).
+        With ``cascade_model`` set, low-confidence regions are then
+        re-transcribed by the larger model (see ``_refine_weak_spans``).
+        With ``cache_dir`` set, a previous result for the same samples and
+        configuration is returned without running Whisper.
+        
         Args:
             audio: ProcessedAudio object with audio data
             
@@ -61,56 +102,24 @@ class TranscriptionEngine(LoggerMixin):
                                duration=audio.duration,
                                sample_rate=audio.sample_rate)
             
-            # Prepare transcription options
-            options = {
-                "language": self.config.language,
-                "word_timestamps": self.config.word_timestamps,
-                "temperature": self.config.temperature,
-                "condition_on_previous_text": False,  # More deterministic
-                "compression_ratio_threshold": 2.4,
-                "logprob_threshold": -1.0,
-                "no_speech_threshold": 0.6,
-            }
+            cache_key = self.cache.key_for(audio, self.config) if self.cache else None
+            if cache_key:
+                cached = self.cache.load(cache_key)
+                if cached is not None:
+                    self.log_stage_complete("transcription",
+                                          words_extracted=len(cached),
+                                          cache="hit",
+                                          **self.cache.stats())
+                    return cached
             
-            self.log_progress("Starting Whisper transcription", **options)
+            chunk_length = self.config.chunk_length_s
+            if chunk_length and audio.duration > chunk_length:
+                words = self._transcribe_chunked(audio)
+            else:
+                words = self._transcribe_array(audio.data)
             
-            # Transcribe audio
-            result = self.model.transcribe(audio.data, **options)
-            
-            # Extract word-level information
-            words = []
-            if "segments" in result:
-                for segment in result["segments"]:
-                    if "words" in segment:
-                        for word_info in segment["words"]:
-                            word = Word(
-                                text=word_info["word"].strip(),
-                                start_time=word_info["start"],
-                                end_time=word_info["end"],
-                                confidence=word_info.get("probability", 0.0)
-                            )
-                            words.append(word)
-            
-            # Fallback: if no word timestamps, create from segments
-            if not words and "segments" in result:
-                self.log_progress("No word timestamps found, using segment-level timing")
-                for segment in result["segments"]:
-                    # Split segment text into words and estimate timing
-                    segment_words = segment["text"].strip().split()
-                    segment_duration = segment["end"] - segment["start"]
-                    word_duration = segment_duration / len(segment_words) if segment_words else 0
-                    
-                    for i, word_text in enumerate(segment_words):
-                        word_start = segment["start"] + (i * word_duration)
-                        word_end = word_start + word_duration
-                        
-                        word = Word(
-                            text=word_text.strip(),
-                            start_time=word_start,
-                            end_time=word_end,
-                            confidence=segment.get("avg_logprob", 0.0)
-                        )
-                        words.append(word)
+            if self.config.cascade_model and words:
+                words = self._refine_weak_spans(audio, words)
             
             # Validate results
             if not words:
@@ -119,9 +128,15 @@ class TranscriptionEngine(LoggerMixin):
             # Filter out empty words
             words = [w for w in words if w.text and len(w.text.strip()) > 0]
             
+            cache_stats = {}
+            if cache_key:
+                self._store_cached(cache_key, words, audio)
+                cache_stats = {"cache": "miss", **self.cache.stats()}
+            
             self.log_stage_complete("transcription",
                                   words_extracted=len(words),
-                                  avg_confidence=sum(w.confidence for w in words) / len(words) if words else 0)
+                                  avg_confidence=sum(w.confidence for w in words) / len(words) if words else 0,
+                                  **cache_stats)
             
             return words
             
@@ -131,11 +146,505 @@ class TranscriptionEngine(LoggerMixin):
                 raise
             raise TranscriptionError(f"Transcription failed: {e}")
 
+    def transcribe_table(self, audio: ProcessedAudio) -> 'WordTable':
+        """
+        Transcribe audio into a columnar WordTable (see word_table).
+        
+        A recording decoded in one pass is read from the Whisper result
+        straight into columns, so no Word object is created. Chunked,
+        cascaded and cached transcriptions are stitched, spliced and stored
+        as Word lists, so those go through transcribe_audio and are converted.
+        
+        Args:
+            audio: ProcessedAudio object with audio data
+            
+        Returns:
+            WordTable with one row per word
+            
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        from .word_table import WordTable
+        chunk_length = self.config.chunk_length_s
+        if self.cache or self.config.cascade_model or (chunk_length and audio.duration > chunk_length):
+            return WordTable.from_words(self.transcribe_audio(audio))
+        
+        try:
+            self.log_stage_start("transcription",
+                               duration=audio.duration,
+                               sample_rate=audio.sample_rate,
+                               columnar=True)
+            
+            options = self._transcription_options()
+            self.log_progress("Starting Whisper transcription", **options)
+            table = self._extract_table(self.backend.transcribe(self.model, audio.data, options))
+            
+            # Texts are stripped on extraction, so empty words have empty offsets
+            empty = np.diff(table.text_offsets) == 0
+            if empty.any():
+                table = table.take(~empty)
+            if not len(table):
+                raise TranscriptionError("No words extracted from transcription")
+            
+            self.log_stage_complete("transcription",
+                                  words_extracted=len(table),
+                                  avg_confidence=float(table.confidence.mean()))
+            return table
+            
+        except Exception as e:
+            self.log_stage_error("transcription", e)
+            if isinstance(e, TranscriptionError):
+                raise
+            raise TranscriptionError(f"Transcription failed: {e}")
+    
+    def iter_transcription(self, audio: ProcessedAudio) -> Iterator[List[Word]]:
+        """
+        Transcribe audio window by window, yielding words as each window finishes.
+        
+        The audio is planned into overlapping windows cut at quiet points
+        (``chunk_length_s``, or 30 s when unset) and transcribed in order in
+        this process. Each batch holds the words that became final with that
+        window, on the original timeline; concatenated, they match the chunked
+        ``transcribe_audio`` result for the same windows. Windows are always
+        decoded serially, and a cache hit yields a single batch.
+        
+        Args:
+            audio: ProcessedAudio object with audio data
+            
+        Yields:
+            Non-empty lists of Word objects in time order
+            
+        Raises:
+            TranscriptionError: If transcription fails or produces no words
+        """
+        from .chunking import plan_chunks, WordStitcher
+        
+        try:
+            self.log_stage_start("transcription",
+                               duration=audio.duration,
+                               sample_rate=audio.sample_rate,
+                               streaming=True)
+            
+            cache_key = self.cache.key_for(audio, self.config) if self.cache else None
+            if cache_key:
+                cached = self.cache.load(cache_key)
+                if cached is not None:
+                    self.log_stage_complete("transcription",
+                                          words_extracted=len(cached),
+                                          cache="hit",
+                                          **self.cache.stats())
+                    yield cached
+                    return
+            
+            chunks = plan_chunks(audio.data, audio.sample_rate,
+                                 self.config.chunk_length_s or STREAM_WINDOW_SECONDS,
+                                 self.config.chunk_overlap_s)
+            stitcher = WordStitcher(chunks, audio.sample_rate)
+            transcribed: List[Word] = []
+            
+            for index, chunk in enumerate(chunks):
+                segment = audio.data[chunk.start_sample:chunk.end_sample]
+                words = self._transcribe_array(segment)
+                if self.config.cascade_model and words:
+                    window = ProcessedAudio(data=segment, sample_rate=audio.sample_rate,
+                                            duration=len(segment) / audio.sample_rate,
+                                            metadata=audio.metadata)
+                    words = self._refine_weak_spans(window, words)
+                
+                batch = stitcher.add(chunk, words)
+                if index == len(chunks) - 1:
+                    batch.extend(stitcher.finish())
+                batch = [w for w in batch if w.text and len(w.text.strip()) > 0]
+                
+                self.log_progress("Transcription window complete",
+                                window=f"{index + 1}/{len(chunks)}",
+                                words=len(batch),
+                                audio_end=round(chunk.own_end, 2))
+                if batch:
+                    transcribed.extend(batch)
+                    yield batch
+            
+            if not transcribed:
+                raise TranscriptionError("No words extracted from transcription")
+            
+            cache_stats = {}
+            if cache_key:
+                self._store_cached(cache_key, transcribed, audio)
+                cache_stats = {"cache": "miss", **self.cache.stats()}
+            
+            self.log_stage_complete("transcription",
+                                  words_extracted=len(transcribed),
+                                  avg_confidence=sum(w.confidence for w in transcribed) / len(transcribed),
+                                  windows=len(chunks),
+                                  **cache_stats)
+            
+        except Exception as e:
+            self.log_stage_error("transcription", e)
+            if isinstance(e, TranscriptionError):
+                raise
+            raise TranscriptionError(f"Transcription failed: {e}")
+    
+    async def aiter_transcription(self, audio: ProcessedAudio) -> AsyncIterator[List[Word]]:
+        """
+        Async form of ``iter_transcription``.
+        
+        Each window is decoded in the event loop's default executor, so the
+        loop stays responsive while Whisper runs.
+        
+        Args:
+            audio: ProcessedAudio object with audio data
+            
+        Yields:
+            Non-empty lists of Word objects in time order
+        """
+        loop = asyncio.get_running_loop()
+        batches = self.iter_transcription(audio)
+        done = object()
+        while True:
+            batch = await loop.run_in_executor(None, next, batches, done)
+            if batch is done:
+                return
+            yield batch
+    
+    def _store_cached(self, cache_key: str, words: List[Word], audio: ProcessedAudio) -> None:
+        """Save words to the cache; failures are logged and never abort transcription."""
+        try:
+            self.cache.store(cache_key, words, {
+                "model": self.config.model,
+                "backend": self.config.backend,
+                "cascade_model": self.config.cascade_model,
+                "audio_duration": audio.duration,
+            })
+        except Exception as e:
+            self.logger.warning("Failed to cache transcription", error=str(e))
+    
+    def _transcription_options(self) -> Dict[str, Any]:
+        """Build Whisper decoding options from configuration."""
+        return {
+            "language": self.config.language,
+            "word_timestamps": self.config.word_timestamps,
+            "temperature": self.config.temperature,
+            "condition_on_previous_text": False,  # More deterministic
+            "compression_ratio_threshold": 2.4,
+            "logprob_threshold": -1.0,
+            "no_speech_threshold": 0.6,
+            "fp16": self.config.precision == "fp16",
+        }
+    
+    def _transcribe_array(self, data: np.ndarray) -> List[Word]:
+        """
+        Run Whisper on a sample array and extract words.
+        
+        Timestamps are relative to the start of ``data``.
+        """
+        options = self._transcription_options()
+        
+        self.log_progress("Starting Whisper transcription", **options)
+        
+        # Transcribe audio
+        result = self.backend.transcribe(self.model, data, options)
+        
+        return self._extract_words(result)
+    
+    def _extract_words(self, result: Dict[str, Any]) -> List[Word]:
+        """Convert a Whisper result dictionary into Word objects."""
+        texts, starts, ends, confidences = self._extract_columns(result)
+        return [Word(text=text, start_time=start, end_time=end, confidence=confidence)
+                for text, start, end, confidence in zip(texts, starts, ends, confidences)]
+    
+    def _extract_table(self, result: Dict[str, Any]) -> 'WordTable':
+        """Read a Whisper result dictionary straight into a WordTable."""
+        from .word_table import WordTable
+        return WordTable.from_columns(*self._extract_columns(result))
+    
+    def _extract_columns(self, result: Dict[str, Any]) -> Tuple[List[str], List[float], List[float], List[float]]:
+        """
+        Word texts, start times, end times and confidences of a Whisper result.
+        
+        Returns:
+            Tuple of four aligned lists
+        """
+        texts, starts, ends, confidences = [], [], [], []
+        
+        # Extract word-level information
+        if "segments" in result:
+            for segment in result["segments"]:
+                if "words" in segment:
+                    for word_info in segment["words"]:
+                        texts.append(word_info["word"].strip())
+                        starts.append(word_info["start"])
+                        ends.append(word_info["end"])
+                        confidences.append(word_info.get("probability", 0.0))
+        
+        # Fallback: if no word timestamps, create from segments
+        if not texts and "segments" in result:
+            self.log_progress("No word timestamps found, using segment-level timing")
+            for segment in result["segments"]:
+                # Split segment text into words and estimate timing
+                segment_words = segment["text"].strip().split()
+                segment_duration = segment["end"] - segment["start"]
+                word_duration = segment_duration / len(segment_words) if segment_words else 0
+                
+                for i, word_text in enumerate(segment_words):
+                    word_start = segment["start"] + (i * word_duration)
+                    texts.append(word_text.strip())
+                    starts.append(word_start)
+                    ends.append(word_start + word_duration)
+                    confidences.append(segment.get("avg_logprob", 0.0))
+        
+        return texts, starts, ends, confidences
+    
+    def _transcribe_chunked(self, audio: ProcessedAudio) -> List[Word]:
+        """
+        Transcribe long audio as overlapping chunks cut at quiet points.
+        
+        Chunks run in a process pool when ``chunk_workers`` > 1, each worker
+        holding its own copy of the model in its registry. The pool outlives
+        the call (see get_chunk_pool), so later files reuse the workers'
+        loaded models. Word timestamps are shifted back onto the original
+        timeline and boundary duplicates removed.
+        """
+        from .chunking import plan_chunks, stitch_chunk_words
+        
+        chunks = plan_chunks(audio.data, audio.sample_rate,
+                             self.config.chunk_length_s, self.config.chunk_overlap_s)
+        workers = min(self.config.chunk_workers, len(chunks))
+        
+        self.log_progress("Chunked transcription",
+                        chunks=len(chunks),
+                        workers=workers,
+                        chunk_length_s=self.config.chunk_length_s,
+                        overlap_s=self.config.chunk_overlap_s)
+        
+        segments = [audio.data[chunk.start_sample:chunk.end_sample] for chunk in chunks]
+        
+        if workers <= 1:
+            chunk_words = [self._transcribe_array(segment) for segment in segments]
+        else:
+            config_data = self.config.model_dump()
+            pool = get_chunk_pool(self.config.chunk_workers)
+            try:
+                chunk_words = list(pool.map(
+                    _transcribe_chunk_worker,
+                    [config_data] * len(segments),
+                    segments
+                ))
+            except BrokenProcessPool:
+                _discard_chunk_pool(self.config.chunk_workers, pool)
+                raise
+        
+        return stitch_chunk_words(list(zip(chunks, chunk_words)), audio.sample_rate)
+    
+    def _refine_weak_spans(self, audio: ProcessedAudio, words: List[Word]) -> List[Word]:
+        """
+        Re-transcribe regions around low-confidence words with ``cascade_model``.
+        
+        The regions are cut at the pauses around their outermost words, so the
+        larger model only decodes the audio the fast model was unsure about and
+        its words are spliced in place of the fast model's.
+        """
+        from .cascade import plan_refinement_spans, splice_refined_words
+        
+        spans = plan_refinement_spans(words,
+                                      self.config.cascade_threshold,
+                                      self.config.cascade_context_s,
+                                      self.config.cascade_merge_gap_s,
+                                      audio.duration)
+        refined_seconds = sum(span.duration for span in spans)
+        self.log_progress("Cascade refinement",
+                        cascade_model=self.config.cascade_model,
+                        spans=len(spans),
+                        refined_seconds=round(refined_seconds, 2),
+                        refined_ratio=round(refined_seconds / audio.duration, 3) if audio.duration else 0)
+        if not spans:
+            return words
+        
+        refiner = TranscriptionEngine(_cascade_config(self.config))
+        refinements = []
+        for span in spans:
+            start = int(round(span.start * audio.sample_rate))
+            end = int(round(span.end * audio.sample_rate))
+            refinements.append((span, refiner._transcribe_array(audio.data[start:end])))
+        
+        return splice_refined_words(words, refinements)
+
+
+def _cascade_config(whisper_config: WhisperConfig) -> WhisperConfig:
+    """Configuration for the cascade's larger model (same backend and decoding options)."""
+    return whisper_config.model_copy(update={"model": whisper_config.cascade_model,
+                                             "cascade_model": None})
+
+
+_chunk_pools: Dict[int, ProcessPoolExecutor] = {}
+_chunk_pools_lock = threading.Lock()
+
+
+def get_chunk_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool of ``workers`` chunk transcription workers.
+    
+    One pool per size is kept for the life of the process (or until
+    shutdown_chunk_pools), so each worker loads its model once rather than
+    once per file.
+    
+    Args:
+        workers: Number of worker processes
+        
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    with _chunk_pools_lock:
+        pool = _chunk_pools.get(workers)
+        if pool is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+            pool = ProcessPoolExecutor(max_workers=workers,
+                                       mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_init_chunk_worker,
+                                       initargs=(threads_per_worker,))
+            _chunk_pools[workers] = pool
+        return pool
+
+
+def _discard_chunk_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next call starts a fresh one."""
+    with _chunk_pools_lock:
+        if _chunk_pools.get(workers) is pool:
+            del _chunk_pools[workers]
+    pool.shutdown(wait=False)
+
+
+def shutdown_chunk_pools() -> None:
+    """Stop every chunk worker pool, releasing the models loaded in the workers."""
+    with _chunk_pools_lock:
+        pools = list(_chunk_pools.values())
+        _chunk_pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_chunk_pools)
+
+
+def _init_chunk_worker(num_threads: int) -> None:
+    """Limit torch threads in each chunk worker so workers do not oversubscribe cores."""
+    torch.set_num_threads(num_threads)
+
+
+def _transcribe_chunk_worker(config_data: Dict[str, Any], data: np.ndarray) -> List[Word]:
+    """Transcribe one chunk in a worker process (model cached per process)."""
+    engine = TranscriptionEngine(WhisperConfig(**config_data))
+    return engine._transcribe_array(data)
+
+
+class TranscriptionCache(LoggerMixin):
+    """
+    Disk cache of transcription results.
+    
+    Entries are keyed by a hash of the samples handed to Whisper and a
+    canonical hash of every WhisperConfig field that can change the output,
+    and stored as a compressed .npz of word columns (text, start, end,
+    confidence) plus a JSON sidecar describing the run. One instance is
+    shared per directory so hit/miss counts cover the whole process.
+    """
+    
+    # Bump when the stored word format or transcription semantics change
+    FORMAT_VERSION = 1
+    
+    # Settings that affect resource use but not the transcribed words
+    _NON_OUTPUT_FIELDS = {"cache_dir", "cache_max_mb", "max_loaded_models",
+                          "model_memory_budget_mb", "chunk_workers"}
+    
+    _instances: Dict[Tuple[str, int], 'TranscriptionCache'] = {}
+    
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        super().__init__()
+        self.disk = DiskCache(directory, max_bytes)
+    
+    @classmethod
+    def from_config(cls, config: WhisperConfig) -> Optional['TranscriptionCache']:
+        """Shared cache for the configured directory, or None when caching is disabled."""
+        if not config.cache_dir:
+            return None
+        max_bytes = config.cache_max_mb * 1024 * 1024
+        key = (os.path.abspath(config.cache_dir), max_bytes)
+        if key not in cls._instances:
+            cls._instances[key] = cls(config.cache_dir, max_bytes)
+        return cls._instances[key]
+    
+    @classmethod
+    def key_for(cls, audio: ProcessedAudio, config: WhisperConfig) -> str:
+        """
+        Cache key for audio samples under the given Whisper settings.
+        
+        Uses the audio's fingerprint when the decoder supplied one (it already
+        identifies the samples); otherwise the samples are hashed.
+        """
+        settings = config.model_dump(exclude=cls._NON_OUTPUT_FIELDS)
+        samples = ("source", audio.fingerprint) if audio.fingerprint else ("samples", array_fingerprint(audio.data))
+        return config_fingerprint("transcription", cls.FORMAT_VERSION,
+                                  samples, audio.sample_rate, settings)
+    
+    def load(self, key: str) -> Optional[List[Word]]:
+        """Read a cached word list, or None on a miss or unreadable entry."""
+        paths = self.disk.lookup(key, [".npz", ".json"])
+        if paths is None:
+            return None
+        try:
+            with np.load(paths[".npz"], allow_pickle=False) as columns:
+                return [
+                    Word(text=str(text), start_time=float(start), end_time=float(end),
+                         confidence=float(confidence))
+                    for text, start, end, confidence in zip(
+                        columns["text"], columns["start"], columns["end"], columns["confidence"]
+                    )
+                ]
+        except Exception as e:
+            self.logger.warning("Unreadable transcription cache entry discarded", key=key, error=str(e))
+            self.disk.discard(key)
+            return None
+    
+    def store(self, key: str, words: List[Word], info: Dict[str, Any]) -> None:
+        """Write an entry and evict old ones beyond the size cap."""
+        words_tmp = self.disk.temp_path(key, ".npz")
+        info_tmp = self.disk.temp_path(key, ".json")
+        with open(words_tmp, 'wb') as f:
+            np.savez_compressed(
+                f,
+                text=np.array([w.text for w in words], dtype=np.str_),
+                start=np.array([w.start_time for w in words], dtype=np.float64),
+                end=np.array([w.end_time for w in words], dtype=np.float64),
+                confidence=np.array([w.confidence for w in words], dtype=np.float64),
+            )
+        with open(info_tmp, 'w', encoding='utf-8') as f:
+            json.dump({**info, "word_count": len(words), "format_version": self.FORMAT_VERSION}, f)
+        self.disk.commit(key, {".npz": words_tmp, ".json": info_tmp})
+    
+    def invalidate(self, key: str) -> None:
+        """Remove one entry."""
+        self.disk.discard(key)
+    
+    def clear(self) -> int:
+        """Remove every entry; returns the number removed."""
+        return self.disk.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Process-wide hit/miss counts for this cache."""
+        lookups = self.disk.hits + self.disk.misses
+        return {
+            "cache_hits": self.disk.hits,
+            "cache_misses": self.disk.misses,
+            "cache_hit_rate": round(self.disk.hits / lookups, 3) if lookups else 0.0,
+            "cache_evictions": self.disk.evictions,
+        }
+
 
 def transcribe_audio(audio: ProcessedAudio, whisper_config: WhisperConfig) -> List[Word]:
     """
     Convenience function for transcribing audio.
     
+    The Whisper model is shared through the model registry, so repeated calls
+    with the same configuration load the model only once per process.
+    
     Args:
         audio: ProcessedAudio object
         whisper_config: Whisper configuration
@@ -147,4 +656,99 @@ def transcribe_audio(audio: ProcessedAudio, whisper_config: WhisperConfig) -> Li
         TranscriptionError: If transcription fails
     """
     engine = TranscriptionEngine(whisper_config)
-    return engine.transcribe_audio(audio)
\ No newline at end of file
+    return engine.transcribe_audio(audio)
+
+
+def transcribe_table(audio: ProcessedAudio, whisper_config: WhisperConfig) -> 'WordTable':
+    """
+    Convenience function for transcribing audio into a columnar WordTable.
+    
+    Args:
+        audio: ProcessedAudio object
+        whisper_config: Whisper configuration
+        
+    Returns:
+        WordTable with one row per word
+        
+    Raises:
+        TranscriptionError: If transcription fails
+    """
+    engine = TranscriptionEngine(whisper_config)
+    return engine.transcribe_table(audio)
+
+
+def transcribe_stream(audio: ProcessedAudio, whisper_config: WhisperConfig) -> Iterator[List[Word]]:
+    """
+    Convenience generator yielding word batches as each window is transcribed.
+    
+    Args:
+        audio: ProcessedAudio object
+        whisper_config: Whisper configuration
+        
+    Yields:
+        Lists of Word objects in time order
+        
+    Raises:
+        TranscriptionError: If transcription fails
+    """
+    engine = TranscriptionEngine(whisper_config)
+    yield from engine.iter_transcription(audio)
+
+
+def whisper_model_keys(whisper_config: WhisperConfig) -> List[tuple]:
+    """
+    Registry keys of the models a configuration loads: the Whisper model and,
+    if configured, the cascade model.
+    
+    Args:
+        whisper_config: Whisper configuration
+        
+    Returns:
+        Model registry keys
+    """
+    configs = [whisper_config]
+    if whisper_config.cascade_model:
+        configs.append(_cascade_config(whisper_config))
+    return [create_backend(config).model_key for config in configs]
+
+
+def preload_whisper_model(whisper_config: WhisperConfig) -> None:
+    """
+    Load the configured Whisper model (and cascade model) into the registry
+    ahead of first use.
+    
+    Args:
+        whisper_config: Whisper configuration
+    """
+    TranscriptionEngine(whisper_config).model
+    if whisper_config.cascade_model:
+        TranscriptionEngine(_cascade_config(whisper_config)).model
+
+
+def release_whisper_model(whisper_config: WhisperConfig) -> bool:
+    """
+    Drop the configured Whisper model (and cascade model) from the registry.
+    
+    Args:
+        whisper_config: Whisper configuration
+        
+    Returns:
+        True if a loaded model was released
+    """
+    registry = get_model_registry()
+    released = [registry.release(key) for key in whisper_model_keys(whisper_config)]
+    return any(released)
+
+
+def clear_transcription_cache(whisper_config: WhisperConfig) -> int:
+    """
+    Remove every cached transcription in the configured cache directory.
+    
+    Args:
+        whisper_config: Whisper configuration (``cache_dir`` selects the cache)
+        
+    Returns:
+        Number of entries removed (0 when caching is disabled)
+    """
+    cache = TranscriptionCache.from_config(whisper_config)
+    return cache.clear() if cache else 0
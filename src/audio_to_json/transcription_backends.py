@@ -0,0 +1,189 @@
+"""
+Interchangeable Whisper inference backends for the transcription engine.
+
+Each backend loads a model for a WhisperConfig and transcribes a 16 kHz
+float32 array into an openai-whisper style result dictionary (segments with
+text, timing, avg_logprob and per-word timing/probability), so the engine
+extracts the same Word list whichever backend produced it.
+
+Backends:
+    openai          - openai-whisper on PyTorch (reference implementation);
+                      precision "int8" applies dynamic quantization on CPU
+    faster-whisper  - CTranslate2 via faster-whisper, int8 on CPU by default
+                      (optional: pip install faster-whisper)
+"""
+import warnings
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Hashable
+
+import numpy as np
+import torch
+import whisper
+
+from ..shared.config import WhisperConfig
+from ..shared.exceptions import TranscriptionError
+
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    WhisperModel = None
+    FASTER_WHISPER_AVAILABLE = False
+
+
+class TranscriptionBackend(ABC):
+    """Base class: loads a model and runs it on a sample array."""
+
+    name = "base"
+
+    def __init__(self, config: WhisperConfig):
+        self.config = config
+
+    @property
+    @abstractmethod
+    def model_key(self) -> Hashable:
+        """Registry key identifying the loaded model."""
+
+    @abstractmethod
+    def load_model(self) -> Any:
+        """Load the model (called by the model registry on a miss)."""
+
+    @abstractmethod
+    def transcribe(self, model: Any, data: np.ndarray, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transcribe audio into a whisper-style result dictionary.
+
+        Args:
+            model: Model returned by load_model
+            data: Mono float32 samples at 16 kHz
+            options: Decoding options from TranscriptionEngine._transcription_options
+
+        Returns:
+            Dictionary with "text" and "segments" (each with "words")
+        """
+
+
+class OpenAIWhisperBackend(TranscriptionBackend):
+    """Reference backend: openai-whisper on PyTorch."""
+
+    name = "openai"
+
+    @property
+    def model_key(self) -> Hashable:
+        return ("whisper", self.config.model, self.config.device or "auto", self.config.precision)
+
+    def load_model(self) -> Any:
+        if self.config.precision == "int8":
+            if self.config.device not in (None, "cpu"):
+                raise TranscriptionError("int8 precision is only supported on CPU",
+                                         {"device": self.config.device})
+            return quantize_whisper_int8(whisper.load_model(self.config.model, device="cpu"))
+        if self.config.device:
+            return whisper.load_model(self.config.model, device=self.config.device)
+        return whisper.load_model(self.config.model)
+
+    def transcribe(self, model: Any, data: np.ndarray, options: Dict[str, Any]) -> Dict[str, Any]:
+        return model.transcribe(data, **options)
+
+
+def quantize_whisper_int8(model: Any) -> Any:
+    """
+    Apply PyTorch dynamic int8 quantization to a Whisper model's linear layers.
+
+    Weights of every attention and MLP projection are stored as int8 and
+    activations are quantized on the fly, which cuts their memory by 4x and
+    speeds up CPU inference. Embeddings, convolutions and layer norms stay
+    in float32. The model is modified in place.
+
+    Args:
+        model: openai-whisper model on CPU
+
+    Returns:
+        The quantized model
+    """
+    # whisper.model.Linear only adds a dtype cast for fp16; quantize_dynamic
+    # matches exact module types, so treat them as plain nn.Linear
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", (DeprecationWarning, UserWarning))
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """CTranslate2 backend via faster-whisper (int8 weights on CPU by default)."""
+
+    name = "faster-whisper"
+
+    @property
+    def model_key(self) -> Hashable:
+        return ("faster-whisper", self.config.model, self.config.device or "cpu", self.config.compute_type)
+
+    def load_model(self) -> Any:
+        if not FASTER_WHISPER_AVAILABLE:
+            raise TranscriptionError(
+                "faster-whisper backend requested but faster-whisper is not installed. "
+                "Install with: pip install faster-whisper"
+            )
+        return WhisperModel(self.config.model,
+                            device=self.config.device or "cpu",
+                            compute_type=self.config.compute_type)
+
+    def transcribe(self, model: Any, data: np.ndarray, options: Dict[str, Any]) -> Dict[str, Any]:
+        segments, _ = model.transcribe(
+            np.asarray(data, dtype=np.float32),
+            language=options["language"],
+            word_timestamps=options["word_timestamps"],
+            temperature=options["temperature"],
+            condition_on_previous_text=options["condition_on_previous_text"],
+            compression_ratio_threshold=options["compression_ratio_threshold"],
+            log_prob_threshold=options["logprob_threshold"],
+            no_speech_threshold=options["no_speech_threshold"],
+            # openai-whisper decodes greedily at temperature 0
+            beam_size=1,
+            best_of=1,
+        )
+
+        result_segments = []
+        for segment in segments:  # Lazy generator: decoding happens here
+            result_segments.append({
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "words": [
+                    {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                    for w in (segment.words or [])
+                ],
+            })
+        return {"text": "".join(s["text"] for s in result_segments), "segments": result_segments}
+
+
+_BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def create_backend(config: WhisperConfig) -> TranscriptionBackend:
+    """
+    Instantiate the backend selected by ``config.backend``.
+
+    Args:
+        config: Whisper configuration
+
+    Returns:
+        TranscriptionBackend instance
+
+    Raises:
+        TranscriptionError: If the backend name is unknown
+    """
+    backend_class = _BACKENDS.get(config.backend)
+    if backend_class is None:
+        raise TranscriptionError(f"Unknown transcription backend: {config.backend}",
+                                 {"valid_backends": sorted(_BACKENDS)})
+    return backend_class(config)
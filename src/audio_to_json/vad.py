@@ -0,0 +1,307 @@
+"""
+Voice activity detection for skipping silence before transcription and diarization.
+
+Finds the voiced regions of decoded audio, either from frame energy relative
+to the recording's noise floor or with the optional Silero VAD model. The
+result is a SpeechRegionMap, which joins the voiced regions into a shorter
+buffer (separated by a short silent gap) and maps times on that buffer back
+onto the original timeline, so Whisper and PyAnnote only process speech.
+"""
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..shared.config import VadConfig
+from ..shared.models import DiarizationResult
+from ..shared.fingerprint import config_fingerprint
+from ..shared.logging_config import LoggerMixin
+from .audio_processor import ProcessedAudio
+from .model_registry import get_model_registry
+from .transcription import Word
+from .word_table import WordTable
+
+
+# Frames quieter than this (dBFS) are never treated as speech
+_MIN_SPEECH_DB = -65.0
+
+# Percentiles of frame energy used as the noise floor and speech level
+_FLOOR_PERCENTILE = 10
+_PEAK_PERCENTILE = 99
+
+# Sample rates the Silero model accepts
+_SILERO_SAMPLE_RATES = (8000, 16000)
+
+
+class SpeechRegionMap:
+    """Voiced regions of a recording and the mapping to a speech-only buffer."""
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int], sample_rate: int,
+                 total_samples: int, gap_samples: int = 0):
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        self.sample_rate = sample_rate
+        self.total_samples = total_samples
+        self.gap_samples = gap_samples
+
+        # Start of each region in the compacted buffer
+        strides = self.ends - self.starts + gap_samples
+        self.compact_starts = (np.cumsum(strides) - strides).astype(np.int64)
+
+    @classmethod
+    def full(cls, total_samples: int, sample_rate: int) -> "SpeechRegionMap":
+        """Map that keeps the whole recording."""
+        return cls([0], [total_samples], sample_rate, total_samples)
+
+    @classmethod
+    def from_seconds(cls, regions: Sequence[Tuple[float, float]], sample_rate: int,
+                     total_samples: int, gap_s: float = 0.0) -> "SpeechRegionMap":
+        """Build a map from (start, end) times, snapped to the sample grid."""
+        starts = [max(0, int(round(start * sample_rate))) for start, _ in regions]
+        ends = [min(total_samples, int(round(end * sample_rate))) for _, end in regions]
+        return cls(starts, ends, sample_rate, total_samples, int(round(gap_s * sample_rate)))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def regions(self) -> List[Tuple[float, float]]:
+        """Voiced (start, end) times on the original timeline."""
+        return [(s / self.sample_rate, e / self.sample_rate) for s, e in zip(self.starts, self.ends)]
+
+    @property
+    def speech_duration(self) -> float:
+        """Total voiced time in seconds."""
+        return float(np.sum(self.ends - self.starts)) / self.sample_rate
+
+    @property
+    def speech_ratio(self) -> float:
+        """Fraction of the recording that is voiced."""
+        return self.speech_duration * self.sample_rate / self.total_samples if self.total_samples else 0.0
+
+    @property
+    def covers_everything(self) -> bool:
+        """True if compacting would not remove anything."""
+        return len(self) == 1 and self.starts[0] == 0 and self.ends[0] >= self.total_samples
+
+    def compact(self, audio: ProcessedAudio) -> ProcessedAudio:
+        """
+        Join the voiced regions into one buffer, separated by silent gaps.
+
+        Args:
+            audio: Decoded audio on the original timeline (1-D or channels x samples)
+
+        Returns:
+            ProcessedAudio holding only speech; metadata still describes the original file
+            and the fingerprint (if the input has one) covers the regions kept
+        """
+        if self.covers_everything:
+            return audio
+
+        lengths = self.ends - self.starts
+        total = int(np.sum(lengths) + self.gap_samples * max(len(self) - 1, 0))
+        data = np.zeros(audio.data.shape[:-1] + (total,), dtype=audio.data.dtype)
+        for start, end, offset in zip(self.starts, self.ends, self.compact_starts):
+            data[..., offset:offset + end - start] = audio.data[..., start:end]
+        fingerprint = None
+        if audio.fingerprint:
+            fingerprint = config_fingerprint("speech-only", audio.fingerprint, self.starts.tolist(),
+                                             self.ends.tolist(), self.gap_samples)
+        return ProcessedAudio(data=data, sample_rate=audio.sample_rate,
+                              duration=total / audio.sample_rate, metadata=audio.metadata,
+                              fingerprint=fingerprint)
+
+    def to_original(self, times) -> np.ndarray:
+        """
+        Map times on the compacted buffer back onto the original timeline.
+
+        Times inside a region shift by that region's offset. Times inside a gap
+        snap to the nearer side: the end of the previous region or the start of
+        the next one.
+
+        Args:
+            times: Scalar or array of seconds on the compacted buffer
+
+        Returns:
+            Array of seconds on the original timeline
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        if len(self) == 0:
+            return times.copy()
+
+        positions = times * self.sample_rate
+        compact_starts = self.compact_starts.astype(np.float64)
+        region = np.clip(np.searchsorted(compact_starts, positions, side='right') - 1, 0, len(self) - 1)
+        offset = np.maximum(positions - compact_starts[region], 0.0)
+        length = (self.ends - self.starts)[region]
+
+        original = self.starts[region] + np.minimum(offset, length)
+        in_gap = offset > length
+        has_next = region + 1 < len(self)
+        to_next = in_gap & has_next & (offset - length > self.gap_samples / 2)
+        original = np.where(to_next, self.starts[np.minimum(region + 1, len(self) - 1)], original)
+        return original / self.sample_rate
+
+    def map_words(self, words: Union[List[Word], WordTable]) -> Union[List[Word], WordTable]:
+        """Shift word timestamps from the compacted buffer to the original timeline."""
+        if isinstance(words, WordTable):
+            return WordTable(self.to_original(words.start), self.to_original(words.end),
+                             words.confidence, words.text_offsets, words.text_buffer)
+        if not words:
+            return []
+        starts = self.to_original([w.start_time for w in words])
+        ends = self.to_original([w.end_time for w in words])
+        return [Word(text=w.text, start_time=float(s), end_time=float(e), confidence=w.confidence)
+                for w, s, e in zip(words, starts, ends)]
+
+    def map_diarization(self, result: DiarizationResult) -> DiarizationResult:
+        """
+        Shift speaker segments to the original timeline.
+
+        Segments that fall entirely inside a gap collapse to zero length and
+        are dropped.
+        """
+        if not result.segments:
+            return result.model_copy(update={"audio_duration": self.total_samples / self.sample_rate})
+        starts = self.to_original([s.start_time for s in result.segments])
+        ends = self.to_original([s.end_time for s in result.segments])
+        segments = [
+            segment.model_copy(update={"start_time": float(start), "end_time": float(end)})
+            for segment, start, end in zip(result.segments, starts, ends) if end > start
+        ]
+        speakers = [speaker for speaker in result.speakers
+                    if any(s.speaker_id == speaker for s in segments)]
+        return DiarizationResult(
+            speakers=speakers,
+            segments=segments,
+            audio_duration=self.total_samples / self.sample_rate,
+            processing_time=result.processing_time
+        )
+
+
+class VoiceActivityDetector(LoggerMixin):
+    """Finds voiced regions in decoded audio."""
+
+    def __init__(self, config: VadConfig):
+        super().__init__()
+        self.config = config
+
+    def detect(self, audio: ProcessedAudio) -> SpeechRegionMap:
+        """
+        Detect voiced regions.
+
+        Falls back to keeping the whole recording when no speech is found, so
+        a misjudged threshold never drops a recording entirely.
+
+        Args:
+            audio: Decoded audio
+
+        Returns:
+            SpeechRegionMap over the audio's timeline
+        """
+        self.log_stage_start("voice_activity_detection", method=self.config.method,
+                           duration=audio.duration)
+
+        data = audio.data if audio.data.ndim == 1 else audio.data.mean(axis=0)
+        total = data.shape[-1]
+
+        regions = None
+        if self.config.method == "silero":
+            regions = self._silero_regions(data, audio.sample_rate)
+        if regions is None:
+            regions = self._energy_regions(data, audio.sample_rate)
+
+        if not regions:
+            self.logger.warning("No speech detected, keeping the whole recording")
+            speech = SpeechRegionMap.full(total, audio.sample_rate)
+        else:
+            speech = SpeechRegionMap.from_seconds(regions, audio.sample_rate, total, self.config.gap_s)
+
+        self.log_stage_complete("voice_activity_detection",
+                              regions=len(speech),
+                              speech_duration=round(speech.speech_duration, 2),
+                              speech_ratio=round(speech.speech_ratio, 3))
+        return speech
+
+    def _energy_regions(self, data: np.ndarray, sample_rate: int) -> List[Tuple[float, float]]:
+        """Regions whose frame energy is well above the recording's noise floor."""
+        frame = max(1, int(round(self.config.frame_seconds * sample_rate)))
+        n_frames = len(data) // frame
+        if n_frames == 0:
+            return []
+
+        frames = np.asarray(data[:n_frames * frame], dtype=np.float32).reshape(n_frames, frame)
+        energy_db = 10 * np.log10(np.einsum("ij,ij->i", frames, frames) / frame + 1e-12)
+
+        floor = np.percentile(energy_db, _FLOOR_PERCENTILE)
+        peak = np.percentile(energy_db, _PEAK_PERCENTILE)
+        margin = self.config.energy_margin_db
+        threshold = max(min(floor + margin, peak - margin), _MIN_SPEECH_DB)
+        voiced = energy_db > threshold
+
+        frame_s = frame / sample_rate
+        return self._smooth(voiced, frame_s, len(data) / sample_rate)
+
+    def _smooth(self, voiced: np.ndarray, frame_s: float, duration: float) -> List[Tuple[float, float]]:
+        """Turn a per-frame voiced mask into padded, merged regions."""
+        edges = np.diff(np.concatenate([[0], voiced.astype(np.int8), [0]]))
+        run_starts = np.flatnonzero(edges == 1) * frame_s
+        run_ends = np.flatnonzero(edges == -1) * frame_s
+
+        regions: List[List[float]] = []
+        for start, end in zip(run_starts, run_ends):
+            # Bridge short pauses inside an utterance
+            if regions and start - regions[-1][1] < self.config.min_silence_s:
+                regions[-1][1] = end
+            else:
+                regions.append([start, end])
+
+        padding = self.config.padding_s
+        padded: List[List[float]] = []
+        for start, end in regions:
+            if end - start < self.config.min_speech_s:
+                continue
+            start, end = max(0.0, start - padding), min(duration, end + padding)
+            if padded and start <= padded[-1][1]:
+                padded[-1][1] = end
+            else:
+                padded.append([start, end])
+        return [(float(start), float(end)) for start, end in padded]
+
+    def _silero_regions(self, data: np.ndarray, sample_rate: int) -> Optional[List[Tuple[float, float]]]:
+        """Regions from the Silero VAD model, or None if it cannot be used."""
+        try:
+            import torch
+            from silero_vad import load_silero_vad, get_speech_timestamps
+        except ImportError:
+            self.logger.warning("silero-vad not installed, using energy VAD")
+            return None
+        if sample_rate not in _SILERO_SAMPLE_RATES:
+            self.logger.warning("Sample rate not supported by Silero VAD, using energy VAD",
+                              sample_rate=sample_rate)
+            return None
+
+        model = get_model_registry().get_or_load(("silero_vad",), load_silero_vad)
+        timestamps = get_speech_timestamps(
+            torch.from_numpy(np.ascontiguousarray(data, dtype=np.float32)), model,
+            sampling_rate=sample_rate,
+            min_speech_duration_ms=int(self.config.min_speech_s * 1000),
+            min_silence_duration_ms=int(self.config.min_silence_s * 1000),
+            speech_pad_ms=int(self.config.padding_s * 1000),
+            return_seconds=True
+        )
+        return [(float(t["start"]), float(t["end"])) for t in timestamps]
+
+
+def detect_speech(audio: ProcessedAudio, config: VadConfig) -> SpeechRegionMap:
+    """
+    Convenience function for voice activity detection.
+
+    Args:
+        audio: Decoded audio
+        config: VAD configuration
+
+    Returns:
+        SpeechRegionMap of the voiced regions
+    """
+    detector = VoiceActivityDetector(config)
+    return detector.detect(audio)
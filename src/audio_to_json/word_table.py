@@ -0,0 +1,133 @@
+"""
+Columnar storage for transcribed words.
+
+A WordTable holds start, end and confidence as NumPy arrays and all word
+texts in one string with an offsets array, instead of one Word object per
+word. Downstream stages read whole columns (durations, centres) with
+vectorized operations, and a 100k-word transcript costs a few megabytes
+rather than one Python object, three floats and a string per word.
+"""
+from typing import Iterable, Iterator, List, Sequence, Union
+
+import numpy as np
+
+from .transcription import Word
+
+
+class WordTable:
+    """Struct-of-arrays word list."""
+
+    __slots__ = ("start", "end", "confidence", "text_offsets", "text_buffer")
+
+    def __init__(self, start: np.ndarray, end: np.ndarray, confidence: np.ndarray,
+                 text_offsets: np.ndarray, text_buffer: str):
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.confidence = np.asarray(confidence, dtype=np.float64)
+        self.text_offsets = np.asarray(text_offsets, dtype=np.int64)
+        self.text_buffer = text_buffer
+
+    @classmethod
+    def from_columns(cls, texts: Sequence[str], start, end, confidence) -> "WordTable":
+        """Build a table from a list of texts and three numeric sequences."""
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(t) for t in texts], out=offsets[1:])
+        return cls(start, end, confidence, offsets, "".join(texts))
+
+    @classmethod
+    def from_words(cls, words: Iterable[Word]) -> "WordTable":
+        """
+        Build a table from Word objects.
+
+        Raises:
+            TypeError, ValueError: If a word's times or confidence are not numeric
+        """
+        words = list(words)
+        return cls.from_columns(
+            [w.text for w in words],
+            np.array([float(w.start_time) for w in words], dtype=np.float64),
+            np.array([float(w.end_time) for w in words], dtype=np.float64),
+            np.array([float(w.confidence) for w in words], dtype=np.float64),
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence["WordTable"]) -> "WordTable":
+        """Join tables end to end."""
+        if not tables:
+            return cls.from_columns([], [], [], [])
+        lengths = np.array([len(t.text_buffer) for t in tables], dtype=np.int64)
+        shifts = np.cumsum(lengths) - lengths
+        offsets = np.concatenate([[0]] + [t.text_offsets[1:] + shift for t, shift in zip(tables, shifts)])
+        return cls(
+            np.concatenate([t.start for t in tables]),
+            np.concatenate([t.end for t in tables]),
+            np.concatenate([t.confidence for t in tables]),
+            offsets,
+            "".join(t.text_buffer for t in tables),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def text(self, index: int) -> str:
+        """Text of one word."""
+        return self.text_buffer[self.text_offsets[index]:self.text_offsets[index + 1]]
+
+    def texts(self) -> List[str]:
+        """Texts of every word."""
+        buffer, offsets = self.text_buffer, self.text_offsets.tolist()
+        return [buffer[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+
+    @property
+    def durations(self) -> np.ndarray:
+        return self.end - self.start
+
+    @property
+    def centres(self) -> np.ndarray:
+        return (self.start + self.end) / 2
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and the text buffer."""
+        text_bytes = len(self.text_buffer.encode('utf-8'))
+        return int(self.start.nbytes + self.end.nbytes + self.confidence.nbytes +
+                   self.text_offsets.nbytes + text_bytes)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray, Sequence[int]]) -> Union[Word, "WordTable"]:
+        if isinstance(key, (int, np.integer)):
+            index = int(key) + (len(self) if key < 0 else 0)
+            if not 0 <= index < len(self):
+                raise IndexError("word index out of range")
+            return Word(text=self.text(index), start_time=float(self.start[index]),
+                        end_time=float(self.end[index]), confidence=float(self.confidence[index]))
+        return self.take(np.arange(len(self))[key])
+
+    def take(self, indices) -> "WordTable":
+        """
+        Select rows by integer positions or a boolean mask.
+
+        Args:
+            indices: Integer index array or boolean mask of length len(self)
+
+        Returns:
+            New WordTable with the selected rows in the given order
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        texts = self.texts()
+        return WordTable.from_columns([texts[i] for i in indices.tolist()],
+                                      self.start[indices], self.end[indices], self.confidence[indices])
+
+    def nonempty(self) -> np.ndarray:
+        """Boolean mask of words whose text is not blank."""
+        return np.fromiter((bool(t.strip()) for t in self.texts()), dtype=bool, count=len(self))
+
+    def __iter__(self) -> Iterator[Word]:
+        starts, ends, confidences = self.start.tolist(), self.end.tolist(), self.confidence.tolist()
+        for text, start, end, confidence in zip(self.texts(), starts, ends, confidences):
+            yield Word(text=text, start_time=start, end_time=end, confidence=confidence)
+
+    def to_words(self) -> List[Word]:
+        """Convert back to a list of Word objects."""
+        return list(self)
@@ -17,10 +17,30 @@ from ..shared.exceptions import (
     EntityError, DatabaseError, PipelineError
 )
 from ..shared.logging_config import init_logger
-from ..audio_to_json.pipeline import process_audio_to_json
 from ..shared.models import WordDatabase
 
 
+# The pipeline pulls in whisper, torch, librosa and pyannote. It is imported
+# inside the commands that run it so version/info/speaker commands start fast.
+
+def process_audio_to_json(*args, **kwargs) -> WordDatabase:
+    """Run the audio-to-JSON pipeline (see audio_to_json.pipeline)."""
+    from ..audio_to_json.pipeline import process_audio_to_json as run_pipeline
+    return run_pipeline(*args, **kwargs)
+
+
+def process_batch(*args, **kwargs):
+    """Run the batch pipeline (see audio_to_json.pipeline)."""
+    from ..audio_to_json.pipeline import process_batch as run_batch
+    return run_batch(*args, **kwargs)
+
+
+def probe_audio(audio_path: str):
+    """Read audio metadata from the file header (see audio_to_json.audio_processor)."""
+    from ..audio_to_json.audio_processor import probe_audio as run_probe
+    return run_probe(audio_path)
+
+
 @click.group()
 @click.option('--config', '-c', 
               type=click.Path(exists=True, path_type=Path),
@@ -92,9 +112,12 @@ def cli(ctx, config: Optional[Path], verbose: bool, quiet: bool):
 @click.option('--resume-from', 
               type=click.Choice(['transcription', 'entities', 'database']),
               help='Resume processing from specific stage')
+@click.option('--checkpoints', is_flag=True,
+              help='Save stage checkpoints so interrupted runs can resume')
 @click.pass_context
 def process(ctx, audio_file: Path, output: Optional[Path], 
-           speaker_map: Optional[Path], resume_from: Optional[str]):
+           speaker_map: Optional[Path], resume_from: Optional[str],
+           checkpoints: bool):
     """
     Process an audio file to extract pronunciation clips.
     
@@ -104,11 +127,15 @@ def process(ctx, audio_file: Path, output: Optional[Path],
         pronunciation-clips process audio.wav
         pronunciation-clips process audio.wav --output results.json
         pronunciation-clips process audio.wav --speaker-map speakers.json
+        pronunciation-clips process audio.wav --checkpoints --resume-from database
     """
     config = ctx.obj['config']
     verbose = ctx.obj['verbose']
     quiet = ctx.obj['quiet']
     
+    if checkpoints:
+        config.processing.checkpoints = True
+    
     try:
         if not quiet:
             click.echo(f"Processing: {audio_file}")
@@ -194,6 +221,148 @@ def process(ctx, audio_file: Path, output: Optional[Path],
         sys.exit(1)
 
 
+@cli.command('process-batch')
+@click.argument('source')
+@click.option('--output-dir', '-o',
+              type=click.Path(file_okay=False, path_type=Path),
+              help='Directory for JSON outputs (default: next to each audio file; '
+                   'a.wav and a.mp3 become a.wav.json and a.mp3.json)')
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=1,
+              help='Number of worker processes (default: 1)')
+@click.option('--pattern', '-p',
+              help='Glob filter when SOURCE is a directory (e.g. "*.wav")')
+@click.option('--speaker-map', '-s',
+              type=click.Path(exists=True, path_type=Path),
+              help='JSON file with speaker time mappings applied to every file')
+@click.option('--summary',
+              type=click.Path(path_type=Path),
+              help='Write per-file results summary to this JSON file')
+@click.pass_context
+def process_batch_command(ctx, source: str, output_dir: Optional[Path], workers: int,
+                          pattern: Optional[str], speaker_map: Optional[Path],
+                          summary: Optional[Path]):
+    """
+    Process many audio files in parallel.
+    
+    SOURCE: Directory of audio files, glob pattern, or manifest (.txt/.json)
+    
+    Examples:
+        pronunciation-clips process-batch recordings/ --workers 8
+        pronunciation-clips process-batch "recordings/**/*.mp3" -o results/
+        pronunciation-clips process-batch manifest.txt --summary batch_summary.json
+    """
+    config = ctx.obj['config']
+    verbose = ctx.obj['verbose']
+    quiet = ctx.obj['quiet']
+    
+    try:
+        speaker_mapping = None
+        if speaker_map:
+            with open(speaker_map, 'r') as f:
+                speaker_mapping = json.load(f)
+        
+        if not quiet:
+            click.echo(f"Batch processing: {source} ({workers} worker{'s' if workers != 1 else ''})")
+        
+        batch_summary = process_batch(
+            source,
+            config,
+            str(output_dir) if output_dir else None,
+            workers,
+            speaker_mapping,
+            pattern
+        )
+        
+        if summary:
+            summary.parent.mkdir(parents=True, exist_ok=True)
+            with open(summary, 'w', encoding='utf-8') as f:
+                json.dump(batch_summary.model_dump(), f, indent=2, ensure_ascii=False)
+        
+        if not quiet:
+            click.echo(f"✓ Batch complete in {batch_summary.total_time:.1f}s")
+            click.echo(f"  Succeeded: {batch_summary.succeeded}")
+            click.echo(f"  Failed: {batch_summary.failed}")
+            if batch_summary.total_time > 0:
+                click.echo(f"  Throughput: {batch_summary.total_audio_duration / batch_summary.total_time:.1f}x realtime")
+            if summary:
+                click.echo(f"  Summary saved: {summary}")
+        
+        for result in batch_summary.results:
+            if not result.success:
+                click.echo(f"  ✗ {result.audio_path}: {result.error}", err=True)
+            elif verbose:
+                click.echo(f"  ✓ {result.audio_path} ({result.entity_count} entities, "
+                           f"{result.processing_time:.1f}s)")
+        
+        if batch_summary.failed:
+            sys.exit(1)
+        
+    except PipelineError as e:
+        click.echo(f"Pipeline error: {e}", err=True)
+        sys.exit(1)
+        
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument('source')
+@click.option('--pattern', '-p',
+              help='Glob filter when SOURCE is a directory (e.g. "*.wav")')
+@click.option('--output-format', type=click.Choice(['text', 'json']), default='text',
+              help='Output format (default: text)')
+@click.pass_context
+def probe(ctx, source: str, pattern: Optional[str], output_format: str):
+    """
+    Show audio metadata read from file headers, without decoding.
+    
+    SOURCE: Audio file, directory, glob pattern, or manifest (.txt/.json)
+    
+    Examples:
+        pronunciation-clips probe recording.wav
+        pronunciation-clips probe recordings/ --output-format json
+    """
+    from ..audio_to_json.batch import resolve_batch_inputs
+    
+    try:
+        if Path(source).is_file() and Path(source).suffix.lower() not in {'.txt', '.json'}:
+            audio_files = [Path(source)]
+        else:
+            audio_files = resolve_batch_inputs(source, pattern)
+    except PipelineError as e:
+        click.echo(f"Pipeline error: {e}", err=True)
+        sys.exit(1)
+    
+    probed = []
+    failures = 0
+    for audio_file in audio_files:
+        try:
+            probed.append(probe_audio(str(audio_file)).model_dump())
+        except AudioError as e:
+            failures += 1
+            probed.append({"path": str(audio_file), "error": str(e)})
+    
+    if output_format == 'json':
+        click.echo(json.dumps(probed, indent=2, ensure_ascii=False))
+    else:
+        total = 0.0
+        for item in probed:
+            if "error" in item:
+                click.echo(f"✗ {item['path']}: {item['error']}", err=True)
+                continue
+            total += item["duration"]
+            click.echo(f"{item['path']}: {item['duration']:.2f}s, {item['sample_rate']} Hz, "
+                       f"{item['channels']} ch, {item['format']}")
+        click.echo(f"{len(probed) - failures} file(s), {total:.1f}s total")
+    
+    if failures:
+        sys.exit(1)
+
+
 @cli.command()
 @click.pass_context
 def version(ctx):
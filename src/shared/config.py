@@ -18,6 +18,19 @@ class AudioConfig(BaseModel):
     sample_rate: int = Field(default=16000, ge=8000, le=48000)
     channels: int = Field(default=1, ge=1, le=2)
     buffer_seconds: float = Field(default=0.025, ge=0.0, le=1.0)
+    streaming: bool = Field(default=False)
+    block_seconds: float = Field(default=30.0, gt=0.0)
+    cache_dir: Optional[str] = Field(default=None)
+    cache_max_mb: int = Field(default=4096, ge=1)
+    resampler: str = Field(default="librosa")
+
+    @field_validator('resampler')
+    @classmethod
+    def validate_resampler(cls, v):
+        valid_resamplers = ["librosa", "soxr_hq", "soxr_qq", "scipy_poly"]
+        if v not in valid_resamplers:
+            raise ValueError(f"resampler must be one of {valid_resamplers}")
+        return v
 
 
 class WhisperConfig(BaseModel):
@@ -26,7 +39,22 @@ class WhisperConfig(BaseModel):
     language: str = Field(default="es")
     word_timestamps: bool = Field(default=True)
     temperature: float = Field(default=0.0, ge=0.0, le=1.0)
-    
+    device: Optional[str] = Field(default=None)
+    precision: str = Field(default="fp32")
+    max_loaded_models: int = Field(default=2, ge=1)
+    model_memory_budget_mb: Optional[int] = Field(default=None, ge=1)
+    chunk_length_s: Optional[float] = Field(default=None, gt=0.0)
+    chunk_overlap_s: float = Field(default=2.0, ge=0.0)
+    chunk_workers: int = Field(default=1, ge=1)
+    backend: str = Field(default="openai")
+    compute_type: str = Field(default="int8")
+    cascade_model: Optional[str] = Field(default=None)
+    cascade_threshold: float = Field(default=0.5, ge=0.0, le=1.0)
+    cascade_context_s: float = Field(default=1.0, ge=0.0)
+    cascade_merge_gap_s: float = Field(default=2.0, ge=0.0)
+    cache_dir: Optional[str] = Field(default=None)
+    cache_max_mb: int = Field(default=256, ge=1)
+
     @field_validator('model')
     @classmethod
     def validate_model(cls, v):
@@ -35,6 +63,42 @@ class WhisperConfig(BaseModel):
             raise ValueError(f"model must be one of {valid_models}")
         return v
 
+    @field_validator('precision')
+    @classmethod
+    def validate_precision(cls, v):
+        valid_precisions = ["fp32", "fp16", "int8"]
+        if v not in valid_precisions:
+            raise ValueError(f"precision must be one of {valid_precisions}")
+        return v
+
+    @field_validator('backend')
+    @classmethod
+    def validate_backend(cls, v):
+        valid_backends = ["openai", "faster-whisper"]
+        if v not in valid_backends:
+            raise ValueError(f"backend must be one of {valid_backends}")
+        return v
+
+    @field_validator('cascade_model')
+    @classmethod
+    def validate_cascade_model(cls, v, info):
+        if v is None:
+            return v
+        valid_models = ["tiny", "base", "small", "medium", "large"]
+        if v not in valid_models:
+            raise ValueError(f"cascade_model must be one of {valid_models}")
+        if v == info.data.get('model'):
+            raise ValueError("cascade_model must differ from model")
+        return v
+
+    @field_validator('chunk_overlap_s')
+    @classmethod
+    def validate_chunk_overlap(cls, v, info):
+        chunk_length = info.data.get('chunk_length_s')
+        if chunk_length is not None and v >= chunk_length:
+            raise ValueError("chunk_overlap_s must be shorter than chunk_length_s")
+        return v
+
 
 class DiarizationConfig(BaseModel):
     """Diarization-specific configuration."""
@@ -60,6 +124,7 @@ class OutputConfig(BaseModel):
     encoding: str = Field(default="utf-8")
     pretty_print: bool = Field(default=True)
     backup_on_update: bool = Field(default=True)
+    text_index: bool = Field(default=True)  # Save a text index next to the database
 
 
 class QualityConfig(BaseModel):
@@ -77,6 +142,36 @@ class QualityConfig(BaseModel):
         return v
 
 
+class VadConfig(BaseModel):
+    """Voice activity detection configuration."""
+    enabled: bool = Field(default=False)
+    method: str = Field(default="energy")
+    frame_seconds: float = Field(default=0.03, gt=0.0, le=0.5)
+    energy_margin_db: float = Field(default=12.0, ge=0.0)
+    min_speech_s: float = Field(default=0.25, ge=0.0)
+    min_silence_s: float = Field(default=0.6, ge=0.0)
+    padding_s: float = Field(default=0.2, ge=0.0)
+    gap_s: float = Field(default=0.1, ge=0.0)
+
+    @field_validator('method')
+    @classmethod
+    def validate_method(cls, v):
+        valid_methods = ["energy", "silero"]
+        if v not in valid_methods:
+            raise ValueError(f"method must be one of {valid_methods}")
+        return v
+
+
+class ProcessingConfig(BaseModel):
+    """Pipeline execution configuration."""
+    checkpoints: bool = Field(default=False)
+    checkpoint_dir: str = Field(default="temp/checkpoints")
+    checkpoint_max_mb: int = Field(default=4096, ge=1)
+    concurrent_diarization: bool = Field(default=True)
+    concurrent_threads: Optional[int] = Field(default=None, ge=1)  # Torch threads while both stages run (None: current budget)
+    columnar_words: bool = Field(default=False)  # Keep transcribed words in a WordTable until entity creation
+
+
 class LoggingConfig(BaseModel):
     """Logging configuration."""
     level: str = Field(default="INFO")
@@ -108,6 +203,8 @@ class Config(BaseModel):
     speakers: SpeakersConfig = Field(default_factory=SpeakersConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
     quality: QualityConfig = Field(default_factory=QualityConfig)
+    vad: VadConfig = Field(default_factory=VadConfig)
+    processing: ProcessingConfig = Field(default_factory=ProcessingConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
 
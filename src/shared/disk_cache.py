@@ -0,0 +1,154 @@
+"""
+Size-capped on-disk cache with least-recently-used eviction.
+
+Each entry is one or more files named ``{key}{suffix}`` in the cache
+directory (e.g. ``<key>.npy`` plus ``<key>.json``). Reads touch the entry's
+modification time, and after every write the oldest entries are removed until
+the directory fits the size cap. Writers stage files under a temporary name
+and rename them into place, so readers never see partial entries.
+"""
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .logging_config import LoggerMixin
+
+
+_TMP_MARKER = ".tmp-"
+
+
+class DiskCache(LoggerMixin):
+    """LRU-evicting cache of files grouped by key."""
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        super().__init__()
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path(self, key: str, suffix: str) -> Path:
+        """Final location of one file of an entry."""
+        return self.directory / f"{key}{suffix}"
+
+    def temp_path(self, key: str, suffix: str) -> Path:
+        """Staging location for writing one file of an entry."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / f"{key}{_TMP_MARKER}{uuid.uuid4().hex[:8]}{suffix}"
+
+    def lookup(self, key: str, suffixes: List[str]) -> Optional[Dict[str, Path]]:
+        """
+        Find a complete entry and mark it as recently used.
+
+        Args:
+            key: Entry key
+            suffixes: Files that must all exist for the entry to count
+
+        Returns:
+            Mapping of suffix to path, or None on a miss
+        """
+        paths = {suffix: self.path(key, suffix) for suffix in suffixes}
+        if not all(p.exists() for p in paths.values()):
+            self.misses += 1
+            return None
+        for p in paths.values():
+            try:
+                os.utime(p, None)
+            except OSError:
+                pass
+        self.hits += 1
+        return paths
+
+    def commit(self, key: str, staged: Dict[str, Path]) -> Dict[str, Path]:
+        """
+        Move staged files into place and enforce the size cap.
+
+        Args:
+            key: Entry key
+            staged: Mapping of suffix to temp_path() written by the caller
+
+        Returns:
+            Mapping of suffix to final path
+        """
+        final = {}
+        for suffix, tmp in staged.items():
+            target = self.path(key, suffix)
+            os.replace(tmp, target)
+            final[suffix] = target
+        self.enforce_limit(keep=key)
+        return final
+
+    def discard(self, key: str) -> None:
+        """Remove every file of an entry."""
+        for path, _, _ in self._entry_files().get(key, []):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> int:
+        """Remove every committed entry; returns the number removed."""
+        keys = list(self._entry_files())
+        for key in keys:
+            self.discard(key)
+        return len(keys)
+
+    def size_bytes(self) -> int:
+        """Total size of committed entries."""
+        return sum(size for files in self._entry_files().values() for _, size, _ in files)
+
+    def enforce_limit(self, keep: Optional[str] = None) -> int:
+        """
+        Evict least recently used entries until the cache fits max_bytes.
+
+        Args:
+            keep: Key that must not be evicted (the entry just written)
+
+        Returns:
+            Number of entries evicted
+        """
+        if self.max_bytes is None:
+            return 0
+
+        entries = self._entry_files()
+        total = sum(size for files in entries.values() for _, size, _ in files)
+        evicted = 0
+        by_age: List[Tuple[float, str]] = sorted(
+            (max(mtime for _, _, mtime in files), key) for key, files in entries.items()
+        )
+        for _, key in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for path, size, _ in entries[key]:
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+            evicted += 1
+
+        if evicted:
+            self.evictions += evicted
+            self.log_progress("Cache entries evicted", directory=str(self.directory),
+                            evicted=evicted, size_mb=round(total / 1e6, 1))
+        return evicted
+
+    def _entry_files(self) -> Dict[str, List[Tuple[Path, int, float]]]:
+        """Committed files grouped by key, with size and modification time."""
+        entries: Dict[str, List[Tuple[Path, int, float]]] = {}
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.iterdir():
+            if not path.is_file() or _TMP_MARKER in path.name:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            key = path.name.split(".", 1)[0]
+            entries.setdefault(key, []).append((path, stat.st_size, stat.st_mtime))
+        return entries
@@ -0,0 +1,69 @@
+"""
+Secondary indexes over a WordDatabase's entities.
+
+Built once from the entity list and reused by the WordDatabase query
+methods until the entities change:
+
+- hash buckets by entity type and by speaker
+- confidences sorted ascending, so a threshold query is one binary search
+- entities sorted by start time with a running maximum of end times, so
+  "entities overlapping [t0, t1]" is two binary searches plus a scan of
+  the candidates between them
+
+Every query returns a new list in the entities' original order, matching a
+linear scan of the list.
+"""
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+class EntityIndex:
+    """Immutable lookup structures for one version of an entity list."""
+
+    def __init__(self, entities: Sequence, version: Sequence):
+        self.entities = entities
+        self.version = tuple(version)
+
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_speaker: Dict[int, List[int]] = {}
+        for position, entity in enumerate(entities):
+            self._by_type.setdefault(entity.entity_type, []).append(position)
+            self._by_speaker.setdefault(entity.speaker_id, []).append(position)
+
+        count = len(entities)
+        confidence = np.fromiter((e.confidence for e in entities), dtype=np.float64, count=count)
+        self._by_confidence = np.argsort(confidence, kind='stable')
+        self._sorted_confidence = confidence[self._by_confidence]
+
+        starts = np.fromiter((e.start_time for e in entities), dtype=np.float64, count=count)
+        ends = np.fromiter((e.end_time for e in entities), dtype=np.float64, count=count)
+        self._by_start = np.argsort(starts, kind='stable')
+        self._sorted_starts = starts[self._by_start]
+        self._ends_by_start = ends[self._by_start]
+        # Largest end among the first k entities by start: entities before
+        # the first k with max end >= t0 all end before t0
+        self._max_end = np.maximum.accumulate(self._ends_by_start) if count else self._ends_by_start
+
+    def _select(self, positions) -> List:
+        return [self.entities[i] for i in positions]
+
+    def by_type(self, entity_type: str) -> List:
+        return self._select(self._by_type.get(entity_type, ()))
+
+    def by_speaker(self, speaker_id: int) -> List:
+        return self._select(self._by_speaker.get(speaker_id, ()))
+
+    def at_least_confidence(self, min_confidence: float) -> List:
+        first = np.searchsorted(self._sorted_confidence, min_confidence, side='left')
+        return self._select(np.sort(self._by_confidence[first:]).tolist())
+
+    def overlapping(self, start: float, end: float) -> List:
+        """Entities whose [start_time, end_time] intersects [start, end]."""
+        first = np.searchsorted(self._max_end, start, side='left')
+        last = np.searchsorted(self._sorted_starts, end, side='right')
+        if first >= last:
+            return []
+        candidates = np.arange(first, last)
+        hits = candidates[self._ends_by_start[first:last] >= start]
+        return self._select(np.sort(self._by_start[hits]).tolist())
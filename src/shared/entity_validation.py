@@ -0,0 +1,235 @@
+"""
+Batch validation of entity fields.
+
+Checks the constraints that Entity's field definitions and validators apply
+one object at a time (ranges, end after start, duration matching the times,
+known entity type, syllable count matching the syllable list), but as array
+comparisons over a whole batch. Violations are reported per rule instead of
+failing on the first bad entity. Trusted producers can then build entities
+without per-object validation (construct_entities) and check the batch once.
+"""
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+from .models import Entity
+
+
+ENTITY_TYPES = ("word", "sentence", "phrase")
+
+# Maximum |duration - (end_time - start_time)|, as in Entity.duration_matches_times
+DURATION_TOLERANCE = 0.001
+
+# Row positions kept per rule for error messages
+_EXAMPLES_PER_RULE = 5
+
+_ENTITY_FIELDS = Entity.model_fields
+_FIELD_NAMES = frozenset(_ENTITY_FIELDS)
+_REQUIRED_FIELDS = tuple(name for name, info in _ENTITY_FIELDS.items() if info.is_required())
+_STR_FIELDS = ("entity_id", "entity_type", "text", "recording_id", "recording_path", "created_at")
+_OPTIONAL_STR_FIELDS = ("phonetic", "clip_path", "selection_reason")
+_FLOAT_FIELDS = ("start_time", "end_time", "duration", "confidence", "probability", "quality_score")
+_INT_FIELDS = ("syllable_count", "speaker_id")
+
+
+@dataclass
+class EntityBatchReport:
+    """Per-rule violations found in a batch of entities."""
+    total: int
+    invalid: np.ndarray  # True for rows violating at least one rule
+    violations: Dict[str, int] = field(default_factory=dict)  # Rule -> rows violating it
+    examples: Dict[str, List[int]] = field(default_factory=dict)  # Rule -> first violating rows
+
+    @property
+    def invalid_count(self) -> int:
+        return int(self.invalid.sum())
+
+    @property
+    def valid(self) -> bool:
+        return not self.invalid.any()
+
+    def summary(self) -> str:
+        """One-line description of the violations."""
+        rules = ", ".join(f"{rule}: {count} (rows {self.examples[rule]})"
+                          for rule, count in self.violations.items())
+        return f"{self.invalid_count} of {self.total} entities invalid ({rules})"
+
+
+def _build_report(total: int, masks: Dict[str, np.ndarray]) -> EntityBatchReport:
+    invalid = np.zeros(total, dtype=bool)
+    violations, examples = {}, {}
+    for rule, mask in masks.items():
+        count = int(mask.sum())
+        if count:
+            invalid |= mask
+            violations[rule] = count
+            examples[rule] = np.flatnonzero(mask)[:_EXAMPLES_PER_RULE].tolist()
+    return EntityBatchReport(total=total, invalid=invalid, violations=violations, examples=examples)
+
+
+def _constraint_masks(columns: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+    """Rule -> rows violating it; comparisons are negated so NaN counts as a violation."""
+    start = np.asarray(columns["start_time"], dtype=np.float64)
+    end = np.asarray(columns["end_time"], dtype=np.float64)
+    duration = np.asarray(columns["duration"], dtype=np.float64)
+    syllable_count = np.asarray(columns["syllable_count"], dtype=np.float64)
+    syllable_lengths = np.asarray(columns["syllable_lengths"], dtype=np.float64)
+    speaker_id = np.asarray(columns["speaker_id"], dtype=np.float64)
+    entity_types = columns["entity_type"]
+
+    def unit_range(name: str) -> np.ndarray:
+        values = np.asarray(columns[name], dtype=np.float64)
+        return ~((values >= 0.0) & (values <= 1.0))
+
+    return {
+        "entity_type": np.fromiter((t not in ENTITY_TYPES for t in entity_types),
+                                   dtype=bool, count=len(start)),
+        "start_time": ~(start >= 0.0),
+        "end_time": ~((end >= 0.0) & (end > start)),
+        "duration": ~((duration >= 0.0) & (np.abs(duration - (end - start)) <= DURATION_TOLERANCE)),
+        "confidence": unit_range("confidence"),
+        "probability": unit_range("probability"),
+        "quality_score": unit_range("quality_score"),
+        "syllable_count": ~((syllable_count >= 0) & (syllable_count == syllable_lengths)),
+        "speaker_id": ~(speaker_id >= 0),
+    }
+
+
+def check_entity_columns(columns: Mapping[str, Any]) -> EntityBatchReport:
+    """
+    Validate entity fields given as columns.
+
+    Args:
+        columns: start_time, end_time, duration, confidence, probability,
+            quality_score, syllable_count and speaker_id as numeric arrays;
+            syllable_lengths (length of each syllables list) and entity_type
+            (sequence of strings)
+
+    Returns:
+        EntityBatchReport
+    """
+    return _build_report(len(columns["start_time"]), _constraint_masks(columns))
+
+
+class _Missing:
+    """Placeholder for a field absent from a record."""
+
+
+_MISSING = _Missing()
+_NUMBER_TYPES = (int, float)
+
+
+def _column(rows: Sequence[dict], name: str) -> List[Any]:
+    return [row.get(name, _MISSING) for row in rows]
+
+
+def _type_mask(values: List[Any], allowed: tuple) -> np.ndarray:
+    """True where a value's exact type is not allowed (absent values are allowed)."""
+    allowed = allowed + (_Missing,)
+    if set(map(type, values)) <= set(allowed):
+        return np.zeros(len(values), dtype=bool)
+    return np.fromiter((type(v) not in allowed for v in values), dtype=bool, count=len(values))
+
+
+def _numbers(values: List[Any], default: float = np.nan) -> np.ndarray:
+    """Numeric column; absent values become ``default`` and unreadable ones NaN."""
+    if set(map(type, values)) <= set(_NUMBER_TYPES):
+        return np.array(values, dtype=np.float64)
+    return np.array([v if type(v) in _NUMBER_TYPES else (default if v is _MISSING else np.nan)
+                     for v in values], dtype=np.float64)
+
+
+def check_entity_records(records: Sequence[Any]) -> EntityBatchReport:
+    """
+    Validate serialized entities (dictionaries, e.g. read back from JSON).
+
+    Besides the value constraints, reports records that are not
+    dictionaries, lack a required field, or hold a value of the wrong type.
+    Rows failing those checks are not counted again under value rules.
+
+    Args:
+        records: Entity dictionaries
+
+    Returns:
+        EntityBatchReport
+    """
+    count = len(records)
+    not_dict = np.fromiter((type(record) is not dict for record in records), dtype=bool, count=count)
+    rows = [record if type(record) is dict else {} for record in records]
+    required = set(_REQUIRED_FIELDS)
+    missing = np.fromiter((not required <= row.keys() for row in rows), dtype=bool, count=count) & ~not_dict
+
+    wrong_type = np.zeros(count, dtype=bool)
+    for name in _STR_FIELDS:
+        wrong_type |= _type_mask(_column(rows, name), (str,))
+    for name in _OPTIONAL_STR_FIELDS:
+        wrong_type |= _type_mask(_column(rows, name), (str, type(None)))
+    wrong_type |= _type_mask(_column(rows, "processed"), (bool,))
+
+    columns: Dict[str, Any] = {}
+    for name in _FLOAT_FIELDS + _INT_FIELDS:
+        values = _column(rows, name)
+        wrong_type |= _type_mask(values, _NUMBER_TYPES)
+        columns[name] = _numbers(values, default=0.0 if name in ("quality_score", "syllable_count") else np.nan)
+    for name in _INT_FIELDS:
+        wrong_type |= ~np.isnan(columns[name]) & (columns[name] != np.floor(columns[name]))
+
+    syllables = _column(rows, "syllables")
+    wrong_type |= _type_mask(syllables, (list,))
+    lists = [value if type(value) is list else [] for value in syllables]
+    if not set(map(type, itertools.chain.from_iterable(lists))) <= {str}:
+        wrong_type |= np.fromiter((any(type(s) is not str for s in value) for value in lists),
+                                  dtype=bool, count=count)
+    columns["syllable_lengths"] = np.fromiter(map(len, lists), dtype=np.float64, count=count)
+    columns["entity_type"] = _column(rows, "entity_type")
+
+    unreadable = not_dict | missing | wrong_type
+    masks = {
+        "not_a_dict": not_dict,
+        "missing_field": missing,
+        "type": wrong_type & ~not_dict,
+    }
+    masks.update({rule: mask & ~unreadable for rule, mask in _constraint_masks(columns).items()})
+    return _build_report(count, masks)
+
+
+def _complete_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Record restricted to Entity fields, with defaults for absent optional ones."""
+    values = {name: record[name] for name in _ENTITY_FIELDS if name in record}
+    for name, info in _ENTITY_FIELDS.items():
+        if name not in values and not info.is_required():
+            values[name] = info.get_default(call_default_factory=True)
+    return values
+
+
+def construct_entities(records: Iterable[Dict[str, Any]]) -> List[Entity]:
+    """
+    Build Entity objects from trusted field dictionaries without validation.
+
+    Callers are responsible for checking the values (check_entity_columns).
+    Each instance gets the same state Entity.model_construct would give it
+    (``__dict__``, ``__pydantic_fields_set__``, no extra or private values),
+    set directly instead of through model_construct's per-field alias loop.
+
+    Args:
+        records: Dictionaries with a value for every required Entity field
+
+    Returns:
+        List of Entity objects
+    """
+    new, set_state = Entity.__new__, object.__setattr__
+    entities = []
+    for record in records:
+        if record.keys() == _FIELD_NAMES:
+            values, fields_set = dict(record), set(record)
+        else:
+            values, fields_set = _complete_record(record), set(_FIELD_NAMES.intersection(record))
+        entity = new(Entity)
+        set_state(entity, '__dict__', values)
+        set_state(entity, '__pydantic_fields_set__', fields_set)
+        set_state(entity, '__pydantic_extra__', None)
+        set_state(entity, '__pydantic_private__', None)
+        entities.append(entity)
+    return entities
@@ -0,0 +1,78 @@
+"""
+Content and configuration fingerprints for cache and checkpoint keys.
+
+File fingerprints hash the bytes of the file (not its path or mtime), so a
+renamed or copied recording maps to the same key. Array fingerprints do the
+same for decoded samples already in memory. Config fingerprints hash a
+canonical JSON rendering, so field order and model instances vs dicts do not
+matter.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+def file_fingerprint(path: Union[str, Path]) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest of the file bytes
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_READ_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def array_fingerprint(data: np.ndarray) -> str:
+    """
+    Hash the contents of a numpy array.
+
+    Args:
+        data: Array of any shape (memory-mapped arrays are read, not copied)
+
+    Returns:
+        Hex SHA-256 digest of the dtype, shape and raw sample bytes
+    """
+    data = np.ascontiguousarray(data)
+    digest = hashlib.sha256(f"{data.dtype.str}{data.shape}".encode('utf-8'))
+    digest.update(memoryview(data).cast('B'))
+    return digest.hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert models and containers to JSON-serialisable canonical form."""
+    if isinstance(value, BaseModel):
+        return _canonical(value.model_dump())
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def config_fingerprint(*parts: Any) -> str:
+    """
+    Hash configuration sections and other key material.
+
+    Args:
+        *parts: Pydantic models, dicts, lists or scalars
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON rendering
+    """
+    payload = json.dumps([_canonical(p) for p in parts], sort_keys=True, default=str,
+                         separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
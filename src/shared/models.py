@@ -5,7 +5,7 @@ Defines the core data structures used throughout the pipeline with proper valida
 serialization, and type safety. Designed for easy JSON serialization and pandas integration.
 """
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -80,6 +80,88 @@ class Entity(BaseModel):
         return v
 
 
+class EntityList(list):
+    """
+    List of entities that tracks its own changes.
+    
+    ``version`` counts every change to the list and ``rewrites`` every change
+    other than appending. Carries the WordDatabase query indexes built for it
+    (``index``, ``text_index``), which are reused while the list has not
+    changed; the text index is also kept across appends. Fields edited in
+    place on an entity are not seen; call WordDatabase.invalidate_indexes
+    after such edits. The indexes are not pickled and do not take part in
+    comparisons.
+    """
+    
+    version = 0
+    rewrites = 0
+    index: Optional['EntityIndex'] = None
+    text_index: Optional['TextIndex'] = None
+    text_index_stamp: Optional[int] = None
+    
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name in ('index', 'text_index', 'text_index_stamp'):
+            state.pop(name, None)
+        return state
+    
+    def _changed(self, rewrite: bool = True) -> None:
+        self.version += 1
+        if rewrite:
+            self.rewrites += 1
+    
+    def append(self, entity):
+        super().append(entity)
+        self._changed(rewrite=False)
+    
+    def extend(self, entities):
+        super().extend(entities)
+        self._changed(rewrite=False)
+    
+    def __iadd__(self, entities):
+        super().__iadd__(entities)
+        self._changed(rewrite=False)
+        return self
+    
+    def insert(self, index, entity):
+        super().insert(index, entity)
+        self._changed()
+    
+    def remove(self, entity):
+        super().remove(entity)
+        self._changed()
+    
+    def pop(self, index=-1):
+        entity = super().pop(index)
+        self._changed()
+        return entity
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def reverse(self):
+        super().reverse()
+        self._changed()
+    
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._changed()
+    
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+    
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+    
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._changed()
+        return self
+
+
 class SpeakerInfo(BaseModel):
     """Information about a speaker."""
     name: str = Field(..., description="Speaker name")
@@ -139,9 +221,50 @@ class AudioMetadata(BaseModel):
     size_bytes: int = Field(..., ge=0, description="File size in bytes")
 
 
+class BatchFileResult(BaseModel):
+    """Outcome of processing one file in a batch run."""
+    audio_path: str = Field(..., description="Path to input audio file")
+    output_path: Optional[str] = Field(default=None, description="Path to written JSON database")
+    success: bool = Field(..., description="Whether the file was processed successfully")
+    error: Optional[str] = Field(default=None, description="Error message if processing failed")
+    error_type: Optional[str] = Field(default=None, description="Exception class name if processing failed")
+    entity_count: int = Field(default=0, ge=0, description="Entities written for this file")
+    audio_duration: float = Field(default=0.0, ge=0.0, description="Audio duration in seconds")
+    processing_time: float = Field(default=0.0, ge=0.0, description="Wall-clock processing time in seconds")
+    worker_pid: Optional[int] = Field(default=None, description="Process that handled the file")
+
+
+class BatchSummary(BaseModel):
+    """Per-file results and totals for a batch run."""
+    results: List[BatchFileResult] = Field(default_factory=list, description="Per-file results in input order")
+    workers: int = Field(default=1, ge=1, description="Worker processes used")
+    total_time: float = Field(default=0.0, ge=0.0, description="Wall-clock time for the whole batch")
+    
+    @property
+    def succeeded(self) -> int:
+        """Number of files processed successfully."""
+        return sum(1 for r in self.results if r.success)
+    
+    @property
+    def failed(self) -> int:
+        """Number of files that failed."""
+        return sum(1 for r in self.results if not r.success)
+    
+    @property
+    def total_audio_duration(self) -> float:
+        """Total seconds of audio processed successfully."""
+        return sum(r.audio_duration for r in self.results if r.success)
+
+
 class WordDatabase(BaseModel):
     """
     Complete database container for all entities and metadata.
+    
+    The get_entities_* queries use indexes (see entity_index) built on first
+    use and rebuilt after the entity list is modified. find_entities uses an
+    accent-insensitive text index (see text_index) that is extended in place
+    when entities are appended. After editing an entity's fields in place,
+    call invalidate_indexes.
     """
     metadata: Dict[str, Any] = Field(..., description="Database metadata")
     speaker_map: Dict[int, SpeakerInfo] = Field(..., description="Speaker ID to info mapping")
@@ -157,14 +280,85 @@ class WordDatabase(BaseModel):
                 raise ValueError(f'metadata must contain {field}')
         return v
     
+    def model_post_init(self, __context: Any) -> None:
+        self.__dict__['entities'] = EntityList(self.entities)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'entities':
+            value = EntityList(value)
+        super().__setattr__(name, value)
+    
+    def _entity_index(self) -> 'EntityIndex':
+        """Current index, rebuilt if the entities changed since it was built."""
+        from .entity_index import EntityIndex  # numpy stays out of CLI startup
+        entities = self.entities
+        if not isinstance(entities, EntityList):
+            return EntityIndex(entities, ())
+        version = (entities.version,)
+        index = entities.index
+        if index is None or index.entities is not entities or index.version != version:
+            index = entities.index = EntityIndex(entities, version)
+        return index
+    
+    def invalidate_indexes(self) -> None:
+        """Drop the query indexes after entities were edited in place (rebuilt on the next query)."""
+        if isinstance(self.entities, EntityList):
+            self.entities.index = None
+            self.entities.text_index = None
+    
     def get_entities_by_type(self, entity_type: str) -> List[Entity]:
         """Get all entities of a specific type."""
-        return [e for e in self.entities if e.entity_type == entity_type]
+        return self._entity_index().by_type(entity_type)
     
     def get_entities_by_speaker(self, speaker_id: int) -> List[Entity]:
         """Get all entities for a specific speaker."""
-        return [e for e in self.entities if e.speaker_id == speaker_id]
+        return self._entity_index().by_speaker(speaker_id)
     
     def get_entities_by_confidence(self, min_confidence: float) -> List[Entity]:
         """Get all entities above a confidence threshold."""
-        return [e for e in self.entities if e.confidence >= min_confidence]
\ No newline at end of file
+        return self._entity_index().at_least_confidence(min_confidence)
+    
+    def get_entities_in_range(self, start_time: float, end_time: float) -> List[Entity]:
+        """Get all entities overlapping [start_time, end_time]."""
+        return self._entity_index().overlapping(start_time, end_time)
+    
+    def _text_index(self) -> 'TextIndex':
+        """Current text index: extended after appends, rebuilt after other changes."""
+        from .text_index import TextIndex
+        entities = self.entities
+        if not isinstance(entities, EntityList):
+            return TextIndex.from_entities(entities)
+        stamp = entities.rewrites
+        index = entities.text_index
+        if index is None or entities.text_index_stamp != stamp or not index.update(entities, verify=False):
+            index = TextIndex.from_entities(entities)
+        entities.text_index, entities.text_index_stamp = index, stamp
+        return index
+    
+    def use_text_index(self, index: 'TextIndex') -> None:
+        """
+        Answer find_entities from an existing index, e.g. one loaded from the
+        file saved next to the database (see text_index.text_index_path).
+        Entities appended since it was saved are indexed; an index that does
+        not match the entities is ignored.
+        """
+        entities = self.entities
+        if isinstance(entities, EntityList):
+            if index.update(entities):
+                entities.text_index, entities.text_index_stamp = index, entities.rewrites
+    
+    def find_entities(self, text: str, prefix: bool = False,
+                      syllable_range: Optional[Tuple[int, int]] = None) -> List[Entity]:
+        """
+        Get entities by text, ignoring case, accents and punctuation.
+        
+        Args:
+            text: Word to find ("esta" matches "está" and "ESTÁ,")
+            prefix: Match every word starting with ``text``
+            syllable_range: Optional inclusive (min, max) syllable count
+            
+        Returns:
+            Matching entities in list order
+        """
+        entities = self.entities
+        return [entities[i] for i in self._text_index().lookup(text, prefix, syllable_range)]
@@ -0,0 +1,253 @@
+"""
+Accent-insensitive inverted index from entity text to entity positions.
+
+Entity texts are normalised (casefolded, accents and punctuation removed,
+"ñ" kept as a letter of its own) so "está", "esta" and "ESTÁ," share one
+key. The index answers exact and prefix lookups, optionally restricted to a
+syllable-count range, and returns positions in the entity list.
+
+Positions only grow: an index built for a database can be extended with the
+entities appended to it since (update), and is saved as a JSON file next to
+the database (text_index_path) so it does not have to be rebuilt on load. A
+digest of the indexed entities' ids, texts and syllable counts tells whether
+a saved index still describes the start of a database.
+"""
+import bisect
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .models import Entity
+
+
+_COMBINING_TILDE = "\u0303"
+
+
+@lru_cache(maxsize=65536)
+def normalize_text(text: str) -> str:
+    """
+    Lookup key for a text: casefolded, accents and punctuation removed.
+
+    The tilde of "ñ" is kept ("año" and "ano" are different words); every
+    other diacritic is dropped ("está" -> "esta", "pingüino" -> "pinguino").
+
+    Args:
+        text: Entity text or query
+
+    Returns:
+        Normalised key (empty if the text has no letters or digits)
+    """
+    decomposed = unicodedata.normalize("NFD", text.casefold())
+    kept = []
+    for char in decomposed:
+        if unicodedata.combining(char):
+            if char == _COMBINING_TILDE and kept and kept[-1] == "n":
+                kept.append(char)
+        elif char.isalnum():
+            kept.append(char)
+    return unicodedata.normalize("NFC", "".join(kept))
+
+
+def text_index_path(database_path: Union[str, Path]) -> Path:
+    """Path of the text index saved next to a database file."""
+    database_path = Path(database_path)
+    return database_path.with_name(f"{database_path.stem}.text_index.json")
+
+
+def _digest_entities(digest: Any, entities: Iterable[Entity]) -> None:
+    """Feed the fields the index depends on into a running hash."""
+    for entity in entities:
+        digest.update(f"{entity.recording_id}\x1f{entity.entity_id}\x1f{entity.text}\x1f"
+                      f"{entity.syllable_count}\x1e".encode('utf-8'))
+
+
+class TextIndex:
+    """Inverted index from normalised text to entity positions."""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self):
+        self.postings: Dict[str, List[int]] = {}
+        self.syllable_counts: List[int] = []
+        self._sorted_keys: Optional[List[str]] = None
+        self._digest = hashlib.sha256()  # Over the indexed entities, or None after loading
+        self._saved_digest: Optional[str] = None
+
+    @property
+    def content_digest(self) -> str:
+        """Hex digest of the indexed entities' ids, texts and syllable counts."""
+        return self._digest.hexdigest() if self._digest is not None else self._saved_digest
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Entity]) -> "TextIndex":
+        """Index a list of entities from position 0."""
+        index = cls()
+        index.add_entities(entities)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.syllable_counts)
+
+    def add_entities(self, entities: Iterable[Entity]) -> None:
+        """Index entities appended after the ones already indexed."""
+        if self._digest is None:
+            raise ValueError("a loaded index must be matched to its entities (update) before adding more")
+        entities = list(entities)
+        _digest_entities(self._digest, entities)
+        position = len(self.syllable_counts)
+        for entity in entities:
+            key = normalize_text(entity.text)
+            if key:
+                postings = self.postings.get(key)
+                if postings is None:
+                    postings = self.postings[key] = []
+                    self._sorted_keys = None
+                postings.append(position)
+            self.syllable_counts.append(entity.syllable_count)
+            position += 1
+
+    def covers_prefix_of(self, entities: Sequence[Entity], verify: bool = True) -> bool:
+        """
+        Whether the indexed entities are the start of ``entities``.
+
+        Args:
+            entities: The full entity list
+            verify: Re-hash the first len(self) entities and compare digests;
+                without it only the length is checked (for callers that know
+                the list was only appended to)
+        """
+        count = len(self)
+        if count > len(entities):
+            return False
+        if not verify:
+            return self._digest is not None
+        digest = hashlib.sha256()
+        _digest_entities(digest, itertools.islice(entities, count))
+        if digest.hexdigest() != self.content_digest:
+            return False
+        self._digest = digest
+        return True
+
+    def update(self, entities: Sequence[Entity], verify: bool = True) -> bool:
+        """
+        Index the entities appended to a list since this index was built.
+
+        Args:
+            entities: The full entity list
+            verify: See covers_prefix_of
+
+        Returns:
+            False (and nothing changed) if the index does not match the start
+            of the list, in which case it must be rebuilt
+        """
+        if not self.covers_prefix_of(entities, verify):
+            return False
+        self.add_entities(entities[len(self):])
+        return True
+
+    def lookup(self, text: str, prefix: bool = False,
+               syllable_range: Optional[Tuple[int, int]] = None) -> List[int]:
+        """
+        Find entity positions by text.
+
+        Args:
+            text: Word or prefix to look up (normalised like entity texts)
+            prefix: Match every key starting with the normalised text
+            syllable_range: Optional inclusive (min, max) syllable count
+
+        Returns:
+            Ascending entity positions
+        """
+        key = normalize_text(text)
+        if not key:
+            return []
+        if prefix:
+            if self._sorted_keys is None:
+                self._sorted_keys = sorted(self.postings)
+            keys = self._sorted_keys
+            start = bisect.bisect_left(keys, key)
+            end = bisect.bisect_left(keys, key + "\U0010ffff", lo=start)
+            positions = sorted(p for k in keys[start:end] for p in self.postings[k])
+        else:
+            positions = list(self.postings.get(key, ()))
+
+        if syllable_range is not None:
+            low, high = syllable_range
+            counts = self.syllable_counts
+            positions = [p for p in positions if low <= counts[p] <= high]
+        return positions
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "format_version": self.FORMAT_VERSION,
+            "entity_count": len(self),
+            "content_digest": self.content_digest,
+            "syllable_counts": self.syllable_counts,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["TextIndex"]:
+        """Rebuild a saved index; None if the data is from another format version."""
+        if data.get("format_version") != cls.FORMAT_VERSION:
+            return None
+        index = cls()
+        index.postings = {key: list(positions) for key, positions in data["postings"].items()}
+        index.syllable_counts = list(data["syllable_counts"])
+        index._digest = None
+        index._saved_digest = data["content_digest"]
+        if len(index.syllable_counts) != data["entity_count"]:
+            return None
+        return index
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the index to JSON atomically."""
+        path = Path(path)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_name, path)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["TextIndex"]:
+        """Read a saved index; None if it is missing, unreadable or outdated."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def update_text_index(database_path: Union[str, Path], entities: Sequence[Entity]) -> TextIndex:
+    """
+    Convenience function for keeping a database's saved text index current.
+
+    Loads the index saved next to the database, indexes only the entities
+    appended since it was written (rebuilding it if the database was
+    otherwise changed), and saves it again.
+
+    Args:
+        database_path: Path of the database JSON file
+        entities: The database's full entity list
+
+    Returns:
+        Up-to-date TextIndex
+    """
+    path = text_index_path(database_path)
+    index = TextIndex.load(path)
+    if index is None or not index.update(entities):
+        index = TextIndex.from_entities(entities)
+    index.save(path)
+    return index
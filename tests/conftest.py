@@ -20,6 +20,16 @@ def pytest_configure(config):
         pass
 
 
+@pytest.fixture(autouse=True)
+def reset_model_registry():
+    """Start every test with an empty process-wide model registry."""
+    from src.audio_to_json.model_registry import get_model_registry
+    registry = get_model_registry()
+    registry.clear()
+    yield
+    registry.clear()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs"""
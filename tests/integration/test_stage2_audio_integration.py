@@ -216,7 +216,7 @@ class TestFullAudioProcessingPipelineIntegration:
         result = pipeline.process_audio_to_json("test.wav", "output.json")
         
         # Verify all components were called in correct order
-        mock_process_audio.assert_called_once_with("test.wav", config)
+        mock_process_audio.assert_called_once_with("test.wav", config, None)
         mock_transcribe.assert_called_once_with(mock_processed_audio, config.whisper)
         mock_create_entities.assert_called_once()
         mock_apply_filters.assert_called_once()
@@ -76,7 +76,7 @@ class TestFullPipelineIntegration:
         result = pipeline.process_audio_to_json("test.wav", "output.json")
         
         # Verify all stages called in correct order
-        mock_process_audio.assert_called_once_with("test.wav", config)
+        mock_process_audio.assert_called_once_with("test.wav", config, None)
         mock_transcribe.assert_called_once_with(processed_audio, config.whisper)
         mock_create_entities.assert_called_once()
         mock_apply_filters.assert_called_once()
@@ -307,7 +307,7 @@ class TestProcessAudioFunction:
         
         # Verify function calls
         mock_processor_class.assert_called_once_with(config)
-        mock_processor.process_audio.assert_called_once_with("test.wav")
+        mock_processor.process_audio.assert_called_once_with("test.wav", None)
         assert result == mock_result
     
     @patch('src.audio_to_json.audio_processor.AudioProcessor')
@@ -432,4 +432,320 @@ class TestAudioProcessorEdgeCases:
             
             processor = AudioProcessor(config)
             assert processor.config.audio.sample_rate == config_data["sample_rate"]
-            assert processor.config.audio.channels == config_data["channels"]
\ No newline at end of file
+            assert processor.config.audio.channels == config_data["channels"]
+
+class TestStreamingAudio:
+    """Test block-wise streaming decode and resample."""
+    
+    def _write(self, temp_dir, data, sample_rate, name="long.wav"):
+        import soundfile as sf
+        path = temp_dir / name
+        sf.write(str(path), data, sample_rate, subtype='FLOAT')
+        return str(path)
+    
+    def _config(self, channels=1, block_seconds=0.5):
+        config = Config()
+        config.audio.streaming = True
+        config.audio.channels = channels
+        config.audio.block_seconds = block_seconds
+        return config
+    
+    def _signal(self, sample_rate, seconds, channels=2):
+        rng = np.random.RandomState(0)
+        return (rng.randn(int(sample_rate * seconds) + 37, channels) * 0.1).astype(np.float32)
+    
+    def test_streaming_matches_whole_file_resample(self, temp_dir):
+        """Test blocks stitch into the same signal as one-shot resampling."""
+        from scipy.signal import resample_poly
+        stereo = self._signal(44100, 3.2)
+        path = self._write(temp_dir, stereo, 44100)
+        
+        result = AudioProcessor(self._config()).process_audio(path)
+        
+        expected = resample_poly(stereo.mean(axis=1), 160, 441).astype(np.float32)
+        assert result.data.dtype == np.float32
+        assert result.data.shape == expected.shape
+        assert np.allclose(result.data, expected, atol=1e-6)
+        assert result.sample_rate == 16000
+        assert result.metadata.sample_rate == 44100
+        assert result.metadata.channels == 2
+        assert result.metadata.duration == pytest.approx(len(stereo) / 44100)
+    
+    def test_streaming_preserves_channels(self, temp_dir):
+        """Test stereo output keeps (channels, samples) layout."""
+        path = self._write(temp_dir, self._signal(48000, 1.5), 48000)
+        
+        result = AudioProcessor(self._config(channels=2)).process_audio(path)
+        
+        assert result.channels == 2
+        assert result.data.shape[0] == 2
+        assert result.data.shape[1] == int(np.ceil((48000 * 1.5 + 37) / 3))
+    
+    def test_stream_audio_yields_bounded_blocks(self, temp_dir):
+        """Test the generator never yields more than one block of output."""
+        from src.audio_to_json.audio_processor import stream_audio
+        path = self._write(temp_dir, self._signal(44100, 2.0), 44100)
+        
+        blocks = list(stream_audio(path, self._config(block_seconds=0.25)))
+        
+        assert len(blocks) == 9
+        assert max(len(b) for b in blocks) <= int(0.25 * 16000) + 1
+    
+    def test_same_rate_passthrough(self, temp_dir):
+        """Test matching sample rates copy samples unchanged."""
+        mono = self._signal(16000, 1.0, channels=1)
+        path = self._write(temp_dir, mono, 16000)
+        
+        result = AudioProcessor(self._config()).process_audio(path)
+        
+        assert np.array_equal(result.data, mono[:, 0])
+    
+    @pytest.mark.parametrize("resampler", ["scipy_poly", "soxr_hq"])
+    def test_single_channel_file_is_1d(self, resampler, temp_dir):
+        """Test a mono file kept at channels=2 streams 1-D, like the non-streaming path."""
+        path = self._write(temp_dir, self._signal(44100, 1.0, channels=1), 44100)
+        config = self._config(channels=2)
+        config.audio.resampler = resampler
+        
+        streamed = AudioProcessor(config).process_audio(path)
+        config.audio.streaming = False
+        loaded = AudioProcessor(config).process_audio(path)
+        
+        assert streamed.data.ndim == 1
+        assert streamed.data.shape == loaded.data.shape
+        assert streamed.channels == 1
+    
+    def test_librosa_resampler_warns_when_streaming(self, temp_dir):
+        """Test streaming with the librosa resampler logs its polyphase substitute."""
+        path = self._write(temp_dir, self._signal(44100, 1.0), 44100)
+        processor = AudioProcessor(self._config())
+        
+        with patch.object(processor, '_logger') as mock_logger:
+            processor.process_audio(path)
+        
+        mock_logger.warning.assert_called_once()
+        assert "scipy polyphase" in mock_logger.warning.call_args.args[0]
+    
+    def test_unreadable_header_raises(self, temp_dir):
+        """Test files whose header soundfile cannot read are rejected."""
+        path = temp_dir / "clip.m4a"
+        path.write_bytes(b"not audio")
+        
+        with pytest.raises(AudioError, match="Cannot read audio header"):
+            AudioProcessor(self._config()).process_audio(str(path))
+
+
+class TestProbeAudio:
+    """Test header-only metadata probing."""
+    
+    def _write(self, temp_dir, seconds, sample_rate=44100, channels=2, name="clip.wav"):
+        import soundfile as sf
+        data = np.zeros((int(sample_rate * seconds), channels), dtype=np.float32)
+        path = temp_dir / name
+        sf.write(str(path), data, sample_rate)
+        return str(path)
+    
+    def test_probe_reads_header_metadata(self, temp_dir):
+        """Test duration, rate, channels, format and size come from the header."""
+        from src.audio_to_json.audio_processor import probe_audio
+        path = self._write(temp_dir, 2.5)
+        
+        metadata = probe_audio(path)
+        
+        assert metadata.duration == pytest.approx(2.5)
+        assert metadata.sample_rate == 44100
+        assert metadata.channels == 2
+        assert metadata.format == "wav"
+        assert metadata.size_bytes == os.path.getsize(path)
+    
+    @patch('src.audio_to_json.audio_processor.librosa.load')
+    def test_probe_does_not_decode(self, mock_load, temp_dir):
+        """Test probing never loads samples."""
+        from src.audio_to_json.audio_processor import probe_audio
+        path = self._write(temp_dir, 1.0)
+        
+        probe_audio(path)
+        
+        mock_load.assert_not_called()
+    
+    def test_probe_matches_decoded_metadata(self, temp_dir):
+        """Test the probe agrees with the metadata of a full decode."""
+        from src.audio_to_json.audio_processor import probe_audio
+        path = self._write(temp_dir, 1.25, sample_rate=22050, channels=1)
+        
+        decoded = AudioProcessor(Config()).process_audio(path).metadata
+        
+        assert probe_audio(path) == decoded
+    
+    def test_decode_reads_header_once(self, temp_dir):
+        """Test the decode path reuses one header read."""
+        import soundfile as sf
+        path = self._write(temp_dir, 1.0)
+        
+        with patch('src.audio_to_json.audio_processor.sf.info', wraps=sf.info) as mock_info:
+            AudioProcessor(Config()).process_audio(path)
+        
+        mock_info.assert_called_once_with(path)
+    
+    def test_probe_missing_file(self, temp_dir):
+        """Test probing a missing file raises AudioError."""
+        from src.audio_to_json.audio_processor import probe_audio
+        
+        with pytest.raises(AudioError, match="Audio file not found"):
+            probe_audio(str(temp_dir / "missing.wav"))
+
+
+class TestResamplers:
+    """Test selectable resampling backends."""
+    
+    RESAMPLERS = ["librosa", "soxr_hq", "soxr_qq", "scipy_poly"]
+    
+    def _sine(self, sample_rate, seconds=1.0, freq=440.0):
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        return np.sin(2 * np.pi * freq * t).astype(np.float32)
+    
+    @pytest.mark.parametrize("resampler", RESAMPLERS)
+    @pytest.mark.parametrize("original_sr", [44100, 48000])
+    def test_resampled_sine_matches_reference(self, resampler, original_sr):
+        """Test every backend reproduces an in-band tone at the target rate."""
+        from src.audio_to_json.audio_processor import resample_audio
+        
+        result = resample_audio(self._sine(original_sr), original_sr, 16000, resampler)
+        
+        expected = self._sine(16000)
+        assert abs(len(result) - len(expected)) <= 1
+        assert result.dtype == np.float32
+        # Ignore filter edge effects at both ends
+        n = min(len(result), len(expected))
+        assert np.max(np.abs(result[200:n - 200] - expected[200:n - 200])) < 0.01
+    
+    def test_unknown_resampler_raises(self):
+        """Test an unknown backend name is rejected."""
+        from src.audio_to_json.audio_processor import resample_audio
+        
+        with pytest.raises(AudioError, match="Unknown resampler"):
+            resample_audio(self._sine(44100), 44100, 16000, "kaiser_best")
+    
+    @patch('src.audio_to_json.audio_processor.sf.info')
+    @patch('src.audio_to_json.audio_processor.os.path.getsize')
+    @patch('src.audio_to_json.audio_processor.librosa.load')
+    @patch('src.audio_to_json.audio_processor.Path.exists')
+    def test_downmix_happens_before_resampling(self, mock_exists, mock_load, mock_getsize, mock_info):
+        """Test stereo input is averaged first so only one channel is resampled."""
+        mock_exists.return_value = True
+        stereo = np.stack([self._sine(44100), -0.5 * self._sine(44100)])
+        mock_load.return_value = (stereo, 44100)
+        mock_getsize.return_value = 1000
+        mock_info.return_value = MagicMock(channels=2, format='WAV')
+        config = Config()
+        config.audio.resampler = "soxr_hq"
+        
+        with patch('src.audio_to_json.audio_processor.soxr.resample',
+                   wraps=__import__('soxr').resample) as mock_resample:
+            result = AudioProcessor(config).process_audio("stereo.wav")
+        
+        assert mock_resample.call_args.args[0].ndim == 1
+        assert result.data.ndim == 1
+        assert result.data.dtype == np.float32
+    
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_soxr_streaming_matches_whole_file(self, temp_dir, channels):
+        """Test streamed soxr output equals one-shot soxr resampling."""
+        import soundfile as sf
+        from src.audio_to_json.audio_processor import resample_audio
+        stereo = (np.random.RandomState(0).randn(48000 * 2 + 37, 2) * 0.1).astype(np.float32)
+        path = temp_dir / "long.wav"
+        sf.write(str(path), stereo, 48000, subtype='FLOAT')
+        config = Config()
+        config.audio.streaming = True
+        config.audio.block_seconds = 0.3
+        config.audio.channels = channels
+        config.audio.resampler = "soxr_hq"
+        
+        result = AudioProcessor(config).process_audio(str(path))
+        
+        source = stereo.T.mean(axis=0, dtype=np.float32) if channels == 1 else stereo.T
+        expected = resample_audio(source, 48000, 16000, "soxr_hq")
+        assert result.data.shape == expected.shape
+        assert np.allclose(result.data, expected, atol=1e-6)
+    
+    def test_cache_key_depends_on_resampler(self, temp_dir):
+        """Test cached audio is not shared between resamplers."""
+        from src.audio_to_json.audio_processor import DecodedAudioCache
+        path = temp_dir / "clip.wav"
+        path.write_bytes(b"audio bytes")
+        config = Config()
+        base = DecodedAudioCache.key_for(str(path), config)
+        
+        config.audio.resampler = "soxr_qq"
+        
+        assert DecodedAudioCache.key_for(str(path), config) != base
+
+
+class TestDecodedAudioCache:
+    """Test the memory-mapped decoded-audio cache."""
+    
+    def _write(self, temp_dir, seconds=1.0, sample_rate=44100, name="clip.wav", seed=1):
+        import soundfile as sf
+        data = (np.random.RandomState(seed).randn(int(sample_rate * seconds)) * 0.1).astype(np.float32)
+        path = temp_dir / name
+        sf.write(str(path), data, sample_rate, subtype='FLOAT')
+        return str(path)
+    
+    def _config(self, temp_dir):
+        config = Config()
+        config.audio.cache_dir = str(temp_dir / "cache")
+        return config
+    
+    def test_second_run_hits_cache_without_decoding(self, temp_dir):
+        """Test cached audio is reopened as a memory map and librosa is skipped."""
+        path = self._write(temp_dir)
+        config = self._config(temp_dir)
+        first = AudioProcessor(config).process_audio(path)
+        
+        with patch('src.audio_to_json.audio_processor.librosa.load') as mock_load:
+            second = AudioProcessor(config).process_audio(path)
+        
+        mock_load.assert_not_called()
+        assert isinstance(second.data, np.memmap)
+        assert np.array_equal(second.data, first.data)
+        assert second.metadata == first.metadata
+        assert second.duration == pytest.approx(first.duration)
+    
+    def test_key_depends_on_content_and_settings(self, temp_dir):
+        """Test renamed copies share a key and decode settings change it."""
+        from src.audio_to_json.audio_processor import DecodedAudioCache
+        path = self._write(temp_dir)
+        copy = temp_dir / "renamed.wav"
+        copy.write_bytes(Path(path).read_bytes())
+        config = self._config(temp_dir)
+        
+        key = DecodedAudioCache.key_for(path, config)
+        assert DecodedAudioCache.key_for(str(copy), config) == key
+        
+        config.audio.sample_rate = 22050
+        assert DecodedAudioCache.key_for(path, config) != key
+    
+    def test_size_cap_evicts_oldest(self, temp_dir):
+        """Test the cache stays within cache_max_mb."""
+        config = self._config(temp_dir)
+        config.audio.cache_max_mb = 1  # ~16 s of float32 audio at 16 kHz
+        processor = AudioProcessor(config)
+        
+        for i in range(3):
+            processor.process_audio(self._write(temp_dir, seconds=8.0, name=f"clip{i}.wav", seed=i))
+        
+        assert processor.cache.disk.size_bytes() <= 1024 * 1024
+        assert processor.cache.disk.evictions >= 1
+    
+    def test_corrupt_entry_is_discarded(self, temp_dir):
+        """Test unreadable entries are removed and audio is decoded again."""
+        path = self._write(temp_dir)
+        config = self._config(temp_dir)
+        AudioProcessor(config).process_audio(path)
+        next((temp_dir / "cache").glob("*.json")).write_text("{broken")
+        
+        result = AudioProcessor(config).process_audio(path)
+        
+        assert not isinstance(result.data, np.memmap)
+        assert len(list((temp_dir / "cache").glob("*.npy"))) == 1
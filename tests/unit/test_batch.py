@@ -0,0 +1,250 @@
+"""
+Unit tests for batch processing.
+
+Tests batch input resolution (directory, glob, manifest), output path
+derivation, per-file failure isolation, and worker fan-out in the pipeline.
+"""
+import json
+import pytest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.batch import resolve_batch_inputs, batch_output_paths
+from src.audio_to_json.pipeline import AudioToJsonPipeline, process_batch
+from src.shared.config import Config
+from src.shared.models import BatchSummary
+from src.shared.exceptions import PipelineError, AudioError
+
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs jobs in-process."""
+
+    def __init__(self, *args, initializer=None, initargs=(), **kwargs):
+        if initializer:
+            initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _make_files(root: Path, names):
+    paths = []
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        paths.append(path)
+    return paths
+
+
+def _fake_database(entity_count=3, duration=10.0):
+    database = MagicMock()
+    database.entities = [MagicMock()] * entity_count
+    database.metadata = {"audio_duration": duration}
+    return database
+
+
+class TestResolveBatchInputs:
+    """Test expansion of batch sources."""
+
+    def test_directory_source_filters_audio(self, temp_dir):
+        """Test directories are searched recursively for audio files."""
+        _make_files(temp_dir, ["a.wav", "sub/b.mp3", "notes.txt", "c.flac"])
+
+        files = resolve_batch_inputs(str(temp_dir))
+
+        assert files == [temp_dir / "a.wav", temp_dir / "c.flac", temp_dir / "sub/b.mp3"]
+
+    def test_directory_with_pattern(self, temp_dir):
+        """Test pattern narrows a directory source."""
+        _make_files(temp_dir, ["a.wav", "b.mp3"])
+
+        files = resolve_batch_inputs(str(temp_dir), pattern="*.wav")
+
+        assert [p.name for p in files] == ["a.wav"]
+
+    def test_glob_source(self, temp_dir):
+        """Test glob patterns are expanded."""
+        _make_files(temp_dir, ["x/one.wav", "y/two.wav", "y/three.mp3"])
+
+        files = resolve_batch_inputs(str(temp_dir / "**" / "*.wav"))
+
+        assert sorted(p.name for p in files) == ["one.wav", "two.wav"]
+
+    def test_text_manifest(self, temp_dir):
+        """Test .txt manifests with relative paths and comments."""
+        _make_files(temp_dir, ["audio/a.wav", "audio/b.wav"])
+        manifest = temp_dir / "manifest.txt"
+        manifest.write_text("# recordings\naudio/a.wav\n\naudio/b.wav\n")
+
+        files = resolve_batch_inputs(str(manifest))
+
+        assert files == [temp_dir / "audio/a.wav", temp_dir / "audio/b.wav"]
+
+    def test_json_manifest(self, temp_dir):
+        """Test .json manifests listing paths."""
+        _make_files(temp_dir, ["a.wav"])
+        manifest = temp_dir / "manifest.json"
+        manifest.write_text(json.dumps(["a.wav"]))
+
+        assert resolve_batch_inputs(str(manifest)) == [temp_dir / "a.wav"]
+
+    def test_invalid_json_manifest(self, temp_dir):
+        """Test malformed manifests raise PipelineError."""
+        manifest = temp_dir / "manifest.json"
+        manifest.write_text(json.dumps({"not": "a list"}))
+
+        with pytest.raises(PipelineError):
+            resolve_batch_inputs(str(manifest))
+
+    def test_no_matches_raises(self, temp_dir):
+        """Test empty sources raise PipelineError."""
+        with pytest.raises(PipelineError):
+            resolve_batch_inputs(str(temp_dir / "*.wav"))
+
+
+class TestBatchOutputPaths:
+    """Test output path derivation."""
+
+    def test_default_next_to_audio(self, temp_dir):
+        """Test outputs default to the audio file's directory."""
+        files = [temp_dir / "a.wav"]
+        assert batch_output_paths(files, None) == [temp_dir / "a.json"]
+
+    def test_output_dir_mirrors_structure(self, temp_dir):
+        """Test same-named files in different folders do not collide."""
+        files = _make_files(temp_dir, ["day1/take.wav", "day2/take.wav"])
+        out_dir = temp_dir / "out"
+
+        outputs = batch_output_paths(files, out_dir)
+
+        assert outputs == [out_dir / "day1/take.json", out_dir / "day2/take.json"]
+
+    @pytest.mark.parametrize("with_output_dir", [False, True])
+    def test_same_stem_keeps_extension(self, temp_dir, with_output_dir):
+        """Test a.wav and a.mp3 in one folder get distinct outputs."""
+        files = _make_files(temp_dir, ["a.mp3", "a.wav", "b.wav"])
+        out_dir = temp_dir / "out" if with_output_dir else None
+
+        outputs = batch_output_paths(files, out_dir)
+
+        base = out_dir or temp_dir
+        assert outputs == [base / "a.mp3.json", base / "a.wav.json", base / "b.json"]
+
+    def test_unresolvable_collision_rejected(self, temp_dir):
+        """Test inputs that would still share an output raise instead of overwriting."""
+        files = _make_files(temp_dir, ["a.wav"])
+
+        with pytest.raises(PipelineError):
+            batch_output_paths(files * 2, None)
+
+
+class TestProcessBatch:
+    """Test AudioToJsonPipeline.process_batch."""
+
+    @patch.object(AudioToJsonPipeline, 'preload_models')
+    @patch.object(AudioToJsonPipeline, 'process_audio_to_json')
+    def test_serial_batch_success(self, mock_process, mock_preload, temp_dir):
+        """Test every file is processed and results keep input order."""
+        files = _make_files(temp_dir, ["a.wav", "b.wav"])
+        mock_process.return_value = _fake_database(entity_count=4, duration=12.0)
+
+        summary = AudioToJsonPipeline(Config()).process_batch([str(f) for f in files])
+
+        assert isinstance(summary, BatchSummary)
+        assert mock_preload.call_count == 1
+        assert summary.succeeded == 2
+        assert summary.failed == 0
+        assert [r.audio_path for r in summary.results] == [str(f) for f in files]
+        assert summary.results[0].entity_count == 4
+        assert summary.total_audio_duration == 24.0
+
+    @patch.object(AudioToJsonPipeline, 'preload_models')
+    @patch.object(AudioToJsonPipeline, 'process_audio_to_json')
+    def test_failures_are_isolated(self, mock_process, mock_preload, temp_dir):
+        """Test one failing file does not stop the batch."""
+        files = _make_files(temp_dir, ["bad.wav", "good.wav"])
+        mock_process.side_effect = [AudioError("corrupt file"), _fake_database()]
+
+        summary = AudioToJsonPipeline(Config()).process_batch([str(f) for f in files])
+
+        assert summary.failed == 1
+        assert summary.succeeded == 1
+        assert summary.results[0].success is False
+        assert summary.results[0].error_type == "AudioError"
+        assert "corrupt file" in summary.results[0].error
+        assert summary.results[1].success is True
+
+    @patch.object(AudioToJsonPipeline, 'preload_models', side_effect=RuntimeError("no model"))
+    @patch.object(AudioToJsonPipeline, 'process_audio_to_json')
+    def test_preload_failure_does_not_abort(self, mock_process, mock_preload, temp_dir):
+        """Test a model preload failure is reported per file instead."""
+        files = _make_files(temp_dir, ["a.wav"])
+        mock_process.return_value = _fake_database()
+
+        summary = AudioToJsonPipeline(Config()).process_batch([str(f) for f in files])
+
+        assert summary.succeeded == 1
+
+    @patch('src.audio_to_json.pipeline.ProcessPoolExecutor', _InlineExecutor)
+    @patch.object(AudioToJsonPipeline, 'preload_models')
+    @patch.object(AudioToJsonPipeline, 'process_audio_to_json')
+    def test_parallel_batch_uses_worker_pipeline(self, mock_process, mock_preload, temp_dir):
+        """Test worker fan-out builds one warm pipeline per worker."""
+        files = _make_files(temp_dir, ["a.wav", "b.wav", "c.wav"])
+        mock_process.return_value = _fake_database()
+
+        summary = AudioToJsonPipeline(Config()).process_batch(
+            [str(f) for f in files], output_dir=str(temp_dir / "out"), workers=2
+        )
+
+        assert summary.workers == 2
+        assert summary.succeeded == 3
+        # One preload for the single inline "worker" initializer
+        assert mock_preload.call_count == 1
+        assert summary.results[2].output_path == str(temp_dir / "out" / "c.json")
+
+    @patch('src.audio_to_json.pipeline.ProcessPoolExecutor', _InlineExecutor)
+    @patch.object(AudioToJsonPipeline, 'preload_models')
+    @patch.object(AudioToJsonPipeline, 'process_audio_to_json')
+    def test_parallel_batch_starts_longest_first(self, mock_process, mock_preload, temp_dir):
+        """Test workers receive files by decreasing duration, results keep input order."""
+        import numpy as np
+        import soundfile as sf
+        files = []
+        for name, seconds in [("short.wav", 0.5), ("long.wav", 2.0), ("mid.wav", 1.0)]:
+            path = temp_dir / name
+            sf.write(str(path), np.zeros(int(16000 * seconds), dtype=np.float32), 16000)
+            files.append(path)
+        mock_process.return_value = _fake_database()
+
+        summary = AudioToJsonPipeline(Config()).process_batch(
+            [str(f) for f in files], workers=2
+        )
+
+        started = [Path(call.args[0]).name for call in mock_process.call_args_list]
+        assert started == ["long.wav", "mid.wav", "short.wav"]
+        assert [Path(r.audio_path).name for r in summary.results] == ["short.wav", "long.wav", "mid.wav"]
+
+    @patch.object(AudioToJsonPipeline, 'preload_models')
+    @patch.object(AudioToJsonPipeline, 'process_audio_to_json')
+    def test_workers_capped_by_file_count(self, mock_process, mock_preload, temp_dir):
+        """Test a single file never starts a pool."""
+        files = _make_files(temp_dir, ["a.wav"])
+        mock_process.return_value = _fake_database()
+
+        summary = process_batch([str(f) for f in files], Config(), workers=8)
+
+        assert summary.workers == 1
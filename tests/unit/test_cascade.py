@@ -0,0 +1,187 @@
+"""
+Unit tests for cascade module.
+
+Tests planning of re-transcription spans around low-confidence words,
+splicing of the larger model's words, and the cascade mode of
+TranscriptionEngine.
+"""
+import pytest
+import numpy as np
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.cascade import RefinementSpan, plan_refinement_spans, splice_refined_words
+from src.audio_to_json.transcription import (
+    TranscriptionEngine, Word, preload_whisper_model, release_whisper_model
+)
+from src.audio_to_json.model_registry import get_model_registry
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.shared.config import WhisperConfig
+from src.shared.models import AudioMetadata
+
+
+SAMPLE_RATE = 16000
+
+
+def _words(*specs):
+    """Words from (text, start, end, confidence) tuples."""
+    return [Word(text, start, end, confidence) for text, start, end, confidence in specs]
+
+
+def _sentence():
+    return _words(
+        ("hoy", 0.0, 0.4, 0.95),
+        ("vamos", 0.5, 0.9, 0.9),
+        ("a", 1.0, 1.1, 0.9),
+        ("estudiar", 1.2, 1.8, 0.3),
+        ("la", 1.9, 2.0, 0.9),
+        ("historia", 5.0, 5.6, 0.9),
+        ("de", 5.7, 5.8, 0.9),
+        ("Colombia", 5.9, 6.5, 0.95),
+    )
+
+
+class TestPlanRefinementSpans:
+    """Test span planning around weak words."""
+
+    def test_confident_transcript_needs_no_spans(self):
+        """Test nothing is re-transcribed when every word is confident."""
+        words = [w for w in _sentence() if w.confidence > 0.5]
+
+        assert plan_refinement_spans(words, 0.5, 1.0, 2.0, 7.0) == []
+
+    def test_weak_word_widened_by_context(self):
+        """Test neighbours inside the context window are replaced too."""
+        spans = plan_refinement_spans(_sentence(), 0.5, 0.5, 0.0, 7.0)
+
+        assert len(spans) == 1
+        span = spans[0]
+        # "vamos" (ends 0.9 > 0.7) through "la" (starts 1.9 < 2.3)
+        assert (span.first_word, span.last_word) == (1, 4)
+        # Cuts sit in the pauses before "vamos" and after "la"
+        assert span.start == pytest.approx(0.45)
+        assert span.end == pytest.approx(3.5)
+
+    def test_edges_cut_at_audio_bounds(self):
+        """Test spans touching the first or last word extend to the audio edges."""
+        words = _words(("uno", 0.2, 0.5, 0.1), ("dos", 3.0, 3.4, 0.9), ("tres", 6.0, 6.4, 0.2))
+
+        spans = plan_refinement_spans(words, 0.5, 0.5, 0.0, 7.0)
+
+        assert [(s.first_word, s.last_word) for s in spans] == [(0, 0), (2, 2)]
+        assert spans[0].start == 0.0
+        assert spans[1].end == 7.0
+
+    def test_nearby_spans_merged(self):
+        """Test spans closer than merge_gap_s become one."""
+        words = _words(("uno", 0.2, 0.5, 0.1), ("dos", 1.0, 1.4, 0.9), ("tres", 2.0, 2.4, 0.2))
+
+        separate = plan_refinement_spans(words, 0.5, 0.1, 0.0, 3.0)
+        merged = plan_refinement_spans(words, 0.5, 0.1, 2.0, 3.0)
+
+        assert len(separate) == 2
+        assert [(s.first_word, s.last_word, s.start, s.end) for s in merged] == [(0, 2, 0.0, 3.0)]
+
+
+class TestSpliceRefinedWords:
+    """Test splicing the larger model's words."""
+
+    def test_span_words_replaced_and_shifted(self):
+        """Test refined words replace the span and move to the original timeline."""
+        span = RefinementSpan(first_word=2, last_word=4, start=0.95, end=3.5)
+        refined = _words(("a", 0.05, 0.15, 0.9), ("estudiar", 0.25, 0.85, 0.92), ("la", 0.95, 1.05, 0.9))
+
+        spliced = splice_refined_words(_sentence(), [(span, refined)])
+
+        assert [w.text for w in spliced] == ["hoy", "vamos", "a", "estudiar", "la",
+                                             "historia", "de", "Colombia"]
+        assert spliced[3].confidence == 0.92
+        assert spliced[3].start_time == pytest.approx(1.2)
+        assert spliced[5:] == _sentence()[5:]
+
+    def test_words_outside_span_dropped(self):
+        """Test refined words centred past the span end are discarded."""
+        span = RefinementSpan(first_word=0, last_word=0, start=0.0, end=1.0)
+        refined = _words(("uno", 0.2, 0.5, 0.9), ("fantasma", 1.2, 1.6, 0.4))
+
+        spliced = splice_refined_words(_words(("uno", 0.2, 0.5, 0.1)), [(span, refined)])
+
+        assert [w.text for w in spliced] == ["uno"]
+
+    def test_empty_refinement_keeps_fast_words(self):
+        """Test a span the larger model left empty keeps the original words."""
+        words = _sentence()
+        span = RefinementSpan(first_word=2, last_word=4, start=0.95, end=3.5)
+
+        assert splice_refined_words(words, [(span, [])]) == words
+
+
+class TestCascadeTranscription:
+    """Test TranscriptionEngine cascade mode."""
+
+    def _create_audio(self, duration: float) -> ProcessedAudio:
+        data = np.zeros(int(duration * SAMPLE_RATE), dtype=np.float32)
+        metadata = AudioMetadata(
+            path="class.wav", duration=duration, sample_rate=SAMPLE_RATE,
+            channels=1, format="wav", size_bytes=1000
+        )
+        return ProcessedAudio(data, SAMPLE_RATE, duration, metadata)
+
+    def _models(self):
+        fast = MagicMock()
+        fast.transcribe.return_value = {"segments": [{"words": [
+            {"word": " hoy", "start": 0.0, "end": 0.4, "probability": 0.95},
+            {"word": " estudiamos", "start": 5.0, "end": 5.6, "probability": 0.2},
+            {"word": " historia", "start": 10.0, "end": 10.6, "probability": 0.9},
+        ]}]}
+        large = MagicMock()
+        large.transcribe.return_value = {"segments": [{"words": [
+            {"word": " estudiaremos", "start": 0.3, "end": 1.0, "probability": 0.85},
+        ]}]}
+        return {"base": fast, "medium": large}
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_only_weak_region_re_transcribed(self, mock_load_model):
+        """Test the larger model sees just the weak span and its words are spliced in."""
+        models = self._models()
+        mock_load_model.side_effect = lambda name, **kwargs: models[name]
+        config = WhisperConfig(model="base", cascade_model="medium", cascade_context_s=0.5)
+
+        words = TranscriptionEngine(config).transcribe_audio(self._create_audio(12.0))
+
+        assert models["medium"].transcribe.call_count == 1
+        segment = models["medium"].transcribe.call_args.args[0]
+        # Cut between "hoy" (ends 0.4) and "estudiamos", and between it and "historia"
+        assert len(segment) == int(round((7.8 - 2.7) * SAMPLE_RATE))
+        assert [w.text for w in words] == ["hoy", "estudiaremos", "historia"]
+        assert words[1].start_time == pytest.approx(2.7 + 0.3)
+        assert words[1].confidence == 0.85
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_confident_transcript_skips_large_model(self, mock_load_model):
+        """Test the larger model is never loaded when nothing is weak."""
+        models = self._models()
+        models["base"].transcribe.return_value["segments"][0]["words"][1]["probability"] = 0.9
+        mock_load_model.side_effect = lambda name, **kwargs: models[name]
+
+        TranscriptionEngine(WhisperConfig(cascade_model="medium")).transcribe_audio(self._create_audio(12.0))
+
+        assert [call.args[0] for call in mock_load_model.call_args_list] == ["base"]
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_preload_and_release_both_models(self, mock_load_model):
+        """Test the cascade model is preloaded and released with the fast model."""
+        mock_load_model.side_effect = lambda name, **kwargs: MagicMock(name=name)
+        config = WhisperConfig(model="base", cascade_model="medium")
+
+        preload_whisper_model(config)
+        assert len(get_model_registry()) == 2
+
+        assert release_whisper_model(config) is True
+        assert len(get_model_registry()) == 0
+
+    def test_cascade_model_validation(self):
+        """Test the cascade model must be a known, different model."""
+        with pytest.raises(ValueError):
+            WhisperConfig(model="base", cascade_model="base")
+        with pytest.raises(ValueError):
+            WhisperConfig(cascade_model="huge")
@@ -0,0 +1,292 @@
+"""
+Unit tests for checkpoints module.
+
+Tests content-hashed stage keys, checkpoint round trips, handling of
+corrupt checkpoints, and pipeline resume from each stage.
+"""
+import os
+import pytest
+import numpy as np
+import soundfile as sf
+from pathlib import Path
+from unittest.mock import patch
+
+from src.audio_to_json.checkpoints import CheckpointStore
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.audio_to_json.transcription import Word
+from src.audio_to_json.word_table import WordTable
+from src.audio_to_json.entity_creation import create_entities
+from src.audio_to_json.pipeline import AudioToJsonPipeline
+from src.shared.config import Config
+from src.shared.models import AudioMetadata, DiarizationResult, SpeakerSegment
+from src.shared.fingerprint import file_fingerprint, config_fingerprint
+
+
+def _make_audio_file(directory: Path, name: str = "clip.wav", content: bytes = b"RIFF-fake-audio") -> Path:
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+def _processed_audio(path: Path) -> ProcessedAudio:
+    metadata = AudioMetadata(
+        path=str(path), duration=4.0, sample_rate=16000,
+        channels=1, format="wav", size_bytes=100
+    )
+    return ProcessedAudio(np.linspace(-1, 1, 64000, dtype=np.float32), 16000, 4.0, metadata)
+
+
+def _words():
+    return [
+        Word("hablamos", 0.5, 1.1, 0.95),
+        Word("mañana", 1.3, 1.9, 0.9),
+        Word("temprano", 2.1, 2.8, 0.92),
+    ]
+
+
+def _config(temp_dir: Path, checkpoints: bool = True) -> Config:
+    config = Config()
+    config.processing.checkpoints = checkpoints
+    config.processing.checkpoint_dir = str(temp_dir / "checkpoints")
+    return config
+
+
+class TestFingerprints:
+    """Test content and config fingerprints."""
+
+    def test_file_fingerprint_depends_on_content_only(self, temp_dir):
+        """Test renamed copies share a fingerprint."""
+        first = _make_audio_file(temp_dir, "a.wav", b"same bytes")
+        second = _make_audio_file(temp_dir, "b.wav", b"same bytes")
+        third = _make_audio_file(temp_dir, "c.wav", b"other bytes")
+
+        assert file_fingerprint(first) == file_fingerprint(second)
+        assert file_fingerprint(first) != file_fingerprint(third)
+
+    def test_config_fingerprint_is_canonical(self):
+        """Test dict ordering and model vs dict do not change the hash."""
+        config = Config()
+        assert config_fingerprint({"a": 1, "b": 2}) == config_fingerprint({"b": 2, "a": 1})
+        assert config_fingerprint(config.whisper) == config_fingerprint(config.whisper.model_dump())
+
+
+class TestCheckpointStore:
+    """Test CheckpointStore round trips."""
+
+    def test_stage_keys_track_relevant_config(self, temp_dir):
+        """Test each key changes only with its own config section or upstream."""
+        audio_file = _make_audio_file(temp_dir)
+        store = CheckpointStore(str(temp_dir / "ckpt"))
+        config = Config()
+        base = store.stage_keys(str(audio_file), config)
+
+        config.quality.min_confidence = 0.1
+        assert store.stage_keys(str(audio_file), config) == base
+
+        config.whisper.temperature = 0.5
+        changed = store.stage_keys(str(audio_file), config)
+        assert changed.audio == base.audio
+        assert changed.words != base.words
+        assert changed.entities != base.entities
+
+    def test_audio_round_trip_is_memory_mapped(self, temp_dir):
+        """Test decoded audio is restored from .npy via mmap."""
+        store = CheckpointStore(str(temp_dir))
+        audio = _processed_audio(temp_dir / "clip.wav")
+
+        store.save_audio("k", audio)
+        restored = store.load_audio("k")
+
+        assert isinstance(restored.data, np.memmap)
+        assert np.array_equal(restored.data, audio.data)
+        assert restored.metadata == audio.metadata
+
+    def test_words_diarization_entities_round_trip(self, temp_dir):
+        """Test words, diarization and entities survive a round trip."""
+        store = CheckpointStore(str(temp_dir))
+        words = _words()
+        diarization = DiarizationResult(
+            speakers=[0],
+            segments=[SpeakerSegment(speaker_id=0, start_time=0.0, end_time=4.0, confidence=0.9)],
+            audio_duration=4.0,
+            processing_time=0.1
+        )
+        entities = create_entities(words, None, "rec_1", "clip.wav")
+
+        store.save_words("k", words)
+        store.save_diarization("k", diarization)
+        store.save_entities("k", entities)
+
+        assert store.load_words("k") == words
+        assert store.load_diarization("k") == diarization
+        assert store.load_entities("k") == entities
+
+    def test_word_table_saved_as_words(self, temp_dir):
+        """Test a WordTable is checkpointed in the Word list format."""
+        store = CheckpointStore(str(temp_dir))
+        words = _words()
+
+        store.save_words("k", WordTable.from_words(words))
+
+        assert store.load_words("k") == words
+
+    def test_missing_and_corrupt_checkpoints_return_none(self, temp_dir):
+        """Test absent or unreadable checkpoints are treated as misses."""
+        store = CheckpointStore(str(temp_dir))
+        assert store.load_words("missing") is None
+
+        store.save_words("k", _words())
+        next(temp_dir.glob("words_*.json")).write_text("{not json")
+        assert store.load_words("k") is None
+
+    def test_size_cap_evicts_least_recently_used(self, temp_dir):
+        """Test the directory stays under the cap by evicting old checkpoints."""
+        audio = _processed_audio(temp_dir / "clip.wav")
+        store = CheckpointStore(str(temp_dir / "ckpt"), max_bytes=int(audio.data.nbytes * 1.5))
+
+        store.save_audio("old", audio)
+        for path in (temp_dir / "ckpt").iterdir():
+            os.utime(path, (1, 1))
+        store.save_audio("new", audio)
+
+        assert store.load_audio("old") is None
+        assert store.load_audio("new") is not None
+        assert store.disk.size_bytes() <= store.disk.max_bytes
+
+    def test_audio_fingerprint_round_trip(self, temp_dir):
+        """Test the decoded audio fingerprint is restored with the samples."""
+        store = CheckpointStore(str(temp_dir))
+        audio = _processed_audio(temp_dir / "clip.wav")
+        audio.fingerprint = "abc"
+
+        store.save_audio("k", audio)
+
+        assert store.load_audio("k").fingerprint == "abc"
+
+    def test_stage_keys_reuse_content_hash(self, temp_dir):
+        """Test a precomputed content hash is used instead of re-reading the file."""
+        audio_file = _make_audio_file(temp_dir)
+        store = CheckpointStore(str(temp_dir / "ckpt"))
+        expected = store.stage_keys(str(audio_file), Config())
+
+        with patch('src.audio_to_json.checkpoints.file_fingerprint') as mock_fingerprint:
+            keys = store.stage_keys(str(audio_file), Config(),
+                                    content_hash=file_fingerprint(audio_file))
+
+        mock_fingerprint.assert_not_called()
+        assert keys == expected
+
+
+class TestPipelineResume:
+    """Test AudioToJsonPipeline resume from checkpoints."""
+
+    def _run(self, config, audio_file, resume_from_stage=None, transcribe_side_effect=None):
+        with patch('src.audio_to_json.pipeline.process_audio') as mock_process, \
+             patch('src.audio_to_json.pipeline.transcribe_audio') as mock_transcribe:
+            mock_process.return_value = _processed_audio(audio_file)
+            mock_transcribe.return_value = _words()
+            if transcribe_side_effect:
+                mock_transcribe.side_effect = transcribe_side_effect
+            database = AudioToJsonPipeline(config).process_audio_to_json(
+                str(audio_file), resume_from_stage=resume_from_stage
+            )
+            return database, mock_process, mock_transcribe
+
+    def test_checkpoints_disabled_by_default(self, temp_dir):
+        """Test nothing is written unless checkpoints are enabled."""
+        audio_file = _make_audio_file(temp_dir)
+        config = _config(temp_dir, checkpoints=False)
+
+        self._run(config, audio_file)
+
+        assert not (temp_dir / "checkpoints").exists()
+
+    def test_resume_from_database_skips_audio_and_transcription(self, temp_dir):
+        """Test a database-stage resume reuses raw entities."""
+        audio_file = _make_audio_file(temp_dir)
+        config = _config(temp_dir)
+        first, _, _ = self._run(config, audio_file)
+
+        config.quality.min_confidence = 0.0  # Threshold sweep on cached entities
+        resumed, mock_process, mock_transcribe = self._run(
+            config, audio_file, "database", transcribe_side_effect=AssertionError("re-transcribed")
+        )
+
+        mock_process.assert_not_called()
+        mock_transcribe.assert_not_called()
+        assert [e.text for e in resumed.entities] == [e.text for e in first.entities]
+
+    def test_resume_from_transcription_reuses_audio(self, temp_dir):
+        """Test a transcription-stage resume reuses decoded audio only."""
+        audio_file = _make_audio_file(temp_dir)
+        config = _config(temp_dir)
+        self._run(config, audio_file)
+
+        _, mock_process, mock_transcribe = self._run(config, audio_file, "transcription")
+
+        mock_process.assert_not_called()
+        mock_transcribe.assert_called_once()
+
+    def test_rerun_after_crash_picks_up_last_checkpoint(self, temp_dir):
+        """Test a crash after transcription does not repeat it on re-run."""
+        audio_file = _make_audio_file(temp_dir)
+        config = _config(temp_dir)
+
+        with patch('src.audio_to_json.pipeline.create_entities', side_effect=RuntimeError("crash")):
+            with pytest.raises(Exception):
+                self._run(config, audio_file)
+
+        _, mock_process, mock_transcribe = self._run(config, audio_file)
+
+        mock_process.assert_not_called()
+        mock_transcribe.assert_not_called()
+
+    def test_resume_without_checkpoints_recomputes(self, temp_dir):
+        """Test resume falls back to running stages when no checkpoint exists."""
+        audio_file = _make_audio_file(temp_dir)
+        config = _config(temp_dir, checkpoints=False)
+
+        database, mock_process, mock_transcribe = self._run(config, audio_file, "entities")
+
+        mock_process.assert_called_once()
+        mock_transcribe.assert_called_once()
+        assert len(database.entities) > 0
+
+    def test_source_hashed_once_per_run(self, temp_dir):
+        """Test checkpoints and the decoded-audio and transcription caches share one file hash."""
+        audio_file = temp_dir / "tone.wav"
+        sf.write(str(audio_file), np.sin(np.linspace(0, 800, 16000)).astype(np.float32), 16000)
+        config = _config(temp_dir)
+        config.audio.cache_dir = str(temp_dir / "audio_cache")
+        config.whisper.cache_dir = str(temp_dir / "whisper_cache")
+        calls = []
+
+        def counting_fingerprint(path):
+            calls.append(path)
+            return file_fingerprint(path)
+
+        with patch('src.audio_to_json.pipeline.file_fingerprint', counting_fingerprint), \
+             patch('src.audio_to_json.checkpoints.file_fingerprint', counting_fingerprint), \
+             patch('src.audio_to_json.audio_processor.file_fingerprint', counting_fingerprint), \
+             patch('src.audio_to_json.transcription.array_fingerprint') as mock_array_fingerprint, \
+             patch('src.audio_to_json.transcription.whisper.load_model') as mock_load_model:
+            mock_load_model.return_value.transcribe.return_value = {"segments": [{
+                "start": 0.1, "end": 0.8, "text": " hablamos",
+                "words": [{"word": " hablamos", "start": 0.1, "end": 0.8, "probability": 0.9}]
+            }]}
+            AudioToJsonPipeline(config).process_audio_to_json(str(audio_file))
+
+        assert calls == [str(audio_file)]
+        mock_array_fingerprint.assert_not_called()
+
+    def test_changed_audio_invalidates_checkpoints(self, temp_dir):
+        """Test checkpoints are keyed by file content."""
+        audio_file = _make_audio_file(temp_dir, content=b"first take")
+        config = _config(temp_dir)
+        self._run(config, audio_file)
+
+        audio_file.write_bytes(b"second take")
+        _, mock_process, mock_transcribe = self._run(config, audio_file, "database")
+
+        mock_process.assert_called_once()
+        mock_transcribe.assert_called_once()
@@ -0,0 +1,255 @@
+"""
+Unit tests for chunking module.
+
+Tests quiet-point detection, overlapping chunk planning, timestamp stitching
+with boundary de-duplication, and chunked transcription in TranscriptionEngine.
+"""
+import pytest
+import numpy as np
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.chunking import (
+    AudioChunk, find_quiet_point, plan_chunks, stitch_chunk_words
+)
+from src.audio_to_json.transcription import TranscriptionEngine, Word, shutdown_chunk_pools
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.shared.config import WhisperConfig
+from src.shared.models import AudioMetadata
+
+
+SAMPLE_RATE = 16000
+
+
+def _speech_with_pauses(duration: float, pauses: list) -> np.ndarray:
+    """Create noise-like 'speech' with silent pauses at given (start, end) seconds."""
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-0.5, 0.5, int(duration * SAMPLE_RATE)).astype(np.float32)
+    for start, end in pauses:
+        data[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] = 0.0
+    return data
+
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs work in-process."""
+
+    created = 0
+
+    def __init__(self, *args, initializer=None, initargs=(), **kwargs):
+        _InlineExecutor.created += 1
+        if initializer:
+            initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        return [fn(*args) for args in zip(*iterables)]
+
+    def shutdown(self, wait=True):
+        pass
+
+
+class TestQuietPoint:
+    """Test low-energy cut point search."""
+
+    def test_finds_pause_near_target(self):
+        """Test the cut lands inside a nearby pause."""
+        data = _speech_with_pauses(10.0, [(4.6, 4.9)])
+        cut = find_quiet_point(data, SAMPLE_RATE, 5 * SAMPLE_RATE, SAMPLE_RATE)
+
+        assert 4.6 * SAMPLE_RATE <= cut <= 4.9 * SAMPLE_RATE
+
+    def test_short_window_returns_target(self):
+        """Test degenerate search windows fall back to the target."""
+        data = np.ones(100, dtype=np.float32)
+        assert find_quiet_point(data, SAMPLE_RATE, 50, 1) == 50
+
+
+class TestPlanChunks:
+    """Test chunk planning."""
+
+    def test_short_audio_single_chunk(self):
+        """Test audio shorter than a chunk is not split."""
+        data = np.zeros(5 * SAMPLE_RATE, dtype=np.float32)
+        chunks = plan_chunks(data, SAMPLE_RATE, chunk_length_s=30.0, overlap_s=2.0)
+
+        assert len(chunks) == 1
+        assert chunks[0].start_sample == 0
+        assert chunks[0].end_sample == len(data)
+
+    def test_chunks_cover_audio_and_overlap(self):
+        """Test owned spans partition the timeline and windows overlap."""
+        data = _speech_with_pauses(95.0, [(29.5, 30.2), (60.4, 61.0)])
+        chunks = plan_chunks(data, SAMPLE_RATE, chunk_length_s=30.0, overlap_s=2.0)
+
+        assert len(chunks) >= 3
+        assert chunks[0].own_start == 0.0
+        assert chunks[-1].own_end == pytest.approx(95.0)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert previous.own_end == current.own_start
+            assert previous.end_sample > current.start_sample
+
+    def test_cuts_prefer_pauses(self):
+        """Test cut points fall inside silent gaps."""
+        data = _speech_with_pauses(95.0, [(29.5, 30.2), (60.4, 61.0)])
+        chunks = plan_chunks(data, SAMPLE_RATE, chunk_length_s=30.0, overlap_s=2.0)
+
+        assert 29.5 <= chunks[1].own_start <= 30.2
+
+
+class TestStitchChunkWords:
+    """Test merging chunk transcriptions."""
+
+    def test_offsets_applied(self):
+        """Test chunk-relative timestamps are moved to the original timeline."""
+        first = AudioChunk(0, 11 * SAMPLE_RATE, 0.0, 10.0)
+        second = AudioChunk(9 * SAMPLE_RATE, 20 * SAMPLE_RATE, 10.0, 20.0)
+        words = stitch_chunk_words([
+            (first, [Word("hola", 1.0, 1.5, 0.9)]),
+            (second, [Word("mundo", 2.0, 2.5, 0.8)]),
+        ], SAMPLE_RATE)
+
+        assert [w.text for w in words] == ["hola", "mundo"]
+        assert words[1].start_time == pytest.approx(11.0)
+        assert words[1].end_time == pytest.approx(11.5)
+
+    def test_words_outside_owned_span_dropped(self):
+        """Test words in the overlap are kept only by the owning chunk."""
+        first = AudioChunk(0, 11 * SAMPLE_RATE, 0.0, 10.0)
+        second = AudioChunk(9 * SAMPLE_RATE, 20 * SAMPLE_RATE, 10.0, 20.0)
+        words = stitch_chunk_words([
+            (first, [Word("antes", 9.2, 9.6, 0.9), Word("despues", 10.2, 10.6, 0.9)]),
+            (second, [Word("antes", 0.2, 0.6, 0.9), Word("despues", 1.2, 1.6, 0.9)]),
+        ], SAMPLE_RATE)
+
+        assert [w.text for w in words] == ["antes", "despues"]
+
+    def test_boundary_duplicates_removed(self):
+        """Test a word seen on both sides of a cut appears once."""
+        first = AudioChunk(0, 11 * SAMPLE_RATE, 0.0, 10.0)
+        second = AudioChunk(9 * SAMPLE_RATE, 20 * SAMPLE_RATE, 10.0, 20.0)
+        words = stitch_chunk_words([
+            (first, [Word("palabra", 9.80, 10.15, 0.7)]),     # centre 9.975 -> first
+            (second, [Word("Palabra,", 0.85, 1.20, 0.9)]),    # centre 10.025 -> second
+        ], SAMPLE_RATE)
+
+        assert len(words) == 1
+        assert words[0].confidence == 0.9
+
+
+class TestChunkedTranscription:
+    """Test TranscriptionEngine chunked mode."""
+
+    def _create_audio(self, duration: float) -> ProcessedAudio:
+        data = _speech_with_pauses(duration, [(29.5, 30.5)])
+        metadata = AudioMetadata(
+            path="long.wav", duration=duration, sample_rate=SAMPLE_RATE,
+            channels=1, format="wav", size_bytes=1000
+        )
+        return ProcessedAudio(data, SAMPLE_RATE, duration, metadata)
+
+    def _mock_model(self):
+        """Model that reports one word 1s into every window it sees."""
+        model = MagicMock()
+        model.transcribe.side_effect = lambda data, **options: {
+            "segments": [{"words": [{"word": " hola", "start": 1.0, "end": 1.4, "probability": 0.9}]}]
+        }
+        return model
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_chunking_disabled_by_default(self, mock_load_model):
+        """Test whole audio goes to a single transcribe call by default."""
+        mock_model = self._mock_model()
+        mock_load_model.return_value = mock_model
+
+        TranscriptionEngine(WhisperConfig()).transcribe_audio(self._create_audio(60.0))
+
+        assert mock_model.transcribe.call_count == 1
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_serial_chunked_transcription(self, mock_load_model):
+        """Test chunks are transcribed and timestamps offset."""
+        mock_model = self._mock_model()
+        mock_load_model.return_value = mock_model
+        config = WhisperConfig(chunk_length_s=30.0, chunk_overlap_s=2.0)
+
+        words = TranscriptionEngine(config).transcribe_audio(self._create_audio(60.0))
+
+        assert mock_model.transcribe.call_count == 2
+        assert len(words) == 2
+        assert words[0].start_time == pytest.approx(1.0)
+        # Chunk two starts 1s (half the overlap) before a cut inside the
+        # 29.5-30.5s pause, and the word sits 1s into the chunk
+        assert 29.5 <= words[1].start_time <= 30.5
+
+    @patch('src.audio_to_json.transcription.ProcessPoolExecutor', _InlineExecutor)
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_parallel_chunked_transcription(self, mock_load_model):
+        """Test worker path produces the same words as the serial path."""
+        mock_load_model.return_value = self._mock_model()
+        audio = self._create_audio(60.0)
+
+        serial = TranscriptionEngine(
+            WhisperConfig(chunk_length_s=30.0, chunk_overlap_s=2.0)
+        ).transcribe_audio(audio)
+        try:
+            parallel = TranscriptionEngine(
+                WhisperConfig(chunk_length_s=30.0, chunk_overlap_s=2.0, chunk_workers=2)
+            ).transcribe_audio(audio)
+        finally:
+            shutdown_chunk_pools()
+
+        assert [(w.text, w.start_time) for w in parallel] == [(w.text, w.start_time) for w in serial]
+
+    @patch('src.audio_to_json.transcription.ProcessPoolExecutor', _InlineExecutor)
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_worker_pool_reused_across_files(self, mock_load_model):
+        """Test consecutive files share one worker pool until it is shut down."""
+        mock_load_model.return_value = self._mock_model()
+        config = WhisperConfig(chunk_length_s=30.0, chunk_overlap_s=2.0, chunk_workers=2)
+        shutdown_chunk_pools()
+        created = _InlineExecutor.created
+
+        try:
+            TranscriptionEngine(config).transcribe_audio(self._create_audio(60.0))
+            TranscriptionEngine(config).transcribe_audio(self._create_audio(90.0))
+            assert _InlineExecutor.created == created + 1
+        finally:
+            shutdown_chunk_pools()
+
+        TranscriptionEngine(config).transcribe_audio(self._create_audio(60.0))
+        shutdown_chunk_pools()
+        assert _InlineExecutor.created == created + 2
+
+    def test_overlap_must_be_shorter_than_chunk(self):
+        """Test configuration validation of chunk overlap."""
+        with pytest.raises(ValueError):
+            WhisperConfig(chunk_length_s=2.0, chunk_overlap_s=2.0)
+
+
+class TestWordStitcher:
+    """Test incremental stitching for streaming transcription."""
+
+    def test_incremental_matches_batch_stitching(self):
+        """Test words released chunk by chunk equal stitch_chunk_words output."""
+        chunks = [AudioChunk(0, 31 * SAMPLE_RATE, 0.0, 30.0),
+                  AudioChunk(29 * SAMPLE_RATE, 60 * SAMPLE_RATE, 30.0, 60.0)]
+        results = [
+            (chunks[0], [Word("uno", 1.0, 1.4, 0.9), Word("dos", 29.8, 30.2, 0.6)]),
+            (chunks[1], [Word("dos", 0.8, 1.2, 0.8), Word("tres", 5.0, 5.4, 0.9)]),
+        ]
+
+        from src.audio_to_json.chunking import WordStitcher
+        stitcher = WordStitcher(chunks, SAMPLE_RATE)
+        first = stitcher.add(*results[0])
+        second = stitcher.add(*results[1])
+        rest = stitcher.finish()
+
+        # "dos" reaches into the second chunk, so it waits for that chunk to settle it
+        assert [w.text for w in first] == ["uno"]
+        assert [(w.text, w.confidence) for w in second] == [("dos", 0.8)]
+        assert [w.text for w in rest] == ["tres"]
+        assert first + second + rest == stitch_chunk_words(results, SAMPLE_RATE)
@@ -61,6 +61,15 @@ class TestAudioConfig:
         # Invalid buffer
         with pytest.raises(ValueError):
             AudioConfig(buffer_seconds=-0.1)
+    
+    def test_resampler_validation(self):
+        """Test resampler backend validation."""
+        assert AudioConfig().resampler == "librosa"
+        for resampler in ["librosa", "soxr_hq", "soxr_qq", "scipy_poly"]:
+            AudioConfig(resampler=resampler)
+        
+        with pytest.raises(ValueError):
+            AudioConfig(resampler="kaiser_best")
 
 
 class TestWhisperConfig:
@@ -408,6 +408,30 @@ class TestDatabaseWriter:
             with pytest.raises(DatabaseError, match="validation failed"):
                 writer._validate_written_file(incomplete_path)
 
+    def test_validate_written_file_reports_entity_violations(self):
+        """Test invalid entities are reported per rule in one error."""
+        writer = DatabaseWriter(Config())
+        entity = Entity(
+            entity_id="word_001", entity_type="word", text="hola",
+            start_time=0.0, end_time=0.5, duration=0.5, confidence=0.9, probability=0.9,
+            speaker_id=0, recording_id="test", recording_path="test.wav",
+            created_at=datetime.now().isoformat()
+        ).model_dump()
+        data = create_default_database().model_dump()
+        data["entities"] = [entity, {**entity, "confidence": 1.5}, {**entity, "confidence": -1.0},
+                            {**entity, "end_time": 0.0, "duration": 0.0}]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "entities.json"
+            with open(path, 'w') as f:
+                json.dump(data, f)
+
+            with pytest.raises(DatabaseError, match="3 of 4 entities invalid") as exc_info:
+                writer._validate_written_file(path)
+
+        assert exc_info.value.context["violations"] == {"end_time": 1, "confidence": 2}
+        assert exc_info.value.context["examples"]["confidence"] == [1, 2]
+
 
 class TestWriteDatabaseFunction:
     """Test standalone write_database function."""
@@ -608,4 +632,77 @@ class TestDatabaseWriterEdgeCases:
             # Mock open to raise OSError (disk full)
             with patch('builtins.open', side_effect=OSError("No space left on device")):
                 with pytest.raises(DatabaseError):
-                    writer.write_database(database, output_path)
\ No newline at end of file
+                    writer.write_database(database, output_path)
+
+class TestDatabaseStream:
+    """Test streamed database writing."""
+
+    def _entity(self, index: int) -> Entity:
+        return Entity(
+            entity_id=f"word_{index:03d}", entity_type="word", text="González",
+            start_time=float(index), end_time=index + 0.5, duration=0.5,
+            confidence=0.9, probability=0.9, syllables=["gon", "zá", "lez"], syllable_count=3,
+            quality_score=0.8, speaker_id=0, recording_id="rec", recording_path="rec.wav",
+            created_at=datetime.now().isoformat()
+        )
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_stream_matches_write_database_content(self, pretty, temp_dir):
+        """Test a streamed file loads to the same database as write_database."""
+        config = Config()
+        config.output.pretty_print = pretty
+        writer = DatabaseWriter(config)
+        entities = [self._entity(i) for i in range(1, 6)]
+        database = create_default_database(entities=entities)
+
+        writer.write_database(database, temp_dir / "whole.json")
+        with writer.open_stream(temp_dir / "streamed.json") as stream:
+            stream.write_entities(entities[:2])
+            stream.write_entities([])
+            stream.write_entities(entities[2:])
+            stream.close(database.metadata, database.speaker_map)
+
+        with open(temp_dir / "whole.json", encoding='utf-8') as f:
+            whole = json.load(f)
+        with open(temp_dir / "streamed.json", encoding='utf-8') as f:
+            streamed = json.load(f)
+        assert streamed == whole
+        assert WordDatabase.model_validate(streamed).entities == entities
+
+    def test_empty_stream(self, temp_dir):
+        """Test a stream with no entities produces a valid database."""
+        writer = DatabaseWriter(Config())
+        database = create_default_database()
+
+        with writer.open_stream(temp_dir / "empty.json") as stream:
+            path = stream.close(database.metadata, database.speaker_map)
+
+        with open(path, encoding='utf-8') as f:
+            assert WordDatabase.model_validate(json.load(f)).entities == []
+
+    def test_failure_discards_partial_file_and_restores_backup(self, temp_dir):
+        """Test an exception mid-stream leaves the previous database in place."""
+        config = Config()
+        config.output.backup_on_update = True
+        writer = DatabaseWriter(config)
+        output = temp_dir / "db.json"
+        writer.write_database(create_default_database(), output)
+        original = output.read_text(encoding='utf-8')
+
+        with pytest.raises(RuntimeError):
+            with writer.open_stream(output) as stream:
+                stream.write_entities([self._entity(1)])
+                raise RuntimeError("transcription failed")
+
+        assert output.read_text(encoding='utf-8') == original
+        assert not (temp_dir / "db.json.tmp").exists()
+
+    def test_invalid_metadata_rejected(self, temp_dir):
+        """Test metadata is validated before the file is moved into place."""
+        writer = DatabaseWriter(Config())
+
+        with pytest.raises(DatabaseError):
+            with writer.open_stream(temp_dir / "bad.json") as stream:
+                stream.close({"version": "1.0"}, {0: SpeakerInfo(name="A", gender="Unknown")})
+
+        assert list(temp_dir.iterdir()) == []
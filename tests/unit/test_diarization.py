@@ -14,8 +14,11 @@ from src.audio_to_json.diarization import (
     DiarizationProcessor, 
     check_diarization_dependencies,
     process_diarization,
+    preload_diarization_pipeline,
+    release_diarization_pipeline,
     PYANNOTE_AVAILABLE
 )
+from src.audio_to_json.model_registry import get_model_registry
 from src.shared.config import DiarizationConfig
 from src.shared.models import DiarizationResult, SpeakerSegment
 from src.shared.exceptions import PipelineError
@@ -205,6 +208,35 @@ class TestDiarizationProcessor:
         finally:
             Path(tmp_path).unlink(missing_ok=True)
     
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    def test_process_audio_uses_decoded_buffer(self, mock_pipeline_class):
+        """Test decoded audio is passed as a zero-copy waveform tensor."""
+        torch = pytest.importorskip("torch")
+        import numpy as np
+        from src.audio_to_json.audio_processor import ProcessedAudio
+        from src.shared.models import AudioMetadata
+        
+        mock_pipeline = Mock()
+        mock_pipeline_class.from_pretrained.return_value = mock_pipeline
+        mock_segment = Mock(start=0.0, end=10.0)
+        mock_pipeline.return_value.itertracks.return_value = [(mock_segment, None, "SPEAKER_00")]
+        
+        data = np.zeros(160000, dtype=np.float32)
+        metadata = AudioMetadata(path="gone.wav", duration=10.0, sample_rate=16000,
+                                 channels=1, format="wav", size_bytes=1000)
+        audio = ProcessedAudio(data, 16000, 10.0, metadata)
+        
+        with patch('src.audio_to_json.diarization.torch', torch):
+            # The file need not exist when the buffer is supplied
+            result = DiarizationProcessor(DiarizationConfig()).process_audio("gone.wav", 10.0, audio=audio)
+        
+        pipeline_input = mock_pipeline.call_args[0][0]
+        assert pipeline_input["sample_rate"] == 16000
+        assert tuple(pipeline_input["waveform"].shape) == (1, 160000)
+        assert pipeline_input["waveform"].data_ptr() == data.ctypes.data  # Shares memory
+        assert result.speakers == [0]
+    
     def test_speaker_label_to_id(self):
         """Test speaker label to ID conversion."""
         config = DiarizationConfig()
@@ -373,7 +405,7 @@ class TestConvenienceFunction:
         
         # Verify processor was created with config
         mock_processor_class.assert_called_once_with(config)
-        mock_processor.process_audio.assert_called_once_with("test.wav", 10.0)
+        mock_processor.process_audio.assert_called_once_with("test.wav", 10.0, audio=None)
         assert result == mock_result
     
     @patch('src.audio_to_json.diarization.DiarizationProcessor')
@@ -398,6 +430,18 @@ class TestConvenienceFunction:
         assert result == mock_result
 
 
+    @patch('src.audio_to_json.diarization.DiarizationProcessor')
+    def test_process_diarization_forwards_decoded_audio(self, mock_processor_class):
+        """Test convenience function passes decoded audio through."""
+        audio = Mock()
+        
+        process_diarization("test.wav", 10.0, audio=audio)
+        
+        mock_processor_class.return_value.process_audio.assert_called_once_with(
+            "test.wav", 10.0, audio=audio
+        )
+
+
 class TestPipelineIntegration:
     """Test integration aspects of the diarization processor."""
     
@@ -461,4 +505,133 @@ class TestPipelineIntegration:
             processor._load_pipeline()
         
         assert "Failed to load diarization pipeline" in str(exc_info.value)
-        assert "Model not found" in str(exc_info.value)
\ No newline at end of file
+        assert "Model not found" in str(exc_info.value)
+
+class TestPipelineCache:
+    """Test PyAnnote pipelines are shared through the model registry."""
+    
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    def test_pipeline_loaded_once_across_processors(self, mock_pipeline_class):
+        """Test repeated processors reuse the cached pipeline."""
+        config = DiarizationConfig(model="test-model")
+        
+        first = DiarizationProcessor(config)
+        first._load_pipeline()
+        second = DiarizationProcessor(DiarizationConfig(model="test-model"))
+        second._load_pipeline()
+        
+        mock_pipeline_class.from_pretrained.assert_called_once()
+        assert first.pipeline is second.pipeline
+    
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    def test_thresholds_are_part_of_key(self, mock_pipeline_class):
+        """Test different thresholds load separately configured pipelines."""
+        DiarizationProcessor(DiarizationConfig(clustering_threshold=0.7))._load_pipeline()
+        DiarizationProcessor(DiarizationConfig(clustering_threshold=0.6))._load_pipeline()
+        
+        assert mock_pipeline_class.from_pretrained.call_count == 2
+    
+    def test_speaker_bounds_do_not_change_key(self):
+        """Test per-file speaker bounds share one cached pipeline."""
+        a = DiarizationProcessor(DiarizationConfig(min_speakers=1, max_speakers=2))
+        b = DiarizationProcessor(DiarizationConfig(min_speakers=2, max_speakers=6))
+        
+        assert a.model_key == b.model_key
+    
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    def test_preload_and_release(self, mock_pipeline_class):
+        """Test explicit warm-up and release of the cached pipeline."""
+        config = DiarizationConfig(model="test-model")
+        key = DiarizationProcessor(config).model_key
+        
+        preload_diarization_pipeline(config)
+        assert key in get_model_registry()
+        
+        assert release_diarization_pipeline(config) is True
+        assert key not in get_model_registry()
+        assert release_diarization_pipeline(config) is False
+    
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    def test_load_failure_is_not_cached(self, mock_pipeline_class):
+        """Test a failed load is retried on the next call."""
+        mock_pipeline_class.from_pretrained.side_effect = [Exception("offline"), Mock()]
+        config = DiarizationConfig()
+        
+        with pytest.raises(PipelineError):
+            DiarizationProcessor(config)._load_pipeline()
+        DiarizationProcessor(config)._load_pipeline()
+        
+        assert mock_pipeline_class.from_pretrained.call_count == 2
+    
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_pipeline_survives_cascade_models(self, mock_load_model, mock_pipeline_class):
+        """Test Whisper and cascade models never evict the cached pipeline between files."""
+        from src.audio_to_json.pipeline import AudioToJsonPipeline
+        from src.audio_to_json.transcription import preload_whisper_model
+        from src.shared.config import Config
+        
+        config = Config()
+        config.whisper.cascade_model = "small"
+        config.speakers.diarization = DiarizationConfig(model="test-model")
+        AudioToJsonPipeline(config)
+        
+        for _ in range(3):  # One iteration per file
+            preload_whisper_model(config.whisper)
+            DiarizationProcessor(config.speakers.diarization)._load_pipeline()
+        
+        mock_pipeline_class.from_pretrained.assert_called_once()
+        assert mock_load_model.call_count == 2
+        assert get_model_registry().evictions == 0
+    
+    @patch('src.audio_to_json.pipeline.preload_whisper_model')
+    @patch('src.audio_to_json.pipeline.check_diarization_dependencies', return_value=(True, None))
+    @patch('src.audio_to_json.pipeline.preload_diarization_pipeline')
+    def test_audio_pipeline_warms_diarization(self, mock_preload, mock_deps, mock_whisper):
+        """Test AudioToJsonPipeline.preload_models warms PyAnnote when diarization is on."""
+        from src.audio_to_json.pipeline import AudioToJsonPipeline
+        from src.shared.config import Config
+        
+        config = Config()
+        config.speakers.enable_diarization = True
+        config.speakers.diarization = DiarizationConfig(model="test-model")
+        
+        AudioToJsonPipeline(config).preload_models()
+        
+        mock_preload.assert_called_once_with(config.speakers.diarization)
+
+class TestSingleDecode:
+    """Test each file is decoded once per run."""
+    
+    @patch('src.audio_to_json.pipeline.check_diarization_dependencies', return_value=(True, None))
+    @patch('src.audio_to_json.pipeline.process_diarization')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_pipeline_diarization_reuses_decoded_audio(self, mock_process_audio,
+                                                       mock_diarize, mock_deps):
+        """Test diarization-only runs decode once and take duration from the buffer."""
+        from src.audio_to_json.pipeline import AudioToJsonPipeline
+        from src.shared.config import Config
+        
+        config = Config()
+        config.speakers.enable_diarization = True
+        processed_audio = Mock()
+        processed_audio.duration = 12.5
+        mock_process_audio.return_value = processed_audio
+        mock_diarize.return_value = DiarizationResult(
+            speakers=[0],
+            segments=[SpeakerSegment(speaker_id=0, start_time=0.0, end_time=12.5, confidence=0.9)],
+            audio_duration=12.5,
+            processing_time=0.1
+        )
+        
+        AudioToJsonPipeline(config).process_diarization("talk.wav")
+        
+        mock_process_audio.assert_called_once()
+        kwargs = mock_diarize.call_args.kwargs
+        assert kwargs["audio"] is processed_audio
+        assert kwargs["audio_duration"] == 12.5
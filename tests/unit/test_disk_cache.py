@@ -0,0 +1,83 @@
+"""
+Unit tests for disk_cache module.
+
+Tests entry lookup, atomic commit, size accounting and LRU eviction.
+"""
+import os
+import time
+
+from src.shared.disk_cache import DiskCache
+
+
+def _put(cache: DiskCache, key: str, size: int, mtime: float = None):
+    tmp = cache.temp_path(key, ".bin")
+    tmp.write_bytes(b"x" * size)
+    paths = cache.commit(key, {".bin": tmp})
+    if mtime is not None:
+        os.utime(paths[".bin"], (mtime, mtime))
+    return paths
+
+
+class TestDiskCache:
+    """Test DiskCache behaviour."""
+
+    def test_lookup_hit_and_miss(self, temp_dir):
+        """Test complete entries hit and incomplete ones miss."""
+        cache = DiskCache(str(temp_dir))
+        _put(cache, "abc", 10)
+
+        assert cache.lookup("abc", [".bin"]) == {".bin": temp_dir / "abc.bin"}
+        assert cache.lookup("abc", [".bin", ".json"]) is None
+        assert cache.lookup("missing", [".bin"]) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_staged_files_are_not_entries(self, temp_dir):
+        """Test temp files are ignored until committed."""
+        cache = DiskCache(str(temp_dir))
+        cache.temp_path("abc", ".bin").write_bytes(b"partial")
+
+        assert cache.size_bytes() == 0
+        assert cache.lookup("abc", [".bin"]) is None
+
+    def test_evicts_least_recently_used(self, temp_dir):
+        """Test oldest entries go first and the new entry is kept."""
+        cache = DiskCache(str(temp_dir), max_bytes=250)
+        now = time.time()
+        _put(cache, "old", 100, mtime=now - 300)
+        _put(cache, "used", 100, mtime=now - 200)
+        cache.lookup("used", [".bin"])  # Touch: now most recent
+
+        _put(cache, "new", 100)
+
+        assert not (temp_dir / "old.bin").exists()
+        assert (temp_dir / "used.bin").exists()
+        assert (temp_dir / "new.bin").exists()
+        assert cache.evictions == 1
+        assert cache.size_bytes() == 200
+
+    def test_oversized_entry_is_kept(self, temp_dir):
+        """Test an entry larger than the cap survives its own commit."""
+        cache = DiskCache(str(temp_dir), max_bytes=50)
+
+        _put(cache, "big", 100)
+
+        assert (temp_dir / "big.bin").exists()
+
+    def test_discard(self, temp_dir):
+        """Test discard removes all files of an entry."""
+        cache = DiskCache(str(temp_dir))
+        _put(cache, "abc", 10)
+        (temp_dir / "abc.json").write_text("{}")
+
+        cache.discard("abc")
+
+        assert list(temp_dir.iterdir()) == []
+
+    def test_clear(self, temp_dir):
+        """Test clear removes every entry and reports how many."""
+        cache = DiskCache(str(temp_dir))
+        _put(cache, "abc", 10)
+        _put(cache, "def", 10)
+
+        assert cache.clear() == 2
+        assert cache.size_bytes() == 0
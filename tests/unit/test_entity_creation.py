@@ -629,6 +629,22 @@ class TestEntityCreatorEdgeCases:
             mock_warning.assert_called()
             assert len(entities) == 0  # Entity creation should fail due to validation
     
+    def test_create_entities_invalid_words_reported_together(self):
+        """Test invalid words are skipped with one aggregate warning."""
+        creator = EntityCreator(QualityConfig())
+        words = [Word("hola", 0.0, 0.5, 0.9), Word("mal", 1.0, 0.8, 0.9),
+                 Word("alto", 1.0, 1.5, 1.5), Word("bajo", 2.0, 2.5, -0.5), Word("bien", 3.0, 3.5, 0.8)]
+
+        with patch.object(creator.logger, 'warning') as mock_warning:
+            entities = creator.create_entities(words, "test", "test.wav")
+
+        assert [e.entity_id for e in entities] == ["word_001", "word_005"]
+        mock_warning.assert_called_once()
+        details = mock_warning.call_args.kwargs
+        assert details["skipped"] == 3
+        assert details["violations"]["confidence"] == 2
+        assert details["word_indices"]["confidence"] == [2, 3]
+
     def test_quality_filters_all_filters_combined(self):
         """Test quality filters with multiple criteria."""
         config = QualityConfig()
@@ -663,4 +679,20 @@ class TestEntityCreatorEdgeCases:
         filtered = creator.apply_quality_filters(entities)
         
         assert len(filtered) == 1
-        assert filtered[0].entity_id == "good"
\ No newline at end of file
+        assert filtered[0].entity_id == "good"
+
+class TestIterEntities:
+    """Test batch-by-batch entity creation."""
+
+    def test_batches_match_single_call(self):
+        """Test concatenated batches equal create_entities on all words with continuous IDs."""
+        words = [Word("hola", 0.0, 0.5, 0.9), Word("mundo", 0.6, 1.0, 0.8),
+                 Word("buenos", 1.2, 1.6, 0.9), Word("días", 1.7, 2.1, 0.85)]
+        creator = EntityCreator(QualityConfig())
+
+        batches = list(creator.iter_entities(iter([words[:1], words[1:]]), "rec", "rec.wav"))
+        whole = creator.create_entities(words, "rec", "rec.wav")
+
+        assert [len(b) for b in batches] == [1, 3]
+        assert [e.entity_id for b in batches for e in b] == [e.entity_id for e in whole]
+        assert [e.text for b in batches for e in b] == [e.text for e in whole]
@@ -0,0 +1,136 @@
+"""
+Unit tests for entity_validation module.
+
+Tests batch checks of entity columns and serialized entity records, their
+per-rule aggregation, agreement with per-object Pydantic validation, and
+unvalidated entity construction.
+"""
+import pytest
+import numpy as np
+from datetime import datetime
+from pydantic import ValidationError
+
+from src.shared.entity_validation import check_entity_columns, check_entity_records, construct_entities
+from src.shared.models import Entity
+
+
+def _record(**overrides):
+    record = Entity(
+        entity_id="word_001", entity_type="word", text="hola",
+        start_time=1.0, end_time=1.5, duration=0.5,
+        confidence=0.9, probability=0.9, syllables=["ho", "la"], syllable_count=2,
+        quality_score=0.8, speaker_id=0, recording_id="rec", recording_path="rec.wav",
+        created_at=datetime.now().isoformat()
+    ).model_dump()
+    record.update(overrides)
+    return record
+
+
+class TestCheckEntityColumns:
+    """Test validation of columnar entity fields."""
+
+    def test_valid_batch(self):
+        """Test a clean batch has no violations."""
+        report = check_entity_columns({
+            "entity_type": ["word", "word"],
+            "start_time": np.array([0.0, 1.0]), "end_time": np.array([0.5, 1.4]),
+            "duration": np.array([0.5, 0.4]),
+            "confidence": np.array([0.9, 1.0]), "probability": np.array([0.9, 1.0]),
+            "quality_score": np.array([0.8, 0.7]),
+            "syllable_count": np.array([2, 1]), "syllable_lengths": np.array([2, 1]),
+            "speaker_id": np.array([0, 1]),
+        })
+
+        assert report.valid
+        assert report.violations == {}
+
+    def test_violations_aggregated_by_rule(self):
+        """Test each failing row is counted under its rule with example rows."""
+        report = check_entity_columns({
+            "entity_type": ["word", "word", "token", "word"],
+            "start_time": np.array([0.0, 1.0, 2.0, 3.0]), "end_time": np.array([0.5, 0.9, 2.5, 3.5]),
+            "duration": np.array([0.5, -0.1, 0.5, 0.5]),
+            "confidence": np.array([1.5, 0.9, 0.9, np.nan]), "probability": np.array([0.9, 0.9, 0.9, 0.9]),
+            "quality_score": np.array([0.8, 0.8, 0.8, 0.8]),
+            "syllable_count": np.array([2, 2, 2, 2]), "syllable_lengths": np.array([2, 2, 2, 2]),
+            "speaker_id": np.array([0, 0, 0, 0]),
+        })
+
+        assert report.invalid.tolist() == [True, True, True, True]
+        assert report.violations == {"entity_type": 1, "end_time": 1, "duration": 1, "confidence": 2}
+        assert report.examples["confidence"] == [0, 3]
+        assert "4 of 4 entities invalid" in report.summary()
+
+
+class TestCheckEntityRecords:
+    """Test validation of serialized entities."""
+
+    def test_structural_problems(self):
+        """Test non-dicts, missing fields and wrong types are reported without double counting."""
+        record = _record()
+        del record["text"]
+        records = [_record(), "word", record, _record(start_time="uno"), _record(speaker_id=1.5)]
+
+        report = check_entity_records(records)
+
+        assert report.invalid.tolist() == [False, True, True, True, True]
+        assert report.violations == {"not_a_dict": 1, "missing_field": 1, "type": 2}
+
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"end_time": 1.0},
+        {"end_time": 0.5, "duration": -0.5},
+        {"duration": 0.6},
+        {"duration": 0.5005},
+        {"confidence": -0.1},
+        {"probability": 1.01},
+        {"quality_score": 2.0},
+        {"syllable_count": 3},
+        {"syllables": ["hola"], "syllable_count": 1},
+        {"speaker_id": -1},
+        {"entity_type": "sentence"},
+        {"entity_type": "letter"},
+        {"start_time": -0.5, "duration": 2.0},
+        {"text": 5},
+        {"syllables": "ho-la"},
+        {"phonetic": "ˈo.la"},
+        {"clip_path": 3},
+    ])
+    def test_agrees_with_pydantic(self, overrides):
+        """Test a record is rejected exactly when Entity.model_validate rejects it."""
+        record = _record(**overrides)
+        try:
+            Entity.model_validate(record)
+            pydantic_valid = True
+        except ValidationError:
+            pydantic_valid = False
+
+        assert check_entity_records([record]).valid == pydantic_valid
+
+
+class TestConstructEntities:
+    """Test construction of trusted entities."""
+
+    def test_matches_validated_entity(self):
+        """Test constructed entities equal validated ones and behave like them."""
+        record = _record()
+
+        entity = construct_entities([dict(record)])[0]
+
+        assert entity == Entity.model_validate(record)
+        assert entity.model_dump() == record
+        entity.processed = True
+        assert entity.model_dump()["processed"] is True
+
+    def test_matches_model_construct_state(self):
+        """Test partial records get model_construct's defaults and fields set."""
+        record = _record()
+        for name in ("syllables", "syllable_count", "phonetic", "quality_score"):
+            del record[name]
+
+        entity = construct_entities([dict(record)])[0]
+        expected = Entity.model_construct(**record)
+
+        assert entity == expected
+        assert entity.model_fields_set == expected.model_fields_set
+        assert entity.model_dump() == expected.model_dump()
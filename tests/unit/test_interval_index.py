@@ -0,0 +1,129 @@
+"""
+Unit tests for interval_index module.
+
+Tests containing/nearest lookups against a linear-scan reference, including
+touching boundaries, overlapping and unsorted intervals, and the vectorized
+speaker assignment used by entity creation.
+"""
+import random
+
+import numpy as np
+import pytest
+
+from src.audio_to_json.interval_index import IntervalIndex, assign_speakers
+from src.audio_to_json.entity_creation import EntityCreator
+from src.audio_to_json.transcription import Word
+from src.shared.config import QualityConfig
+from src.shared.models import SpeakerSegment, DiarizationResult
+
+
+def _reference_lookup(intervals, point):
+    """Linear scan: first containing interval, else closest (ties to earliest)."""
+    for i, (start, end) in enumerate(intervals):
+        if start <= point <= end:
+            return i
+    best, best_distance = -1, float('inf')
+    for i, (start, end) in enumerate(intervals):
+        distance = start - point if point < start else point - end
+        if distance < best_distance:
+            best, best_distance = i, distance
+    return best
+
+
+def _index(intervals):
+    return IntervalIndex([s for s, _ in intervals], [e for _, e in intervals])
+
+
+class TestIntervalIndex:
+    """Test IntervalIndex lookups."""
+
+    def test_containing_and_gaps(self):
+        """Test points inside, between and outside intervals."""
+        index = _index([(0.0, 2.0), (3.0, 5.0)])
+
+        assert index.containing([1.0, 2.5, 4.0, 6.0, -1.0]).tolist() == [0, -1, 1, -1, -1]
+
+    def test_touching_boundary_prefers_earlier_listed(self):
+        """Test a shared boundary resolves to the first listed interval."""
+        assert _index([(0.0, 2.0), (2.0, 4.0)]).containing(2.0).tolist() == [0]
+        assert _index([(2.0, 4.0), (0.0, 2.0)]).containing(2.0).tolist() == [0]
+
+    def test_nearest_tie_prefers_earlier_listed(self):
+        """Test equidistant neighbours resolve to the first listed interval."""
+        assert _index([(0.0, 1.0), (3.0, 4.0)]).nearest(2.0).tolist() == [0]
+        assert _index([(3.0, 4.0), (0.0, 1.0)]).nearest(2.0).tolist() == [0]
+
+    def test_lookup_falls_back_to_nearest(self):
+        """Test lookup returns the closest interval for uncovered points."""
+        index = _index([(0.0, 1.0), (5.0, 6.0)])
+
+        assert index.lookup([0.5, 1.5, 4.0, 10.0]).tolist() == [0, 0, 1, 1]
+
+    def test_empty_index(self):
+        """Test empty indexes return -1."""
+        index = _index([])
+
+        assert index.lookup([1.0, 2.0]).tolist() == [-1, -1]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_linear_scan(self, seed):
+        """Test random overlapping, unsorted intervals match the linear scan."""
+        rng = random.Random(seed)
+        intervals = []
+        for _ in range(60):
+            start = round(rng.uniform(0, 100), 1)
+            intervals.append((start, round(start + rng.uniform(0.1, 8), 1)))
+        points = [round(rng.uniform(-5, 110), 1) for _ in range(500)]
+        points += [s for s, _ in intervals] + [e for _, e in intervals]
+
+        result = _index(intervals).lookup(points).tolist()
+
+        assert result == [_reference_lookup(intervals, p) for p in points]
+
+
+    def test_nested_and_open_ended_intervals(self):
+        """Test nested intervals and infinite ends match the linear scan."""
+        intervals = [(5.0, 6.0), (0.0, float('inf')), (2.0, 9.0), (3.0, 4.0), (10.0, float('inf'))]
+        points = [-1.0, 0.0, 2.5, 3.5, 5.0, 5.5, 9.5, 10.0, 1e9]
+
+        result = _index(intervals).lookup(points).tolist()
+
+        assert result == [_reference_lookup(intervals, p) for p in points]
+
+class TestSpeakerAssignment:
+    """Test vectorized speaker assignment."""
+
+    def _segments(self):
+        return [
+            SpeakerSegment(speaker_id=0, start_time=0.0, end_time=2.0, confidence=0.9),
+            SpeakerSegment(speaker_id=1, start_time=2.0, end_time=4.0, confidence=0.9),
+            SpeakerSegment(speaker_id=2, start_time=6.0, end_time=8.0, confidence=0.9),
+        ]
+
+    def test_assign_speakers(self):
+        """Test centres map to containing or nearest segment speakers."""
+        centres = np.array([1.0, 2.0, 3.0, 4.5, 5.5, 9.0])
+
+        assert assign_speakers(self._segments(), centres).tolist() == [0, 0, 1, 1, 2, 2]
+
+    def test_assign_speakers_without_segments(self):
+        """Test missing segments default to speaker 0."""
+        assert assign_speakers([], [1.0, 2.0]).tolist() == [0, 0]
+
+    def test_create_entities_matches_linear_scan(self):
+        """Test bulk assignment in create_entities agrees with a linear scan."""
+        creator = EntityCreator(QualityConfig())
+        diarization = DiarizationResult(
+            speakers=[0, 1, 2], segments=self._segments(),
+            audio_duration=8.0, processing_time=0.1
+        )
+        words = [Word(f"palabra{i}", t, t + 0.4, 0.9) for i, t in enumerate(np.arange(0.0, 9.0, 0.35))]
+
+        entities = creator.create_entities(words, "rec", "rec.wav", diarization_result=diarization)
+
+        intervals = [(seg.start_time, seg.end_time) for seg in self._segments()]
+        expected = [
+            self._segments()[_reference_lookup(intervals, (w.start_time + w.end_time) / 2)].speaker_id
+            for w in words
+        ]
+        assert [e.speaker_id for e in entities] == expected
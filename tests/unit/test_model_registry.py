@@ -0,0 +1,251 @@
+"""
+Unit tests for model registry module.
+
+Tests process-wide model caching, LRU and memory-budget eviction,
+thread-safe loading, and sharing of Whisper models between engines.
+"""
+import threading
+import time
+import pytest
+import numpy as np
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.model_registry import ModelRegistry, get_model_registry, estimate_model_bytes
+from src.audio_to_json.transcription import TranscriptionEngine, transcribe_audio
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.shared.config import WhisperConfig
+from src.shared.models import AudioMetadata
+
+
+class _SizedModel:
+    """Fake model reporting a fixed parameter size."""
+
+    def __init__(self, size_bytes: int):
+        self._param = MagicMock()
+        self._param.numel.return_value = size_bytes
+        self._param.element_size.return_value = 1
+
+    def parameters(self):
+        return [self._param]
+
+
+class TestModelRegistry:
+    """Test ModelRegistry class."""
+
+    def test_get_or_load_caches_model(self):
+        """Test that a model is loaded once and then served from cache."""
+        registry = ModelRegistry()
+        loader = MagicMock(return_value="model")
+
+        assert registry.get_or_load(("whisper", "base"), loader) == "model"
+        assert registry.get_or_load(("whisper", "base"), loader) == "model"
+
+        loader.assert_called_once()
+        assert registry.hits == 1
+        assert registry.misses == 1
+        assert ("whisper", "base") in registry
+
+    def test_lru_eviction_by_model_count(self):
+        """Test least recently used model is evicted when over capacity."""
+        registry = ModelRegistry(max_models=2)
+        registry.get_or_load("a", lambda: "A")
+        registry.get_or_load("b", lambda: "B")
+        registry.get_or_load("a", lambda: "A")  # Touch "a" so "b" is LRU
+        registry.get_or_load("c", lambda: "C")
+
+        assert registry.keys() == ["a", "c"]
+        assert registry.evictions == 1
+
+    def test_eviction_by_memory_budget(self):
+        """Test models are evicted to stay within the memory budget."""
+        registry = ModelRegistry(max_models=10, memory_budget_bytes=150)
+        registry.get_or_load("small", lambda: _SizedModel(100))
+        registry.get_or_load("large", lambda: _SizedModel(100))
+
+        assert registry.keys() == ["large"]
+        assert registry.total_bytes == 100
+
+    def test_model_over_budget_is_kept(self):
+        """Test a single model larger than the budget is still served."""
+        registry = ModelRegistry(memory_budget_bytes=10)
+        model = registry.get_or_load("huge", lambda: _SizedModel(100))
+
+        assert isinstance(model, _SizedModel)
+        assert len(registry) == 1
+
+    def test_configure_shrinks_registry(self):
+        """Test lowering capacity evicts immediately."""
+        registry = ModelRegistry(max_models=3)
+        for key in ["a", "b", "c"]:
+            registry.get_or_load(key, lambda: key)
+
+        registry.configure(max_models=1)
+
+        assert registry.keys() == ["c"]
+
+    def test_families_capped_separately(self):
+        """Test models of one family never evict another family's models."""
+        registry = ModelRegistry(max_models=1, family_limits={"whisper": 2})
+        registry.get_or_load(("whisper", "base"), lambda: "base")
+        registry.get_or_load(("whisper", "small"), lambda: "small")
+        registry.get_or_load(("pyannote", "3.1"), lambda: "pyannote")
+        registry.get_or_load(("silero_vad",), lambda: "silero")
+
+        assert len(registry) == 4
+        assert registry.evictions == 0
+
+        registry.get_or_load(("whisper", "tiny"), lambda: "tiny")
+
+        assert registry.keys() == [("whisper", "small"), ("pyannote", "3.1"),
+                                   ("silero_vad",), ("whisper", "tiny")]
+
+    def test_configure_can_remove_memory_budget(self):
+        """Test passing None clears the budget while omitting it keeps it."""
+        registry = ModelRegistry(memory_budget_bytes=100)
+
+        registry.configure(max_models=3)
+        assert registry.memory_budget_bytes == 100
+
+        registry.configure(memory_budget_bytes=None)
+        assert registry.memory_budget_bytes is None
+
+    def test_pipeline_keeps_cascade_models_resident(self):
+        """Test the Whisper cap fits the model and cascade model."""
+        from src.audio_to_json.pipeline import AudioToJsonPipeline
+        from src.shared.config import Config
+
+        config = Config()
+        config.whisper.max_loaded_models = 1
+        config.whisper.cascade_model = "small"
+        AudioToJsonPipeline(config)
+
+        assert get_model_registry().family_limit("whisper") == 2
+
+    def test_release_and_clear(self):
+        """Test explicit release of models."""
+        registry = ModelRegistry()
+        registry.get_or_load("a", lambda: "A")
+
+        assert registry.release("a") is True
+        assert registry.release("a") is False
+
+        registry.get_or_load("b", lambda: "B")
+        registry.clear()
+        assert len(registry) == 0
+
+    def test_concurrent_requests_share_single_load(self):
+        """Test threads requesting the same key trigger one load."""
+        registry = ModelRegistry()
+        load_count = []
+
+        def slow_loader():
+            load_count.append(1)
+            time.sleep(0.05)
+            return "model"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get_or_load("k", slow_loader)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(load_count) == 1
+        assert results == ["model"] * 8
+
+    def test_failed_load_releases_load_lock(self):
+        """Test a loader error leaves no per-key lock and the next call retries."""
+        registry = ModelRegistry()
+
+        with pytest.raises(RuntimeError):
+            registry.get_or_load("k", MagicMock(side_effect=RuntimeError("download failed")))
+
+        assert registry._load_locks == {}
+        assert registry.get_or_load("k", lambda: "model") == "model"
+
+    def test_estimate_model_bytes_unknown_object(self):
+        """Test size estimation falls back to zero."""
+        assert estimate_model_bytes("not a model") == 0
+        assert estimate_model_bytes(_SizedModel(42)) == 42
+
+    def test_estimate_model_bytes_nested_modules(self):
+        """Test modules held in attributes (e.g. a PyAnnote pipeline) are counted once."""
+        class _Inference:
+            def __init__(self, model):
+                self.model = model
+
+        class _Pipeline:
+            def __init__(self):
+                segmentation = _SizedModel(30)
+                self._segmentation = _Inference(segmentation)
+                self._embedding = _Inference(_SizedModel(12))
+                self.segmentation_model = segmentation
+
+        assert estimate_model_bytes(_Pipeline()) == 42
+
+    def test_get_model_registry_is_singleton(self):
+        """Test the process-wide registry is shared."""
+        assert get_model_registry() is get_model_registry()
+
+
+class TestWhisperModelSharing:
+    """Test TranscriptionEngine integration with the registry."""
+
+    def _create_audio(self):
+        metadata = AudioMetadata(
+            path="test.wav", duration=1.0, sample_rate=16000,
+            channels=1, format="wav", size_bytes=1000
+        )
+        return ProcessedAudio(np.zeros(16000, dtype=np.float32), 16000, 1.0, metadata)
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_engines_share_loaded_model(self, mock_load_model):
+        """Test two engines with the same config load the model once."""
+        mock_load_model.return_value = MagicMock()
+        config = WhisperConfig(model="base")
+
+        first = TranscriptionEngine(config).model
+        second = TranscriptionEngine(config).model
+
+        assert first is second
+        mock_load_model.assert_called_once_with("base")
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_different_keys_load_separately(self, mock_load_model):
+        """Test model name and precision are part of the registry key."""
+        mock_load_model.side_effect = lambda *args, **kwargs: MagicMock()
+
+        TranscriptionEngine(WhisperConfig(model="base")).model
+        TranscriptionEngine(WhisperConfig(model="base", precision="fp16")).model
+        TranscriptionEngine(WhisperConfig(model="tiny")).model
+
+        assert mock_load_model.call_count == 3
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_convenience_function_reuses_model(self, mock_load_model):
+        """Test repeated transcribe_audio calls do not reload the model."""
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {
+            "segments": [{"words": [{"word": " hola", "start": 0.0, "end": 0.5, "probability": 0.9}]}]
+        }
+        mock_load_model.return_value = mock_model
+        config = WhisperConfig()
+        audio = self._create_audio()
+
+        for _ in range(3):
+            transcribe_audio(audio, config)
+
+        mock_load_model.assert_called_once()
+        assert mock_model.transcribe.call_count == 3
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_explicit_device_passed_to_loader(self, mock_load_model):
+        """Test configured device is forwarded to whisper.load_model."""
+        mock_load_model.return_value = MagicMock()
+
+        TranscriptionEngine(WhisperConfig(model="base", device="cpu")).model
+
+        mock_load_model.assert_called_once_with("base", device="cpu")
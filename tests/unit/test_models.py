@@ -404,6 +404,122 @@ class TestWordDatabase:
         assert len(all_entities) == 2
 
 
+
+def _indexed_entity(i: int, start: float, end: float, confidence: float, speaker_id: int,
+                    entity_type: str = "word") -> Entity:
+    return Entity(
+        entity_id=f"word_{i:03d}", entity_type=entity_type, text=f"palabra{i}",
+        start_time=start, end_time=end, duration=end - start,
+        confidence=confidence, probability=confidence, speaker_id=speaker_id,
+        recording_id="test", recording_path="test.wav", created_at="2025-01-01T00:00:00Z"
+    )
+
+
+class TestWordDatabaseIndexes:
+    """Test indexed WordDatabase queries and their invalidation."""
+    
+    def _database(self) -> WordDatabase:
+        return WordDatabase(
+            metadata={"version": "1.0", "created_at": "2025-01-01T00:00:00Z"},
+            speaker_map={},
+            entities=[
+                _indexed_entity(1, 0.0, 0.5, 0.9, 0),
+                _indexed_entity(2, 0.6, 1.0, 0.4, 1),
+                _indexed_entity(3, 0.2, 3.0, 0.7, 0, "phrase"),
+                _indexed_entity(4, 1.5, 2.0, 0.7, 1),
+                _indexed_entity(5, 4.0, 4.5, 0.95, 2),
+            ]
+        )
+    
+    @staticmethod
+    def _ids(entities):
+        return [e.entity_id for e in entities]
+    
+    def test_queries_match_linear_scan(self):
+        """Test every query returns the scan result in list order."""
+        db = self._database()
+        
+        assert self._ids(db.get_entities_by_type("word")) == ["word_001", "word_002", "word_004", "word_005"]
+        assert self._ids(db.get_entities_by_speaker(1)) == ["word_002", "word_004"]
+        assert self._ids(db.get_entities_by_speaker(7)) == []
+        assert self._ids(db.get_entities_by_confidence(0.7)) == ["word_001", "word_003", "word_004", "word_005"]
+        assert self._ids(db.get_entities_by_confidence(0.99)) == []
+    
+    def test_time_range_queries(self):
+        """Test overlap queries, including a long entity starting early."""
+        db = self._database()
+        
+        assert self._ids(db.get_entities_in_range(1.2, 1.4)) == ["word_003"]
+        assert self._ids(db.get_entities_in_range(0.5, 0.6)) == ["word_001", "word_002", "word_003"]
+        assert self._ids(db.get_entities_in_range(3.5, 3.9)) == []
+        assert self._ids(db.get_entities_in_range(4.5, 10.0)) == ["word_005"]
+    
+    def test_index_reused_between_queries(self):
+        """Test the index is built once while nothing changes."""
+        db = self._database()
+        
+        db.get_entities_by_speaker(0)
+        index = db.entities.index
+        db.get_entities_by_confidence(0.5)
+        
+        assert index is not None
+        assert db.entities.index is index
+    
+    def test_list_mutation_invalidates(self):
+        """Test appending, removing and replacing entities is reflected."""
+        db = self._database()
+        assert len(db.get_entities_by_speaker(2)) == 1
+        
+        db.entities.append(_indexed_entity(6, 5.0, 5.5, 0.8, 2))
+        assert self._ids(db.get_entities_by_speaker(2)) == ["word_005", "word_006"]
+        
+        del db.entities[4]
+        assert self._ids(db.get_entities_by_speaker(2)) == ["word_006"]
+        
+        db.entities = [_indexed_entity(7, 0.0, 0.3, 0.5, 3)]
+        assert self._ids(db.get_entities_by_speaker(3)) == ["word_007"]
+        assert db.get_entities_by_speaker(2) == []
+    
+    def test_entity_mutation_after_invalidate(self):
+        """Test in-place entity edits are reflected once the indexes are dropped."""
+        db = self._database()
+        assert len(db.get_entities_by_confidence(0.8)) == 2
+        
+        db.entities[1].confidence = 0.85
+        db.entities[1].speaker_id = 2
+        db.invalidate_indexes()
+        
+        assert db.entities.index is None
+        assert self._ids(db.get_entities_by_confidence(0.8)) == ["word_001", "word_002", "word_005"]
+        assert self._ids(db.get_entities_by_speaker(2)) == ["word_002", "word_005"]
+    
+    def test_confidence_query_thresholds(self):
+        """Test thresholds at, between and around the stored confidences."""
+        db = self._database()
+        
+        assert self._ids(db.get_entities_by_confidence(0.0)) == self._ids(db.entities)
+        assert self._ids(db.get_entities_by_confidence(0.4)) == self._ids(db.entities)
+        assert self._ids(db.get_entities_by_confidence(0.71)) == ["word_001", "word_005"]
+        assert self._ids(db.get_entities_by_confidence(0.95)) == ["word_005"]
+    
+    def test_results_are_copies(self):
+        """Test changing a returned list does not affect the index."""
+        db = self._database()
+        
+        db.get_entities_by_speaker(0).clear()
+        
+        assert len(db.get_entities_by_speaker(0)) == 2
+    
+    def test_index_not_serialized_or_compared(self):
+        """Test the index is invisible to dumps and equality."""
+        db = self._database()
+        other = self._database()
+        db.get_entities_by_type("word")
+        
+        assert db == other
+        assert db.model_dump() == other.model_dump()
+
+
 class TestSpeakerSegment:
     """Test SpeakerSegment model validation."""
     
@@ -78,7 +78,7 @@ class TestAudioToJsonPipeline:
         result = pipeline.process_audio_to_json("test.wav", "output.json")
         
         # Verify all stages were called
-        mock_process_audio.assert_called_once_with("test.wav", config)
+        mock_process_audio.assert_called_once_with("test.wav", config, None)
         mock_transcribe.assert_called_once_with(mock_processed_audio, config.whisper)
         mock_create_entities.assert_called_once()
         mock_apply_filters.assert_called_once()
@@ -148,14 +148,22 @@ class TestAudioToJsonPipeline:
         with pytest.raises(PipelineError, match="Pipeline failed"):
             pipeline.process_audio_to_json("test.wav")
     
-    def test_process_audio_to_json_resume_not_implemented(self):
-        """Test that resume functionality raises NotImplementedError."""
+    def test_process_audio_to_json_resume_missing_file(self):
+        """Test that resuming for a missing audio file raises PipelineError."""
         config = Config()
         pipeline = AudioToJsonPipeline(config)
         
-        with pytest.raises(NotImplementedError):
+        with pytest.raises(PipelineError):
             pipeline.process_audio_to_json("test.wav", resume_from_stage="transcription")
     
+    def test_process_audio_to_json_invalid_resume_stage(self):
+        """Test that unknown resume stages are rejected."""
+        config = Config()
+        pipeline = AudioToJsonPipeline(config)
+        
+        with pytest.raises(PipelineError, match="Unknown resume stage"):
+            pipeline.process_audio_to_json("test.wav", resume_from_stage="clips")
+    
     @patch('src.audio_to_json.pipeline.apply_quality_filters')
     @patch('src.audio_to_json.pipeline.create_entities')
     @patch('src.audio_to_json.pipeline.transcribe_audio')
@@ -568,4 +576,180 @@ class TestPipelineEdgeCases:
             path="test.wav", duration=1.0, sample_rate=16000,
             channels=1, format="wav", size_bytes=1000
         )
-        return ProcessedAudio(audio_data, 16000, 1.0, metadata)
\ No newline at end of file
+        return ProcessedAudio(audio_data, 16000, 1.0, metadata)
+
+class TestConcurrentStages:
+    """Test concurrent transcription and diarization."""
+    
+    def _config(self, concurrent: bool) -> Config:
+        config = Config()
+        config.speakers.enable_diarization = True
+        config.processing.concurrent_diarization = concurrent
+        config.processing.concurrent_threads = 2
+        return config
+    
+    def _processed_audio(self) -> ProcessedAudio:
+        metadata = AudioMetadata(
+            path="test.wav", duration=1.0, sample_rate=16000,
+            channels=1, format="wav", size_bytes=1000
+        )
+        return ProcessedAudio(np.zeros(16000, dtype=np.float32), 16000, 1.0, metadata)
+    
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_stages_overlap_when_concurrent(self, mock_process_audio, mock_transcribe):
+        """Test transcription and diarization run at the same time."""
+        import threading
+        import torch
+        pipeline = AudioToJsonPipeline(self._config(concurrent=True))
+        processed_audio = self._processed_audio()
+        mock_process_audio.return_value = processed_audio
+        diarization_started = threading.Event()
+        threads_seen = []
+        threads_before = torch.get_num_threads()
+        
+        def transcribe(*args):
+            # Only returns promptly if diarization is running alongside
+            assert diarization_started.wait(timeout=5)
+            threads_seen.append(torch.get_num_threads())
+            return [Word("hola", 0.0, 0.5, 0.9)]
+        
+        def diarize(*args):
+            threads_seen.append(torch.get_num_threads())
+            diarization_started.set()
+            return None
+        
+        mock_transcribe.side_effect = transcribe
+        with patch.object(pipeline, '_process_diarization', side_effect=diarize) as mock_diarize:
+            result = pipeline.process_audio_to_json("test.wav")
+        
+        mock_diarize.assert_called_once_with("test.wav", processed_audio)
+        assert [e.text for e in result.entities] == ["hola"]
+        # One process-wide setting for both stages, restored afterwards
+        assert threads_seen == [2, 2]
+        assert torch.get_num_threads() == threads_before
+    
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_unset_threads_keep_current_budget(self, mock_process_audio, mock_transcribe):
+        """Test stages keep the caller's torch threads (e.g. a batch worker's cap) by default."""
+        import torch
+        config = self._config(concurrent=True)
+        config.processing.concurrent_threads = None
+        pipeline = AudioToJsonPipeline(config)
+        mock_process_audio.return_value = self._processed_audio()
+        threads_seen = []
+        
+        def transcribe(*args):
+            threads_seen.append(torch.get_num_threads())
+            return [Word("hola", 0.0, 0.5, 0.9)]
+        
+        mock_transcribe.side_effect = transcribe
+        threads_before = torch.get_num_threads()
+        torch.set_num_threads(1)
+        try:
+            with patch.object(pipeline, '_process_diarization', return_value=None):
+                pipeline.process_audio_to_json("test.wav")
+        finally:
+            torch.set_num_threads(threads_before)
+        
+        assert threads_seen == [1]
+    
+    @patch('src.audio_to_json.pipeline.ThreadPoolExecutor')
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_sequential_when_disabled(self, mock_process_audio, mock_transcribe, mock_executor):
+        """Test the concurrent path is skipped when turned off."""
+        pipeline = AudioToJsonPipeline(self._config(concurrent=False))
+        mock_process_audio.return_value = self._processed_audio()
+        mock_transcribe.return_value = [Word("hola", 0.0, 0.5, 0.9)]
+        
+        with patch.object(pipeline, '_process_diarization', return_value=None) as mock_diarize:
+            pipeline.process_audio_to_json("test.wav")
+        
+        mock_executor.assert_not_called()
+        mock_diarize.assert_called_once()
+    
+    @patch('src.audio_to_json.pipeline.ThreadPoolExecutor')
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_no_threads_without_diarization(self, mock_process_audio, mock_transcribe, mock_executor):
+        """Test diarization-disabled runs stay on the calling thread."""
+        config = self._config(concurrent=True)
+        config.speakers.enable_diarization = False
+        pipeline = AudioToJsonPipeline(config)
+        mock_process_audio.return_value = self._processed_audio()
+        mock_transcribe.return_value = [Word("hola", 0.0, 0.5, 0.9)]
+        
+        pipeline.process_audio_to_json("test.wav")
+        
+        mock_executor.assert_not_called()
+    
+    @patch('src.audio_to_json.pipeline._set_torch_threads')
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_transcription_error_propagates(self, mock_process_audio, mock_transcribe, mock_threads):
+        """Test a failing transcription thread fails the pipeline."""
+        pipeline = AudioToJsonPipeline(self._config(concurrent=True))
+        mock_process_audio.return_value = self._processed_audio()
+        mock_transcribe.side_effect = RuntimeError("whisper crashed")
+        
+        with patch.object(pipeline, '_process_diarization', return_value=None):
+            with pytest.raises(PipelineError, match="whisper crashed"):
+                pipeline.process_audio_to_json("test.wav")
+
+
+class TestStreamingPipeline:
+    """Test stream_audio_to_json."""
+
+    def _processed_audio(self) -> ProcessedAudio:
+        metadata = AudioMetadata(
+            path="class.wav", duration=60.0, sample_rate=16000,
+            channels=1, format="wav", size_bytes=1000
+        )
+        return ProcessedAudio(np.zeros(60 * 16000, dtype=np.float32), 16000, 60.0, metadata)
+
+    @patch('src.audio_to_json.pipeline.transcribe_stream')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_entities_written_as_batches_arrive(self, mock_process_audio, mock_stream, temp_dir):
+        """Test each word batch reaches the file before the next is transcribed."""
+        import json
+        config = Config()
+        config.quality.min_confidence = 0.0
+        output = temp_dir / "class.json"
+        mock_process_audio.return_value = self._processed_audio()
+        written_before_second_batch = []
+
+        def batches(*args):
+            yield [Word("estudiamos", 1.0, 1.6, 0.9)]
+            written_before_second_batch.append(output.with_suffix(".json.tmp").read_text(encoding='utf-8'))
+            yield [Word("historia", 31.0, 31.6, 0.9)]
+
+        mock_stream.side_effect = batches
+
+        path = AudioToJsonPipeline(config).stream_audio_to_json("class.wav", str(output))
+
+        assert "estudiamos" in written_before_second_batch[0]
+        with open(path, encoding='utf-8') as f:
+            database = WordDatabase.model_validate(json.load(f))
+        assert [e.text for e in database.entities] == ["estudiamos", "historia"]
+        assert [e.entity_id for e in database.entities] == ["word_001", "word_002"]
+        assert database.metadata["entity_count"] == 2
+        assert list(database.speaker_map) == [0]
+
+    @patch('src.audio_to_json.pipeline.transcribe_stream')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_transcription_failure_leaves_no_file(self, mock_process_audio, mock_stream, temp_dir):
+        """Test a failure mid-stream raises PipelineError and discards the partial file."""
+        mock_process_audio.return_value = self._processed_audio()
+
+        def batches(*args):
+            yield [Word("estudiamos", 1.0, 1.6, 0.9)]
+            raise RuntimeError("decoder crashed")
+
+        mock_stream.side_effect = batches
+
+        with pytest.raises(PipelineError):
+            AudioToJsonPipeline(Config()).stream_audio_to_json("class.wav", str(temp_dir / "class.json"))
+
+        assert list(temp_dir.iterdir()) == []
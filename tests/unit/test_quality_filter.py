@@ -0,0 +1,98 @@
+"""
+Unit tests for quality_filter module.
+
+Tests rule masks over entity columns, the per-rule rejection counts, parity
+with EntityCreator.apply_quality_filters, and threshold sweeps.
+"""
+import pytest
+import numpy as np
+from datetime import datetime
+from unittest.mock import patch
+
+from src.audio_to_json.entity_creation import EntityCreator
+from src.audio_to_json.quality_filter import (
+    EntityColumns, QUALITY_RULES, evaluate_quality_filters, rule_masks, sweep_quality_filters
+)
+from src.shared.config import QualityConfig
+from src.shared.models import Entity
+
+
+def _entity(text: str, confidence: float, duration: float, syllable_count: int) -> Entity:
+    return Entity(
+        entity_id="test_001", entity_type="word", text=text,
+        start_time=0.0, end_time=duration, duration=duration,
+        confidence=confidence, probability=confidence,
+        syllables=["x"] * syllable_count, syllable_count=syllable_count,
+        quality_score=0.8, speaker_id=0, recording_id="test", recording_path="test.wav",
+        processed=False, created_at=datetime.now().isoformat()
+    )
+
+
+def _entities():
+    return [
+        _entity("historia", 0.9, 0.6, 3),     # passes
+        _entity("colombia", 0.5, 0.6, 3),     # low confidence
+        _entity("casa", 0.9, 0.1, 2),         # too short
+        _entity("larguísima", 0.6, 4.0, 4),   # low confidence and too long
+        _entity("sol", 0.9, 0.5, 1),          # too few syllables
+        _entity("Con", 0.9, 0.5, 1),          # whitelisted short word
+        _entity("  ", 0.9, 0.5, 2),           # empty text
+    ]
+
+
+class TestRuleMasks:
+    """Test individual rule masks."""
+
+    def test_each_rule_flags_its_entities(self):
+        """Test every mask marks exactly the entities its rule rejects."""
+        masks = rule_masks(EntityColumns.from_entities(_entities()), QualityConfig())
+
+        assert list(masks) == list(QUALITY_RULES)
+        assert np.flatnonzero(masks["confidence"]).tolist() == [1, 3]
+        assert np.flatnonzero(masks["min_duration"]).tolist() == [2]
+        assert np.flatnonzero(masks["max_duration"]).tolist() == [3]
+        assert np.flatnonzero(masks["syllable_range"]).tolist() == [4]
+        assert np.flatnonzero(masks["empty_text"]).tolist() == [6]
+
+
+class TestEvaluateQualityFilters:
+    """Test combined filtering and rejection counts."""
+
+    def test_survivors_and_histogram(self):
+        """Test surviving indices and a count per rule."""
+        result = evaluate_quality_filters(EntityColumns.from_entities(_entities()), QualityConfig())
+
+        assert result.indices.tolist() == [0, 5]
+        assert result.rejections == {"confidence": 2, "min_duration": 1, "max_duration": 1,
+                                     "syllable_range": 1, "empty_text": 1}
+        assert result.passed == 2
+        assert result.pass_rate == pytest.approx(2 / 7)
+        assert [e.text for e in result.select(_entities())] == ["historia", "Con"]
+
+    def test_empty_input(self):
+        """Test no entities gives no survivors and zero counts."""
+        result = evaluate_quality_filters(EntityColumns.from_entities([]), QualityConfig())
+
+        assert result.passed == 0
+        assert result.pass_rate == 0.0
+        assert set(result.rejections.values()) == {0}
+
+    def test_matches_entity_creator(self):
+        """Test EntityCreator.apply_quality_filters keeps the same entities and logs the counts."""
+        entities = _entities()
+        creator = EntityCreator(QualityConfig())
+
+        with patch.object(creator, 'log_stage_complete') as mock_complete:
+            filtered = creator.apply_quality_filters(entities)
+
+        assert filtered == [entities[0], entities[5]]
+        assert mock_complete.call_args.kwargs["rejections"]["confidence"] == 2
+
+    def test_sweep_over_thresholds(self):
+        """Test several configs are evaluated against one set of columns."""
+        configs = [QualityConfig(min_confidence=c) for c in (0.4, 0.8, 0.95)]
+
+        results = sweep_quality_filters(_entities(), configs)
+
+        assert [r.rejections["confidence"] for r in results] == [0, 2, 7]
+        assert [r.passed for r in results] == [3, 2, 0]
@@ -0,0 +1,159 @@
+"""
+Unit tests for speaker_identification module.
+
+Tests compiled speaker mappings (list and dict forms), first-match priority
+for overlapping ranges, copy-on-write entity updates, and legacy mapping
+support in entity creation.
+"""
+import pytest
+
+from src.audio_to_json.speaker_identification import (
+    CompiledSpeakerMapping,
+    SpeakerMapper,
+    apply_speaker_mapping,
+    parse_time_range,
+)
+from src.audio_to_json.entity_creation import EntityCreator
+from src.audio_to_json.transcription import Word
+from src.shared.config import QualityConfig
+from src.shared.models import Entity
+from src.shared.exceptions import SpeakerError
+
+
+def _entity(index: int, start: float, end: float, speaker_id: int = 0) -> Entity:
+    return Entity(
+        entity_id=f"word_{index:03d}", entity_type="word", text=f"palabra{index}",
+        start_time=start, end_time=end, duration=end - start, confidence=0.9,
+        probability=0.9, syllables=["pa", "la", "bra"], syllable_count=3,
+        quality_score=0.8, speaker_id=speaker_id, recording_id="rec",
+        recording_path="rec.wav", created_at="2025-01-01T00:00:00"
+    )
+
+
+class TestCompiledSpeakerMapping:
+    """Test mapping compilation."""
+
+    def test_parse_time_range(self):
+        """Test "start-end" keys parse to floats."""
+        assert parse_time_range("1.5-3") == (1.5, 3.0)
+        with pytest.raises(ValueError):
+            parse_time_range("1-2-3")
+
+    def test_dict_mapping_skips_invalid_ranges(self):
+        """Test malformed keys are recorded and excluded."""
+        compiled = CompiledSpeakerMapping.from_mapping({"0-5": "speaker_1", "bad": "speaker_2"})
+
+        assert len(compiled) == 1
+        assert compiled.invalid_ranges == ["bad"]
+
+    def test_integer_ids_skip_unconvertible_values(self):
+        """Test legacy integer conversion drops ranges with non-numeric IDs."""
+        compiled = CompiledSpeakerMapping.from_mapping(
+            {"0-5": "speaker_a", "0-6": "speaker_3"}, integer_ids=True
+        )
+
+        assert compiled.speaker_ids == [3]
+        assert compiled.lookup(2.0).tolist() == [0]
+
+    def test_earliest_listed_range_wins(self):
+        """Test overlapping ranges resolve in listed order."""
+        compiled = CompiledSpeakerMapping.from_mapping([
+            {"start": 0.0, "end": 10.0, "speaker_id": 1},
+            {"start": 2.0, "end": 4.0, "speaker_id": 2},
+        ])
+
+        assert compiled.lookup([3.0, 11.0]).tolist() == [0, -1]
+
+    def test_invalid_list_bounds_raise(self):
+        """Test non-numeric list bounds raise SpeakerError."""
+        with pytest.raises(SpeakerError):
+            CompiledSpeakerMapping.from_mapping([{"start": "soon", "end": 2.0}])
+
+
+class TestSpeakerMapper:
+    """Test SpeakerMapper.apply_speaker_mapping."""
+
+    def test_list_mapping(self):
+        """Test list mappings assign speakers and build the speaker map."""
+        entities = [_entity(1, 1.0, 1.5), _entity(2, 10.0, 10.8), _entity(3, 20.0, 20.5)]
+        mapping = [
+            {"start": 0.0, "end": 5.0, "speaker": "María", "speaker_id": 1, "region": "Bogotá"},
+            {"start": 5.0, "end": 15.0, "speaker": "Carlos", "speaker_id": 2},
+        ]
+
+        updated, speaker_map = apply_speaker_mapping(entities, mapping)
+
+        assert [e.speaker_id for e in updated] == [1, 2, 0]
+        assert list(speaker_map) == [1, 2, 0]
+        assert speaker_map[1] == {"name": "María", "gender": "Unknown", "region": "Bogotá"}
+        assert speaker_map[0]["name"] == "Default Speaker"
+
+    def test_dict_mapping_keeps_string_ids(self):
+        """Test dict mappings keep speaker IDs exactly as given."""
+        entities = [_entity(1, 0.5, 1.0), _entity(2, 2.5, 3.0)]
+
+        updated, speaker_map = apply_speaker_mapping(
+            entities, {"0.0-2.0": "speaker_0", "2.0-4.0": "speaker_1"}
+        )
+
+        assert [e.speaker_id for e in updated] == ["speaker_0", "speaker_1"]
+        assert speaker_map["speaker_1"]["name"] == "Speaker 1"
+
+    def test_inputs_are_not_modified(self):
+        """Test copy-on-write leaves the input entities untouched."""
+        entities = [_entity(1, 1.0, 1.5), _entity(2, 10.0, 10.5, speaker_id=4)]
+
+        updated, _ = apply_speaker_mapping(entities, [{"start": 0.0, "end": 5.0, "speaker_id": 3}])
+
+        assert entities[0].speaker_id == 0
+        assert updated[0].speaker_id == 3
+        assert updated[0] is not entities[0]
+        assert updated[1] is entities[1]  # Unchanged entities are shared
+
+    def test_default_speaker(self):
+        """Test None mapping assigns the default speaker."""
+        updated, speaker_map = SpeakerMapper().apply_speaker_mapping([_entity(1, 1.0, 1.5)], None)
+
+        assert updated[0].speaker_id == 0
+        assert list(speaker_map) == [0]
+
+    def test_unsupported_format(self):
+        """Test unsupported mapping types raise SpeakerError."""
+        with pytest.raises(SpeakerError):
+            apply_speaker_mapping([_entity(1, 1.0, 1.5)], "0-5:speaker_1")
+
+    def test_large_mapping(self):
+        """Test thousands of ranges apply with correct assignment."""
+        mapping = {f"{i}-{i + 1}": f"speaker_{i % 7}" for i in range(5000)}
+        entities = [_entity(i, i + 0.2, i + 0.6) for i in range(5000)]
+
+        updated, speaker_map = apply_speaker_mapping(entities, mapping)
+
+        assert [e.speaker_id for e in updated[:8]] == [f"speaker_{i % 7}" for i in range(8)]
+        assert len(speaker_map) == 7
+
+
+class TestEntityCreatorMapping:
+    """Test legacy speaker mappings in entity creation."""
+
+    def test_dict_mapping_bulk_matches_per_word(self):
+        """Test bulk assignment agrees with the per-word method."""
+        creator = EntityCreator(QualityConfig())
+        mapping = {"0.0-2.0": "speaker_1", "2.0-4.0": "2", "x-y": "3"}
+        words = [Word(f"palabra{i}", t, t + 0.5, 0.9) for i, t in enumerate([0.2, 1.6, 2.4, 5.0])]
+
+        entities = creator.create_entities(words, "rec", "rec.wav", mapping)
+
+        expected = [creator._assign_speaker_id(w.start_time, w.end_time, None, mapping) for w in words]
+        assert [e.speaker_id for e in entities] == expected == [1, 1, 2, 0]
+
+    def test_list_mapping(self):
+        """Test list-form mappings are accepted by entity creation."""
+        creator = EntityCreator(QualityConfig())
+        words = [Word("hola", 0.5, 1.0, 0.9), Word("mundo", 6.0, 6.5, 0.9)]
+
+        entities = creator.create_entities(
+            words, "rec", "rec.wav", [{"start": 0.0, "end": 5.0, "speaker_id": 2}]
+        )
+
+        assert [e.speaker_id for e in entities] == [2, 0]
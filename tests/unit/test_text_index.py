@@ -0,0 +1,233 @@
+"""
+Unit tests for text_index module.
+
+Tests text normalisation, exact/prefix/syllable lookups, incremental
+updates and their rejection when entities were rewritten, the saved index
+file, and WordDatabase.find_entities staying correct as entities change.
+"""
+import json
+
+import pytest
+
+from src.audio_to_json.database_writer import DatabaseWriter, create_default_database
+from src.shared.config import Config
+from src.shared.models import Entity, WordDatabase
+from src.shared.text_index import TextIndex, normalize_text, text_index_path, update_text_index
+
+
+def _entity(i: int, text: str, syllables=("pa", "la")) -> Entity:
+    return Entity(
+        entity_id=f"word_{i:03d}", entity_type="word", text=text,
+        start_time=float(i), end_time=i + 0.5, duration=0.5,
+        confidence=0.9, probability=0.9, syllables=list(syllables), syllable_count=len(syllables),
+        speaker_id=0, recording_id="rec", recording_path="rec.wav", created_at="2025-01-01T00:00:00Z"
+    )
+
+
+def _entities():
+    return [
+        _entity(1, "está", ["es", "tá"]),
+        _entity(2, "año", ["a", "ño"]),
+        _entity(3, "ESTÁ,", ["es", "tá"]),
+        _entity(4, "estación", ["es", "ta", "ción"]),
+        _entity(5, "ano", ["a", "no"]),
+        _entity(6, "pingüino", ["pin", "güi", "no"]),
+        _entity(7, "¿esta?", ["es", "ta"]),
+    ]
+
+
+class TestNormalizeText:
+    """Test lookup keys."""
+
+    @pytest.mark.parametrize("text,key", [
+        ("está", "esta"),
+        ("ESTÁ,", "esta"),
+        ("¿Esta?", "esta"),
+        ("pingüino", "pinguino"),
+        ("año", "año"),
+        ("AÑO", "año"),
+        ("ano", "ano"),
+        ("...", ""),
+    ])
+    def test_keys(self, text, key):
+        """Test case, accents and punctuation are dropped but ñ is kept."""
+        assert normalize_text(text) == key
+
+
+class TestTextIndex:
+    """Test index lookups and incremental updates."""
+
+    def test_exact_lookup(self):
+        """Test accent-insensitive exact matches keep ñ distinct."""
+        index = TextIndex.from_entities(_entities())
+
+        assert index.lookup("esta") == [0, 2, 6]
+        assert index.lookup("Está") == [0, 2, 6]
+        assert index.lookup("año") == [1]
+        assert index.lookup("ano") == [4]
+        assert index.lookup("pinguino") == [5]
+        assert index.lookup("nada") == []
+        assert index.lookup("?") == []
+
+    def test_prefix_and_syllable_lookup(self):
+        """Test prefix matches across keys and syllable range filtering."""
+        index = TextIndex.from_entities(_entities())
+
+        assert index.lookup("est", prefix=True) == [0, 2, 3, 6]
+        assert index.lookup("est", prefix=True, syllable_range=(3, 4)) == [3]
+        assert index.lookup("an", prefix=True) == [4]
+        assert index.lookup("a", prefix=True, syllable_range=(2, 2)) == [1, 4]
+
+    def test_update_indexes_appended_entities(self):
+        """Test an update after appends matches an index built from scratch."""
+        entities = _entities()
+        index = TextIndex.from_entities(entities[:4])
+        index.lookup("e", prefix=True)
+
+        assert index.update(entities)
+        assert len(index) == len(entities)
+        assert index.to_dict() == TextIndex.from_entities(entities).to_dict()
+        assert index.lookup("e", prefix=True) == [0, 2, 3, 6]
+
+    def test_update_rejects_rewritten_entities(self):
+        """Test an index is not extended over entities that changed or were removed."""
+        entities = _entities()
+        index = TextIndex.from_entities(entities)
+        rewritten = _entities()
+        rewritten[1] = _entity(2, "otro")
+
+        assert not index.update(rewritten)
+        assert not index.update(entities[:3])
+        assert index.lookup("año") == [1]
+
+    def test_save_and_load(self, temp_dir):
+        """Test a saved index loads equal and can be extended after matching."""
+        entities = _entities()
+        path = TextIndex.from_entities(entities[:5]).save(temp_dir / "db.text_index.json")
+
+        loaded = TextIndex.load(path)
+
+        assert loaded.lookup("esta") == [0, 2]
+        with pytest.raises(ValueError):
+            loaded.add_entities(entities[5:])
+        assert loaded.update(entities)
+        assert loaded.to_dict() == TextIndex.from_entities(entities).to_dict()
+
+    def test_load_rejects_missing_or_outdated_files(self, temp_dir):
+        """Test unusable files load as None."""
+        path = temp_dir / "db.text_index.json"
+        assert TextIndex.load(path) is None
+
+        path.write_text("{not json", encoding='utf-8')
+        assert TextIndex.load(path) is None
+
+        data = TextIndex.from_entities(_entities()).to_dict()
+        data["format_version"] = TextIndex.FORMAT_VERSION + 1
+        path.write_text(json.dumps(data), encoding='utf-8')
+        assert TextIndex.load(path) is None
+
+
+class TestUpdateTextIndex:
+    """Test the saved index next to a database."""
+
+    def test_path_next_to_database(self, temp_dir):
+        """Test the index file name is derived from the database name."""
+        assert text_index_path(temp_dir / "words.json") == temp_dir / "words.text_index.json"
+
+    def test_appends_and_rebuilds(self, temp_dir):
+        """Test appended entities extend the saved index and rewrites rebuild it."""
+        database_path = temp_dir / "words.json"
+        entities = _entities()
+        update_text_index(database_path, entities[:3])
+
+        index = update_text_index(database_path, entities)
+        assert index.lookup("esta") == [0, 2, 6]
+
+        rewritten = [_entity(1, "otra"), _entity(2, "cosa")]
+        index = update_text_index(database_path, rewritten)
+        assert index.lookup("esta") == []
+        assert TextIndex.load(text_index_path(database_path)).lookup("cosa") == [1]
+
+    def test_writers_save_index(self, temp_dir):
+        """Test write_database and streamed writes save a matching index."""
+        writer = DatabaseWriter(Config())
+        database = create_default_database(entities=_entities())
+
+        writer.write_database(database, temp_dir / "whole.json")
+        with writer.open_stream(temp_dir / "streamed.json") as stream:
+            stream.write_entities(database.entities[:2])
+            stream.write_entities(database.entities[2:])
+            stream.close(database.metadata, database.speaker_map)
+
+        expected = TextIndex.from_entities(database.entities).to_dict()
+        assert TextIndex.load(temp_dir / "whole.text_index.json").to_dict() == expected
+        assert TextIndex.load(temp_dir / "streamed.text_index.json").to_dict() == expected
+
+    def test_index_disabled(self, temp_dir):
+        """Test no index file is written when disabled."""
+        config = Config()
+        config.output.text_index = False
+
+        DatabaseWriter(config).write_database(create_default_database(entities=_entities()),
+                                              temp_dir / "words.json")
+
+        assert not text_index_path(temp_dir / "words.json").exists()
+
+
+class TestFindEntities:
+    """Test WordDatabase.find_entities as entities change."""
+
+    def _database(self) -> WordDatabase:
+        return create_default_database(entities=_entities())
+
+    @staticmethod
+    def _ids(entities):
+        return [e.entity_id for e in entities]
+
+    def test_find(self):
+        """Test exact, prefix and syllable-filtered searches."""
+        db = self._database()
+
+        assert self._ids(db.find_entities("ESTA")) == ["word_001", "word_003", "word_007"]
+        assert self._ids(db.find_entities("est", prefix=True, syllable_range=(3, 3))) == ["word_004"]
+
+    def test_append_extends_index(self):
+        """Test appended entities are found without rebuilding the index."""
+        db = self._database()
+        db.find_entities("esta")
+        index = db.entities.text_index
+
+        db.entities.append(_entity(8, "Está"))
+
+        assert self._ids(db.find_entities("esta")) == ["word_001", "word_003", "word_007", "word_008"]
+        assert db.entities.text_index is index
+
+    def test_changes_rebuild_index(self):
+        """Test edited, removed and reassigned entities are reflected."""
+        db = self._database()
+        db.find_entities("esta")
+
+        db.entities[0].text = "otra"
+        db.invalidate_indexes()
+        assert self._ids(db.find_entities("esta")) == ["word_003", "word_007"]
+
+        del db.entities[1]
+        assert self._ids(db.find_entities("esta")) == ["word_003", "word_007"]
+        assert self._ids(db.find_entities("año")) == []
+
+        db.entities = [_entity(9, "está")]
+        assert self._ids(db.find_entities("esta")) == ["word_009"]
+
+    def test_use_saved_index(self, temp_dir):
+        """Test a loaded index is used only if it matches the entities."""
+        db = self._database()
+        saved = TextIndex.load(TextIndex.from_entities(db.entities[:5]).save(temp_dir / "i.json"))
+
+        db.use_text_index(saved)
+        assert db.entities.text_index is saved
+        assert self._ids(db.find_entities("esta")) == ["word_001", "word_003", "word_007"]
+
+        other = create_default_database(entities=[_entity(1, "otra")])
+        other.use_text_index(TextIndex.load(temp_dir / "i.json"))
+        assert other.entities.text_index is None
+        assert self._ids(other.find_entities("otra")) == ["word_001"]
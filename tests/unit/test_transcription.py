@@ -563,4 +563,76 @@ class TestTranscriptionEngineEdgeCases:
             engine = TranscriptionEngine(config)
             assert engine.config.model == config_data["model"]
             assert engine.config.language == config_data["language"]
-            assert engine.config.temperature == config_data["temperature"]
\ No newline at end of file
+            assert engine.config.temperature == config_data["temperature"]
+
+class TestStreamingTranscription:
+    """Test TranscriptionEngine.iter_transcription and its async form."""
+
+    def _audio(self, seconds: float) -> ProcessedAudio:
+        rng = np.random.default_rng(0)
+        data = rng.uniform(-0.5, 0.5, int(seconds * 16000)).astype(np.float32)
+        metadata = AudioMetadata(
+            path="long.wav", duration=seconds, sample_rate=16000,
+            channels=1, format="wav", size_bytes=1000
+        )
+        return ProcessedAudio(data, 16000, seconds, metadata)
+
+    def _model(self):
+        """Model that reports one word 1s into every window it sees."""
+        model = MagicMock()
+        model.transcribe.side_effect = lambda data, **options: {
+            "segments": [{"words": [{"word": " hola", "start": 1.0, "end": 1.4, "probability": 0.9}]}]
+        }
+        return model
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_yields_one_batch_per_window(self, mock_load_model):
+        """Test words are yielded before later windows are decoded."""
+        model = self._model()
+        mock_load_model.return_value = model
+        engine = TranscriptionEngine(WhisperConfig())
+
+        batches = engine.iter_transcription(self._audio(90.0))
+        first = next(batches)
+
+        assert model.transcribe.call_count == 1
+        assert [w.start_time for w in first] == [pytest.approx(1.0)]
+        rest = list(batches)
+        assert model.transcribe.call_count == 3
+        assert len(rest) == 2
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_matches_chunked_transcription(self, mock_load_model):
+        """Test concatenated batches equal transcribe_audio with the same windows."""
+        mock_load_model.return_value = self._model()
+        config = WhisperConfig(chunk_length_s=30.0)
+        audio = self._audio(90.0)
+
+        streamed = [w for batch in TranscriptionEngine(config).iter_transcription(audio) for w in batch]
+        whole = TranscriptionEngine(config).transcribe_audio(audio)
+
+        assert streamed == whole
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_async_iteration(self, mock_load_model):
+        """Test the async iterator yields the same batches."""
+        import asyncio
+        mock_load_model.return_value = self._model()
+        engine = TranscriptionEngine(WhisperConfig())
+
+        async def collect():
+            return [batch async for batch in engine.aiter_transcription(self._audio(60.0))]
+
+        batches = asyncio.run(collect())
+
+        assert len(batches) == 2
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_no_words_raises(self, mock_load_model):
+        """Test a silent stream raises once every window is done."""
+        model = MagicMock()
+        model.transcribe.return_value = {"segments": []}
+        mock_load_model.return_value = model
+
+        with pytest.raises(TranscriptionError, match="No words"):
+            list(TranscriptionEngine(WhisperConfig()).iter_transcription(self._audio(10.0)))
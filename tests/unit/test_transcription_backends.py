@@ -0,0 +1,252 @@
+"""
+Unit tests for transcription_backends module.
+
+Tests backend selection, the faster-whisper result conversion, int8 dynamic
+quantization of the PyTorch model, and (when
+faster-whisper and model weights are available) parity of the CTranslate2
+backend against the openai-whisper reference on a fixture recording.
+"""
+import re
+import pytest
+import numpy as np
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.transcription import TranscriptionEngine
+from src.audio_to_json.transcription_backends import (
+    create_backend, quantize_whisper_int8, TranscriptionBackend,
+    OpenAIWhisperBackend, FasterWhisperBackend, FASTER_WHISPER_AVAILABLE
+)
+from src.audio_to_json.model_registry import get_model_registry, estimate_model_bytes
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.shared.config import WhisperConfig
+from src.shared.exceptions import TranscriptionError
+from src.shared.models import AudioMetadata
+
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "spanish_30sec_16khz.wav"
+
+
+def _audio(data: np.ndarray) -> ProcessedAudio:
+    metadata = AudioMetadata(
+        path="test.wav", duration=len(data) / 16000, sample_rate=16000,
+        channels=1, format="wav", size_bytes=1000
+    )
+    return ProcessedAudio(data, 16000, len(data) / 16000, metadata)
+
+
+def _fw_segment(start, end, text, words):
+    return SimpleNamespace(
+        start=start, end=end, text=text, avg_logprob=-0.2,
+        words=[SimpleNamespace(word=w, start=s, end=e, probability=p) for w, s, e, p in words]
+    )
+
+
+class TestBackendSelection:
+    """Test WhisperConfig.backend selection."""
+
+    def test_default_is_openai(self):
+        """Test the reference backend is used unless configured otherwise."""
+        engine = TranscriptionEngine(WhisperConfig())
+
+        assert isinstance(engine.backend, OpenAIWhisperBackend)
+        assert engine.model_key == ("whisper", "base", "auto", "fp32")
+
+    def test_faster_whisper_selected(self):
+        """Test the CTranslate2 backend and its registry key."""
+        engine = TranscriptionEngine(WhisperConfig(backend="faster-whisper"))
+
+        assert isinstance(engine.backend, FasterWhisperBackend)
+        assert engine.model_key == ("faster-whisper", "base", "cpu", "int8")
+
+    def test_unknown_backend_rejected(self):
+        """Test config validation rejects unknown backends."""
+        with pytest.raises(ValueError):
+            WhisperConfig(backend="whisper.cpp")
+
+        config = WhisperConfig()
+        config.backend = "whisper.cpp"  # Bypasses validation
+        with pytest.raises(TranscriptionError, match="Unknown transcription backend"):
+            create_backend(config)
+
+    def test_backends_must_implement_interface(self):
+        """Test the base class and incomplete backends cannot be instantiated."""
+        class NoTranscribe(TranscriptionBackend):
+            model_key = ("none",)
+
+            def load_model(self):
+                return None
+
+        with pytest.raises(TypeError):
+            TranscriptionBackend(WhisperConfig())
+        with pytest.raises(TypeError, match="transcribe"):
+            NoTranscribe(WhisperConfig())
+
+    @patch('src.audio_to_json.transcription_backends.FASTER_WHISPER_AVAILABLE', False)
+    def test_missing_faster_whisper_raises(self):
+        """Test a clear error when faster-whisper is not installed."""
+        backend = create_backend(WhisperConfig(backend="faster-whisper"))
+
+        with pytest.raises(TranscriptionError, match="faster-whisper is not installed"):
+            backend.load_model()
+
+
+class TestFasterWhisperBackend:
+    """Test faster-whisper result conversion."""
+
+    @patch('src.audio_to_json.transcription_backends.FASTER_WHISPER_AVAILABLE', True)
+    @patch('src.audio_to_json.transcription_backends.WhisperModel')
+    def test_loads_int8_cpu_model(self, mock_model_class):
+        """Test the model is built with the configured compute type."""
+        create_backend(WhisperConfig(backend="faster-whisper", model="small")).load_model()
+
+        mock_model_class.assert_called_once_with("small", device="cpu", compute_type="int8")
+
+    @patch('src.audio_to_json.transcription_backends.FASTER_WHISPER_AVAILABLE', True)
+    @patch('src.audio_to_json.transcription_backends.WhisperModel')
+    def test_engine_returns_same_word_shape(self, mock_model_class):
+        """Test segments and words map onto the engine's Word objects."""
+        model = MagicMock()
+        model.transcribe.return_value = (iter([
+            _fw_segment(0.0, 1.2, " hola mundo", [(" hola", 0.0, 0.5, 0.9), (" mundo", 0.6, 1.2, 0.8)]),
+            _fw_segment(1.5, 2.0, " adiós", [(" adiós", 1.5, 2.0, 0.95)]),
+        ]), SimpleNamespace(language="es"))
+        mock_model_class.return_value = model
+
+        engine = TranscriptionEngine(WhisperConfig(backend="faster-whisper"))
+        words = engine.transcribe_audio(_audio(np.zeros(32000, dtype=np.float32)))
+
+        assert [(w.text, w.start_time, w.end_time, w.confidence) for w in words] == [
+            ("hola", 0.0, 0.5, 0.9), ("mundo", 0.6, 1.2, 0.8), ("adiós", 1.5, 2.0, 0.95)
+        ]
+        options = model.transcribe.call_args.kwargs
+        assert options["language"] == "es"
+        assert options["word_timestamps"] is True
+        assert options["beam_size"] == 1
+
+    def test_segments_without_words_use_segment_timing(self):
+        """Test the engine's segment-level fallback still applies."""
+        model = MagicMock()
+        model.transcribe.return_value = (iter([_fw_segment(0.0, 1.0, " uno dos", [])]), None)
+        engine = TranscriptionEngine(WhisperConfig(backend="faster-whisper"))
+        engine._model = model
+
+        words = engine.transcribe_audio(_audio(np.zeros(16000, dtype=np.float32)))
+
+        assert [(w.text, w.start_time, w.end_time) for w in words] == [("uno", 0.0, 0.5), ("dos", 0.5, 1.0)]
+
+
+def _tiny_random_whisper():
+    """Small randomly initialised Whisper model (no weights download)."""
+    from whisper.model import Whisper, ModelDimensions
+    torch = pytest.importorskip("torch")
+    torch.manual_seed(0)
+    dims = ModelDimensions(n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=4,
+                           n_audio_layer=2, n_vocab=51865, n_text_ctx=448, n_text_state=64,
+                           n_text_head=4, n_text_layer=2)
+    return Whisper(dims).eval()
+
+
+class TestInt8Quantization:
+    """Test dynamic int8 quantization of the PyTorch Whisper model."""
+
+    def test_linear_layers_are_quantized(self):
+        """Test every projection becomes a dynamic int8 Linear."""
+        import torch
+        from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+        model = _tiny_random_whisper()
+        linear_count = sum(isinstance(m, torch.nn.Linear) for m in model.modules())
+
+        quantized = quantize_whisper_int8(model)
+
+        assert quantized is model
+        assert sum(isinstance(m, DynamicLinear) for m in quantized.modules()) == linear_count
+
+    def test_quantized_encoder_tracks_fp32(self):
+        """Test quantized activations stay close to the fp32 model."""
+        import copy
+        import torch
+        reference = _tiny_random_whisper()
+        quantized = quantize_whisper_int8(copy.deepcopy(reference))
+        mel = torch.randn(1, 80, 3000)
+
+        with torch.no_grad():
+            expected = reference.encoder(mel).flatten()
+            actual = quantized.encoder(mel).flatten()
+
+        assert torch.nn.functional.cosine_similarity(expected, actual, dim=0) > 0.99
+
+    def test_quantized_model_is_smaller_in_registry(self):
+        """Test size estimation counts the packed int8 weights."""
+        import copy
+        reference = _tiny_random_whisper()
+        fp32_bytes = estimate_model_bytes(reference)
+
+        int8_bytes = estimate_model_bytes(quantize_whisper_int8(copy.deepcopy(reference)))
+
+        assert 0 < int8_bytes < fp32_bytes
+
+    @patch('src.audio_to_json.transcription_backends.whisper.load_model')
+    def test_int8_model_loaded_on_cpu_and_cached(self, mock_load_model):
+        """Test int8 loads on CPU, quantizes once and is served from the registry."""
+        from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+        mock_load_model.return_value = _tiny_random_whisper()
+        config = WhisperConfig(model="small", precision="int8")
+
+        first = TranscriptionEngine(config).model
+        second = TranscriptionEngine(config).model
+
+        mock_load_model.assert_called_once_with("small", device="cpu")
+        assert first is second
+        assert any(isinstance(m, DynamicLinear) for m in first.modules())
+        assert ("whisper", "small", "auto", "int8") in get_model_registry()
+
+    def test_int8_requires_cpu(self):
+        """Test int8 on a GPU device is rejected."""
+        backend = create_backend(WhisperConfig(precision="int8", device="cuda"))
+
+        with pytest.raises(TranscriptionError, match="only supported on CPU"):
+            backend.load_model()
+
+    def test_int8_decodes_in_fp32(self):
+        """Test Whisper is not asked to run fp16 on the quantized model."""
+        engine = TranscriptionEngine(WhisperConfig(precision="int8"))
+
+        assert engine._transcription_options()["fp16"] is False
+
+
+def _normalise(text: str) -> str:
+    return re.sub(r"[^\w]", "", text.lower())
+
+
+@pytest.mark.skipif(not FASTER_WHISPER_AVAILABLE, reason="faster-whisper not installed")
+class TestBackendParity:
+    """Compare faster-whisper against the openai-whisper reference on a fixture."""
+
+    def _transcribe(self, backend: str):
+        import soundfile as sf
+        data, sample_rate = sf.read(str(FIXTURE), dtype='float32')
+        assert sample_rate == 16000
+        config = WhisperConfig(model="tiny", backend=backend)
+        try:
+            return TranscriptionEngine(config).transcribe_audio(_audio(data))
+        except TranscriptionError as e:
+            pytest.skip(f"{backend} model unavailable: {e}")
+
+    def test_words_and_timestamps_match_reference(self):
+        """Test most words agree and matched timestamps stay close."""
+        from difflib import SequenceMatcher
+        reference = self._transcribe("openai")
+        candidate = self._transcribe("faster-whisper")
+
+        ref_text = [_normalise(w.text) for w in reference]
+        cand_text = [_normalise(w.text) for w in candidate]
+        matcher = SequenceMatcher(a=ref_text, b=cand_text, autojunk=False)
+        assert matcher.ratio() >= 0.85
+
+        drift = [
+            abs(reference[block.a + k].start_time - candidate[block.b + k].start_time)
+            for block in matcher.get_matching_blocks() for k in range(block.size)
+        ]
+        assert np.median(drift) < 0.2
@@ -0,0 +1,170 @@
+"""
+Unit tests for the transcription result cache.
+
+Tests keying by audio content and output-relevant WhisperConfig fields,
+round-tripping of word lists, invalidation, size-bounded eviction, and
+hit/miss reporting from TranscriptionEngine.
+"""
+import numpy as np
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.transcription import (
+    TranscriptionCache, TranscriptionEngine, Word, clear_transcription_cache
+)
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.shared.config import WhisperConfig
+from src.shared.models import AudioMetadata
+
+
+def _audio(seed: int = 0, seconds: float = 1.0) -> ProcessedAudio:
+    data = np.random.default_rng(seed).uniform(-0.5, 0.5, int(seconds * 16000)).astype(np.float32)
+    metadata = AudioMetadata(
+        path="class.wav", duration=seconds, sample_rate=16000,
+        channels=1, format="wav", size_bytes=1000
+    )
+    return ProcessedAudio(data, 16000, seconds, metadata)
+
+
+def _mock_model():
+    model = MagicMock()
+    model.transcribe.return_value = {"segments": [{"words": [
+        {"word": " señora", "start": 0.1, "end": 0.5, "probability": 0.91},
+        {"word": " González", "start": 0.6, "end": 0.95, "probability": 0.72},
+    ]}]}
+    return model
+
+
+class TestTranscriptionCacheKeys:
+    """Test what the cache key depends on."""
+
+    def test_same_samples_same_key(self):
+        """Test the key follows sample content, not object identity or path."""
+        config = WhisperConfig()
+        copy = _audio(0)
+        copy.metadata = copy.metadata.model_copy(update={"path": "renamed.wav"})
+
+        assert TranscriptionCache.key_for(_audio(0), config) == TranscriptionCache.key_for(copy, config)
+        assert TranscriptionCache.key_for(_audio(0), config) != TranscriptionCache.key_for(_audio(1), config)
+
+    def test_output_settings_change_key(self):
+        """Test model, language and decoding settings invalidate entries."""
+        base = TranscriptionCache.key_for(_audio(), WhisperConfig())
+
+        for change in [{"model": "small"}, {"language": "en"}, {"temperature": 0.2},
+                       {"precision": "int8"}, {"cascade_model": "medium"}]:
+            assert TranscriptionCache.key_for(_audio(), WhisperConfig(**change)) != base
+
+    def test_resource_settings_keep_key(self):
+        """Test cache location and model residency do not affect the key."""
+        base = TranscriptionCache.key_for(_audio(), WhisperConfig())
+        config = WhisperConfig(cache_dir="/elsewhere", cache_max_mb=1, max_loaded_models=4, chunk_workers=3)
+
+        assert TranscriptionCache.key_for(_audio(), config) == base
+
+
+class TestTranscriptionCacheStorage:
+    """Test storing, loading and evicting entries."""
+
+    def test_round_trip(self, temp_dir):
+        """Test words come back exactly, including non-ASCII text."""
+        cache = TranscriptionCache(str(temp_dir))
+        words = [Word("señora", 0.1, 0.5, 0.91), Word("González", 0.6, 0.95, 0.72)]
+
+        cache.store("k1", words, {"model": "base"})
+
+        assert cache.load("k1") == words
+        assert cache.load("missing") is None
+        assert cache.stats()["cache_hits"] == 1
+        assert cache.stats()["cache_misses"] == 1
+
+    def test_corrupt_entry_discarded(self, temp_dir):
+        """Test an unreadable entry is treated as a miss and removed."""
+        cache = TranscriptionCache(str(temp_dir))
+        cache.store("k1", [Word("hola", 0.0, 0.4, 0.9)], {})
+        (temp_dir / "k1.npz").write_bytes(b"not a zip")
+
+        assert cache.load("k1") is None
+        assert not (temp_dir / "k1.json").exists()
+
+    def test_invalidate_and_clear(self, temp_dir):
+        """Test explicit invalidation of one entry and of the whole cache."""
+        cache = TranscriptionCache(str(temp_dir))
+        for key in ["a", "b", "c"]:
+            cache.store(key, [Word("hola", 0.0, 0.4, 0.9)], {})
+
+        cache.invalidate("a")
+        assert cache.load("a") is None
+
+        assert clear_transcription_cache(WhisperConfig(cache_dir=str(temp_dir))) == 2
+        assert cache.load("b") is None
+
+    def test_size_bounded_eviction(self, temp_dir):
+        """Test least recently used entries are evicted beyond the size cap."""
+        cache = TranscriptionCache(str(temp_dir))
+        words = [Word(f"palabra{i}", i * 0.5, i * 0.5 + 0.4, 0.9) for i in range(200)]
+        cache.store("first", words, {})
+        entry_bytes = cache.disk.size_bytes()
+
+        cache.disk.max_bytes = int(entry_bytes * 1.5)
+        cache.store("second", words, {})
+
+        assert cache.load("first") is None
+        assert cache.load("second") == words
+        assert cache.stats()["cache_evictions"] == 1
+
+
+class TestEngineCaching:
+    """Test TranscriptionEngine reads and writes the cache."""
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_second_run_skips_whisper(self, mock_load_model, temp_dir):
+        """Test a repeated transcription is served from the cache."""
+        model = _mock_model()
+        mock_load_model.return_value = model
+        config = WhisperConfig(cache_dir=str(temp_dir))
+
+        first = TranscriptionEngine(config).transcribe_audio(_audio())
+        second = TranscriptionEngine(config).transcribe_audio(_audio())
+
+        assert model.transcribe.call_count == 1
+        assert second == first
+        assert [w.text for w in second] == ["señora", "González"]
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_config_change_misses(self, mock_load_model, temp_dir):
+        """Test a different model does not reuse another model's result."""
+        model = _mock_model()
+        mock_load_model.return_value = model
+
+        TranscriptionEngine(WhisperConfig(cache_dir=str(temp_dir))).transcribe_audio(_audio())
+        TranscriptionEngine(WhisperConfig(cache_dir=str(temp_dir), model="small")).transcribe_audio(_audio())
+
+        assert model.transcribe.call_count == 2
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_stage_complete_reports_hits_and_misses(self, mock_load_model, temp_dir):
+        """Test the stage-complete log carries the cache outcome and totals."""
+        mock_load_model.return_value = _mock_model()
+        config = WhisperConfig(cache_dir=str(temp_dir))
+        engines = [TranscriptionEngine(config), TranscriptionEngine(config)]
+
+        logged = []
+        for engine in engines:
+            with patch.object(engine, 'log_stage_complete') as mock_complete:
+                engine.transcribe_audio(_audio())
+                logged.append(mock_complete.call_args.kwargs)
+
+        assert logged[0]["cache"] == "miss"
+        assert logged[1]["cache"] == "hit"
+        assert (logged[1]["cache_hits"], logged[1]["cache_misses"]) == (1, 1)
+        assert logged[1]["cache_hit_rate"] == 0.5
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_disabled_by_default(self, mock_load_model, temp_dir):
+        """Test no cache is used unless cache_dir is configured."""
+        mock_load_model.return_value = _mock_model()
+        engine = TranscriptionEngine(WhisperConfig())
+
+        engine.transcribe_audio(_audio())
+
+        assert engine.cache is None
@@ -0,0 +1,237 @@
+"""
+Unit tests for vad module.
+
+Tests energy-based speech detection, compaction of voiced regions, mapping
+of word and speaker timestamps back to the original timeline, and the
+pipeline's VAD stage.
+"""
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+
+from src.audio_to_json.vad import SpeechRegionMap, VoiceActivityDetector, detect_speech
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.audio_to_json.transcription import Word
+from src.audio_to_json.word_table import WordTable
+from src.audio_to_json.pipeline import AudioToJsonPipeline
+from src.shared.config import Config, VadConfig
+from src.shared.models import AudioMetadata, DiarizationResult, SpeakerSegment
+
+
+SR = 16000
+
+
+def _audio(data: np.ndarray) -> ProcessedAudio:
+    metadata = AudioMetadata(
+        path="class.wav", duration=data.shape[-1] / SR, sample_rate=SR,
+        channels=1, format="wav", size_bytes=1000
+    )
+    return ProcessedAudio(data, SR, data.shape[-1] / SR, metadata)
+
+
+def _bursts(seconds: float, bursts, noise: float = 1e-4) -> np.ndarray:
+    """Low noise with 220 Hz tone bursts at the given (start, end) times."""
+    rng = np.random.RandomState(0)
+    data = (rng.randn(int(seconds * SR)) * noise).astype(np.float32)
+    t = np.arange(len(data)) / SR
+    for start, end in bursts:
+        mask = (t >= start) & (t < end)
+        data[mask] += 0.3 * np.sin(2 * np.pi * 220 * t[mask]).astype(np.float32)
+    return data
+
+
+class TestEnergyDetection:
+    """Test energy-based voiced region detection."""
+
+    def test_detects_bursts_with_padding(self):
+        """Test each burst becomes one padded region."""
+        data = _bursts(10.0, [(1.0, 2.0), (5.0, 6.5)])
+        config = VadConfig(padding_s=0.2, min_silence_s=0.5)
+
+        speech = VoiceActivityDetector(config).detect(_audio(data))
+
+        assert len(speech) == 2
+        for (start, end), (expected_start, expected_end) in zip(speech.regions, [(0.8, 2.2), (4.8, 6.7)]):
+            assert start == pytest.approx(expected_start, abs=0.05)
+            assert end == pytest.approx(expected_end, abs=0.05)
+        assert speech.speech_ratio == pytest.approx(3.3 / 10, abs=0.02)
+
+    def test_short_pauses_are_bridged(self):
+        """Test pauses shorter than min_silence_s stay inside one region."""
+        data = _bursts(6.0, [(1.0, 2.0), (2.3, 3.0)])
+
+        speech = detect_speech(_audio(data), VadConfig(min_silence_s=0.5))
+
+        assert len(speech) == 1
+
+    def test_short_clicks_are_dropped(self):
+        """Test bursts shorter than min_speech_s are ignored."""
+        data = _bursts(6.0, [(1.0, 1.05), (3.0, 4.0)])
+
+        speech = detect_speech(_audio(data), VadConfig(min_speech_s=0.25, padding_s=0.0))
+
+        assert len(speech) == 1
+        assert speech.regions[0][0] == pytest.approx(3.0, abs=0.05)
+
+    def test_silence_keeps_whole_recording(self):
+        """Test a recording with no speech is not dropped."""
+        speech = detect_speech(_audio(np.zeros(SR * 3, dtype=np.float32)), VadConfig())
+
+        assert speech.covers_everything
+
+    def test_silero_unavailable_falls_back_to_energy(self):
+        """Test the model method degrades to energy detection without silero-vad."""
+        data = _bursts(4.0, [(1.0, 2.0)])
+
+        with patch.dict('sys.modules', {'silero_vad': None}):
+            speech = detect_speech(_audio(data), VadConfig(method="silero"))
+
+        assert len(speech) == 1
+
+
+class TestSpeechRegionMap:
+    """Test compaction and timestamp mapping."""
+
+    def _map(self):
+        # Regions 1-2 s and 5-6.5 s of a 10 s recording, 0.1 s gap between them
+        return SpeechRegionMap.from_seconds([(1.0, 2.0), (5.0, 6.5)], SR, 10 * SR, gap_s=0.1)
+
+    def test_compact_keeps_only_voiced_samples(self):
+        """Test the compacted buffer is the regions joined by silent gaps."""
+        data = np.arange(10 * SR, dtype=np.float32)
+
+        compact = self._map().compact(_audio(data))
+
+        assert compact.duration == pytest.approx(2.6)
+        assert np.array_equal(compact.data[:SR], data[SR:2 * SR])
+        assert np.all(compact.data[SR:SR + SR // 10] == 0)
+        assert np.array_equal(compact.data[SR + SR // 10:], data[5 * SR:int(6.5 * SR)])
+        assert compact.metadata.duration == 10.0
+
+    def test_to_original_shifts_each_region(self):
+        """Test times inside regions map back by the region offset."""
+        original = self._map().to_original([0.0, 0.5, 1.1, 1.6, 2.6])
+
+        assert np.allclose(original, [1.0, 1.5, 5.0, 5.5, 6.5])
+
+    def test_gap_times_snap_to_nearer_region(self):
+        """Test times in a gap snap to the nearer region boundary."""
+        original = self._map().to_original([1.02, 1.08])
+
+        assert np.allclose(original, [2.0, 5.0])
+
+    def test_map_words(self):
+        """Test word timestamps are moved to the original timeline."""
+        words = [Word("hola", 0.2, 0.6, 0.9), Word("clase", 1.3, 1.8, 0.8)]
+
+        mapped = self._map().map_words(words)
+
+        assert [(w.text, w.start_time, w.end_time) for w in mapped] == [
+            ("hola", pytest.approx(1.2), pytest.approx(1.6)),
+            ("clase", pytest.approx(5.2), pytest.approx(5.7)),
+        ]
+
+    def test_map_word_table(self):
+        """Test a WordTable is mapped column-wise and stays a table."""
+        words = [Word("hola", 0.2, 0.6, 0.9), Word("clase", 1.3, 1.8, 0.8)]
+
+        mapped = self._map().map_words(WordTable.from_words(words))
+
+        assert isinstance(mapped, WordTable)
+        assert mapped.to_words() == self._map().map_words(words)
+
+    def test_map_diarization_drops_gap_segments(self):
+        """Test speaker segments are mapped and gap-only segments removed."""
+        result = DiarizationResult(
+            speakers=[0, 1, 2],
+            segments=[
+                SpeakerSegment(speaker_id=0, start_time=0.0, end_time=1.0, confidence=0.9),
+                SpeakerSegment(speaker_id=2, start_time=1.01, end_time=1.04, confidence=0.9),
+                SpeakerSegment(speaker_id=1, start_time=1.1, end_time=2.6, confidence=0.9),
+            ],
+            audio_duration=2.6,
+            processing_time=0.5
+        )
+
+        mapped = self._map().map_diarization(result)
+
+        assert mapped.speakers == [0, 1]
+        assert [(s.speaker_id, s.start_time, s.end_time) for s in mapped.segments] == [
+            (0, pytest.approx(1.0), pytest.approx(2.0)),
+            (1, pytest.approx(5.0), pytest.approx(6.5)),
+        ]
+        assert mapped.audio_duration == 10.0
+
+    def test_mapping_does_not_drift_over_many_regions(self):
+        """Test sample-exact offsets keep late regions aligned."""
+        regions = [(i * 1.0 + 0.33331, i * 1.0 + 0.71117) for i in range(500)]
+        speech = SpeechRegionMap.from_seconds(regions, SR, 500 * SR, gap_s=0.1)
+
+        compact_times = speech.compact_starts[-1] / SR + 0.1
+        assert speech.to_original(compact_times)[0] == pytest.approx(499.33331 + 0.1, abs=1 / SR)
+
+
+class TestPipelineVad:
+    """Test the VAD stage inside the pipeline."""
+
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_transcription_sees_only_speech(self, mock_process_audio, mock_transcribe):
+        """Test Whisper gets the compacted audio and words land on the original timeline."""
+        config = Config()
+        config.vad.enabled = True
+        config.quality.min_confidence = 0.0
+        mock_process_audio.return_value = _audio(_bursts(20.0, [(2.0, 3.0), (12.0, 13.0)]))
+        mock_transcribe.return_value = [Word("hablamos", 1.6, 2.0, 0.95)]
+
+        database = AudioToJsonPipeline(config).process_audio_to_json("class.wav")
+
+        transcribed = mock_transcribe.call_args.args[0]
+        assert transcribed.duration < 4.0
+        entity = database.entities[0]
+        # Second region starts at 11.8 s (padded) and at 1.5 s in the compacted buffer
+        assert entity.start_time == pytest.approx(11.8 + (1.6 - 1.5), abs=0.05)
+
+    @patch('src.audio_to_json.diarization.PYANNOTE_AVAILABLE', True)
+    @patch('src.audio_to_json.diarization.Pipeline')
+    @patch('src.audio_to_json.pipeline.check_diarization_dependencies', return_value=(True, None))
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_diarization_sees_only_speech(self, mock_process_audio, mock_transcribe,
+                                          mock_deps, mock_pipeline_class):
+        """Test diarization of the compacted audio passes validation and keeps both speakers."""
+        torch = pytest.importorskip("torch")
+        config = Config()
+        config.vad.enabled = True
+        config.speakers.enable_diarization = True
+        config.quality.min_confidence = 0.0
+        mock_process_audio.return_value = _audio(_bursts(20.0, [(2.0, 3.0), (12.0, 13.0)]))
+        mock_transcribe.return_value = [Word("hola", 0.5, 0.9, 0.95), Word("hablamos", 1.6, 2.0, 0.95)]
+
+        def diarize(pipeline_input):
+            # One speaker per half of whatever buffer PyAnnote is given
+            total = pipeline_input["waveform"].shape[-1] / pipeline_input["sample_rate"]
+            output = MagicMock()
+            output.itertracks.return_value = [
+                (MagicMock(start=0.0, end=total / 2), None, "SPEAKER_00"),
+                (MagicMock(start=total / 2, end=total), None, "SPEAKER_01"),
+            ]
+            return output
+        mock_pipeline_class.from_pretrained.return_value = MagicMock(side_effect=diarize)
+
+        with patch('src.audio_to_json.diarization.torch', torch):
+            database = AudioToJsonPipeline(config).process_audio_to_json("class.wav")
+
+        assert [entity.speaker_id for entity in database.entities] == [0, 1]
+
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_disabled_by_default(self, mock_process_audio, mock_transcribe):
+        """Test the full recording is transcribed unless VAD is enabled."""
+        audio = _audio(_bursts(5.0, [(1.0, 2.0)]))
+        mock_process_audio.return_value = audio
+        mock_transcribe.return_value = [Word("hola", 1.2, 1.6, 0.95)]
+
+        AudioToJsonPipeline(Config()).process_audio_to_json("class.wav")
+
+        assert mock_transcribe.call_args.args[0] is audio
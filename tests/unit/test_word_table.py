@@ -0,0 +1,182 @@
+"""
+Unit tests for word_table module.
+
+Tests the columnar WordTable: conversion to and from Word lists, row
+selection and concatenation, its memory footprint, transcription straight
+into a table, and entity creation from a table in and out of the pipeline.
+"""
+import sys
+import pytest
+import numpy as np
+from unittest.mock import patch, MagicMock
+
+from src.audio_to_json.word_table import WordTable
+from src.audio_to_json.transcription import TranscriptionEngine, Word
+from src.audio_to_json.entity_creation import EntityCreator, create_entities
+from src.audio_to_json.audio_processor import ProcessedAudio
+from src.audio_to_json.pipeline import AudioToJsonPipeline
+from src.shared.config import Config, QualityConfig, WhisperConfig
+from src.shared.models import AudioMetadata
+
+
+def _words():
+    return [
+        Word("Hoy", 0.0, 0.4, 0.95),
+        Word("estudiaremos", 0.5, 1.3, 0.9),
+        Word("", 1.4, 1.5, 0.2),
+        Word("canción", 1.6, 2.1, 0.85),
+        Word("niño", 2.2, 2.6, 0.8),
+    ]
+
+
+def _audio(seconds: float) -> ProcessedAudio:
+    metadata = AudioMetadata(path="rec.wav", duration=seconds, sample_rate=16000,
+                             channels=1, format="wav", size_bytes=1000)
+    return ProcessedAudio(np.zeros(int(seconds * 16000), dtype=np.float32), 16000, seconds, metadata)
+
+
+class TestWordTable:
+    """Test WordTable construction and access."""
+
+    def test_round_trip_preserves_words(self):
+        """Test non-ASCII texts and numeric columns survive conversion."""
+        table = WordTable.from_words(_words())
+
+        assert len(table) == 5
+        assert table.to_words() == _words()
+        assert table.text(3) == "canción"
+        assert table[-1] == Word("niño", 2.2, 2.6, 0.8)
+
+    def test_columns(self):
+        """Test derived duration and centre columns."""
+        table = WordTable.from_words(_words())
+
+        np.testing.assert_allclose(table.durations, [0.4, 0.8, 0.1, 0.5, 0.4])
+        np.testing.assert_allclose(table.centres, [0.2, 0.9, 1.45, 1.85, 2.4])
+
+    def test_take_mask_and_slice(self):
+        """Test row selection by indices, boolean mask and slice."""
+        table = WordTable.from_words(_words())
+
+        assert table.take([3, 0]).texts() == ["canción", "Hoy"]
+        assert table.take(table.nonempty()).texts() == ["Hoy", "estudiaremos", "canción", "niño"]
+        assert table[1:3].to_words() == _words()[1:3]
+
+    def test_concat(self):
+        """Test tables join end to end with text offsets shifted."""
+        words = _words()
+        joined = WordTable.concat([WordTable.from_words(words[:2]), WordTable.from_words(words[2:])])
+
+        assert joined.to_words() == words
+        assert len(WordTable.concat([])) == 0
+
+    def test_index_out_of_range(self):
+        """Test integer indexing is bounds-checked."""
+        with pytest.raises(IndexError):
+            WordTable.from_words(_words())[5]
+
+    def test_unreadable_values_rejected(self):
+        """Test non-numeric times cannot enter a table."""
+        with pytest.raises((TypeError, ValueError)):
+            WordTable.from_words([Word("hola", "abc", 0.5, 0.9)])
+
+    def test_smaller_than_word_list(self):
+        """Test the columns take less memory than the Word objects."""
+        words = [Word(f"palabra{i}", i * 0.5, i * 0.5 + 0.4, 0.9) for i in range(1000)]
+        list_bytes = sum(sys.getsizeof(w) + sys.getsizeof(w.__dict__) + sys.getsizeof(w.text) for w in words)
+
+        assert WordTable.from_words(words).nbytes < list_bytes / 2
+
+
+class TestWordTableEntities:
+    """Test entity creation from a WordTable."""
+
+    def test_table_matches_word_list(self):
+        """Test a table yields the same entities as the equivalent Word list."""
+        creator = EntityCreator(QualityConfig())
+        words = [w for w in _words() if w.text]
+
+        from_list = creator.create_entities(words, "rec_001", "rec.wav")
+        from_table = creator.create_entities(WordTable.from_words(words), "rec_001", "rec.wav")
+
+        strip = lambda entities: [e.model_dump(exclude={"created_at"}) for e in entities]
+        assert strip(from_table) == strip(from_list)
+        assert [e.entity_id for e in from_table] == ["word_001", "word_002", "word_003", "word_004"]
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_engine_transcribe_table(self, mock_load_model):
+        """Test the engine returns its words as a table."""
+        model = MagicMock()
+        model.transcribe.return_value = {"segments": [{"words": [
+            {"word": " hola", "start": 0.0, "end": 0.5, "probability": 0.9},
+            {"word": " mundo", "start": 0.6, "end": 1.1, "probability": 0.8},
+        ]}]}
+        mock_load_model.return_value = model
+        metadata = AudioMetadata(path="test.wav", duration=2.0, sample_rate=16000,
+                                 channels=1, format="wav", size_bytes=1000)
+        audio = ProcessedAudio(np.zeros(32000, dtype=np.float32), 16000, 2.0, metadata)
+
+        table = TranscriptionEngine(WhisperConfig()).transcribe_table(audio)
+
+        assert isinstance(table, WordTable)
+        assert table.texts() == ["hola", "mundo"]
+        np.testing.assert_allclose(table.confidence, [0.9, 0.8])
+
+    @patch('src.audio_to_json.transcription.Word', side_effect=AssertionError("Word created"))
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_engine_table_built_from_result(self, mock_load_model, mock_word):
+        """Test the table is read from the Whisper result without Word objects."""
+        model = MagicMock()
+        model.transcribe.return_value = {"segments": [{"words": [
+            {"word": " hola", "start": 0.0, "end": 0.5, "probability": 0.9},
+            {"word": " ", "start": 0.5, "end": 0.6, "probability": 0.1},
+            {"word": " mundo", "start": 0.6, "end": 1.1, "probability": 0.8},
+        ]}]}
+        mock_load_model.return_value = model
+
+        table = TranscriptionEngine(WhisperConfig()).transcribe_table(_audio(2.0))
+
+        assert table.texts() == ["hola", "mundo"]
+        np.testing.assert_allclose(table.start, [0.0, 0.6])
+        mock_word.assert_not_called()
+
+    @patch('src.audio_to_json.transcription.whisper.load_model')
+    def test_engine_table_matches_word_list(self, mock_load_model):
+        """Test the table and the Word list agree, including segment-level timing."""
+        model = MagicMock()
+        model.transcribe.return_value = {"segments": [
+            {"text": " hola mundo", "start": 0.0, "end": 1.0, "avg_logprob": -0.2},
+        ]}
+        mock_load_model.return_value = model
+        engine = TranscriptionEngine(WhisperConfig())
+
+        table = engine.transcribe_table(_audio(2.0))
+
+        assert table.to_words() == engine.transcribe_audio(_audio(2.0))
+        np.testing.assert_allclose(table.end, [0.5, 1.0])
+
+
+class TestColumnarPipeline:
+    """Test processing.columnar_words in the pipeline."""
+
+    @patch('src.audio_to_json.pipeline.create_entities', wraps=create_entities)
+    @patch('src.audio_to_json.pipeline.transcribe_table')
+    @patch('src.audio_to_json.pipeline.transcribe_audio')
+    @patch('src.audio_to_json.pipeline.process_audio')
+    def test_table_reaches_entity_creation(self, mock_process_audio, mock_transcribe,
+                                           mock_transcribe_table, mock_create):
+        """Test the table is passed to entity creation and gives the same entities."""
+        mock_process_audio.return_value = _audio(3.0)
+        mock_transcribe.return_value = _words()
+        mock_transcribe_table.return_value = WordTable.from_words(_words())
+        config = Config()
+        config.quality.min_confidence = 0.0
+
+        from_list = AudioToJsonPipeline(config).process_audio_to_json("rec.wav")
+        config.processing.columnar_words = True
+        from_table = AudioToJsonPipeline(config).process_audio_to_json("rec.wav")
+
+        mock_transcribe.assert_called_once()
+        assert isinstance(mock_create.call_args.args[0], WordTable)
+        strip = lambda db: [e.model_dump(exclude={"created_at", "recording_id"}) for e in db.entities]
+        assert strip(from_table) == strip(from_list)